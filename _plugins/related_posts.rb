@@ -0,0 +1,24 @@
+# _data/related.yml(scripts/build_related_posts.py가 생성)의 항목에 포스트 URL과 날짜를 채운다.
+#
+# 레이아웃에서 항목마다 site.posts를 where로 찾으면 빌드 시간이 포스트 수의 제곱에
+# 비례해 늘어나므로, 읽기 단계 직후 page.path → 포스트 맵을 한 번 만들어 해결한다.
+# 더 이상 없는 포스트를 가리키는 항목은 뺀다.
+Jekyll::Hooks.register :site, :post_read do |site|
+  related = site.data["related"]
+  next unless related.is_a?(Hash)
+
+  posts_by_path = site.posts.docs.each_with_object({}) do |post, map|
+    map[post.relative_path] = post
+  end
+
+  related.each_value do |entries|
+    next unless entries.is_a?(Array)
+
+    entries.select! { |entry| posts_by_path.key?(entry["path"]) }
+    entries.each do |entry|
+      post = posts_by_path[entry["path"]]
+      entry["url"] = post.url
+      entry["date"] = post.date
+    end
+  end
+end
@@ -0,0 +1,269 @@
+"""오프라인 백필용 Batch API 제출 모듈.
+
+대화형 지연 시간이 필요 없는 백필/재생성 작업은 여러 항목의 요청을 JSONL 배치
+파일로 작성하여 OpenAI Batch API 또는 Anthropic Message Batches API로 제출하고,
+완료될 때까지 폴링한 뒤 결과를 custom_id 기준으로 돌려준다.
+
+환경 변수
+----------
+OPENAI_BATCH_BASE_URL
+    OpenAI API 기본 URL (기본값: https://api.openai.com/v1, 테스트 시 가짜 서버 주소)
+ANTHROPIC_BATCH_BASE_URL
+    Anthropic API 기본 URL (기본값: https://api.anthropic.com/v1)
+BATCH_POLL_INTERVAL_SECONDS
+    배치 상태 폴링 간격 (기본값: 60)
+BATCH_TIMEOUT_SECONDS
+    배치 완료 대기 최대 시간 (기본값: 86400)
+BATCH_WORK_DIR
+    배치 요청 파일을 저장할 디렉터리 (기본값: data/batches)
+"""
+from __future__ import annotations
+
+import datetime as dt
+import json
+import os
+import time
+import typing as t
+import urllib.error
+import urllib.request
+import uuid
+from pathlib import Path
+
+from automation.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_WORK_DIR = Path("data/batches")
+
+BatchRequest = t.Tuple[str, t.Dict[str, t.Any]]
+
+
+class BatchError(RuntimeError):
+    """배치 제출/폴링/결과 수집 실패."""
+
+
+class _BatchHTTPClient:
+    """Batch API 공통 HTTP 호출 헬퍼."""
+
+    name = "batch"
+
+    def __init__(self, api_key: str, base_url: str, timeout: float = 60.0):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def _headers(self) -> dict[str, str]:
+        raise NotImplementedError
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: bytes | None = None,
+        content_type: str = "application/json",
+    ) -> bytes:
+        if not url.startswith("http"):
+            url = f"{self.base_url}{url}"
+        headers = self._headers()
+        if body is not None:
+            headers["Content-Type"] = content_type
+        request = urllib.request.Request(url, data=body, headers=headers, method=method)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.read()
+        except urllib.error.HTTPError as exc:
+            error_body = exc.read().decode("utf-8", "replace") if exc.fp else ""
+            raise BatchError(f"{self.name} 배치 API 호출 실패 (HTTP {exc.code}): {exc.reason}\n{error_body}") from exc
+        except urllib.error.URLError as exc:
+            raise BatchError(f"{self.name} 배치 API 연결 실패: {exc}") from exc
+
+    def _request_json(self, method: str, url: str, payload: t.Any = None) -> dict[str, t.Any]:
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        return json.loads(self._request(method, url, body=body).decode("utf-8"))
+
+    def write_requests(self, requests: t.Sequence[BatchRequest], path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as handle:
+            for custom_id, payload in requests:
+                handle.write(json.dumps(self._request_line(custom_id, payload), ensure_ascii=False))
+                handle.write("\n")
+        return path
+
+    def _request_line(self, custom_id: str, payload: dict[str, t.Any]) -> dict[str, t.Any]:
+        raise NotImplementedError
+
+    def submit(self, path: Path) -> str:
+        raise NotImplementedError
+
+    def poll(self, batch_id: str) -> tuple[bool, dict[str, t.Any]]:
+        """(완료 여부, 배치 정보)를 반환한다."""
+        raise NotImplementedError
+
+    def fetch_results(self, batch: dict[str, t.Any]) -> dict[str, str | None]:
+        """custom_id별 응답 텍스트를 반환한다. 실패한 요청은 None."""
+        raise NotImplementedError
+
+
+class OpenAIBatchClient(_BatchHTTPClient):
+    """OpenAI Files + Batches API 클라이언트."""
+
+    name = "openai"
+    endpoint = "/v1/chat/completions"
+    _terminal = {"completed", "failed", "expired", "cancelled"}
+
+    def __init__(self, api_key: str, base_url: str | None = None, timeout: float = 60.0):
+        super().__init__(
+            api_key,
+            base_url or os.getenv("OPENAI_BATCH_BASE_URL", "https://api.openai.com/v1"),
+            timeout,
+        )
+
+    def _headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.api_key}"}
+
+    def _request_line(self, custom_id: str, payload: dict[str, t.Any]) -> dict[str, t.Any]:
+        return {"custom_id": custom_id, "method": "POST", "url": self.endpoint, "body": payload}
+
+    def submit(self, path: Path) -> str:
+        boundary = uuid.uuid4().hex
+        body = b"".join([
+            f"--{boundary}\r\n".encode(),
+            b'Content-Disposition: form-data; name="purpose"\r\n\r\nbatch\r\n',
+            f"--{boundary}\r\n".encode(),
+            f'Content-Disposition: form-data; name="file"; filename="{path.name}"\r\n'.encode(),
+            b"Content-Type: application/jsonl\r\n\r\n",
+            path.read_bytes(),
+            f"\r\n--{boundary}--\r\n".encode(),
+        ])
+        uploaded = json.loads(
+            self._request(
+                "POST",
+                "/files",
+                body=body,
+                content_type=f"multipart/form-data; boundary={boundary}",
+            ).decode("utf-8")
+        )
+        batch = self._request_json("POST", "/batches", {
+            "input_file_id": uploaded["id"],
+            "endpoint": self.endpoint,
+            "completion_window": "24h",
+        })
+        return batch["id"]
+
+    def poll(self, batch_id: str) -> tuple[bool, dict[str, t.Any]]:
+        batch = self._request_json("GET", f"/batches/{batch_id}")
+        return batch.get("status") in self._terminal, batch
+
+    def fetch_results(self, batch: dict[str, t.Any]) -> dict[str, str | None]:
+        if batch.get("status") != "completed":
+            raise BatchError(f"OpenAI 배치가 완료되지 않았습니다 (status={batch.get('status')})")
+
+        results: dict[str, str | None] = {}
+        for file_key in ("output_file_id", "error_file_id"):
+            file_id = batch.get(file_key)
+            if not file_id:
+                continue
+            raw = self._request("GET", f"/files/{file_id}/content").decode("utf-8")
+            for line in raw.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get("response") or {}
+                if record.get("error") or response.get("status_code", 200) >= 400:
+                    results[record["custom_id"]] = None
+                    continue
+                try:
+                    results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+                except (KeyError, IndexError, TypeError):
+                    results[record["custom_id"]] = None
+        return results
+
+
+class AnthropicBatchClient(_BatchHTTPClient):
+    """Anthropic Message Batches API 클라이언트."""
+
+    name = "anthropic"
+
+    def __init__(self, api_key: str, base_url: str | None = None, timeout: float = 60.0):
+        super().__init__(
+            api_key,
+            base_url or os.getenv("ANTHROPIC_BATCH_BASE_URL", "https://api.anthropic.com/v1"),
+            timeout,
+        )
+
+    def _headers(self) -> dict[str, str]:
+        return {"x-api-key": self.api_key, "anthropic-version": "2023-06-01"}
+
+    def _request_line(self, custom_id: str, payload: dict[str, t.Any]) -> dict[str, t.Any]:
+        return {"custom_id": custom_id, "params": payload}
+
+    def submit(self, path: Path) -> str:
+        requests = [
+            json.loads(line)
+            for line in path.read_text(encoding="utf-8").splitlines()
+            if line.strip()
+        ]
+        batch = self._request_json("POST", "/messages/batches", {"requests": requests})
+        return batch["id"]
+
+    def poll(self, batch_id: str) -> tuple[bool, dict[str, t.Any]]:
+        batch = self._request_json("GET", f"/messages/batches/{batch_id}")
+        return batch.get("processing_status") == "ended", batch
+
+    def fetch_results(self, batch: dict[str, t.Any]) -> dict[str, str | None]:
+        results_url = batch.get("results_url")
+        if not results_url:
+            raise BatchError("Anthropic 배치 결과 URL이 없습니다.")
+
+        results: dict[str, str | None] = {}
+        raw = self._request("GET", results_url).decode("utf-8")
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            result = record.get("result") or {}
+            if result.get("type") != "succeeded":
+                results[record["custom_id"]] = None
+                continue
+            blocks = result.get("message", {}).get("content", [])
+            text = "".join(block.get("text", "") for block in blocks if block.get("type", "text") == "text")
+            results[record["custom_id"]] = text or None
+        return results
+
+
+def run_batch(
+    client: _BatchHTTPClient,
+    requests: t.Sequence[BatchRequest],
+    *,
+    work_dir: Path | None = None,
+    poll_interval: float | None = None,
+    timeout: float | None = None,
+    sleep: t.Callable[[float], None] = time.sleep,
+) -> dict[str, str | None]:
+    """배치 파일 작성 → 제출 → 폴링 → 결과 수집을 수행한다."""
+    if not requests:
+        return {}
+
+    work_dir = work_dir or Path(os.getenv("BATCH_WORK_DIR", str(DEFAULT_WORK_DIR)))
+    poll_interval = poll_interval if poll_interval is not None else float(os.getenv("BATCH_POLL_INTERVAL_SECONDS", "60"))
+    timeout = timeout if timeout is not None else float(os.getenv("BATCH_TIMEOUT_SECONDS", "86400"))
+
+    stamp = dt.datetime.now().strftime("%Y%m%d-%H%M%S")
+    path = client.write_requests(requests, work_dir / f"{client.name}-{stamp}-{uuid.uuid4().hex[:8]}.jsonl")
+    batch_id = client.submit(path)
+    logger.info(f"{client.name} 배치 제출 완료: {batch_id} ({len(requests)}건, {path})")
+
+    deadline = time.monotonic() + timeout
+    while True:
+        done, batch = client.poll(batch_id)
+        if done:
+            break
+        if time.monotonic() >= deadline:
+            raise BatchError(f"{client.name} 배치 {batch_id}가 {timeout:.0f}초 안에 완료되지 않았습니다.")
+        sleep(poll_interval)
+
+    results = client.fetch_results(batch)
+    succeeded = sum(1 for text in results.values() if text)
+    logger.info(f"{client.name} 배치 {batch_id} 완료: 성공 {succeeded}/{len(requests)}건")
+    return results
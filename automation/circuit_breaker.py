@@ -0,0 +1,124 @@
+"""외부 의존성 호출을 보호하는 서킷 브레이커 모듈.
+
+연속 실패가 임계치에 도달하면 회로를 열어(open) 쿨다운 동안 호출을 건너뛰고,
+쿨다운이 지나면 한 번의 시험 호출(half-open)로 복구 여부를 판단한다.
+"""
+from __future__ import annotations
+
+import threading
+import time
+import typing as t
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반의 스레드 안전한 서킷 브레이커."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 60.0,
+        clock: t.Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_seconds = max(0.0, cooldown_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+        self.total_trips = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and self._cooldown_elapsed():
+            self._state = HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def _cooldown_elapsed(self) -> bool:
+        return self._opened_at is not None and self._clock() - self._opened_at >= self.cooldown_seconds
+
+    def allow_request(self) -> bool:
+        """호출을 진행해도 되는지 반환한다. half-open 상태에서는 시험 호출 1회만 허용한다."""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def release_trial(self) -> None:
+        """허용받은 시험 호출을 실행하지 않았거나 결과를 판단할 수 없을 때 슬롯을 돌려준다."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            state = self._current_state()
+            self._consecutive_failures += 1
+            if state == HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                if state != OPEN:
+                    self.total_trips += 1
+                self._state = OPEN
+                self._opened_at = self._clock()
+                self._trial_in_flight = False
+
+    def seconds_until_retry(self) -> float:
+        """open 상태에서 다음 시험 호출까지 남은 시간(초)을 반환한다."""
+        with self._lock:
+            if self._state != OPEN or self._opened_at is None:
+                return 0.0
+            return max(0.0, self.cooldown_seconds - (self._clock() - self._opened_at))
+
+    def snapshot(self) -> dict[str, t.Any]:
+        """모니터링/리포트용 상태 요약을 반환한다."""
+        retry_in = self.seconds_until_retry()
+        with self._lock:
+            return {
+                "name": self.name,
+                "state": self._current_state(),
+                "consecutive_failures": self._consecutive_failures,
+                "total_trips": self.total_trips,
+                "retry_in_seconds": round(retry_in, 1),
+            }
+
+    def export_state(self) -> dict[str, t.Any]:
+        """프로세스 간 공유/저장용 상태를 반환한다 (저장 시각은 벽시계 기준)."""
+        state = self.snapshot()
+        state["saved_at"] = time.time()
+        return state
+
+    def restore(self, state: t.Mapping[str, t.Any]) -> None:
+        """export_state() 결과로 상태를 복원한다. 저장 이후 경과 시간만큼 쿨다운을 차감한다."""
+        elapsed = max(0.0, time.time() - float(state.get("saved_at", 0.0)))
+        with self._lock:
+            self._consecutive_failures = int(state.get("consecutive_failures", 0))
+            self.total_trips = int(state.get("total_trips", 0))
+            self._trial_in_flight = False
+            if state.get("state") in (OPEN, HALF_OPEN):
+                remaining = max(0.0, float(state.get("retry_in_seconds", 0.0)) - elapsed)
+                self._state = OPEN
+                self._opened_at = self._clock() - (self.cooldown_seconds - remaining)
+            else:
+                self._state = CLOSED
+                self._opened_at = None
@@ -73,10 +73,15 @@ class Config:
     YOUTUBE_PUBLISHED_AFTER_DAYS: int = int(os.getenv("YOUTUBE_PUBLISHED_AFTER_DAYS", "7"))
     YOUTUBE_CHANNELS_ENABLED: bool = os.getenv("YOUTUBE_CHANNELS_ENABLED", "true").lower() == "true"
     YOUTUBE_CHANNELS_FILE: Path = DATA_DIR / "youtube_channels.json"
+    YOUTUBE_CHANNEL_STATE_FILE: Path = DATA_DIR / "youtube_channel_state.json"
     YOUTUBE_WATCHLIST_ENABLED: bool = os.getenv("YOUTUBE_WATCHLIST_ENABLED", "true").lower() == "true"
     YOUTUBE_WATCHLIST_FILE: Path = DATA_DIR / "youtube_watchlist.json"
     YOUTUBE_KEYWORD_GROUPS_ENABLED: bool = os.getenv("YOUTUBE_KEYWORD_GROUPS_ENABLED", "true").lower() == "true"
     YOUTUBE_KEYWORD_GROUPS_FILE: Path = DATA_DIR / "youtube_keyword_groups.json"
+    YOUTUBE_TRANSCRIPT_WORKERS: int = int(os.getenv("YOUTUBE_TRANSCRIPT_WORKERS", "4"))
+    YOUTUBE_DAILY_QUOTA: int = int(os.getenv("YOUTUBE_DAILY_QUOTA", "10000"))
+    YOUTUBE_RUNS_PER_DAY: int = int(os.getenv("YOUTUBE_RUNS_PER_DAY", "4"))
+    YOUTUBE_QUOTA_FILE: Path = DATA_DIR / "youtube_quota.json"
 
     # ========================================
     # Gmail 뉴스레터 인입 설정
@@ -84,6 +89,7 @@ class Config:
     GOOGLE_CLIENT_SECRET_FILE: str = os.getenv("GOOGLE_CLIENT_SECRET_FILE", str((Path(__file__).parent.parent / "data" / "google_client_secret.json").absolute()))
     GOOGLE_TOKEN_FILE: str = os.getenv("GOOGLE_TOKEN_FILE", str((Path(__file__).parent.parent / "data" / "google_token.json").absolute()))
     GMAIL_LABEL: str = os.getenv("GMAIL_LABEL", "newsletter")
+    GMAIL_SYNC_STATE_FILE: Path = DATA_DIR / "gmail_sync_state.json"
 
     # ========================================
     # 미디어 생성 설정
@@ -257,6 +263,8 @@ class Config:
         print(f"  최대 결과: {cls.YOUTUBE_MAX_RESULTS}")
         print(f"  지역 코드: {cls.YOUTUBE_REGION_CODE}")
         print(f"  최근 일수: {cls.YOUTUBE_PUBLISHED_AFTER_DAYS}")
+        print(f"  자막 조회 워커: {cls.YOUTUBE_TRANSCRIPT_WORKERS}")
+        print(f"  일일 쿼터: {cls.YOUTUBE_DAILY_QUOTA} (하루 {cls.YOUTUBE_RUNS_PER_DAY}회 실행 기준 분배)")
         print(f"  채널 수집: {'활성화' if cls.YOUTUBE_CHANNELS_ENABLED else '비활성화'}")
         if cls.YOUTUBE_CHANNELS_ENABLED:
             channels = cls.load_channels()
@@ -272,6 +280,7 @@ class Config:
 
         print(f"\n[Gmail]")
         print(f"  라벨: {cls.GMAIL_LABEL}")
+        print(f"  동기화 상태: {cls.GMAIL_SYNC_STATE_FILE}")
         print(f"  Client Secret: {cls.GOOGLE_CLIENT_SECRET_FILE}")
         print(f"  Token: {cls.GOOGLE_TOKEN_FILE}")
 
@@ -17,8 +17,14 @@ except ImportError:
 
 from automation.logger import get_logger
 
+if t.TYPE_CHECKING:
+    from automation.relevance_classifier import RelevanceClassifier
+
 logger = get_logger(__name__)
 
+# 로컬 분류기 관련성이 기준 미만인 항목의 우선순위 감점
+LOW_RELEVANCE_PENALTY = 20.0
+
 
 @dataclass
 class ContentMetrics:
@@ -30,6 +36,8 @@ class ContentMetrics:
     is_trending: bool = False
     priority_score: float = 0.0
     categories: list[str] = None
+    predicted_category: str = ""  # 로컬 분류기가 예측한 blog_category
+    relevance: float | None = None  # 로컬 분류기 관련성 (분류기가 없으면 None)
     
     def __post_init__(self):
         if self.categories is None:
@@ -86,11 +94,15 @@ class ContentFilter:
         self, 
         min_votes: int = 10,
         min_comments: int = 0,
-        enable_scraping: bool = False
+        enable_scraping: bool = False,
+        classifier: RelevanceClassifier | None = None,
+        min_relevance: float = 0.0,
     ):
         self.min_votes = min_votes
         self.min_comments = min_comments
         self.enable_scraping = enable_scraping
+        self.classifier = classifier
+        self.min_relevance = min_relevance
     
     def analyze(self, item: t.Mapping[str, t.Any]) -> ContentMetrics:
         """기사를 분석하여 메트릭을 계산한다."""
@@ -100,6 +112,12 @@ class ContentFilter:
         
         metrics = ContentMetrics()
         
+        # 0. 로컬 분류기로 카테고리/관련성 예측 (LLM 호출 전 빠른 선별)
+        if self.classifier is not None:
+            prediction = self.classifier.predict(title, summary)
+            metrics.predicted_category = prediction.category
+            metrics.relevance = prediction.relevance
+        
         # 1. 인기도 수집 (웹 스크래핑 필요시)
         if self.enable_scraping and url:
             metrics.votes, metrics.comments = self._scrape_metrics(url)
@@ -113,8 +131,10 @@ class ContentFilter:
         # 4. 카테고리 분류
         metrics.categories = self._categorize(title, summary)
         
-        # 5. 우선순위 점수 계산
+        # 5. 우선순위 점수 계산 (블로그 주제와 먼 항목은 감점)
         metrics.priority_score = self._calculate_priority(metrics, title, summary)
+        if self._low_relevance(metrics):
+            metrics.priority_score = max(0.0, metrics.priority_score - LOW_RELEVANCE_PENALTY)
         
         return metrics
     
@@ -281,6 +301,9 @@ class ContentFilter:
         
         return min(100.0, score)
     
+    def _low_relevance(self, metrics: ContentMetrics) -> bool:
+        return metrics.relevance is not None and metrics.relevance < self.min_relevance
+
     def should_process(self, metrics: ContentMetrics) -> bool:
         """기사를 처리할지 여부를 결정한다."""
         # AI 관련 항목은 무조건 포함 (QA 자동화 포함)
@@ -291,10 +314,15 @@ class ContentFilter:
         if "QA" in metrics.categories:
             return True
         
-        # 인기도 기준 충족
+        # 인기도 기준 충족 (분류기는 한국어 포스트로 학습해 영어 기술 기사를 낮게 볼 수 있다)
         if metrics.votes >= self.min_votes:
             return True
         
+        # 키워드/인기도 근거가 없고 로컬 분류기도 블로그 주제와 멀다고 본 항목은 제외
+        # (트렌드 키워드가 있으면 분류기가 모르는 영어 기술 용어일 수 있어 남긴다)
+        if self._low_relevance(metrics) and not metrics.is_trending:
+            return False
+        
         # 트렌드이면서 일정 이상의 점수
         if metrics.is_trending and metrics.priority_score >= 20:
             return True
@@ -317,6 +345,12 @@ class ContentFilter:
         max_items: int = 10
     ) -> list[tuple[t.Mapping[str, t.Any], ContentMetrics]]:
         """기사 목록을 필터링하고 우선순위 순으로 정렬한다."""
+        return self.limit(self.select(items), max_items)
+    
+    def select(
+        self, items: t.Iterable[t.Mapping[str, t.Any]]
+    ) -> list[tuple[t.Mapping[str, t.Any], ContentMetrics]]:
+        """처리 대상인 기사를 모두 골라 우선순위 내림차순으로 정렬한다 (개수 제한 없음)."""
         analyzed: list[tuple[t.Mapping[str, t.Any], ContentMetrics]] = []
         
         for item in items:
@@ -326,7 +360,14 @@ class ContentFilter:
         
         # 우선순위 점수 기준 내림차순 정렬
         analyzed.sort(key=lambda x: x[1].priority_score, reverse=True)
-        
+        return analyzed
+    
+    def limit(
+        self,
+        analyzed: list[tuple[t.Mapping[str, t.Any], ContentMetrics]],
+        max_items: int = 10,
+    ) -> list[tuple[t.Mapping[str, t.Any], ContentMetrics]]:
+        """select() 결과에서 이번 실행에 처리할 max_items개를 고른다."""
         # AI 관련 항목은 최소 1개 이상 포함 보장
         ai_items = [x for x in analyzed if x[1].is_ai_related]
         non_ai_items = [x for x in analyzed if not x[1].is_ai_related]
@@ -0,0 +1,307 @@
+"""소스 간 유사 중복 탐지 (MinHash + LSH).
+
+같은 기사가 GeekNews RSS, Gmail 뉴스레터, Reddit, Dev.to, YouTube로 서로 다른 GUID를
+달고 들어오므로 GUID 비교만으로는 중복을 걸러낼 수 없다. 제목과 요약 앞부분을 각각
+정규화한 뒤 문자 3-gram 집합의 MinHash 서명을 만들고, LSH 밴드로 후보를 찾아
+제목 또는 요약의 추정 Jaccard 유사도가 임계값 이상이면 같은 이야기로 본다.
+"Rust 1.80"과 "Rust 1.81"처럼 버전 숫자만 다른 제목은 3-gram이 대부분 겹치므로,
+제목의 숫자 토큰이 서로 다르면 유사도와 관계없이 다른 이야기로 본다.
+제목과 요약을 한 서명으로 합치면 소스마다 길이와 문체가 다른 요약이 제목의
+신호를 희석하므로(기존 포스트의 "-new" 쌍이 0.3~0.5로 떨어짐) 따로 비교한다.
+
+요약만 비슷한 경우는 더 높은 임계값을 쓴다. 같은 YouTube 채널이나 뉴스레터는
+설명/본문 앞부분에 같은 머리말을 붙이므로, 요약에서 링크/해시태그/연락처 줄을
+빼도 남는 머리말만으로 0.5를 넘길 수 있다.
+
+정규화는 한국어/영어를 함께 고려한다. NFKC 정규화와 소문자 변환 후 URL,
+문장 부호, 공백을 모두 제거하므로 띄어쓰기나 전각/반각 차이가 있어도 같은 3-gram이
+만들어진다.
+
+처리 완료된 항목의 서명은 data/near_duplicate_index.json에 처리 상태와 함께 저장된다.
+인덱스 파일이 없으면 _posts/의 기존 포스트 front matter(title, summary)로 초기화한다.
+
+환경 변수
+----------
+NEAR_DUP_THRESHOLD
+    유사 중복으로 판단할 추정 Jaccard 유사도 (기본값: 0.75, 0이면 비활성화)
+NEAR_DUP_BODY_THRESHOLD
+    제목은 다르고 요약만 비슷할 때 적용할 유사도 (기본값: 0.85)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import re
+import time
+import typing as t
+import unicodedata
+from pathlib import Path
+
+from automation.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_INDEX_PATH = Path("data/near_duplicate_index.json")
+DEFAULT_THRESHOLD = 0.75
+DEFAULT_BODY_THRESHOLD = 0.85
+INDEX_VERSION = 4
+NUM_PERM = 64
+BANDS = 16  # 16밴드 × 4행: 유사도 약 0.5부터 후보로 잡힌다
+SHINGLE_SIZE = 3
+SUMMARY_CHARS = 300
+MIN_BODY_CHARS = 60  # 정규화 후 이보다 짧은 요약은 비교하지 않는다
+MAX_ENTRIES = 3000
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_URL_RE = re.compile(r"https?://\S+")
+# 채널/뉴스레터 머리말·꼬리말에 흔한 링크, 연락처, 해시태그 줄
+_BOILERPLATE_LINE_RE = re.compile(r"https?://|www\.|\S+@\S+|(?:^|\s)[#@]\w", re.UNICODE)
+_NON_WORD_RE = re.compile(r"[\W_]+", re.UNICODE)
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)*")
+_FRONT_MATTER_RE = re.compile(r"\A---\s*\n(.*?)\n---", re.DOTALL)
+
+# 시드를 고정해 실행 간에 같은 순열을 쓴다 (저장된 서명과 비교 가능해야 함).
+_rng = random.Random(20251019)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(NUM_PERM)
+]
+
+
+def normalize_text(text: str) -> str:
+    """한/영 혼용 텍스트를 비교용으로 정규화한다 (URL, 문장 부호, 공백 제거)."""
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = _URL_RE.sub(" ", text)
+    return _NON_WORD_RE.sub("", text)
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set[str]:
+    normalized = normalize_text(text)
+    if len(normalized) <= size:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+
+
+def minhash(text: str) -> list[int] | None:
+    """문자 3-gram 집합의 MinHash 서명 (NUM_PERM개의 32비트 정수, 빈 텍스트는 None)."""
+    hashed = [
+        int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for shingle in shingles(text)
+    ]
+    if not hashed:
+        return None
+    return [
+        min(((a * value + b) % _MERSENNE_PRIME) for value in hashed) & _MAX_HASH
+        for a, b in _PERMUTATIONS
+    ]
+
+
+Fingerprint = t.Dict[str, t.Any]
+
+
+def strip_boilerplate(text: str) -> str:
+    """링크, 연락처, 해시태그가 들어간 줄을 뺀다 (영상 설명/뉴스레터의 머리말·꼬리말)."""
+    return "\n".join(line for line in text.splitlines() if not _BOILERPLATE_LINE_RE.search(line))
+
+
+def title_numbers(title: str) -> list[str]:
+    """제목의 숫자 토큰 (버전, 연도 등)."""
+    return sorted(set(_NUMBER_RE.findall(unicodedata.normalize("NFKC", title))))
+
+
+def fingerprint(item: t.Mapping[str, t.Any]) -> Fingerprint:
+    """제목 서명, 요약 앞부분 서명 (요약이 짧으면 None), 제목의 숫자 토큰."""
+    title = str(item.get("title", ""))
+    body = strip_boilerplate(str(item.get("summary", "")))[:SUMMARY_CHARS]
+    return {
+        "title": minhash(title),
+        "body": minhash(body) if len(normalize_text(body)) >= MIN_BODY_CHARS else None,
+        "numbers": title_numbers(title),
+    }
+
+
+def similarity(left: t.Sequence[int], right: t.Sequence[int]) -> float:
+    """두 서명의 추정 Jaccard 유사도."""
+    return sum(1 for a, b in zip(left, right) if a == b) / NUM_PERM
+
+
+def _band_keys(fp: Fingerprint) -> list[str]:
+    rows = NUM_PERM // BANDS
+    keys = []
+    for field in ("title", "body"):
+        signature = fp.get(field)
+        if signature:
+            keys.extend(
+                f"{field}{band}:" + ",".join(map(str, signature[band * rows:(band + 1) * rows]))
+                for band in range(BANDS)
+            )
+    return keys
+
+
+def _match_score(left: Fingerprint, right: Fingerprint, threshold: float, body_threshold: float) -> float | None:
+    """제목 유사도가 threshold 이상이거나 요약 유사도가 body_threshold 이상이면 그 중 큰 값.
+
+    두 제목에 모두 숫자가 있는데 서로 다르면 (다른 버전/회차) 같은 이야기로 보지 않는다.
+    """
+    if left.get("numbers") and right.get("numbers") and left["numbers"] != right["numbers"]:
+        return None
+    scores = []
+    for field, limit in (("title", threshold), ("body", max(threshold, body_threshold))):
+        if left.get(field) and right.get(field):
+            score = similarity(left[field], right[field])  # type: ignore[arg-type]
+            if score >= limit:
+                scores.append(score)
+    return max(scores, default=None)
+
+
+class NearDuplicateIndex:
+    """키(GUID 등) → MinHash 지문(제목/요약 서명) 인덱스와 LSH 버킷."""
+
+    def __init__(
+        self,
+        path: Path | str | None = DEFAULT_INDEX_PATH,
+        threshold: float = DEFAULT_THRESHOLD,
+        max_entries: int = MAX_ENTRIES,
+        body_threshold: float = DEFAULT_BODY_THRESHOLD,
+    ):
+        self.path = Path(path) if path else None
+        self.threshold = threshold
+        self.body_threshold = body_threshold
+        self.max_entries = max_entries
+        self._entries: dict[str, dict[str, t.Any]] = {}
+        self._buckets: dict[str, set[str]] = {}
+        self.loaded_from_disk = False
+        self._load()
+
+    @classmethod
+    def from_env(cls, path: Path | str = DEFAULT_INDEX_PATH) -> "NearDuplicateIndex":
+        return cls(
+            path,
+            threshold=float(os.getenv("NEAR_DUP_THRESHOLD", str(DEFAULT_THRESHOLD))),
+            body_threshold=float(os.getenv("NEAR_DUP_BODY_THRESHOLD", str(DEFAULT_BODY_THRESHOLD))),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def _load(self) -> None:
+        if not self.path or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning(f"유사 중복 인덱스를 읽을 수 없어 새로 시작합니다: {exc}")
+            return
+        if data.get("num_perm") != NUM_PERM or data.get("version") != INDEX_VERSION:
+            logger.info("유사 중복 인덱스 형식이 바뀌어 새로 만듭니다.")
+            return
+        for key, entry in data.get("entries", {}).items():
+            self._index(key, entry)
+        self.loaded_from_disk = True
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        payload = {"version": INDEX_VERSION, "num_perm": NUM_PERM, "bands": BANDS, "entries": self._entries}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        except OSError as exc:
+            logger.warning(f"유사 중복 인덱스 저장 실패: {exc}")
+
+    def _index(self, key: str, entry: dict[str, t.Any]) -> None:
+        self._entries[key] = entry
+        for band in _band_keys(entry["fp"]):
+            self._buckets.setdefault(band, set()).add(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for band in _band_keys(entry["fp"]):
+            bucket = self._buckets.get(band)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band]
+
+    def add(self, key: str, fp: Fingerprint, title: str = "") -> None:
+        """지문을 추가한다. 한도를 넘으면 가장 오래된 항목부터 제거한다."""
+        self._remove(key)
+        self._index(key, {"fp": fp, "title": title[:80], "added": int(time.time())})
+        while len(self._entries) > self.max_entries:
+            self._remove(min(self._entries, key=lambda k: self._entries[k]["added"]))
+
+    def add_item(self, key: str, item: t.Mapping[str, t.Any]) -> None:
+        self.add(key, fingerprint(item), str(item.get("title", "")))
+
+    def query(self, fp: Fingerprint) -> tuple[str, float] | None:
+        """임계값 이상으로 가장 비슷한 (키, 유사도)를 반환한다 (없으면 None)."""
+        candidates: set[str] = set()
+        for band in _band_keys(fp):
+            candidates.update(self._buckets.get(band, ()))
+        best: tuple[str, float] | None = None
+        for key in candidates:
+            score = _match_score(fp, self._entries[key]["fp"], self.threshold, self.body_threshold)
+            if score is not None and (best is None or score > best[1]):
+                best = (key, score)
+        return best
+
+    def title_of(self, key: str) -> str:
+        return str(self._entries.get(key, {}).get("title", ""))
+
+    def seed_from_posts(self, posts_dir: Path | str) -> int:
+        """기존 포스트의 front matter(title, summary)로 인덱스를 채운다."""
+        added = 0
+        for path in sorted(Path(posts_dir).rglob("*.md")):
+            try:
+                match = _FRONT_MATTER_RE.match(path.read_text(encoding="utf-8"))
+            except OSError:
+                continue
+            if not match:
+                continue
+            fields: dict[str, str] = {}
+            for line in match.group(1).splitlines():
+                name, sep, value = line.partition(":")
+                if sep and name.strip() in ("title", "summary"):
+                    fields[name.strip()] = value.strip().strip('"')
+            if fields.get("title"):
+                self.add_item(f"post:{path.relative_to(posts_dir).as_posix()}", fields)
+                added += 1
+        return added
+
+
+def collapse_near_duplicates(
+    items: t.Sequence[t.Mapping[str, t.Any]],
+    index: NearDuplicateIndex,
+) -> tuple[list[t.Any], list[tuple[t.Any, str, float]]]:
+    """이미 처리된 항목이나 같은 배치의 앞선 항목과 유사한 항목을 걸러낸다.
+
+    (남길 항목, [(제외된 항목, 비슷한 항목 키, 유사도)])를 반환한다.
+    같은 배치 안에서는 먼저 나온 항목을 남긴다. 인덱스 자체는 바꾸지 않으며,
+    실제로 게시한 항목만 호출자가 add_item()으로 추가한다.
+    """
+    if not index.enabled:
+        return list(items), []
+    batch = NearDuplicateIndex(None, threshold=index.threshold, body_threshold=index.body_threshold)
+    kept: list[t.Any] = []
+    dropped: list[tuple[t.Any, str, float]] = []
+    for item in items:
+        fp = fingerprint(item)
+        match = index.query(fp) or batch.query(fp)
+        if match is not None:
+            dropped.append((item, match[0], match[1]))
+            continue
+        key = str(item.get("guid", "")) or f"batch:{len(kept)}"
+        batch.add(key, fp, str(item.get("title", "")))
+        kept.append(item)
+    return kept, dropped
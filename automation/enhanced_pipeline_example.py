@@ -532,6 +532,8 @@ class EnhancedQAPipeline:
                 else:
                     report += f"- {platform}: ❌ 실패\n"
         
+        report += f"\n## 🧠 MCP 서버 상태\n{self._mcp_status_line()}\n"
+        
         report += f"""
         ## 💡 개선 제안
         - 더 많은 소스에서 콘텐츠 수집 필요
@@ -555,6 +557,18 @@ class EnhancedQAPipeline:
         
         logger.info(f"📊 최종 보고서 생성: {report_path}")
     
+    def _mcp_status_line(self) -> str:
+        """저장된 MCP 서킷 브레이커 상태를 보고서용 한 줄로 만든다."""
+        from automation.mcp_client import mcp_breaker_status
+        
+        circuit = mcp_breaker_status()
+        if circuit is None:
+            return "- 서킷 상태 기록 없음"
+        return (
+            f"- 서킷: {circuit['state']} (연속 실패 {circuit['consecutive_failures']}회, "
+            f"누적 차단 {circuit['total_trips']}회, 재확인까지 {circuit['retry_in_seconds']}초)"
+        )
+    
     def _calculate_avg_quality(self) -> float:
         """평균 품질 점수 계산."""
         return self.quality_metrics.get("average_quality_score", 0.0)
@@ -3,12 +3,15 @@
 import json
 import os
 import re
-from typing import List, Dict, Any, Optional
+import time
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional, AsyncIterator, Callable, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import asyncio
 import aiohttp
 
+from automation.ingestion import CollectorPlugin, IngestionContext, register_collector
 from automation.logger import get_logger
 
 logger = get_logger(__name__)
@@ -29,10 +32,112 @@ class EnhancedContent:
     metadata: Dict[str, Any]
 
 
+class AsyncRateLimiter:
+    """토큰 버킷 방식의 비동기 요청 속도 제한기.
+
+    초당 rate개의 토큰이 채워지고 최대 burst개까지 모아 둘 수 있다.
+    서버가 대기를 요구하면(backoff, X-Ratelimit-Reset) defer()로 새 요청을 잠시 막는다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = self._clock()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def defer(self, seconds: float) -> None:
+        """seconds 동안 새 요청을 막는다."""
+        self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+
+# 소스별 요청 속도 제한 (초당 요청 수, burst). 수집기와 수집 엔진 플러그인이 함께 쓴다.
+RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    "reddit": (1.5, 15),  # OAuth 클라이언트당 분당 100회 (10분 평균)
+    "devto": (3, 5),
+    "stackoverflow": (10, 5),
+}
+
+
+class SharedHTTPSession:
+    """수집기들이 함께 쓰는 aiohttp 세션.
+
+    세션 하나(커넥션 풀)를 재사용하고, 전체 동시 요청 수를 세마포어로 제한한다.
+    소스별 속도 제한은 요청마다 넘기는 AsyncRateLimiter로 적용한다.
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None, timeout: float = 30):
+        self.max_concurrency = max_concurrency or int(os.getenv("ENHANCED_SOURCES_MAX_CONCURRENCY", "8"))
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self._session
+
+    @asynccontextmanager
+    async def request(
+        self, method: str, url: str, *, limiter: Optional[AsyncRateLimiter] = None, **kwargs: Any
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        session = self._ensure_session()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            if limiter is not None:
+                await limiter.acquire()
+            async with session.request(method, url, **kwargs) as response:
+                yield response
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "SharedHTTPSession":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+
+@asynccontextmanager
+async def _session_scope(http: Optional[SharedHTTPSession]) -> AsyncIterator[SharedHTTPSession]:
+    """공유 세션이 있으면 그대로 쓰고, 없으면 이번 호출 동안만 쓸 세션을 만든다."""
+    if http is not None:
+        yield http
+        return
+    async with SharedHTTPSession() as owned:
+        yield owned
+
+
 class RedditCollector:
     """Reddit에서 QA/Testing 관련 포스트 수집."""
     
-    def __init__(self, client_id: str, client_secret: str, user_agent: Optional[str] = None):
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        user_agent: Optional[str] = None,
+        http: Optional[SharedHTTPSession] = None,
+    ):
         self.client_id = client_id
         self.client_secret = client_secret
         self.user_agent = user_agent or os.getenv("REDDIT_USER_AGENT", "QA-Blog-Automation/1.0")
@@ -47,8 +152,10 @@ class RedditCollector:
         ]
         self._access_token: Optional[str] = None
         self._token_expires_at: Optional[datetime] = None
+        self.http = http
+        self.rate_limiter = AsyncRateLimiter(*RATE_LIMITS["reddit"])
     
-    async def _get_access_token(self) -> str:
+    async def _get_access_token(self, http: Optional[SharedHTTPSession] = None) -> str:
         """Reddit OAuth2 액세스 토큰 획득."""
         if self._access_token and self._token_expires_at and datetime.now() < self._token_expires_at:
             return self._access_token
@@ -58,8 +165,9 @@ class RedditCollector:
             "grant_type": "client_credentials"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
+        async with _session_scope(http or self.http) as session:
+            async with session.request(
+                "POST",
                 auth_url,
                 data=auth_data,
                 auth=aiohttp.BasicAuth(self.client_id, self.client_secret),
@@ -74,42 +182,48 @@ class RedditCollector:
                 expires_in = data.get("expires_in", 3600)
                 self._token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
                 return self._access_token
+
+    async def _fetch_listing(
+        self, http: SharedHTTPSession, subreddit: str, url: str, headers: Dict[str, str]
+    ) -> List[Dict[str, Any]]:
+        """subreddit 목록 한 페이지를 가져온다 (실패 시 빈 목록)."""
+        try:
+            async with http.request("GET", url, headers=headers, limiter=self.rate_limiter) as response:
+                remaining = response.headers.get("X-Ratelimit-Remaining")
+                reset = response.headers.get("X-Ratelimit-Reset")
+                if remaining is not None and reset is not None and float(remaining) < 1:
+                    self.rate_limiter.defer(float(reset))
+                if response.status != 200:
+                    logger.warning(f"Subreddit {subreddit} 호출 실패 (상태: {response.status})")
+                    return []
+                data = await response.json()
+                return data.get("data", {}).get("children", [])
+        except Exception as exc:
+            logger.warning(f"Subreddit {subreddit} 수집 실패: {exc}")
+            return []
     
     async def collect(self, limit: int = 50) -> List[EnhancedContent]:
         """Reddit에서 인기 QA 포스트 수집."""
         try:
-            access_token = await self._get_access_token()
             all_posts = []
             
-            async with aiohttp.ClientSession() as session:
+            async with _session_scope(self.http) as http:
+                access_token = await self._get_access_token(http)
                 headers = {
                     "Authorization": f"bearer {access_token}",
                     "User-Agent": self.user_agent
                 }
                 
-                # 각 subreddit에서 hot/top 포스트 수집
+                # 각 subreddit의 hot/top 목록을 동시에 요청 (세마포어/속도 제한 적용)
+                listing_urls = []
                 for subreddit in self.subreddits:
-                    try:
-                        # hot 포스트 수집
-                        url = f"https://oauth.reddit.com/r/{subreddit}/hot.json?limit=25"
-                        async with session.get(url, headers=headers) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                posts = data.get("data", {}).get("children", [])
-                                all_posts.extend(posts)
-                        
-                        # top 포스트 수집
-                        url = f"https://oauth.reddit.com/r/{subreddit}/top.json?limit=25&t=week"
-                        async with session.get(url, headers=headers) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                posts = data.get("data", {}).get("children", [])
-                                all_posts.extend(posts)
-                        
-                        await asyncio.sleep(0.5)  # Rate limit 방지
-                    except Exception as exc:
-                        logger.warning(f"Subreddit {subreddit} 수집 실패: {exc}")
-                        continue
+                    listing_urls.append((subreddit, f"https://oauth.reddit.com/r/{subreddit}/hot.json?limit=25"))
+                    listing_urls.append((subreddit, f"https://oauth.reddit.com/r/{subreddit}/top.json?limit=25&t=week"))
+                listings = await asyncio.gather(
+                    *(self._fetch_listing(http, subreddit, url, headers) for subreddit, url in listing_urls)
+                )
+                for posts in listings:
+                    all_posts.extend(posts)
             
             # 중복 제거 (같은 post ID)
             seen_ids = set()
@@ -198,33 +312,34 @@ class RedditCollector:
 class DevToCollector:
     """Dev.to에서 QA 관련 아티클 수집."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, http: Optional[SharedHTTPSession] = None):
         self.api_key = api_key
         self.base_url = "https://dev.to/api"
+        self.http = http
+        self.rate_limiter = AsyncRateLimiter(*RATE_LIMITS["devto"])
         
+    async def _fetch_tag(self, http: SharedHTTPSession, tag: str) -> List[Dict[str, Any]]:
+        """태그 하나의 인기 아티클 목록을 가져온다 (실패 시 빈 목록)."""
+        try:
+            url = f"{self.base_url}/articles?tag={tag}&top=7"
+            async with http.request("GET", url, limiter=self.rate_limiter) as response:
+                if response.status == 200:
+                    return await response.json()
+                logger.warning(f"Dev.to API 호출 실패 (태그: {tag}, 상태: {response.status})")
+        except Exception as exc:
+            logger.warning(f"Dev.to 태그 {tag} 수집 실패: {exc}")
+        return []
+
     async def collect(self, tags: List[str] = None) -> List[EnhancedContent]:
         """Dev.to에서 QA/Testing 태그 아티클 수집."""
         if not tags:
             tags = ["testing", "qa", "automation", "testautomation", "e2e"]
         
         try:
-            async with aiohttp.ClientSession() as session:
-                articles = []
-                for tag in tags:
-                    try:
-                        url = f"{self.base_url}/articles?tag={tag}&top=7"
-                        async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                articles.extend(data)
-                            else:
-                                logger.warning(f"Dev.to API 호출 실패 (태그: {tag}, 상태: {response.status})")
-                        await asyncio.sleep(0.3)  # Rate limit 방지
-                    except Exception as exc:
-                        logger.warning(f"Dev.to 태그 {tag} 수집 실패: {exc}")
-                        continue
-                
-                return self._parse_articles(articles)
+            async with _session_scope(self.http) as http:
+                pages = await asyncio.gather(*(self._fetch_tag(http, tag) for tag in tags))
+            articles = [article for page in pages for article in page]
+            return self._parse_articles(articles)
         except Exception as exc:
             logger.error(f"Dev.to 수집 중 오류: {exc}", exc_info=True)
             return []
@@ -356,47 +471,54 @@ class TwitterCollector:
 class StackOverflowCollector:
     """Stack Overflow에서 실제 QA 문제와 해결책 수집."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, http: Optional[SharedHTTPSession] = None):
         self.api_url = "https://api.stackexchange.com/2.3"
         self.qa_tags = ["selenium", "cypress", "playwright", "pytest", "testng"]
         self.api_key = api_key or os.getenv("STACKOVERFLOW_API_KEY")
+        self.http = http
+        # IP당 초당 30회 제한보다 보수적으로 설정
+        self.rate_limiter = AsyncRateLimiter(*RATE_LIMITS["stackoverflow"])
     
+    async def _fetch_tag(self, http: SharedHTTPSession, tag: str, from_date: int) -> List[Dict[str, Any]]:
+        """태그 하나의 인기 질문 목록을 가져온다 (실패 시 빈 목록)."""
+        try:
+            params = {
+                "order": "desc",
+                "sort": "votes",
+                "tagged": tag,
+                "site": "stackoverflow",
+                "pagesize": 20,
+                "fromdate": from_date,
+                "filter": "withbody"
+            }
+            
+            if self.api_key:
+                params["key"] = self.api_key
+            
+            url = f"{self.api_url}/questions"
+            async with http.request("GET", url, params=params, limiter=self.rate_limiter) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    # 서버가 backoff(초)를 지정하면 그동안 같은 메서드 호출을 멈춰야 한다.
+                    if data.get("backoff"):
+                        self.rate_limiter.defer(float(data["backoff"]))
+                    return data.get("items", [])
+                error_text = await response.text()
+                logger.warning(f"Stack Overflow API 호출 실패 (태그: {tag}, 상태: {response.status}): {error_text}")
+        except Exception as exc:
+            logger.warning(f"Stack Overflow 태그 {tag} 수집 실패: {exc}")
+        return []
+
     async def collect_top_questions(self, days: int = 7) -> List[EnhancedContent]:
         """최근 인기 QA 관련 질문과 답변 수집."""
         try:
             all_questions = []
             from_date = int((datetime.now() - timedelta(days=days)).timestamp())
             
-            async with aiohttp.ClientSession() as session:
-                for tag in self.qa_tags:
-                    try:
-                        params = {
-                            "order": "desc",
-                            "sort": "votes",
-                            "tagged": tag,
-                            "site": "stackoverflow",
-                            "pagesize": 20,
-                            "fromdate": from_date,
-                            "filter": "withbody"
-                        }
-                        
-                        if self.api_key:
-                            params["key"] = self.api_key
-                        
-                        url = f"{self.api_url}/questions"
-                        async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                questions = data.get("items", [])
-                                all_questions.extend(questions)
-                            else:
-                                error_text = await response.text()
-                                logger.warning(f"Stack Overflow API 호출 실패 (태그: {tag}, 상태: {response.status}): {error_text}")
-                        
-                        await asyncio.sleep(0.3)  # Rate limit 방지
-                    except Exception as exc:
-                        logger.warning(f"Stack Overflow 태그 {tag} 수집 실패: {exc}")
-                        continue
+            async with _session_scope(self.http) as http:
+                pages = await asyncio.gather(*(self._fetch_tag(http, tag, from_date) for tag in self.qa_tags))
+            for questions in pages:
+                all_questions.extend(questions)
             
             # 중복 제거 (같은 question_id)
             seen_ids = set()
@@ -730,177 +852,317 @@ class AIEnhancedAnalyzer:
         }
 
 
+def filter_quality_content(
+    contents: List[EnhancedContent],
+    limit: Optional[int] = 50
+) -> List[EnhancedContent]:
+    """고품질 콘텐츠만 필터링 (limit=None이면 개수 제한 없음)."""
+    filtered = []
+
+    for content in contents:
+        # 품질 점수 계산
+        quality_score = calculate_quality_score(content)
+
+        # 기준 완화: 30점 이상이면 포함 (QA 관련 키워드만 있어도 30점)
+        if quality_score >= 30:
+            content.metadata["quality_score"] = quality_score
+            filtered.append(content)
+
+    # 품질 점수로 정렬
+    filtered.sort(
+        key=lambda x: x.metadata.get("quality_score", 0), 
+        reverse=True
+    )
+
+    return filtered[:limit] if limit is not None else filtered  # 기본 상위 50개만
+
+
+def calculate_quality_score(content: EnhancedContent) -> float:
+    """콘텐츠 품질 점수 계산."""
+    score = 0.0
+
+    # 1. 참여도 (30점)
+    engagement = content.engagement
+    if engagement.get("likes", 0) > 100:
+        score += 20
+    elif engagement.get("likes", 0) > 50:
+        score += 10
+
+    if engagement.get("comments", 0) > 20:
+        score += 10
+    elif engagement.get("comments", 0) > 10:
+        score += 5
+
+    # 2. 콘텐츠 길이와 깊이 (20점)
+    word_count = len(content.content.split())
+    if word_count > 1000:
+        score += 20
+    elif word_count > 500:
+        score += 10
+
+    # 3. 최신성 (20점)
+    # 타임존 문제 해결
+    now = datetime.now(content.published_at.tzinfo) if content.published_at.tzinfo else datetime.now()
+    published = content.published_at if content.published_at.tzinfo else content.published_at.replace(tzinfo=None)
+    if published.tzinfo and not now.tzinfo:
+        now = now.replace(tzinfo=published.tzinfo)
+    elif not published.tzinfo and now.tzinfo:
+        published = published.replace(tzinfo=now.tzinfo)
+    days_old = (now - published).days
+    if days_old <= 7:
+        score += 20
+    elif days_old <= 30:
+        score += 10
+
+    # 4. QA 관련성 (30점)
+    qa_keywords = ["test", "qa", "quality", "automation", "selenium", "cypress", "playwright"]
+    keyword_count = sum(1 for kw in qa_keywords if kw in content.title.lower() or kw in content.content.lower())
+    score += min(30, keyword_count * 5)
+
+    return score
+
+
 class ContentAggregator:
     """모든 소스에서 수집한 콘텐츠를 통합 관리."""
     
     def __init__(self):
-        self.collectors = {
-            "reddit": RedditCollector,
-            "devto": DevToCollector,
-            "medium": MediumCollector,
-            "linkedin": LinkedInCollector,
-            "twitter": TwitterCollector,
-            "stackoverflow": StackOverflowCollector
-        }
+        self.collectors = {name: plugin.collector_class for name, plugin in ENHANCED_PLUGINS.items()}
         self.analyzer = AIEnhancedAnalyzer()
     
     async def aggregate_all_sources(self) -> List[EnhancedContent]:
-        """모든 소스에서 콘텐츠 수집 및 통합."""
-        all_contents = []
-        
-        # 병렬로 모든 소스에서 수집
-        tasks = []
-        for name, collector_class in self.collectors.items():
-            if self._is_collector_configured(name):
-                collector = self._initialize_collector(name, collector_class)
-                if collector:
-                    tasks.append(self._collect_with_error_handling(name, collector))
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"콘텐츠 수집 중 예외 발생: {result}", exc_info=True)
-            elif result:
-                all_contents.extend(result)
-        
-        # 중복 제거 및 품질 필터링
-        return self._filter_quality_content(all_contents)
+        """모든 소스에서 콘텐츠 수집 및 통합 (품질 점수 상위 50개)."""
+        contents = [content async for content in self.stream_all_sources()]
+        contents.sort(key=lambda x: x.metadata.get("quality_score", 0), reverse=True)
+        return contents[:50]
+
+    async def stream_all_sources(
+        self, deadlines: Optional[Dict[str, float]] = None
+    ) -> AsyncIterator[EnhancedContent]:
+        """수집기가 끝나는 순서대로 고품질 콘텐츠를 내보낸다.
+
+        수집기 결과가 도착할 때마다 중복 제거와 품질 점수 계산을 하고, 그 수집기의
+        콘텐츠를 점수 순으로 yield한다. 느린 소스를 기다리지 않고 먼저 끝난 소스의
+        콘텐츠부터 분석을 시작할 수 있다. deadlines(수집기 이름 → 초)를 넘긴 수집기는
+        취소되며, 지정하지 않으면 ENHANCED_SOURCE_DEADLINE_SECONDS(기본값 60초)를 쓴다.
+        """
+        default_deadline = float(os.getenv("ENHANCED_SOURCE_DEADLINE_SECONDS", "60"))
+        deadlines = deadlines or {}
+        seen_keys: set = set()
+
+        # 수집기들이 세션 하나를 공유
+        async with SharedHTTPSession() as http:
+            tasks = []
+            for name, collector_class in self.collectors.items():
+                if self._is_collector_configured(name):
+                    collector = self._initialize_collector(name, collector_class, http)
+                    if collector:
+                        deadline = deadlines.get(name, default_deadline)
+                        tasks.append(asyncio.ensure_future(self._collect_with_deadline(name, collector, deadline)))
+
+            try:
+                for finished in asyncio.as_completed(tasks):
+                    name, contents = await finished
+                    fresh = []
+                    for content in contents:
+                        key = self._content_key(content)
+                        if key not in seen_keys:
+                            seen_keys.add(key)
+                            fresh.append(content)
+                    accepted = self._filter_quality_content(fresh, limit=None)
+                    logger.info(f"{name}: {len(contents)}개 수집, {len(accepted)}개 통과")
+                    for content in accepted:
+                        yield content
+            finally:
+                # 소비자가 중간에 멈추면 남은 수집기를 취소한다.
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _collect_with_deadline(
+        self, name: str, collector: Any, deadline: float
+    ) -> Tuple[str, List[EnhancedContent]]:
+        """마감 시간 안에 끝나지 않은 수집기는 빈 결과로 처리한다."""
+        try:
+            contents = await asyncio.wait_for(self._collect_with_error_handling(name, collector), timeout=deadline)
+        except asyncio.TimeoutError:
+            logger.warning(f"{name} 수집이 {deadline:.0f}초 안에 끝나지 않아 건너뜁니다.")
+            contents = []
+        return name, contents or []
+
+    @staticmethod
+    def _content_key(content: EnhancedContent) -> str:
+        """URL(없으면 소스+제목) 기준 중복 판별 키."""
+        if content.url:
+            return content.url.strip().rstrip("/").lower()
+        return f"{content.source}:{content.title.strip().lower()}"
     
     def _is_collector_configured(self, name: str) -> bool:
         """수집기가 설정되어 있는지 확인."""
-        if name == "reddit":
-            return bool(os.getenv("REDDIT_CLIENT_ID") and os.getenv("REDDIT_CLIENT_SECRET"))
-        elif name == "devto":
-            # Dev.to는 API 키가 없어도 사용 가능
-            return True
-        elif name == "medium":
-            # Medium은 RSS 피드 사용 가능
-            return True
-        elif name == "linkedin":
-            return bool(os.getenv("LINKEDIN_ACCESS_TOKEN"))
-        elif name == "twitter":
-            return bool(os.getenv("TWITTER_BEARER_TOKEN"))
-        elif name == "stackoverflow":
-            # Stack Overflow는 API 키 없이도 사용 가능 (제한적)
-            return True
-        return False
+        plugin = ENHANCED_PLUGINS.get(name)
+        return bool(plugin and plugin().configured())
     
-    def _initialize_collector(self, name: str, collector_class: type) -> Optional[Any]:
+    def _initialize_collector(
+        self, name: str, collector_class: type, http: Optional[SharedHTTPSession] = None
+    ) -> Optional[Any]:
         """수집기 인스턴스 생성."""
         try:
-            if name == "reddit":
-                client_id = os.getenv("REDDIT_CLIENT_ID")
-                client_secret = os.getenv("REDDIT_CLIENT_SECRET")
-                user_agent = os.getenv("REDDIT_USER_AGENT")
-                if client_id and client_secret:
-                    return collector_class(client_id, client_secret, user_agent)
-            elif name == "devto":
-                api_key = os.getenv("DEVTO_API_KEY")
-                return collector_class(api_key)
-            elif name == "medium":
-                return collector_class()
-            elif name == "linkedin":
-                access_token = os.getenv("LINKEDIN_ACCESS_TOKEN")
-                if access_token:
-                    return collector_class(access_token)
-            elif name == "twitter":
-                bearer_token = os.getenv("TWITTER_BEARER_TOKEN")
-                if bearer_token:
-                    return collector_class(bearer_token)
-            elif name == "stackoverflow":
-                api_key = os.getenv("STACKOVERFLOW_API_KEY")
-                return collector_class(api_key)
+            return ENHANCED_PLUGINS[name]().build(http)
         except Exception as exc:
             logger.error(f"{name} 수집기 초기화 실패: {exc}", exc_info=True)
         return None
     
     async def _collect_with_error_handling(self, name: str, collector: Any) -> List[EnhancedContent]:
         """에러 핸들링과 함께 콘텐츠 수집."""
+        plugin = ENHANCED_PLUGINS.get(name)
+        if plugin is None:
+            logger.warning(f"알 수 없는 수집기: {name}")
+            return []
         try:
-            if name == "reddit":
-                return await collector.collect(limit=50)
-            elif name == "devto":
-                return await collector.collect()
-            elif name == "medium":
-                return await collector.collect()
-            elif name == "linkedin":
-                return await collector.collect_posts()
-            elif name == "twitter":
-                return await collector.collect_trending()
-            elif name == "stackoverflow":
-                return await collector.collect_top_questions(days=7)
-            else:
-                logger.warning(f"알 수 없는 수집기: {name}")
-                return []
+            return await plugin().fetch(collector) or []
         except Exception as exc:
             logger.error(f"{name} 수집 중 오류: {exc}", exc_info=True)
             return []
     
     def _filter_quality_content(
         self, 
-        contents: List[EnhancedContent]
+        contents: List[EnhancedContent],
+        limit: Optional[int] = 50
     ) -> List[EnhancedContent]:
-        """고품질 콘텐츠만 필터링."""
-        filtered = []
-        
-        for content in contents:
-            # 품질 점수 계산
-            quality_score = self._calculate_quality_score(content)
-            
-            # 기준 완화: 30점 이상이면 포함 (QA 관련 키워드만 있어도 30점)
-            if quality_score >= 30:
-                content.metadata["quality_score"] = quality_score
-                filtered.append(content)
-        
-        # 품질 점수로 정렬
-        filtered.sort(
-            key=lambda x: x.metadata.get("quality_score", 0), 
-            reverse=True
-        )
-        
-        return filtered[:50]  # 상위 50개만
+        """고품질 콘텐츠만 필터링 (limit=None이면 개수 제한 없음)."""
+        return filter_quality_content(contents, limit)
     
     def _calculate_quality_score(self, content: EnhancedContent) -> float:
         """콘텐츠 품질 점수 계산."""
-        score = 0.0
-        
-        # 1. 참여도 (30점)
-        engagement = content.engagement
-        if engagement.get("likes", 0) > 100:
-            score += 20
-        elif engagement.get("likes", 0) > 50:
-            score += 10
-        
-        if engagement.get("comments", 0) > 20:
-            score += 10
-        elif engagement.get("comments", 0) > 10:
-            score += 5
-        
-        # 2. 콘텐츠 길이와 깊이 (20점)
-        word_count = len(content.content.split())
-        if word_count > 1000:
-            score += 20
-        elif word_count > 500:
-            score += 10
-        
-        # 3. 최신성 (20점)
-        # 타임존 문제 해결
-        now = datetime.now(content.published_at.tzinfo) if content.published_at.tzinfo else datetime.now()
-        published = content.published_at if content.published_at.tzinfo else content.published_at.replace(tzinfo=None)
-        if published.tzinfo and not now.tzinfo:
-            now = now.replace(tzinfo=published.tzinfo)
-        elif not published.tzinfo and now.tzinfo:
-            published = published.replace(tzinfo=now.tzinfo)
-        days_old = (now - published).days
-        if days_old <= 7:
-            score += 20
-        elif days_old <= 30:
-            score += 10
-        
-        # 4. QA 관련성 (30점)
-        qa_keywords = ["test", "qa", "quality", "automation", "selenium", "cypress", "playwright"]
-        keyword_count = sum(1 for kw in qa_keywords if kw in content.title.lower() or kw in content.content.lower())
-        score += min(30, keyword_count * 5)
-        
-        return score
+        return calculate_quality_score(content)
+
+
+class EnhancedSourcePlugin(CollectorPlugin):
+    """enhanced 수집기를 수집 엔진 플러그인으로 감싼다.
+
+    ContentAggregator와 IngestionEngine이 같은 설정 확인/생성/수집 로직을 쓴다.
+    엔진에서 실행할 때는 실행 단위로 공유하는 aiohttp 세션을 쓴다. 선언한 속도
+    제한(rate_limit)은 수집기가 RATE_LIMITS로 직접 적용한다.
+    """
+
+    group = "enhanced"
+    blocking = False
+    collector_class: type = object
+    required_env: Tuple[str, ...] = ()
+
+    @property
+    def deadline(self) -> float:  # type: ignore[override]
+        return float(os.getenv("ENHANCED_SOURCE_DEADLINE_SECONDS", "60"))
+
+    def configured(self) -> bool:
+        return all(os.getenv(name) for name in self.required_env)
+
+    def is_configured(self, ctx: IngestionContext) -> bool:
+        return self.configured()
+
+    def build(self, http: Optional[SharedHTTPSession] = None) -> Any:
+        return self.collector_class()
+
+    async def fetch(self, collector: Any) -> List[EnhancedContent]:
+        return await collector.collect()
+
+    async def collect_async(self, ctx: IngestionContext) -> List[Dict[str, str]]:
+        collector = self.build(ctx.shared("enhanced_http", SharedHTTPSession))
+        contents = await self.fetch(collector) or []
+        return [content_to_item(content) for content in filter_quality_content(contents, limit=None)]
+
+
+def content_to_item(content: EnhancedContent) -> Dict[str, str]:
+    """EnhancedContent를 FeedItem 형태로 바꾼다."""
+    return {
+        "guid": f"{content.source}:{content.url or content.title}",
+        "title": content.title,
+        "link": content.url,
+        "summary": content.content[:2000],
+        "published_at": content.published_at.isoformat(),
+    }
+
+
+@register_collector
+class RedditPlugin(EnhancedSourcePlugin):
+    name = "reddit"
+    collector_class = RedditCollector
+    required_env = ("REDDIT_CLIENT_ID", "REDDIT_CLIENT_SECRET")
+    cost = 8  # 토큰 1회 + 서브레딧 7개
+    rate_limit = RATE_LIMITS["reddit"]
+
+    def build(self, http: Optional[SharedHTTPSession] = None) -> Any:
+        return RedditCollector(
+            os.getenv("REDDIT_CLIENT_ID", ""),
+            os.getenv("REDDIT_CLIENT_SECRET", ""),
+            os.getenv("REDDIT_USER_AGENT"),
+            http=http,
+        )
+
+    async def fetch(self, collector: Any) -> List[EnhancedContent]:
+        return await collector.collect(limit=50)
+
+
+@register_collector
+class DevToPlugin(EnhancedSourcePlugin):
+    name = "devto"
+    collector_class = DevToCollector
+    cost = 5  # 태그 5개
+    rate_limit = RATE_LIMITS["devto"]
+
+    def build(self, http: Optional[SharedHTTPSession] = None) -> Any:
+        return DevToCollector(os.getenv("DEVTO_API_KEY"), http=http)
+
+
+@register_collector
+class MediumPlugin(EnhancedSourcePlugin):
+    name = "medium"
+    collector_class = MediumCollector
+    cost = 0
+
+
+@register_collector
+class LinkedInPlugin(EnhancedSourcePlugin):
+    name = "linkedin"
+    collector_class = LinkedInCollector
+    required_env = ("LINKEDIN_ACCESS_TOKEN",)
+    cost = 0
+
+    def build(self, http: Optional[SharedHTTPSession] = None) -> Any:
+        return LinkedInCollector(os.getenv("LINKEDIN_ACCESS_TOKEN", ""))
+
+    async def fetch(self, collector: Any) -> List[EnhancedContent]:
+        return await collector.collect_posts()
+
+
+@register_collector
+class TwitterPlugin(EnhancedSourcePlugin):
+    name = "twitter"
+    collector_class = TwitterCollector
+    required_env = ("TWITTER_BEARER_TOKEN",)
+    cost = 0
+
+    def build(self, http: Optional[SharedHTTPSession] = None) -> Any:
+        return TwitterCollector(os.getenv("TWITTER_BEARER_TOKEN", ""))
+
+    async def fetch(self, collector: Any) -> List[EnhancedContent]:
+        return await collector.collect_trending()
+
+
+@register_collector
+class StackOverflowPlugin(EnhancedSourcePlugin):
+    name = "stackoverflow"
+    collector_class = StackOverflowCollector
+    cost = 5  # 태그 5개 (키 없이 하루 300회)
+    rate_limit = RATE_LIMITS["stackoverflow"]
+
+    def build(self, http: Optional[SharedHTTPSession] = None) -> Any:
+        return StackOverflowCollector(os.getenv("STACKOVERFLOW_API_KEY"), http=http)
+
+    async def fetch(self, collector: Any) -> List[EnhancedContent]:
+        return await collector.collect_top_questions(days=7)
+
+
+ENHANCED_PLUGINS: Dict[str, type] = {
+    plugin.name: plugin
+    for plugin in (RedditPlugin, DevToPlugin, MediumPlugin, LinkedInPlugin, TwitterPlugin, StackOverflowPlugin)
+}
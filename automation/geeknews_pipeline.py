@@ -47,16 +47,48 @@ except ImportError:
 try:  # pragma: no cover - 런타임에서만 필요
     from .qa_generator import QAContentGenerator, QAResult
     from .content_filter import ContentFilter, ContentMetrics
+    from .relevance_classifier import load_classifier, min_relevance_from_env
+    from .related_posts import build_related_posts
+    from .search_index import SearchIndex
+    from .posts_manifest import PostsManifest
     from .web_researcher import WebResearcher, ResearchResult
     from .config import Config
+    from .dedupe import NearDuplicateIndex, collapse_near_duplicates
+    from .url_canonical import CanonicalUrlIndex
+    from .ingestion import CollectResult, CollectorPlugin, IngestionContext, IngestionEngine, register_collector
     from .sources import youtube_collector, gmail_collector
+    from .sources.youtube_quota import (
+        CollectionTask,
+        QuotaLedger,
+        QuotaPlanner,
+        channel_task_cost,
+        is_quota_exceeded_error,
+        keyword_task_cost,
+        watchlist_task_cost,
+    )
     from .logger import get_logger
 except ImportError:  # pragma: no cover - 스크립트 직접 실행 대비
     from qa_generator import QAContentGenerator, QAResult
     from content_filter import ContentFilter, ContentMetrics
+    from relevance_classifier import load_classifier, min_relevance_from_env
+    from related_posts import build_related_posts
+    from search_index import SearchIndex
+    from posts_manifest import PostsManifest
     from web_researcher import WebResearcher, ResearchResult
     from config import Config
+    from dedupe import NearDuplicateIndex, collapse_near_duplicates
+    from url_canonical import CanonicalUrlIndex
+    from ingestion import CollectResult, CollectorPlugin, IngestionContext, IngestionEngine, register_collector
     from sources import youtube_collector, gmail_collector
+    from sources.youtube_quota import (
+        CollectionTask,
+        QuotaLedger,
+        QuotaPlanner,
+        channel_task_cost,
+        is_quota_exceeded_error,
+        keyword_task_cost,
+        watchlist_task_cost,
+    )
     from logger import get_logger
 
 logger = get_logger(__name__)
@@ -68,6 +100,8 @@ if not REQUESTS_AVAILABLE:
 DEFAULT_FEED_URL = "https://feeds.feedburner.com/geeknews-feed"
 STATE_DIR = Path("data")
 STATE_FILE = STATE_DIR / "geeknews_state.json"
+NEAR_DUPLICATE_INDEX_FILE = STATE_DIR / "near_duplicate_index.json"
+CANONICAL_URL_INDEX_FILE = STATE_DIR / "canonical_urls.json"
 POSTS_DIR = Path("_posts")
 DEFAULT_MAX_POSTS = 10
 DEFAULT_MIN_VOTES = 10
@@ -249,8 +283,32 @@ def save_state(processed: set[str], path: Path = STATE_FILE) -> None:
         json.dump(payload, fp, ensure_ascii=False, indent=2)
 
 
-def select_new_items(items: list[FeedItem], processed: set[str]) -> list[FeedItem]:
-    return [item for item in items if item["guid"] not in processed]
+def select_new_items(
+    items: list[FeedItem],
+    processed: set[str],
+    url_index: CanonicalUrlIndex | None = None,
+) -> list[FeedItem]:
+    """처리되지 않은 항목만 고른다.
+
+    url_index가 주어지면 정규 URL이 이미 처리되었거나 같은 배치에서 먼저 나온 항목도
+    제외한다. 정규 URL은 canonical_url에 담고, link는 원래 URL(리디렉터 링크는 최종 URL)로 둔다.
+    """
+    if url_index is None:
+        return [item for item in items if item["guid"] not in processed]
+    selected: list[FeedItem] = []
+    seen: set[str] = set()
+    for item in items:
+        if item["guid"] in processed:
+            continue
+        key = url_index.key(item["link"])
+        if key is not None:
+            if key in processed or key in seen:
+                continue
+            seen.add(key)
+            link = url_index.resolve(item["link"])
+            item = t.cast(FeedItem, {**item, "link": link, "canonical_url": key})
+        selected.append(item)
+    return selected
 
 
 def ensure_posts_dir(path: Path = POSTS_DIR) -> None:
@@ -262,7 +320,9 @@ def write_post(
     qa_result: QAResult, 
     metrics: ContentMetrics | None = None,
     *, 
-    timezone: dt.tzinfo | None = None
+    timezone: dt.tzinfo | None = None,
+    search_index: SearchIndex | None = None,
+    manifest: PostsManifest | None = None,
 ) -> Path:
     ensure_posts_dir()
     published_dt = parse_pubdate(item.get("published_at"))
@@ -291,6 +351,9 @@ def write_post(
         category_name = "Learning"
     
     slug = slugify(item["title"])
+    if manifest is not None:
+        # 한글 제목은 슬러그가 비어 "geeknews"로 겹치기 쉬우므로 같은 날짜의 다른 포스트와 구분한다.
+        slug = manifest.unique_slug(f"{published_dt:%Y-%m-%d}", slug, guid=item["guid"])
     filename = f"{published_dt:%Y-%m-%d}-{slug}.md"
     
     # 타겟 카테고리별 디렉토리에 저장
@@ -464,6 +527,16 @@ def write_post(
     with filepath.open("w", encoding="utf-8") as fp:
         fp.write(content)
 
+    if manifest is not None:
+        manifest.record(filepath, guid=item["guid"], content=content)
+
+    # 검색 인덱스는 이 포스트의 토큰이 속한 샤드만 다시 쓴다.
+    if search_index is not None:
+        try:
+            search_index.add_post(filepath, POSTS_DIR)
+        except Exception as exc:
+            logger.warning(f"검색 인덱스 갱신 실패: {exc}", exc_info=True)
+
     return filepath
 
 
@@ -492,182 +565,329 @@ def slugify(value: str) -> str:
     return slug or "geeknews"
 
 
+def _research_item(web_researcher: WebResearcher | None, item: FeedItem) -> ResearchResult | None:
+    """웹 연구를 수행한다. 실패하면 None을 반환한다."""
+    if not web_researcher:
+        return None
+    logger.debug("웹 연구 수행 중...")
+    try:
+        research_data = web_researcher.research(
+            item["title"], 
+            item.get("summary", ""), 
+            item["link"]
+        )
+        logger.debug(f"웹 검색 결과: {len(research_data.web_results)}개")
+        logger.debug(f"전문가 의견: {len(research_data.expert_opinions)}개")
+        return research_data
+    except Exception as exc:
+        logger.warning(f"웹 연구 실패: {exc}", exc_info=True)
+        return None
+
+
+def _generate_sequential(
+    generator: QAContentGenerator,
+    web_researcher: WebResearcher | None,
+    filtered_items: list[tuple[FeedItem, ContentMetrics]],
+) -> t.Iterator[tuple[FeedItem, ContentMetrics, QAResult]]:
+    """항목별로 웹 연구 후 QA 콘텐츠를 생성한다."""
+    for i, (item, metrics) in enumerate(filtered_items, 1):
+        logger.info(f"[{i}/{len(filtered_items)}] 처리 중: {item['title']}")
+        research_data = _research_item(web_researcher, item)
+        
+        # QA 콘텐츠 생성
+        logger.debug("AI 기반 QA 콘텐츠 생성 중...")
+        try:
+            qa_result = generator.generate(item, research_data=research_data)
+            logger.info(f"생성 완료 (인사이트: {len(qa_result.qa_engineer_insights)}개)")
+        except Exception as exc:
+            logger.error(f"생성 실패: {exc}", exc_info=True)
+            continue
+        yield item, metrics, qa_result
+
+
+def _generate_batch(
+    generator: QAContentGenerator,
+    web_researcher: WebResearcher | None,
+    filtered_items: list[tuple[FeedItem, ContentMetrics]],
+) -> t.Iterator[tuple[FeedItem, ContentMetrics, QAResult]]:
+    """모든 항목을 Batch API로 한 번에 제출하고 결과를 돌려준다 (백필용)."""
+    research_list = [_research_item(web_researcher, item) for item, _ in filtered_items]
+    logger.info(f"배치 모드: {len(filtered_items)}개 항목을 Batch API로 제출합니다 (완료까지 대기).")
+    qa_results = generator.generate_batch([item for item, _ in filtered_items], research_list)
+    for (item, metrics), qa_result in zip(filtered_items, qa_results):
+        yield item, metrics, qa_result
+
+
+def _youtube_tasks(channel_states: dict[str, dict[str, t.Any]]) -> list[CollectionTask]:
+    """설정된 채널/워치리스트/키워드 그룹을 쿼터 비용이 붙은 수집 작업으로 만든다."""
+    tasks: list[CollectionTask] = []
+    
+    # 1. 채널 기반 수집 (우선순위 높음)
+    if Config.YOUTUBE_CHANNELS_ENABLED:
+        for ch in Config.load_channels():
+            ch_id = ch.get("id", "")
+            cached = bool(channel_states.get(ch_id, {}).get("uploads_playlist_id"))
+            tasks.append(CollectionTask(f"channel:{ch_id}", channel_task_cost(cached), ch.get("priority", "medium"), ch))
+    
+    # 2. 워치리스트 기반 수집
+    if Config.YOUTUBE_WATCHLIST_ENABLED:
+        watchlist = Config.load_watchlist()
+        video_count = sum(1 for item in watchlist if item.get("video_id"))
+        if video_count:
+            tasks.append(CollectionTask("watchlist", watchlist_task_cost(video_count), "high", watchlist))
+    
+    # 3. 키워드 기반 수집
+    if Config.YOUTUBE_KEYWORD_GROUPS_ENABLED:
+        for grp in Config.load_keyword_groups():
+            if grp.get("keywords"):
+                tasks.append(CollectionTask(
+                    f"keywords:{grp.get('name', 'Unknown')}", keyword_task_cost(), grp.get("priority", "medium"), grp
+                ))
+    else:
+        # 기존 방식: 단일 키워드 문자열 사용
+        tasks.append(CollectionTask("keywords:default", keyword_task_cost(), "medium"))
+    
+    return tasks
+
+
+def _discover_youtube_task(
+    task: CollectionTask,
+    channel_states: dict[str, dict[str, t.Any]],
+    quota: QuotaLedger,
+) -> list[str]:
+    """수집 작업 하나의 비디오 ID만 찾는다 (상세 정보는 모든 작업을 모아 한 번에 조회)."""
+    if task.source.startswith("channel:"):
+        ch = task.payload
+        ch_id = ch.get("id", "")
+        video_ids = youtube_collector.channel_video_ids(
+            api_key=Config.YOUTUBE_API_KEY,
+            channel_id=ch_id,
+            max_results=Config.YOUTUBE_MAX_RESULTS,
+            published_after_days=Config.YOUTUBE_PUBLISHED_AFTER_DAYS,
+            channel_state=channel_states.setdefault(ch_id, {}),
+            quota=quota,
+        )
+        logger.info(f"{ch.get('name', 'Unknown')}: {len(video_ids)}개")
+        return video_ids
+    
+    if task.source == "watchlist":
+        video_ids = [item.get("video_id", "") for item in task.payload if item.get("video_id")]
+        logger.info(f"워치리스트: {len(video_ids)}개")
+        return video_ids
+    
+    grp = task.payload
+    keywords = Config.YOUTUBE_KEYWORDS if grp is None else ", ".join(grp.get("keywords", []))
+    video_ids = youtube_collector.search_video_ids(
+        api_key=Config.YOUTUBE_API_KEY,
+        keywords=keywords,
+        max_results=Config.YOUTUBE_MAX_RESULTS,
+        region_code=Config.YOUTUBE_REGION_CODE,
+        published_after_days=Config.YOUTUBE_PUBLISHED_AFTER_DAYS,
+        quota=quota,
+    )
+    if grp is None:
+        logger.info(f"키워드 검색: {len(video_ids)}개")
+    else:
+        logger.info(f"{grp.get('name', 'Unknown')} ({grp.get('category', 'learning')}): {len(video_ids)}개")
+    return video_ids
+
+
+def _youtube_task_items(
+    task: CollectionTask,
+    video_ids: list[str],
+    index: t.Mapping[str, dict[str, t.Any]],
+) -> list[dict[str, t.Any]]:
+    """상세 정보 인덱스에서 작업의 항목을 꺼내 작업별 메타데이터를 붙인다."""
+    items = [dict(index[vid]) for vid in video_ids if vid in index]
+    
+    if task.source == "watchlist":
+        # 시리즈 메타데이터 추가 (비디오 ID → 워치리스트 항목)
+        watchlist_by_id = {wl_item.get("video_id"): wl_item for wl_item in task.payload}
+        for vid in items:
+            vid["source"] = "youtube_watchlist"
+            wl_item = watchlist_by_id.get(vid["guid"].replace("youtube:", ""), {})
+            if wl_item.get("series"):
+                vid["series"] = wl_item.get("series")
+            if wl_item.get("series_order"):
+                vid["series_order"] = wl_item.get("series_order")
+    elif task.source.startswith("keywords:") and task.payload is not None:
+        # 각 비디오에 카테고리 메타데이터 추가
+        for vid in items:
+            vid["category"] = task.payload.get("category", "learning")
+            vid["keyword_group"] = task.payload.get("name", "Unknown")
+    
+    return items
+
+
+def _collect_youtube() -> CollectResult:
+    """쿼터 계획에 따라 YouTube 채널/워치리스트/키워드 작업을 실행한다.
+
+    채널 워터마크는 바로 저장하지 않고 commit으로 돌려준다. 상세 조회에 실패하면
+    새 워터마크는 버리고, 처리하지 못한 영상(retry)이 있으면 채널별로 그 영상 직전까지만
+    옮겨 다음 실행에서 같은 영상을 다시 찾는다.
+    """
+    yt_all_raw = []
+
+    # 일일 쿼터를 하루의 남은 실행 횟수로 나눠 우선순위/과거 수확량 순으로 작업을 고른다.
+    quota_ledger = QuotaLedger(Config.YOUTUBE_QUOTA_FILE, Config.YOUTUBE_DAILY_QUOTA)
+    planner = QuotaPlanner(quota_ledger, runs_per_day=Config.YOUTUBE_RUNS_PER_DAY)
+    # 업로드 재생목록 ID와 채널별 워터마크 (마지막 영상 ID/게시 시각)
+    channel_states = youtube_collector.load_channel_state(Config.YOUTUBE_CHANNEL_STATE_FILE)
+    selected_tasks, deferred_tasks = planner.plan(_youtube_tasks(channel_states))
+    logger.info(
+        f"YouTube 쿼터: 오늘 {quota_ledger.used()}/{quota_ledger.daily_limit} 사용, "
+        f"이번 실행 예산 {planner.run_budget()} → 작업 {len(selected_tasks)}개 실행, {len(deferred_tasks)}개 연기"
+    )
+    if deferred_tasks:
+        logger.debug(f"연기된 작업: {', '.join(task.source for task in deferred_tasks)}")
+
+    discovered: list[tuple[CollectionTask, list[str]]] = []
+    # 수확량은 이미 처리했거나 이번 실행의 앞선 작업이 찾은 영상을 뺀 새 영상 수로 센다.
+    # (키워드 검색/워치리스트는 매번 같은 영상을 돌려주므로 찾은 ID 수로는 줄지 않는다)
+    known_guids = set(load_state())
+    for task in selected_tasks:
+        try:
+            video_ids = _discover_youtube_task(task, channel_states, quota_ledger)
+        except Exception as exc:
+            logger.warning(f"{task.source} 수집 실패: {exc}", exc_info=True)
+            if is_quota_exceeded_error(exc):
+                logger.error("YouTube 일일 쿼터가 소진되어 남은 수집을 중단합니다.")
+                break
+            continue
+        new_guids = {f"youtube:{vid}" for vid in video_ids} - known_guids
+        known_guids.update(new_guids)
+        quota_ledger.record_yield(task.source, len(new_guids))
+        discovered.append((task, video_ids))
+
+    # 모든 경로의 비디오 ID를 모아 중복을 제거하고 50개 단위로 한 번에 상세 조회한다.
+    all_video_ids = [vid for _, video_ids in discovered for vid in video_ids]
+    video_index: dict[str, dict[str, t.Any]] = {}
+    details_ok = False
+    try:
+        video_index = youtube_collector.fetch_video_details(
+            api_key=Config.YOUTUBE_API_KEY,
+            video_ids=all_video_ids,
+            fetch_transcripts=False,
+            quota=quota_ledger,
+        )
+        details_ok = True
+        logger.info(f"YouTube 상세 조회: ID {len(all_video_ids)}개 → 고유 {len(video_index)}개")
+    except Exception as exc:
+        logger.error(f"YouTube 상세 조회 실패: {exc}", exc_info=True)
+    for task, video_ids in discovered:
+        yt_all_raw.extend(_youtube_task_items(task, video_ids, video_index))
+    # 쿼터 사용량은 이미 소비한 단위이므로 결과 처리와 관계없이 바로 기록한다.
+    quota_ledger.save()
+
+    # 4. 중복 제거 (guid 기준)
+    seen_guids = set()
+    yt_items = []
+    for it in yt_all_raw:
+        guid = it.get("guid", "")
+        if guid and guid not in seen_guids:
+            seen_guids.add(guid)
+            yt_items.append(FeedItem(
+                guid=guid,
+                title=it.get("title", ""),
+                link=it.get("link", ""),
+                summary=it.get("summary", ""),
+                published_at=it.get("published_at", "")
+            ))
+
+    logger.info(f"YouTube 총 {len(yt_items)}개 (중복 제거 후)")
+
+    def commit(retry: t.AbstractSet[str]) -> None:
+        retry_ids = {guid[len("youtube:"):] for guid in retry if guid.startswith("youtube:")}
+        for state in channel_states.values():
+            youtube_collector.commit_watermark(state, apply=details_ok, retry=retry_ids)
+        youtube_collector.save_channel_state(channel_states, Config.YOUTUBE_CHANNEL_STATE_FILE)
+
+    return CollectResult(yt_items, commit)
+
+
+@register_collector
+class RssFeedPlugin(CollectorPlugin):
+    """GeekNews RSS 피드."""
+
+    name = "rss"
+    cost = 1
+
+    def collect_sync(self, ctx: IngestionContext) -> list[FeedItem]:
+        return fetch_feed(ctx.options.get("feed_url", DEFAULT_FEED_URL))
+
+
+@register_collector
+class YouTubePlugin(CollectorPlugin):
+    """YouTube 채널/워치리스트/키워드 검색 (일일 쿼터 계획 적용)."""
+
+    name = "youtube"
+    deadline = 180.0
+
+    def is_configured(self, ctx: IngestionContext) -> bool:
+        return bool(getattr(Config, "YOUTUBE_API_KEY", None) and youtube_collector)
+
+    def estimated_cost(self, ctx: IngestionContext) -> int:
+        ledger = QuotaLedger(Config.YOUTUBE_QUOTA_FILE, Config.YOUTUBE_DAILY_QUOTA)
+        return QuotaPlanner(ledger, runs_per_day=Config.YOUTUBE_RUNS_PER_DAY).run_budget()
+
+    def collect_sync(self, ctx: IngestionContext) -> CollectResult:
+        return _collect_youtube()
+
+
+@register_collector
+class GmailPlugin(CollectorPlugin):
+    """Gmail 뉴스레터 라벨 (토큰 파일이 있을 때만)."""
+
+    name = "gmail"
+    cost = 60  # history.list + 메타데이터/본문 배치 조회 (Gmail 쿼터 단위)
+
+    def is_configured(self, ctx: IngestionContext) -> bool:
+        token_file = getattr(Config, "GOOGLE_TOKEN_FILE", None)
+        return bool(gmail_collector and token_file and Path(token_file).exists())
+
+    def collect_sync(self, ctx: IngestionContext) -> CollectResult:
+        # 라벨별 historyId로 지난 실행 이후 도착한 메일만 조회한다.
+        gmail_states = gmail_collector.load_sync_state(Config.GMAIL_SYNC_STATE_FILE)
+        gm_raw = gmail_collector.collect(
+            client_secret_file=Config.GOOGLE_CLIENT_SECRET_FILE,
+            token_file=Config.GOOGLE_TOKEN_FILE,
+            label=Config.GMAIL_LABEL,
+            max_results=10,
+            sync_state=gmail_states.setdefault(Config.GMAIL_LABEL, {}),
+            seen_guids=load_state(),
+        )
+        def commit(retry: t.AbstractSet[str]) -> None:
+            # 처리하지 못한 메일이 있으면 historyId를 옮기지 않아 다음 실행에서 다시 받는다.
+            if any(item["guid"] in retry for item in gm_raw):
+                logger.warning("처리하지 못한 Gmail 항목이 있어 historyId를 유지합니다.")
+                return
+            gmail_collector.save_sync_state(gmail_states, Config.GMAIL_SYNC_STATE_FILE)
+
+        return CollectResult(gm_raw, commit)
+
+
 def run_pipeline(
     max_posts: int, 
     feed_url: str, 
     timezone: dt.tzinfo | None,
     enable_web_research: bool = DEFAULT_ENABLE_WEB_RESEARCH,
     enable_scraping: bool = DEFAULT_ENABLE_SCRAPING,
-    min_votes: int = DEFAULT_MIN_VOTES
+    min_votes: int = DEFAULT_MIN_VOTES,
+    batch_mode: bool = False,
 ) -> list[Path]:
     logger.info("=" * 80)
     logger.info("GeekNews QA 전문가급 자동화 파이프라인 시작")
     logger.info("=" * 80)
     
-    # 1. 소스 수집 (RSS/YouTube/Gmail)
+    # 1. 소스 수집 (RSS/YouTube/Gmail, 설정 시 enhanced 소스) — 모든 수집기를 동시에 실행
     logger.info("[1단계] 소스 수집 중...")
-    items: list[FeedItem] = []
-    try:
-        rss_items = fetch_feed(feed_url)
-        logger.info(f"RSS {len(rss_items)}개")
-        items.extend(rss_items)
-    except Exception as exc:
-        logger.error(f"RSS 피드 수집 실패: {exc}", exc_info=True)
-
-    # YouTube
-    if getattr(Config, "YOUTUBE_API_KEY", None) and youtube_collector:
-        yt_all_raw = []
-        
-        # 1. 채널 기반 수집 (우선순위 높음)
-        if Config.YOUTUBE_CHANNELS_ENABLED:
-            try:
-                channels = Config.load_channels()
-                if channels:
-                    logger.info(f"활성 채널 {len(channels)}개에서 수집 중...")
-                    for ch in channels:
-                        ch_id = ch.get("id", "")
-                        ch_name = ch.get("name", "Unknown")
-                        try:
-                            ch_videos = youtube_collector.collect_from_channel(
-                                api_key=Config.YOUTUBE_API_KEY,
-                                channel_id=ch_id,
-                                max_results=Config.YOUTUBE_MAX_RESULTS,
-                                published_after_days=Config.YOUTUBE_PUBLISHED_AFTER_DAYS,
-                            )
-                            logger.info(f"{ch_name}: {len(ch_videos)}개")
-                            yt_all_raw.extend(ch_videos)
-                        except Exception as ch_exc:
-                            logger.warning(f"{ch_name} 수집 실패: {ch_exc}", exc_info=True)
-            except Exception as exc:
-                logger.error(f"채널 수집 실패: {exc}", exc_info=True)
-        
-        # 2. 워치리스트 기반 수집
-        if Config.YOUTUBE_WATCHLIST_ENABLED:
-            try:
-                watchlist = Config.load_watchlist()
-                if watchlist:
-                    video_ids = [item.get("video_id", "") for item in watchlist if item.get("video_id")]
-                    if video_ids:
-                        logger.info(f"워치리스트 {len(video_ids)}개에서 수집 중...")
-                        wl_videos = youtube_collector.collect_from_watchlist(
-                            api_key=Config.YOUTUBE_API_KEY,
-                            video_ids=video_ids
-                        )
-                        # 시리즈 메타데이터 추가
-                        for vid in wl_videos:
-                            video_id = vid.get("guid", "").replace("youtube:", "")
-                            # 워치리스트에서 해당 비디오의 메타데이터 찾기
-                            for wl_item in watchlist:
-                                if wl_item.get("video_id") == video_id:
-                                    if wl_item.get("series"):
-                                        vid["series"] = wl_item.get("series")
-                                    if wl_item.get("series_order"):
-                                        vid["series_order"] = wl_item.get("series_order")
-                                    break
-                        
-                        logger.info(f"워치리스트: {len(wl_videos)}개")
-                        yt_all_raw.extend(wl_videos)
-            except Exception as exc:
-                logger.error(f"워치리스트 수집 실패: {exc}", exc_info=True)
-        
-        # 3. 키워드 기반 수집
-        if Config.YOUTUBE_KEYWORD_GROUPS_ENABLED:
-            # 키워드 그룹별로 수집
-            try:
-                keyword_groups = Config.load_keyword_groups()
-                if keyword_groups:
-                    logger.info(f"키워드 그룹 {len(keyword_groups)}개에서 수집 중...")
-                    for grp in keyword_groups:
-                        grp_name = grp.get("name", "Unknown")
-                        grp_category = grp.get("category", "learning")
-                        keywords = grp.get("keywords", [])
-                        
-                        if not keywords:
-                            continue
-                        
-                        try:
-                            # 키워드 리스트를 쉼표로 연결
-                            keywords_str = ", ".join(keywords)
-                            grp_videos = youtube_collector.collect(
-                                api_key=Config.YOUTUBE_API_KEY,
-                                keywords=keywords_str,
-                                max_results=Config.YOUTUBE_MAX_RESULTS,
-                                region_code=Config.YOUTUBE_REGION_CODE,
-                                published_after_days=Config.YOUTUBE_PUBLISHED_AFTER_DAYS,
-                            )
-                            # 각 비디오에 카테고리 메타데이터 추가
-                            for vid in grp_videos:
-                                vid["category"] = grp_category
-                                vid["keyword_group"] = grp_name
-                            
-                            logger.info(f"{grp_name} ({grp_category}): {len(grp_videos)}개")
-                            yt_all_raw.extend(grp_videos)
-                        except Exception as grp_exc:
-                            logger.warning(f"{grp_name} 수집 실패: {grp_exc}", exc_info=True)
-            except Exception as exc:
-                logger.error(f"키워드 그룹 수집 실패: {exc}", exc_info=True)
-        else:
-            # 기존 방식: 단일 키워드 문자열 사용
-            try:
-                yt_kw_raw = youtube_collector.collect(
-                    api_key=Config.YOUTUBE_API_KEY,
-                    keywords=Config.YOUTUBE_KEYWORDS,
-                    max_results=Config.YOUTUBE_MAX_RESULTS,
-                    region_code=Config.YOUTUBE_REGION_CODE,
-                    published_after_days=Config.YOUTUBE_PUBLISHED_AFTER_DAYS,
-                )
-                logger.info(f"키워드 검색: {len(yt_kw_raw)}개")
-                yt_all_raw.extend(yt_kw_raw)
-            except Exception as exc:
-                logger.error(f"키워드 수집 실패: {exc}", exc_info=True)
-        
-        # 4. 중복 제거 (guid 기준)
-        seen_guids = set()
-        yt_items = []
-        for it in yt_all_raw:
-            guid = it.get("guid", "")
-            if guid and guid not in seen_guids:
-                seen_guids.add(guid)
-                yt_items.append(FeedItem(
-                    guid=guid,
-                    title=it.get("title", ""),
-                    link=it.get("link", ""),
-                    summary=it.get("summary", ""),
-                    published_at=it.get("published_at", "")
-                ))
-        
-        logger.info(f"YouTube 총 {len(yt_items)}개 (중복 제거 후)")
-        items.extend(yt_items)
-
-    # Gmail (토큰 파일이 존재할 때만 시도)
-    from pathlib import Path as _P
-    if gmail_collector and getattr(Config, "GOOGLE_TOKEN_FILE", None) and _P(Config.GOOGLE_TOKEN_FILE).exists():
-        try:
-            gm_raw = gmail_collector.collect(
-                client_secret_file=Config.GOOGLE_CLIENT_SECRET_FILE,
-                token_file=Config.GOOGLE_TOKEN_FILE,
-                label=Config.GMAIL_LABEL,
-                max_results=10,
-            )
-            gm_items = [
-                FeedItem(
-                    guid=it.get("guid", ""),
-                    title=it.get("title", ""),
-                    link=it.get("link", ""),
-                    summary=it.get("summary", ""),
-                    published_at=it.get("published_at", "")
-                ) for it in gm_raw
-            ]
-            logger.info(f"Gmail {len(gm_items)}개")
-            items.extend(gm_items)
-        except Exception as exc:
-            logger.error(f"Gmail 수집 실패: {exc}", exc_info=True)
-    else:
-        logger.info("Gmail: 토큰 파일 없음으로 건너뜀")
+    engine = IngestionEngine(options={"feed_url": feed_url})
+    items: list[FeedItem] = t.cast(list[FeedItem], engine.run())
 
     logger.info(f"통합 {len(items)}개 항목 수집 완료")
     if not items:
         logger.warning("수집된 항목이 없습니다.")
+        engine.commit_state()
         return []
     
     # 수집된 RSS 피드 항목 상세 출력
@@ -690,7 +910,22 @@ def run_pipeline(
         if len(processed) > 5:
             logger.debug(f"... 외 {len(processed) - 5}개 항목")
     
-    new_items = select_new_items(items, processed)
+    # 추적 파라미터/리디렉트만 다른 같은 링크는 정규 URL로 비교한다.
+    url_index = CanonicalUrlIndex.from_env(CANONICAL_URL_INDEX_FILE)
+    new_items = select_new_items(items, processed, url_index)
+    
+    # 소스마다 GUID가 다른 같은 이야기(유사 중복)는 LLM 단계 전에 하나로 합친다.
+    dedupe_index = NearDuplicateIndex.from_env(NEAR_DUPLICATE_INDEX_FILE)
+    if dedupe_index.enabled and not dedupe_index.loaded_from_disk:
+        seeded = dedupe_index.seed_from_posts(POSTS_DIR)
+        logger.info(f"유사 중복 인덱스를 기존 포스트 {seeded}개로 초기화했습니다.")
+    new_items, near_duplicates = collapse_near_duplicates(new_items, dedupe_index)
+    # 제외한 항목은 처리 상태에 넣지 않는다 (오탐이면 기준을 고친 뒤 다시 볼 수 있게).
+    for item, match_key, score in near_duplicates:
+        match_title = dedupe_index.title_of(match_key) or match_key
+        logger.debug(f"유사 중복 제외: {item['title'][:50]} ≈ {match_title[:50]} ({score:.2f})")
+    if near_duplicates:
+        logger.info(f"유사 중복 {len(near_duplicates)}개 제외")
     logger.info(f"신규 항목: {len(new_items)}개 발견")
     
     # 신규 항목 상세 출력
@@ -706,15 +941,20 @@ def run_pipeline(
     
     if not new_items:
         logger.info("[OK] 새로운 GeekNews 항목이 없습니다.")
+        url_index.save()
+        engine.commit_state()
         return []
     
     # 3. 콘텐츠 필터링 및 우선순위 결정
     logger.info("[3단계] AI/트렌드 필터링 및 우선순위 결정 중...")
     content_filter = ContentFilter(
         min_votes=min_votes, 
-        enable_scraping=enable_scraping
+        enable_scraping=enable_scraping,
+        classifier=load_classifier(POSTS_DIR),
+        min_relevance=min_relevance_from_env(),
     )
-    filtered_items = content_filter.filter_and_sort(new_items, max_items=max_posts)
+    candidates = content_filter.select(new_items)
+    filtered_items = content_filter.limit(candidates, max_items=max_posts)
     logger.info(f"{len(filtered_items)}개 항목 선별 완료")
     
     for item, metrics in filtered_items[:5]:  # 상위 5개만 출력
@@ -723,62 +963,102 @@ def run_pipeline(
     
     if not filtered_items:
         logger.info("[OK] 필터링 조건을 만족하는 항목이 없습니다.")
+        url_index.save()
+        engine.commit_state()
         return []
     
+    # 게시 대상 YouTube 항목에 대해서만 자막을 조회한다 (수집 단계에서는 영상 설명만 사용).
+    if youtube_collector:
+        hydrated = youtube_collector.hydrate_transcripts(
+            [item for item, _ in filtered_items],
+            max_workers=Config.YOUTUBE_TRANSCRIPT_WORKERS,
+        )
+        if hydrated:
+            logger.info(f"YouTube 자막 {hydrated}개 조회 완료")
+        cache_stats = youtube_collector.transcript_cache_stats()
+        if cache_stats and (cache_stats["hits"] or cache_stats["misses"]):
+            logger.info(
+                f"자막 캐시: 적중 {cache_stats['hits']}회, 미스 {cache_stats['misses']}회, "
+                f"{cache_stats['entries']}개 항목 ({cache_stats['bytes'] / 1024:.0f}KB)"
+            )
+    
     # 4. 웹 연구 및 QA 콘텐츠 생성
     logger.info("[4단계] 웹 연구 및 전문가급 QA 콘텐츠 생성 중...")
     
     web_researcher = WebResearcher(
         max_search_results=5,
-        enable_expert_search=enable_web_research
+        enable_expert_search=enable_web_research,
+        cache=url_index,
     ) if enable_web_research else None
     
     generator = QAContentGenerator()
+    # MCP 분석은 웹 연구와 겹쳐 백그라운드에서 동시에 진행한다.
+    generator.start_mcp_prefetch([item for item, _ in filtered_items])
     created_files: list[Path] = []
-    
-    for i, (item, metrics) in enumerate(filtered_items, 1):
-        logger.info(f"[{i}/{len(filtered_items)}] 처리 중: {item['title']}")
-        
-        # 웹 연구 수행
-        research_data = None
-        if web_researcher:
-            logger.debug("웹 연구 수행 중...")
+
+    if batch_mode:
+        generated = _generate_batch(generator, web_researcher, filtered_items)
+    else:
+        generated = _generate_sequential(generator, web_researcher, filtered_items)
+
+    posts_manifest = PostsManifest.from_env(POSTS_DIR)
+    search_index: SearchIndex | None = SearchIndex()
+    try:
+        search_index.update(POSTS_DIR)
+    except Exception as exc:
+        logger.warning(f"검색 인덱스를 불러올 수 없어 갱신하지 않습니다: {exc}", exc_info=True)
+        search_index = None
+
+    # generated는 지연 제너레이터라 LLM 호출은 이 루프에서 일어난다. 루프가 끝난 뒤 닫는다.
+    try:
+        for item, metrics, qa_result in generated:
+            if metrics.predicted_category and qa_result.blog_category != metrics.predicted_category:
+                logger.info(
+                    f"카테고리 불일치: LLM={qa_result.blog_category}, 로컬 분류기={metrics.predicted_category} "
+                    f"(관련성 {metrics.relevance:.2f}) - {item['title'][:60]}"
+                )
+            # 포스트 작성
+            logger.debug("블로그 포스트 작성 중...")
             try:
-                research_data = web_researcher.research(
-                    item["title"], 
-                    item.get("summary", ""), 
-                    item["link"]
+                filepath = write_post(
+                    item,
+                    qa_result,
+                    metrics=metrics,
+                    timezone=timezone,
+                    search_index=search_index,
+                    manifest=posts_manifest,
                 )
-                logger.debug(f"웹 검색 결과: {len(research_data.web_results)}개")
-                logger.debug(f"전문가 의견: {len(research_data.expert_opinions)}개")
+                logger.info(f"[OK] 생성 완료: {filepath.name}")
+                created_files.append(filepath)
+                processed.add(item["guid"])
+                link_key = item.get("canonical_url") or url_index.key(item["link"])
+                if link_key is not None:
+                    processed.add(link_key)
+                dedupe_index.add_item(item["guid"], item)
             except Exception as exc:
-                logger.warning(f"웹 연구 실패: {exc}", exc_info=True)
-        
-        # QA 콘텐츠 생성
-        logger.debug("AI 기반 QA 콘텐츠 생성 중...")
-        try:
-            qa_result = generator.generate(item, research_data=research_data)
-            logger.info(f"생성 완료 (인사이트: {len(qa_result.qa_engineer_insights)}개)")
-        except Exception as exc:
-            logger.error(f"생성 실패: {exc}", exc_info=True)
-            continue
-        
-        # 포스트 작성
-        logger.debug("블로그 포스트 작성 중...")
-        try:
-            filepath = write_post(item, qa_result, metrics=metrics, timezone=timezone)
-            logger.info(f"[OK] 생성 완료: {filepath.name}")
-            created_files.append(filepath)
-            processed.add(item["guid"])
-        except Exception as exc:
-            logger.error(f"포스트 작성 실패: {exc}", exc_info=True)
-            continue
+                logger.error(f"포스트 작성 실패: {exc}", exc_info=True)
+                continue
+    finally:
+        generator.close()
     
     # 5. 상태 저장
     logger.info("[5단계] 처리 상태 저장 중...")
     save_state(processed)
+    dedupe_index.save()
+    url_index.save()
+    posts_manifest.close()
+    # historyId/채널 워터마크는 처리 상태를 저장한 뒤에 반영한다.
+    # 선별되었지만 max_posts에 밀렸거나 생성/작성에 실패한 항목은 수집기가 다음 실행에서 다시 받는다.
+    retry = {item["guid"] for item, _ in candidates if item["guid"] not in processed}
+    engine.commit_state(retry)
     logger.info("상태 저장 완료")
     
+    if created_files:
+        try:
+            build_related_posts(POSTS_DIR)
+        except Exception as exc:
+            logger.warning(f"관련 포스트 데이터 갱신 실패: {exc}", exc_info=True)
+    
     # 6. GitHub에 자동 push
     git_push_success = False
     if created_files and os.getenv("AUTO_GIT_PUSH", "true").lower() in ("true", "1", "yes"):
@@ -806,7 +1086,30 @@ def run_pipeline(
         logger.info("   git add _posts/ data/")
         logger.info("   git commit -m 'Add new posts'")
         logger.info("   git push")
-    
+
+    provider_health = generator.provider_health()
+    if provider_health:
+        logger.info("LLM 프로바이더 상태:")
+        for name, health in provider_health.items():
+            logger.info(
+                f"   {name}: 요청 {health['requests']}회, 오류율 {health['error_rate']:.0%}, "
+                f"p50 {health['p50_latency']}s, 서킷 {health['circuit']}"
+            )
+
+    hedge_stats = generator.hedge_stats()
+    if hedge_stats and hedge_stats["enabled"]:
+        logger.info(
+            f"Hedge 요청: {hedge_stats['fired']}/{hedge_stats['budget']}회 사용, "
+            f"2순위 응답 채택 {hedge_stats['won']}회"
+        )
+
+    mcp_circuit = generator.mcp_circuit_state()
+    if mcp_circuit:
+        logger.info(
+            f"MCP 서킷: {mcp_circuit['state']} (연속 실패 {mcp_circuit['consecutive_failures']}회, "
+            f"누적 차단 {mcp_circuit['total_trips']}회, 재확인까지 {mcp_circuit['retry_in_seconds']}초)"
+        )
+
     logger.info("=" * 80)
     
     return created_files
@@ -851,6 +1154,11 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         action="store_true", 
         help="GeekNews 웹 스크래핑 활성화 (느림)"
     )
+    parser.add_argument(
+        "--batch", 
+        action="store_true", 
+        help="Batch API로 일괄 제출 후 결과를 기다림 (백필용, 저렴하지만 느림)"
+    )
     return parser.parse_args(argv)
 
 
@@ -880,7 +1188,8 @@ def main(argv: list[str] | None = None) -> int:
             timezone=timezone,
             enable_web_research=not args.no_web_research,
             enable_scraping=args.enable_scraping,
-            min_votes=args.min_votes
+            min_votes=args.min_votes,
+            batch_mode=args.batch,
         )
     except Exception as exc:  # pylint: disable=broad-except
         logger.error(f"[ERROR] 파이프라인 실행 중 오류: {exc}", exc_info=True)
@@ -0,0 +1,312 @@
+"""수집기 플러그인 레지스트리와 통합 수집 엔진.
+
+RSS, YouTube, Gmail, 그리고 enhanced 소스(Reddit, Dev.to, Stack Overflow 등)를
+하나의 플러그인 인터페이스로 다룬다. 플러그인은 이름, 실행당 예상 비용(API 쿼터
+단위), 속도 제한, 마감 시간, 설정 확인(is_configured)을 선언하고
+``@register_collector``로 등록한다.
+
+IngestionEngine은 설정된 플러그인을 한 이벤트 루프에서 동시에 실행한다.
+동기 수집기(googleapiclient 기반 YouTube/Gmail, requests 기반 RSS)는 스레드
+풀에서, 비동기 수집기는 루프에서 직접 실행하며, 결과는 FeedItem 형태
+(guid, title, link, summary, published_at)로 정규화해 내보낸다.
+
+수집기는 historyId나 채널 워터마크 같은 상태를 직접 저장하지 않고
+CollectResult.commit으로 돌려준다. 호출자는 항목을 처리하고 자신의 처리 상태를
+저장한 뒤 commit_state(retry)로 반영한다. retry는 수집했지만 처리하지 못해(생성 실패,
+실행당 개수 제한 등) 다음 실행에서 다시 받아야 할 GUID 집합으로, 수집기는 그 항목을
+지나치지 않도록 상태를 옮긴다. 마감 시간을 넘기거나 실패한 수집기의 commit은
+버려지므로, 스레드에 남아 계속 실행되는 수집기도 상태 파일을 쓰지 않는다.
+
+환경 변수
+----------
+ENABLE_ENHANCED_SOURCES
+    enhanced 소스 플러그인도 함께 수집할지 여부 (기본값: false)
+INGESTION_MAX_WORKERS
+    동기 수집기를 실행할 스레드 수 (기본값: 4)
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import os
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from automation.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_DEADLINE_SECONDS = 60.0
+ITEM_FIELDS = ("guid", "title", "link", "summary", "published_at")
+
+RawItem = t.Mapping[str, t.Any]
+
+
+@dataclass
+class CollectResult:
+    """수집 결과와, 실행이 끝난 뒤 반영할 상태 저장 함수 (다시 받을 GUID 집합을 인자로 받음)."""
+
+    items: t.Sequence[RawItem]
+    commit: t.Callable[[t.AbstractSet[str]], None] | None = None
+
+
+class IngestionContext:
+    """한 번의 수집 실행 동안 플러그인이 공유하는 옵션과 자원.
+
+    shared(name, factory)로 만든 자원(예: aiohttp 세션)은 실행이 끝나면
+    close()/aclose()가 있는 경우 함께 닫힌다.
+    """
+
+    def __init__(self, options: t.Mapping[str, t.Any] | None = None):
+        self.options = dict(options or {})
+        self._resources: dict[str, t.Any] = {}
+
+    def shared(self, name: str, factory: t.Callable[[], t.Any]) -> t.Any:
+        if name not in self._resources:
+            self._resources[name] = factory()
+        return self._resources[name]
+
+    async def aclose(self) -> None:
+        for name, resource in list(self._resources.items()):
+            closer = getattr(resource, "aclose", None) or getattr(resource, "close", None)
+            if closer is None:
+                continue
+            try:
+                result = closer()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as exc:
+                logger.debug(f"수집 자원 정리 실패 ({name}): {exc}")
+        self._resources.clear()
+
+
+class CollectorPlugin:
+    """수집기 플러그인 기본 클래스.
+
+    blocking=True인 플러그인은 collect_sync()를 스레드 풀에서, 아니면
+    collect_async()를 이벤트 루프에서 실행한다. 반환값은 FeedItem 호환 dict 목록이거나,
+    저장할 상태가 있으면 CollectResult다.
+    """
+
+    name: t.ClassVar[str] = ""
+    group: t.ClassVar[str] = "core"  # "core" 또는 "enhanced"
+    cost: t.ClassVar[int] = 1  # 실행당 예상 비용 (API 쿼터 단위)
+    rate_limit: t.ClassVar[tuple[float, int] | None] = None  # (초당 요청 수, burst)
+    deadline: t.ClassVar[float] = DEFAULT_DEADLINE_SECONDS
+    blocking: t.ClassVar[bool] = True
+
+    def is_configured(self, ctx: IngestionContext) -> bool:
+        return True
+
+    def estimated_cost(self, ctx: IngestionContext) -> int:
+        return self.cost
+
+    def collect_sync(self, ctx: IngestionContext) -> t.Sequence[RawItem] | CollectResult:
+        raise NotImplementedError
+
+    async def collect_async(self, ctx: IngestionContext) -> t.Sequence[RawItem] | CollectResult:
+        raise NotImplementedError
+
+
+_REGISTRY: dict[str, type[CollectorPlugin]] = {}
+
+PluginT = t.TypeVar("PluginT", bound=t.Type[CollectorPlugin])
+
+
+def register_collector(cls: PluginT) -> PluginT:
+    """수집기 플러그인 클래스를 등록한다 (같은 이름이면 교체)."""
+    if not cls.name:
+        raise ValueError(f"{cls.__name__}: 플러그인 이름(name)이 필요합니다.")
+    _REGISTRY[cls.name] = cls
+    return cls
+
+
+def registered_collectors() -> dict[str, type[CollectorPlugin]]:
+    """등록 순서대로 이름 → 플러그인 클래스."""
+    return dict(_REGISTRY)
+
+
+def enhanced_sources_enabled() -> bool:
+    return os.getenv("ENABLE_ENHANCED_SOURCES", "false").lower() in ("true", "1", "yes")
+
+
+def load_enhanced_plugins() -> bool:
+    """enhanced 소스 모듈을 불러와 플러그인을 등록한다 (aiohttp가 없으면 False)."""
+    try:
+        import automation.enhanced_sources  # noqa: F401
+    except ImportError as exc:
+        logger.warning(f"enhanced 소스를 불러올 수 없습니다 (aiohttp 필요): {exc}")
+        return False
+    return True
+
+
+def default_plugins() -> list[CollectorPlugin]:
+    """등록된 플러그인 인스턴스 (enhanced 그룹은 ENABLE_ENHANCED_SOURCES일 때만)."""
+    include_enhanced = enhanced_sources_enabled() and load_enhanced_plugins()
+    # core 플러그인이 항상 앞에 오도록 한다 (결과 병합 순서 = 중복 판단 우선순위).
+    classes = sorted(registered_collectors().values(), key=lambda cls: cls.group != "core")
+    return [cls() for cls in classes if cls.group != "enhanced" or include_enhanced]
+
+
+def normalize_item(raw: RawItem) -> dict[str, str] | None:
+    """FeedItem 필드만 문자열로 남긴다 (guid나 제목이 없으면 None)."""
+    item = {name: str(raw.get(name) or "") for name in ITEM_FIELDS}
+    if not item["guid"] or not item["title"]:
+        return None
+    return item
+
+
+@dataclass
+class SourceReport:
+    """소스별 수집 결과 요약."""
+
+    name: str
+    items: int = 0
+    seconds: float = 0.0
+    cost: int = 0
+    error: str = ""
+    skipped: str = ""
+
+
+class IngestionEngine:
+    """플러그인을 동시에 실행해 정규화된 항목을 모은다."""
+
+    def __init__(
+        self,
+        plugins: t.Sequence[CollectorPlugin] | None = None,
+        *,
+        options: t.Mapping[str, t.Any] | None = None,
+        max_workers: int | None = None,
+        cost_budget: int | None = None,
+    ):
+        self.plugins = list(plugins) if plugins is not None else default_plugins()
+        self.options = dict(options or {})
+        self.max_workers = max_workers or int(os.getenv("INGESTION_MAX_WORKERS", str(DEFAULT_MAX_WORKERS)))
+        self.cost_budget = cost_budget
+        self.reports: dict[str, SourceReport] = {}
+        self._pending_commits: dict[str, t.Callable[[t.AbstractSet[str]], None]] = {}
+
+    def _select(self, ctx: IngestionContext) -> list[tuple[CollectorPlugin, int]]:
+        """설정되어 있고 비용 예산 안에 드는 플러그인만 고른다 (등록 순서 유지)."""
+        selected: list[tuple[CollectorPlugin, int]] = []
+        remaining = self.cost_budget
+        for plugin in self.plugins:
+            try:
+                configured = plugin.is_configured(ctx)
+            except Exception as exc:
+                logger.warning(f"{plugin.name} 설정 확인 실패: {exc}", exc_info=True)
+                configured = False
+            if not configured:
+                self.reports[plugin.name] = SourceReport(plugin.name, skipped="not configured")
+                logger.info(f"{plugin.name}: 설정되지 않아 건너뜀")
+                continue
+            cost = plugin.estimated_cost(ctx)
+            if remaining is not None:
+                if cost > remaining:
+                    self.reports[plugin.name] = SourceReport(plugin.name, cost=cost, skipped="over budget")
+                    logger.info(f"{plugin.name}: 예상 비용 {cost}이 남은 예산 {remaining}을 넘어 건너뜀")
+                    continue
+                remaining -= cost
+            selected.append((plugin, cost))
+        return selected
+
+    async def _run_plugin(
+        self,
+        plugin: CollectorPlugin,
+        cost: int,
+        ctx: IngestionContext,
+        executor: ThreadPoolExecutor,
+    ) -> tuple[CollectorPlugin, list[dict[str, str]]]:
+        report = SourceReport(plugin.name, cost=cost)
+        self.reports[plugin.name] = report
+        started = time.perf_counter()
+        raw: t.Sequence[RawItem] = []
+        try:
+            if plugin.blocking:
+                loop = asyncio.get_running_loop()
+                call = loop.run_in_executor(executor, plugin.collect_sync, ctx)
+            else:
+                call = plugin.collect_async(ctx)
+            result = await asyncio.wait_for(call, timeout=plugin.deadline)
+            if isinstance(result, CollectResult):
+                if result.commit is not None:
+                    self._pending_commits[plugin.name] = result.commit
+                result = result.items
+            raw = result or []
+        except asyncio.TimeoutError:
+            # 스레드에서 실행 중인 동기 수집기는 중단되지 않고 결과만 버린다.
+            # 상태는 commit으로만 저장되므로 다음 실행에서 같은 범위를 다시 조회한다.
+            report.error = "timeout"
+            logger.warning(f"{plugin.name} 수집이 {plugin.deadline:.0f}초 안에 끝나지 않아 건너뜁니다.")
+        except Exception as exc:
+            report.error = str(exc)
+            logger.error(f"{plugin.name} 수집 실패: {exc}", exc_info=True)
+        items = [item for item in map(normalize_item, raw) if item is not None]
+        report.items = len(items)
+        report.seconds = time.perf_counter() - started
+        return plugin, items
+
+    async def stream(self) -> t.AsyncIterator[tuple[str, list[dict[str, str]]]]:
+        """수집기가 끝나는 순서대로 (플러그인 이름, 정규화된 항목)을 내보낸다."""
+        ctx = IngestionContext(self.options)
+        selected = self._select(ctx)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ingestion")
+        tasks = [asyncio.ensure_future(self._run_plugin(plugin, cost, ctx, executor)) for plugin, cost in selected]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                plugin, items = await finished
+                logger.info(f"{plugin.name} {len(items)}개 ({self.reports[plugin.name].seconds:.1f}초)")
+                yield plugin.name, items
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await ctx.aclose()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def collect_all(self) -> list[dict[str, str]]:
+        """모든 수집기 결과를 플러그인 등록 순서로 합치고 GUID 중복을 제거한다.
+
+        순서가 유지되어야 이후 중복 판단에서 앞선 소스(GeekNews RSS)의 항목이 남는다.
+        """
+        order = {plugin.name: index for index, plugin in enumerate(self.plugins)}
+        results: dict[str, list[dict[str, str]]] = {}
+        async for name, items in self.stream():
+            results[name] = items
+        seen: set[str] = set()
+        merged: list[dict[str, str]] = []
+        for name in sorted(results, key=order.__getitem__):
+            for item in results[name]:
+                if item["guid"] not in seen:
+                    seen.add(item["guid"])
+                    merged.append(item)
+        return merged
+
+    def run(self) -> list[dict[str, str]]:
+        """동기 코드에서 호출하는 진입점."""
+        return asyncio.run(self.collect_all())
+
+    def commit_state(self, retry: t.AbstractSet[str] = frozenset()) -> None:
+        """제때 성공한 수집기의 상태(historyId, 워터마크 등)를 저장한다.
+
+        수집한 항목을 처리하고 호출자의 처리 상태를 저장한 뒤에 호출한다.
+        그 전에 실행이 중단되면 다음 실행에서 같은 범위를 다시 수집한다.
+        retry에 든 GUID는 수집기가 다음 실행에서 다시 내보낼 수 있게 상태를 옮긴다.
+        """
+        commits, self._pending_commits = self._pending_commits, {}
+        for name, commit in commits.items():
+            try:
+                commit(retry)
+            except Exception as exc:
+                logger.error(f"{name} 수집 상태 저장 실패: {exc}", exc_info=True)
+
+    def discard_state(self, *names: str) -> None:
+        """저장하지 않은 수집 상태를 버린다 (다음 실행에서 다시 수집). 이름이 없으면 전부."""
+        dropped = [name for name in self._pending_commits if not names or name in names]
+        if dropped:
+            logger.warning(f"수집 상태를 저장하지 않습니다: {', '.join(dropped)}")
+        for name in dropped:
+            del self._pending_commits[name]
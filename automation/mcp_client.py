@@ -12,23 +12,54 @@ MCP_SERVER_URL : str
     MCP 서버 URL (기본값: http://localhost:3000)
 MCP_THINKING_DEPTH : int
     사고 깊이 수준 1-5 (기본값: 3)
+MCP_CACHE_TTL_SECONDS : int
+    (문제, 깊이, 컨텍스트) 해시별 분석 결과 캐시 유효 시간 (기본값: 86400, 0이면 비활성화)
+MCP_CACHE_PATH : str
+    분석 결과 캐시 파일 경로 (기본값: data/mcp_think_cache.json)
+MCP_CIRCUIT_FAILURE_THRESHOLD : int
+    서킷을 여는 연속 실패 횟수 (기본값: 3)
+MCP_CIRCUIT_COOLDOWN_SECONDS : float
+    서킷이 열린 뒤 헬스체크로 재확인하기까지의 대기 시간 (기본값: 300)
+MCP_BREAKER_STATE_PATH : str
+    서킷 상태 저장 파일 (기본값: data/mcp_breaker_state.json)
 """
 from __future__ import annotations
 
 import asyncio
+import atexit
+import concurrent.futures
+import hashlib
+import json
 import os
+import threading
+import time
+import typing as t
+import weakref
+from pathlib import Path
 from typing import Any, Dict, Optional
-import json
 
 try:
     import httpx
 except ImportError:
     httpx = None
 
+from automation.circuit_breaker import CLOSED, OPEN, CircuitBreaker
 from automation.logger import get_logger
 
 logger = get_logger(__name__)
 
+T = t.TypeVar("T")
+
+DEFAULT_CACHE_PATH = Path("data/mcp_think_cache.json")
+DEFAULT_CACHE_TTL_SECONDS = 86400
+DEFAULT_BREAKER_STATE_PATH = Path("data/mcp_breaker_state.json")
+
+
+def _resolve_depth(depth: int | None) -> int:
+    if depth is None:
+        depth = int(os.getenv("MCP_THINKING_DEPTH", "3"))
+    return max(1, min(5, depth))
+
 
 class SequentialThinkingClient:
     """Sequential Thinking MCP 서버와 통신하는 비동기 클라이언트"""
@@ -84,11 +115,8 @@ class SequentialThinkingClient:
         Raises:
             httpx.HTTPError: 서버 통신 실패
         """
-        if depth is None:
-            depth = int(os.getenv("MCP_THINKING_DEPTH", "3"))
-        
         # depth 범위 제한
-        depth = max(1, min(5, depth))
+        depth = _resolve_depth(depth)
         
         payload = {
             "problem": problem,
@@ -140,13 +168,258 @@ class SequentialThinkingClient:
         await self.close()
 
 
+class ThinkCache:
+    """(문제, 깊이, 컨텍스트) 해시를 키로 하는 MCP 분석 결과 TTL 캐시.
+
+    같은 기사를 재실행하거나 사전 분석과 생성 단계에서 중복 호출할 때 서버 왕복을 생략한다.
+    path가 주어지면 JSON 파일에 저장하여 실행 간에도 재사용한다.
+    폴백(오류) 결과는 캐시하지 않는다.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+        path: Path | str | None = None,
+        clock: t.Callable[[], float] = time.time,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.path = Path(path) if path else None
+        self._clock = clock
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> "ThinkCache | None":
+        ttl = float(os.getenv("MCP_CACHE_TTL_SECONDS", str(DEFAULT_CACHE_TTL_SECONDS)))
+        if ttl <= 0:
+            return None
+        return cls(ttl, os.getenv("MCP_CACHE_PATH", str(DEFAULT_CACHE_PATH)))
+
+    @staticmethod
+    def make_key(problem: str, depth: int, context: Dict[str, Any] | None = None) -> str:
+        raw = json.dumps([problem, depth, context or {}], ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            self._entries = {}
+            if self.path and self.path.exists():
+                try:
+                    self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+                except (OSError, ValueError) as exc:
+                    logger.warning(f"MCP 캐시 파일을 읽을 수 없어 비웁니다: {exc}")
+        return self._entries
+
+    def _save(self, entries: dict[str, dict[str, Any]]) -> None:
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp_path.write_text(json.dumps(entries, ensure_ascii=False), encoding="utf-8")
+            tmp_path.replace(self.path)
+        except OSError as exc:
+            logger.warning(f"MCP 캐시 저장 실패: {exc}")
+
+    def get(self, key: str) -> Dict[str, Any] | None:
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is None or self._clock() - entry["stored_at"] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry["result"]
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        if result.get("error") or result.get("fallback"):
+            return
+        with self._lock:
+            entries = self._load()
+            now = self._clock()
+            expired = [k for k, entry in entries.items() if now - entry["stored_at"] > self.ttl_seconds]
+            for k in expired:
+                del entries[k]
+            entries[key] = {"stored_at": now, "result": result}
+            self._save(entries)
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class MCPCircuitBreaker(CircuitBreaker):
+    """상태가 바뀔 때마다 JSON 파일에 저장하는 MCP 서버용 서킷 브레이커.
+
+    다음 실행과 scripts/health_check.py가 같은 상태를 보도록 저장하며,
+    생성 시 저장된 상태를 읽어 남은 쿨다운을 이어서 적용한다.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 300.0,
+        state_path: Path | str | None = None,
+        clock: t.Callable[[], float] = time.monotonic,
+    ):
+        super().__init__("mcp", failure_threshold, cooldown_seconds, clock)
+        self.state_path = Path(state_path) if state_path else None
+        self._saved_key: tuple[str, int] | None = None
+        saved = load_breaker_state(self.state_path) if self.state_path else None
+        if saved:
+            self.restore(saved)
+            self._saved_key = (saved.get("state", CLOSED), int(saved.get("consecutive_failures", 0)))
+
+    @classmethod
+    def from_env(cls) -> "MCPCircuitBreaker":
+        return cls(
+            failure_threshold=int(os.getenv("MCP_CIRCUIT_FAILURE_THRESHOLD", "3")),
+            cooldown_seconds=float(os.getenv("MCP_CIRCUIT_COOLDOWN_SECONDS", "300")),
+            state_path=os.getenv("MCP_BREAKER_STATE_PATH", str(DEFAULT_BREAKER_STATE_PATH)),
+        )
+
+    def record_success(self) -> None:
+        super().record_success()
+        self.save()
+
+    def record_failure(self) -> None:
+        super().record_failure()
+        self.save()
+
+    def save(self) -> None:
+        """상태(또는 연속 실패 횟수)가 바뀐 경우에만 파일에 저장한다."""
+        if not self.state_path:
+            return
+        state = self.export_state()
+        key = (state["state"], state["consecutive_failures"])
+        if key == self._saved_key:
+            return
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            self.state_path.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+            self._saved_key = key
+        except OSError as exc:
+            logger.warning(f"MCP 서킷 상태 저장 실패: {exc}")
+
+
+def load_breaker_state(path: Path | str | None = None) -> Dict[str, Any] | None:
+    """저장된 MCP 서킷 상태를 읽는다 (없거나 손상되면 None)."""
+    path = Path(path or os.getenv("MCP_BREAKER_STATE_PATH", str(DEFAULT_BREAKER_STATE_PATH)))
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def mcp_breaker_status() -> Dict[str, Any] | None:
+    """저장된 상태에 현재 시각을 반영한 MCP 서킷 요약을 반환한다 (리포트/헬스체크용)."""
+    if load_breaker_state() is None:
+        return None
+    return MCPCircuitBreaker.from_env().snapshot()
+
+
+def _completed(result: Dict[str, Any]) -> concurrent.futures.Future[Dict[str, Any]]:
+    future: concurrent.futures.Future[Dict[str, Any]] = concurrent.futures.Future()
+    future.set_result(result)
+    return future
+
+
+def _circuit_open_result(breaker: CircuitBreaker) -> Dict[str, Any]:
+    return {
+        "error": f"MCP 서킷 열림 (재확인까지 {breaker.seconds_until_retry():.0f}초)",
+        "fallback": True,
+        "circuit_open": True,
+        "thoughts": [],
+        "insights": [],
+        "conclusion": "MCP 서버 장애로 분석 생략",
+    }
+
+
+class _BackgroundLoop:
+    """프로세스 수명 동안 유지되는 전용 이벤트 루프 스레드.
+
+    동기 코드에서 제출한 코루틴은 모두 이 루프에서 실행되므로 httpx.AsyncClient의
+    커넥션 풀이 하나의 루프에 묶여 재사용되고, 여러 스레드에서 동시에 호출할 수 있다.
+    """
+
+    def __init__(self):
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None and self._loop.is_running()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+
+                def run() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(started.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=run, name="mcp-event-loop", daemon=True)
+                self._thread.start()
+                started.wait()
+                self._loop = loop
+            return self._loop
+
+    def submit(self, coro: t.Coroutine[t.Any, t.Any, T]) -> concurrent.futures.Future[T]:
+        """코루틴을 백그라운드 루프에 제출하고 concurrent.futures.Future를 반환한다."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_started())
+
+    def call_later(self, delay: float, callback: t.Callable[[], t.Any]) -> None:
+        """delay초 뒤 백그라운드 루프에서 callback을 실행하도록 예약한다."""
+        loop = self._ensure_started()
+        loop.call_soon_threadsafe(loop.call_later, delay, callback)
+
+    def stop(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        if not loop.is_running():
+            loop.close()
+
+
+_BACKGROUND_LOOP = _BackgroundLoop()
+_OPEN_CLIENTS: "weakref.WeakSet[SyncSequentialThinkingClient]" = weakref.WeakSet()
+
+
+@atexit.register
+def _shutdown_background_loop() -> None:
+    """종료 시 열린 클라이언트를 닫고 백그라운드 루프를 정리한다."""
+    for client in list(_OPEN_CLIENTS):
+        try:
+            client.close()
+        except Exception:  # pylint: disable=broad-except
+            pass
+    _BACKGROUND_LOOP.stop()
+
+
 class SyncSequentialThinkingClient:
-    """동기 방식 MCP 클라이언트 (기존 동기 코드와의 호환성)"""
+    """동기 방식 MCP 클라이언트 (기존 동기 코드와의 호환성)
+
+    모든 호출은 프로세스 전용 백그라운드 이벤트 루프에서 실행되며,
+    여러 파이프라인 워커 스레드에서 동시에 호출해도 안전하다.
+    """
     
     def __init__(
         self,
         server_url: str | None = None,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        cache: ThinkCache | None = None,
+        breaker: CircuitBreaker | None = None
     ):
         """
         동기 MCP 클라이언트 초기화
@@ -154,9 +427,101 @@ class SyncSequentialThinkingClient:
         Args:
             server_url: MCP 서버 URL
             timeout: 요청 타임아웃 (초)
+            cache: 분석 결과 캐시 (None이면 캐시하지 않음)
+            breaker: 서킷 브레이커 (None이면 장애 시에도 매번 호출)
         """
         self.async_client = SequentialThinkingClient(server_url, timeout)
-        self._loop = None
+        self.timeout = timeout
+        self.cache = cache
+        self.breaker = breaker
+        self._probe_lock = threading.Lock()
+        self._probe_scheduled = False
+        self._closed = False
+        _OPEN_CLIENTS.add(self)
+
+    def _result(self, future: concurrent.futures.Future[T], timeout: float | None) -> T:
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def submit_think(
+        self,
+        problem: str,
+        depth: int | None = None,
+        context: Dict[str, Any] | None = None
+    ) -> concurrent.futures.Future[Dict[str, Any]]:
+        """
+        Sequential Thinking 호출을 제출하고 결과 Future를 반환 (논블로킹)
+        
+        Returns:
+            분석 결과 딕셔너리를 담는 concurrent.futures.Future
+        """
+        if self._closed:
+            raise RuntimeError("이미 종료된 MCP 클라이언트입니다.")
+
+        depth = _resolve_depth(depth)
+        key = None
+        if self.cache is not None:
+            key = ThinkCache.make_key(problem, depth, context)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return _completed(cached)
+
+        # 서킷이 열려 있으면 서버를 기다리지 않고 즉시 폴백하며, 복구 확인은 백그라운드 헬스체크가 맡는다.
+        if self.breaker is not None and self.breaker.state != CLOSED:
+            self._schedule_probe()
+            return _completed(_circuit_open_result(self.breaker))
+
+        return _BACKGROUND_LOOP.submit(self._guarded_think(key, problem, depth, context))
+
+    async def _guarded_think(
+        self, key: str | None, problem: str, depth: int, context: Dict[str, Any] | None
+    ) -> Dict[str, Any]:
+        # Future가 완료되기 전에 기록해야 호출자가 곧바로 다시 호출해도 캐시/서킷 상태가 반영된다.
+        try:
+            result = await self.async_client.think(problem, depth, context)
+        except Exception:
+            self._record_failure()
+            raise
+        if result.get("fallback"):
+            self._record_failure()
+        else:
+            if self.breaker is not None:
+                self.breaker.record_success()
+            if self.cache is not None and key is not None:
+                self.cache.put(key, result)
+        return result
+
+    def _record_failure(self) -> None:
+        if self.breaker is None:
+            return
+        self.breaker.record_failure()
+        if self.breaker.state == OPEN:
+            self._schedule_probe()
+
+    def _schedule_probe(self) -> None:
+        """쿨다운이 끝나는 시점에 백그라운드 헬스체크를 한 번 예약한다."""
+        with self._probe_lock:
+            if self._probe_scheduled or self._closed or self.breaker is None:
+                return
+            self._probe_scheduled = True
+        delay = self.breaker.seconds_until_retry()
+        _BACKGROUND_LOOP.call_later(delay, lambda: asyncio.ensure_future(self._probe()))
+
+    async def _probe(self) -> None:
+        with self._probe_lock:
+            self._probe_scheduled = False
+        if self._closed or self.breaker is None or not self.breaker.allow_request():
+            return
+        healthy = await self.async_client.health_check()
+        if healthy:
+            self.breaker.record_success()
+            logger.info("MCP 서버 복구 확인, 서킷을 닫습니다.")
+        else:
+            self._record_failure()
+            logger.info(f"MCP 서버 재확인 실패, {self.breaker.cooldown_seconds:.0f}초 후 다시 확인합니다.")
     
     def think(
         self,
@@ -175,19 +540,8 @@ class SyncSequentialThinkingClient:
         Returns:
             분석 결과 딕셔너리
         """
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # 이미 실행 중인 루프가 있으면 새 루프 생성
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(
-            self.async_client.think(problem, depth, context)
-        )
+        # httpx 타임아웃이 먼저 적용되도록 약간의 여유를 둔다.
+        return self._result(self.submit_think(problem, depth, context), self.timeout + 5)
     
     def health_check(self) -> bool:
         """
@@ -196,29 +550,21 @@ class SyncSequentialThinkingClient:
         Returns:
             서버가 정상이면 True
         """
+        if self._closed:
+            return False
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(self.async_client.health_check())
+            return self._result(_BACKGROUND_LOOP.submit(self.async_client.health_check()), 10)
+        except Exception:  # pylint: disable=broad-except
+            return False
     
     def close(self):
-        """클라이언트 연결 종료"""
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        loop.run_until_complete(self.async_client.close())
+        """클라이언트 연결 종료 (여러 번 호출해도 안전)"""
+        if self._closed:
+            return
+        self._closed = True
+        _OPEN_CLIENTS.discard(self)
+        if _BACKGROUND_LOOP.running:
+            self._result(_BACKGROUND_LOOP.submit(self.async_client.close()), 5)
     
     def __enter__(self):
         return self
@@ -227,10 +573,13 @@ class SyncSequentialThinkingClient:
         self.close()
     
     def __del__(self):
-        """소멸자: 리소스 정리"""
+        """소멸자: 백그라운드 루프에 종료만 예약하고 기다리지 않는다."""
+        if getattr(self, "_closed", True) or not _BACKGROUND_LOOP.running:
+            return
+        self._closed = True
         try:
-            self.close()
-        except:
+            _BACKGROUND_LOOP.submit(self.async_client.close())
+        except Exception:  # pylint: disable=broad-except
             pass
 
 
@@ -259,12 +608,21 @@ def create_mcp_client() -> SyncSequentialThinkingClient | None:
         return None
     
     try:
-        client = SyncSequentialThinkingClient()
+        breaker = MCPCircuitBreaker.from_env()
+        client = SyncSequentialThinkingClient(cache=ThinkCache.from_env(), breaker=breaker)
+        if breaker.state == OPEN:
+            # 이전 실행에서 서킷이 열렸다면 쿨다운 동안 헬스체크 없이 폴백으로 동작한다.
+            logger.warning(f"MCP 서킷이 열려 있어 {breaker.seconds_until_retry():.0f}초 동안 MCP 분석을 생략합니다.")
+            client._schedule_probe()
+            return client
         # 간단한 연결 테스트
         if client.health_check():
+            breaker.record_success()
             return client
         else:
+            breaker.record_failure()
             logger.warning("MCP 서버에 연결할 수 없습니다.")
+            client.close()
             return None
     except Exception as e:
         logger.warning(f"MCP 클라이언트 생성 실패: {e}", exc_info=True)
@@ -0,0 +1,270 @@
+"""블로그 포스트 매니페스트 (SQLite).
+
+최신 포스트 찾기, GUID로 포스트 찾기, 같은 날짜의 슬러그 충돌 확인을 위해 매번
+_posts/**를 glob하고 파일을 읽는 대신, write_post가 포스트를 쓸 때마다 경로, GUID,
+슬러그, 날짜, 카테고리, 태그, 내용 해시를 한 행으로 기록하고 인덱스로 조회한다.
+
+매니페스트가 비어 있으면(처음 실행) 기존 포스트 front matter로 한 번 채운다.
+직접 추가/삭제한 포스트는 sync()로 맞출 수 있다 (수정 시각/크기가 바뀐 파일만 읽음).
+
+환경 변수
+----------
+POSTS_MANIFEST_PATH
+    매니페스트 파일 경로 (기본값: data/posts_manifest.sqlite3)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+import typing as t
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from automation.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MANIFEST_PATH = Path("data/posts_manifest.sqlite3")
+DEFAULT_POSTS_DIR = Path("_posts")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    path TEXT PRIMARY KEY,
+    guid TEXT NOT NULL DEFAULT '',
+    slug TEXT NOT NULL,
+    date TEXT NOT NULL,
+    category TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL DEFAULT '',
+    tags TEXT NOT NULL DEFAULT '[]',
+    content_hash TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    written_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_posts_guid ON posts (guid);
+CREATE INDEX IF NOT EXISTS idx_posts_date_slug ON posts (date, slug);
+CREATE INDEX IF NOT EXISTS idx_posts_written ON posts (written_at);
+"""
+_COLUMNS = "path, guid, slug, date, category, title, tags, content_hash, written_at"
+
+_FRONT_MATTER_RE = re.compile(r"\A---\s*\n(.*?)\n[ \t]*---[ \t]*\n?", re.DOTALL)
+_FILENAME_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})-(.+)$")
+
+
+@dataclass
+class PostRecord:
+    """매니페스트의 포스트 한 행."""
+
+    path: str  # 프로젝트 기준 경로 (예: _posts/learning/2025-10-01-slug.md)
+    guid: str
+    slug: str
+    date: str  # YYYY-MM-DD
+    category: str
+    title: str
+    tags: list[str] = field(default_factory=list)
+    content_hash: str = ""
+    written_at: float = 0.0
+
+    @classmethod
+    def from_row(cls, row: t.Sequence[t.Any]) -> "PostRecord":
+        path, guid, slug, date, category, title, tags, content_hash, written_at = row
+        return cls(path, guid, slug, date, category, title, json.loads(tags), content_hash, written_at)
+
+
+def parse_front_matter(text: str) -> dict[str, t.Any]:
+    """title, date, categories, tags만 읽는 간단한 front matter 파서."""
+    match = _FRONT_MATTER_RE.match(text)
+    fields: dict[str, t.Any] = {}
+    if not match:
+        return fields
+    for line in match.group(1).splitlines():
+        name, sep, value = line.partition(":")
+        name, value = name.strip(), value.strip()
+        if not sep or name not in ("title", "date", "categories", "tags"):
+            continue
+        if name in ("categories", "tags"):
+            fields[name] = [part.strip().strip("\"'") for part in value.strip("[]").split(",") if part.strip()]
+        else:
+            fields[name] = value.strip("\"'")
+    return fields
+
+
+def split_filename(name: str) -> tuple[str, str]:
+    """``2025-10-01-slug.md`` → (날짜, 슬러그). 날짜가 없으면 날짜는 빈 문자열."""
+    stem = name[:-3] if name.endswith(".md") else name
+    match = _FILENAME_RE.match(stem)
+    return (match.group(1), match.group(2)) if match else ("", stem)
+
+
+class PostsManifest:
+    """포스트 경로/GUID/슬러그/날짜/카테고리/태그/내용 해시 인덱스."""
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_MANIFEST_PATH,
+        posts_dir: Path | str = DEFAULT_POSTS_DIR,
+        *,
+        bootstrap: bool = True,
+    ):
+        self.path = Path(path)
+        self.posts_dir = Path(posts_dir)
+        if str(self.path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.executescript(_SCHEMA)
+        if bootstrap and self.count() == 0 and self.posts_dir.exists():
+            added, _ = self.sync()
+            if added:
+                logger.info(f"포스트 매니페스트 초기화: 기존 포스트 {len(added)}개")
+
+    @classmethod
+    def from_env(cls, posts_dir: Path | str = DEFAULT_POSTS_DIR) -> "PostsManifest":
+        return cls(os.getenv("POSTS_MANIFEST_PATH", str(DEFAULT_MANIFEST_PATH)), posts_dir)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def key(self, path: Path | str) -> str:
+        """포스트 파일 경로 → 매니페스트 키 (posts_dir 이름부터 시작하는 경로)."""
+        path = Path(path)
+        try:
+            relative = path.relative_to(self.posts_dir)
+        except ValueError:
+            relative = path.resolve().relative_to(self.posts_dir.resolve())
+        return f"{self.posts_dir.name}/{relative.as_posix()}"
+
+    def file_path(self, record: PostRecord) -> Path:
+        """매니페스트 키 → posts_dir 기준 실제 파일 경로."""
+        return self.posts_dir / record.path.split("/", 1)[1]
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+
+    def record(
+        self,
+        path: Path | str,
+        *,
+        guid: str = "",
+        content: str | None = None,
+        written_at: float | None = None,
+    ) -> PostRecord:
+        """포스트 한 개를 기록(또는 갱신)한다. content를 주면 파일을 다시 읽지 않는다."""
+        path = Path(path)
+        raw = content.encode("utf-8") if content is not None else path.read_bytes()
+        stat = path.stat()
+        fields = parse_front_matter(raw.decode("utf-8", errors="replace"))
+        filename_date, slug = split_filename(path.name)
+        date = filename_date or str(fields.get("date", ""))[:10]
+        categories = fields.get("categories") or [path.parent.name]
+        record = PostRecord(
+            path=self.key(path),
+            guid=guid,
+            slug=slug,
+            date=date,
+            category=categories[0],
+            title=str(fields.get("title", "")),
+            tags=list(fields.get("tags", [])),
+            content_hash=hashlib.sha1(raw).hexdigest(),
+            written_at=written_at if written_at is not None else time.time(),
+        )
+        with self._conn:
+            if not guid:
+                # 직접 수정한 포스트를 다시 기록할 때 기존 GUID를 유지한다.
+                row = self._conn.execute("SELECT guid FROM posts WHERE path = ?", (record.path,)).fetchone()
+                record.guid = row[0] if row else ""
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO posts ({_COLUMNS}, mtime, size) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    record.path, record.guid, record.slug, record.date, record.category, record.title,
+                    json.dumps(record.tags, ensure_ascii=False), record.content_hash, record.written_at,
+                    stat.st_mtime, stat.st_size,
+                ),
+            )
+        return record
+
+    def remove(self, path: Path | str) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM posts WHERE path = ?", (self.key(path),))
+
+    def sync(self) -> tuple[list[str], list[str]]:
+        """posts_dir와 매니페스트를 맞춘다. (추가/갱신된 키, 삭제된 키)를 반환한다.
+
+        수정 시각과 크기가 같은 파일은 읽지 않는다. 새로 발견한 파일의 written_at은
+        파일 수정 시각이다.
+        """
+        known = {
+            path: (mtime, size)
+            for path, mtime, size in self._conn.execute("SELECT path, mtime, size FROM posts")
+        }
+        seen: set[str] = set()
+        updated: list[str] = []
+        for path in sorted(self.posts_dir.rglob("*.md")):
+            key = self.key(path)
+            seen.add(key)
+            try:
+                stat = path.stat()
+                if known.get(key) == (stat.st_mtime, stat.st_size):
+                    continue
+                self.record(path, written_at=stat.st_mtime)
+            except OSError as exc:
+                logger.warning(f"포스트를 읽을 수 없습니다 ({path}): {exc}")
+                continue
+            updated.append(key)
+        removed = sorted(set(known) - seen)
+        with self._conn:
+            self._conn.executemany("DELETE FROM posts WHERE path = ?", [(key,) for key in removed])
+        return updated, removed
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def _query(self, where: str = "", params: t.Sequence[t.Any] = (), suffix: str = "") -> list[PostRecord]:
+        sql = f"SELECT {_COLUMNS} FROM posts {f'WHERE {where}' if where else ''} {suffix}"
+        return [PostRecord.from_row(row) for row in self._conn.execute(sql, params)]
+
+    def count(self, category: str | None = None) -> int:
+        if category is None:
+            return self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+        return self._conn.execute("SELECT COUNT(*) FROM posts WHERE category = ?", (category,)).fetchone()[0]
+
+    def get(self, path: Path | str) -> PostRecord | None:
+        records = self._query("path = ?", (self.key(path),))
+        return records[0] if records else None
+
+    def latest(self, category: str | None = None) -> PostRecord | None:
+        """가장 최근에 기록된 포스트."""
+        if category is None:
+            records = self._query(suffix="ORDER BY written_at DESC, path DESC LIMIT 1")
+        else:
+            records = self._query("category = ?", (category,), "ORDER BY written_at DESC, path DESC LIMIT 1")
+        return records[0] if records else None
+
+    def by_guid(self, guid: str) -> list[PostRecord]:
+        return self._query("guid = ?", (guid,), "ORDER BY written_at")
+
+    def by_date_slug(self, date: str, slug: str) -> list[PostRecord]:
+        return self._query("date = ? AND slug = ?", (date, slug))
+
+    def unique_slug(self, date: str, slug: str, guid: str = "") -> str:
+        """같은 날짜에 다른 GUID의 포스트가 같은 슬러그를 쓰고 있으면 -2, -3...을 붙인다.
+
+        같은 GUID의 포스트(재생성)는 충돌로 보지 않는다.
+        """
+        rows = self._conn.execute(
+            "SELECT slug, guid FROM posts WHERE date = ? AND (slug = ? OR slug LIKE ?)",
+            (date, slug, f"{slug}-%"),
+        ).fetchall()
+        taken = {row_slug for row_slug, row_guid in rows if not guid or row_guid != guid}
+        own = {row_slug for row_slug, row_guid in rows if guid and row_guid == guid}
+        if slug in own or slug not in taken:
+            return slug
+        number = 2
+        while f"{slug}-{number}" in taken and f"{slug}-{number}" not in own:
+            number += 1
+        return f"{slug}-{number}"
@@ -0,0 +1,352 @@
+"""여러 LLM 프로바이더를 상태 기반으로 라우팅하는 모듈.
+
+구성된 모든 프로바이더의 최근 지연 시간과 오류율을 추적하여 가장 건강한
+프로바이더로 요청을 보내고, 429/5xx가 반복되면 서킷 브레이커를 열어 해당
+프로바이더를 잠시 제외한 뒤 다음 LLM으로 페일오버한다.
+
+환경 변수
+----------
+LLM_PROVIDERS
+    라우팅 대상 프로바이더 순서 (기본값: ``claude,openai``)
+PROVIDER_LATENCY_WINDOW
+    지연 시간/오류율 계산에 사용할 최근 요청 수 (기본값: 20)
+PROVIDER_CIRCUIT_FAILURE_THRESHOLD
+    서킷을 여는 연속 429/5xx 횟수 (기본값: 3)
+PROVIDER_CIRCUIT_COOLDOWN_SECONDS
+    서킷이 열린 뒤 재시도까지 대기 시간 (기본값: 300)
+ENABLE_HEDGED_REQUESTS
+    1순위 프로바이더가 p90 지연 시간 안에 응답하지 않으면 2순위에 중복 요청 (기본값: false)
+HEDGE_BUDGET
+    실행당 허용되는 중복(hedge) 요청 수 (기본값: 3)
+HEDGE_DEFAULT_DELAY_SECONDS
+    p90을 계산할 표본이 부족할 때 사용할 hedge 대기 시간 (기본값: 30)
+"""
+from __future__ import annotations
+
+import re
+import socket
+import threading
+import time
+import typing as t
+import urllib.error
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from automation.circuit_breaker import CircuitBreaker
+from automation.logger import get_logger
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from automation.qa_generator import QAProvider, QAResult
+
+logger = get_logger(__name__)
+
+_HTTP_STATUS_PATTERN = re.compile(r"HTTP (\d{3})")
+
+# p90으로 hedge 시점을 정하기 위한 최소 표본 수
+_HEDGE_MIN_SAMPLES = 5
+
+
+class AllProvidersFailedError(RuntimeError):
+    """라우팅 가능한 모든 LLM 프로바이더가 실패했을 때 발생한다."""
+
+
+class ProviderStats:
+    """프로바이더별 최근 요청의 지연 시간과 성공 여부를 보관한다."""
+
+    def __init__(self, window: int = 20):
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.total_requests = 0
+        self.total_failures = 0
+
+    def record(self, latency: float, success: bool) -> None:
+        self.total_requests += 1
+        if not success:
+            self.total_failures += 1
+        self.outcomes.append(success)
+        if success:
+            # 실패 요청의 지연 시간은 타임아웃/즉시 실패가 섞여 있어 분포를 왜곡한다.
+            self.latencies.append(latency)
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return 1.0 - (sum(self.outcomes) / len(self.outcomes))
+
+    def percentile(self, pct: float) -> float | None:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+        return ordered[index]
+
+
+def _is_breaker_failure(exc: BaseException) -> bool:
+    """서킷 브레이커에 반영할 실패(429, 5xx, 연결 실패)인지 판단한다."""
+    current: BaseException | None = exc
+    while current is not None:
+        if isinstance(current, urllib.error.HTTPError):
+            return current.code == 429 or current.code >= 500
+        if isinstance(current, (urllib.error.URLError, socket.timeout, TimeoutError, ConnectionError)):
+            return True
+        match = _HTTP_STATUS_PATTERN.search(str(current))
+        if match:
+            code = int(match.group(1))
+            return code == 429 or code >= 500
+        current = current.__cause__
+    return False
+
+
+class ProviderRouter:
+    """QAProvider 인터페이스를 구현하는 지연 시간 인지형 라우터."""
+
+    def __init__(
+        self,
+        providers: t.Sequence[tuple[str, "QAProvider"]],
+        *,
+        window: int = 20,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 300.0,
+        hedge_enabled: bool = False,
+        hedge_budget: int = 3,
+        hedge_default_delay: float = 30.0,
+        clock: t.Callable[[], float] = time.monotonic,
+    ):
+        if not providers:
+            raise ValueError("ProviderRouter에는 최소 1개의 프로바이더가 필요합니다.")
+        self._providers: dict[str, "QAProvider"] = dict(providers)
+        self._order = [name for name, _ in providers]
+        self._stats = {name: ProviderStats(window) for name in self._order}
+        self._breakers = {
+            name: CircuitBreaker(
+                name,
+                failure_threshold=failure_threshold,
+                cooldown_seconds=cooldown_seconds,
+                clock=clock,
+            )
+            for name in self._order
+        }
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        # hedging은 1순위 응답이 p90을 넘길 때만 2순위 프로바이더에 중복 요청한다.
+        self.hedge_enabled = hedge_enabled and len(self._order) > 1
+        self.hedge_budget = max(0, hedge_budget)
+        self.hedge_default_delay = max(0.0, hedge_default_delay)
+        self.hedges_fired = 0
+        self.hedges_won = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def provider_names(self) -> list[str]:
+        return list(self._order)
+
+    def providers(self) -> list[tuple[str, "QAProvider"]]:
+        """현재 순위 기준 (이름, 프로바이더) 목록을 반환한다."""
+        return [(name, self._providers[name]) for name in self.ranked_providers()]
+
+    def set_research_data(self, research_data: t.Any) -> None:
+        """웹 연구 데이터를 모든 프로바이더에 전달한다."""
+        for provider in self._providers.values():
+            if hasattr(provider, "set_research_data"):
+                provider.set_research_data(research_data)
+
+    def set_mcp_insights(self, mcp_insights: dict[str, t.Any]) -> None:
+        """MCP 분석 결과를 모든 프로바이더에 전달한다."""
+        for provider in self._providers.values():
+            if hasattr(provider, "set_mcp_insights"):
+                provider.set_mcp_insights(mcp_insights)
+
+    def ranked_providers(self) -> list[str]:
+        """오류율과 중앙값 지연 시간 기준으로 정렬된 프로바이더 이름 목록.
+
+        측정값이 없는 프로바이더는 지연 시간 0으로 취급해 한 번은 시도되도록 하고,
+        동률이면 설정된 순서를 유지한다.
+        """
+        with self._lock:
+            def score(name: str) -> tuple[float, float, int]:
+                stats = self._stats[name]
+                p50 = stats.percentile(50)
+                return (round(stats.error_rate, 2), p50 if p50 is not None else 0.0, self._order.index(name))
+
+            return sorted(self._order, key=score)
+
+    def generate(self, item: t.Mapping[str, t.Any]) -> "QAResult":
+        last_exc: BaseException | None = None
+        attempted: list[str] = []
+        queue = self.ranked_providers()
+
+        while queue:
+            name = queue.pop(0)
+            breaker = self._breakers[name]
+            if not breaker.allow_request():
+                logger.info(f"{name} 서킷이 열려 있어 건너뜁니다 ({breaker.seconds_until_retry():.0f}초 후 재시도)")
+                continue
+
+            attempted.append(name)
+            try:
+                if self.hedge_enabled:
+                    return self._call_hedged(name, queue, item, attempted)
+                return self._call(name, item)
+            except Exception as exc:  # pylint: disable=broad-except
+                last_exc = exc
+                logger.warning(f"{name} 프로바이더 실패, 다음 프로바이더로 페일오버합니다: {exc}")
+
+        if not attempted:
+            raise AllProvidersFailedError("모든 LLM 프로바이더의 서킷이 열려 있습니다.")
+        raise AllProvidersFailedError(
+            f"모든 LLM 프로바이더 호출 실패 (시도: {', '.join(attempted)})"
+        ) from last_exc
+
+    def _call(self, name: str, item: t.Mapping[str, t.Any]) -> "QAResult":
+        """프로바이더를 호출하고 지연 시간/성공 여부를 기록한다."""
+        started = self._clock()
+        try:
+            result = self._providers[name].generate(item)
+        except Exception as exc:
+            self._record_failure(name, self._clock() - started, exc)
+            raise
+        self._record_success(name, self._clock() - started)
+        return result
+
+    def _hedge_delay(self, name: str) -> float:
+        with self._lock:
+            stats = self._stats[name]
+            if len(stats.latencies) < _HEDGE_MIN_SAMPLES:
+                return self.hedge_default_delay
+            return stats.percentile(90) or self.hedge_default_delay
+
+    def _take_hedge_budget(self) -> bool:
+        with self._lock:
+            if self.hedges_fired >= self.hedge_budget:
+                return False
+            self.hedges_fired += 1
+            return True
+
+    def _refund_hedge_budget(self) -> None:
+        with self._lock:
+            self.hedges_fired -= 1
+
+    def _submit(self, executor: ThreadPoolExecutor, name: str, item: t.Mapping[str, t.Any]) -> Future:
+        """_call을 스레드 풀에 제출한다. 시작 전에 취소되면 half-open 시험 슬롯을 돌려준다."""
+        future = executor.submit(self._call, name, item)
+        breaker = self._breakers[name]
+        future.add_done_callback(lambda f: breaker.release_trial() if f.cancelled() else None)
+        return future
+
+    def _call_hedged(
+        self,
+        primary: str,
+        queue: list[str],
+        item: t.Mapping[str, t.Any],
+        attempted: list[str],
+    ) -> "QAResult":
+        """1순위 호출이 p90을 넘기면 다음 프로바이더에 중복 요청하고 먼저 성공한 결과를 사용한다.
+
+        진행 중인 urllib 호출은 중단할 수 없으므로 패배한 요청은 시작 전이면 취소하고,
+        이미 실행 중이면 결과를 버린다(지연 시간 통계에는 반영된다).
+        """
+        executor = self._get_executor()
+        primary_future = self._submit(executor, primary, item)
+        delay = self._hedge_delay(primary)
+        done, _ = wait([primary_future], timeout=delay)
+        if done:
+            return primary_future.result()
+
+        # 예산을 먼저 확인한다. allow_request()는 half-open 시험 슬롯을 차지하기 때문이다.
+        if not self._take_hedge_budget():
+            return primary_future.result()
+        secondary = next((name for name in queue if self._breakers[name].allow_request()), None)
+        if secondary is None:
+            self._refund_hedge_budget()
+            return primary_future.result()
+
+        queue.remove(secondary)
+        attempted.append(secondary)
+        logger.info(
+            f"{primary} 응답이 {delay:.1f}초(p90)를 넘어 {secondary}에 hedge 요청을 보냅니다 "
+            f"({self.hedges_fired}/{self.hedge_budget})"
+        )
+        futures: dict[Future, str] = {
+            primary_future: primary,
+            self._submit(executor, secondary, item): secondary,
+        }
+
+        pending = set(futures)
+        last_exc: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                exc = future.exception()
+                if exc is not None:
+                    last_exc = exc
+                    logger.warning(f"{futures[future]} hedge 경쟁 요청 실패: {exc}")
+                    continue
+                for loser in pending:
+                    loser.cancel()
+                if futures[future] == secondary:
+                    with self._lock:
+                        self.hedges_won += 1
+                return future.result()
+
+        assert last_exc is not None
+        raise last_exc
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(self._order) * 2,
+                    thread_name_prefix="llm-hedge",
+                )
+            return self._executor
+
+    def hedge_stats(self) -> dict[str, t.Any]:
+        """hedge 사용 현황을 반환한다."""
+        with self._lock:
+            return {
+                "enabled": self.hedge_enabled,
+                "fired": self.hedges_fired,
+                "won": self.hedges_won,
+                "budget": self.hedge_budget,
+            }
+
+    def close(self) -> None:
+        """hedge용 스레드 풀을 정리한다. 실행 중인 요청은 기다리지 않는다."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _record_success(self, name: str, latency: float) -> None:
+        with self._lock:
+            self._stats[name].record(latency, success=True)
+        self._breakers[name].record_success()
+
+    def _record_failure(self, name: str, latency: float, exc: BaseException) -> None:
+        with self._lock:
+            self._stats[name].record(latency, success=False)
+        if _is_breaker_failure(exc):
+            self._breakers[name].record_failure()
+        else:
+            self._breakers[name].release_trial()
+
+    def health_snapshot(self) -> dict[str, dict[str, t.Any]]:
+        """프로바이더별 지연 시간, 오류율, 서킷 상태를 반환한다."""
+        snapshot: dict[str, dict[str, t.Any]] = {}
+        for name in self._order:
+            with self._lock:
+                stats = self._stats[name]
+                p50 = stats.percentile(50)
+                p90 = stats.percentile(90)
+                entry = {
+                    "requests": stats.total_requests,
+                    "failures": stats.total_failures,
+                    "error_rate": round(stats.error_rate, 3),
+                    "p50_latency": round(p50, 2) if p50 is not None else None,
+                    "p90_latency": round(p90, 2) if p90 is not None else None,
+                }
+            entry["circuit"] = self._breakers[name].snapshot()["state"]
+            snapshot[name] = entry
+        return snapshot
@@ -0,0 +1,234 @@
+"""TF-IDF 기반 관련 포스트 인덱스.
+
+Jekyll의 lsi 관련 포스트 기능은 빌드마다 전체 포스트를 다시 분석해 포스트가 늘수록
+빌드가 느려진다. 대신 Python 빌드 단계에서 _posts/**의 TF-IDF 벡터로 포스트별
+상위 k개의 관련 포스트를 계산해 ``_data/related.yml``로 내보내고, 레이아웃은
+``site.data.related[page.path]``만 읽는다. 항목의 URL과 날짜는 Jekyll이 정하므로
+_plugins/related_posts.rb가 빌드 시 page.path → 포스트 맵을 한 번 만들어 채운다.
+
+- 토큰: relevance_classifier.tokenize (영문 단어 + 한글 음절 bigram)
+- 포스트별 토큰 빈도는 data/related_index.json에 저장하고, 수정 시각/크기가 바뀐
+  파일 중 내용 해시가 달라진 파일만 다시 토큰화한다.
+- 유사도: (1 + log tf) × idf 벡터의 코사인 유사도. 토큰 → (포스트, 가중치) 역색인으로
+  겹치는 토큰이 있는 포스트 쌍만 내적을 누적한다.
+
+사용 예시::
+
+    python scripts/build_related_posts.py --top-k 5
+"""
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import math
+import re
+import typing as t
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from automation.logger import get_logger
+from automation.relevance_classifier import tokenize
+
+logger = get_logger(__name__)
+
+DEFAULT_INDEX_PATH = Path("data/related_index.json")
+DEFAULT_OUTPUT_PATH = Path("_data/related.yml")
+DEFAULT_TOP_K = 5
+MIN_SIMILARITY = 0.05
+INDEX_VERSION = 1
+
+_FRONT_MATTER_RE = re.compile(r"\A---\s*\n(.*?)\n[ \t]*---[ \t]*\n?", re.DOTALL)
+_MARKUP_RE = re.compile(r"`{3}.*?`{3}|<[^>]+>|\[([^\]]*)\]\([^)]*\)|https?://\S+", re.DOTALL)
+
+
+def post_key(path: Path, posts_dir: Path) -> str:
+    """Jekyll의 page.path와 같은 형태의 키 (예: _posts/learning/2025-01-01-a.md)."""
+    return f"{posts_dir.name}/{path.relative_to(posts_dir).as_posix()}"
+
+
+def post_terms(raw: str) -> tuple[str, dict[str, int]]:
+    """포스트 원문에서 (제목, 토큰 빈도)를 만든다. 제목과 태그는 두 번 센다."""
+    title = ""
+    weighted: list[str] = []
+    match = _FRONT_MATTER_RE.match(raw)
+    if match:
+        for line in match.group(1).splitlines():
+            name, sep, value = line.partition(":")
+            name = name.strip()
+            value = value.strip().strip("\"'[]")
+            if not sep:
+                continue
+            if name == "title":
+                title = value
+            if name in ("title", "tags"):
+                weighted.extend([value, value])
+            elif name in ("description", "summary"):
+                weighted.append(value)
+        raw = raw[match.end():]
+    body = _MARKUP_RE.sub(lambda m: m.group(1) or " ", raw)
+    return title, dict(Counter(tokenize(" ".join(weighted) + " " + body)))
+
+
+@dataclass
+class IndexedPost:
+    """인덱스에 저장된 포스트 하나."""
+
+    title: str
+    digest: str
+    mtime: float
+    size: int
+    terms: dict[str, int] = field(default_factory=dict)
+
+
+class RelatedPostsIndex:
+    """포스트별 토큰 빈도를 보관하고 관련 포스트를 계산한다."""
+
+    def __init__(self, path: Path | str | None = DEFAULT_INDEX_PATH):
+        self.path = Path(path) if path else None
+        self.posts: dict[str, IndexedPost] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning(f"관련 포스트 인덱스를 읽을 수 없어 새로 만듭니다: {exc}")
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        self.posts = {key: IndexedPost(**value) for key, value in data.get("posts", {}).items()}
+
+    def save(self) -> None:
+        if not self.path or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": INDEX_VERSION,
+            "posts": {key: vars(post) for key, post in sorted(self.posts.items())},
+        }
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(self.path)
+        self._dirty = False
+
+    def update(self, posts_dir: Path | str) -> tuple[list[str], list[str]]:
+        """디렉터리와 인덱스를 맞춘다. (다시 토큰화한 키, 삭제된 키)를 반환한다."""
+        posts_dir = Path(posts_dir)
+        seen: set[str] = set()
+        changed: list[str] = []
+        for path in sorted(posts_dir.rglob("*.md")):
+            key = post_key(path, posts_dir)
+            seen.add(key)
+            try:
+                stat = path.stat()
+                known = self.posts.get(key)
+                if known and known.mtime == stat.st_mtime and known.size == stat.st_size:
+                    continue
+                raw = path.read_bytes()
+            except OSError as exc:
+                logger.warning(f"포스트를 읽을 수 없습니다 ({path}): {exc}")
+                continue
+            digest = hashlib.sha1(raw).hexdigest()
+            self._dirty = True
+            if known and known.digest == digest:
+                known.mtime, known.size = stat.st_mtime, stat.st_size
+                continue
+            title, terms = post_terms(raw.decode("utf-8", errors="replace"))
+            self.posts[key] = IndexedPost(title, digest, stat.st_mtime, stat.st_size, terms)
+            changed.append(key)
+        removed = [key for key in self.posts if key not in seen]
+        for key in removed:
+            del self.posts[key]
+            self._dirty = True
+        return changed, removed
+
+    def _vectors(self) -> dict[str, dict[str, float]]:
+        """L2 정규화한 (1 + log tf) × idf 벡터. 한 포스트에만 나오는 토큰은 유사도에 기여하지 않아 제외한다."""
+        doc_freq: Counter[str] = Counter()
+        for post in self.posts.values():
+            doc_freq.update(post.terms.keys())
+        n_docs = len(self.posts)
+        idf = {token: math.log(n_docs / df) for token, df in doc_freq.items() if 1 < df < n_docs}
+        vectors: dict[str, dict[str, float]] = {}
+        for key, post in self.posts.items():
+            vector = {
+                token: (1 + math.log(count)) * idf[token]
+                for token, count in post.terms.items() if token in idf
+            }
+            norm = math.sqrt(sum(value * value for value in vector.values()))
+            vectors[key] = {token: value / norm for token, value in vector.items()} if norm else {}
+        return vectors
+
+    def related(self, top_k: int = DEFAULT_TOP_K, min_similarity: float = MIN_SIMILARITY) -> dict[str, list[tuple[str, float]]]:
+        """포스트별 유사도 상위 top_k개의 (키, 코사인 유사도)."""
+        vectors = self._vectors()
+        postings: dict[str, list[tuple[str, float]]] = defaultdict(list)
+        for key, vector in vectors.items():
+            for token, weight in vector.items():
+                postings[token].append((key, weight))
+
+        result: dict[str, list[tuple[str, float]]] = {}
+        for key, vector in vectors.items():
+            scores: dict[str, float] = defaultdict(float)
+            for token, weight in vector.items():
+                for other, other_weight in postings[token]:
+                    scores[other] += weight * other_weight
+            scores.pop(key, None)
+            best = heapq.nlargest(top_k, scores.items(), key=lambda pair: (pair[1], pair[0]))
+            result[key] = [(other, round(score, 4)) for other, score in best if score >= min_similarity]
+        return result
+
+
+def _yaml_str(value: str) -> str:
+    # JSON 문자열은 YAML의 큰따옴표 스칼라로도 유효하다 (PyYAML 없이 출력).
+    return json.dumps(value, ensure_ascii=False)
+
+
+def write_related_yaml(
+    related: t.Mapping[str, t.Sequence[tuple[str, float]]],
+    posts: t.Mapping[str, IndexedPost],
+    path: Path | str = DEFAULT_OUTPUT_PATH,
+) -> bool:
+    """``_data/related.yml``을 쓴다. 내용이 그대로면 쓰지 않고 False를 반환한다."""
+    lines = ["# scripts/build_related_posts.py가 생성한 파일입니다. 직접 수정하지 마세요."]
+    for key in sorted(related):
+        if not related[key]:
+            continue
+        lines.append(f"{_yaml_str(key)}:")
+        for other, score in related[key]:
+            lines.append(f"  - path: {_yaml_str(other)}")
+            lines.append(f"    title: {_yaml_str(posts[other].title)}")
+            lines.append(f"    score: {score}")
+    text = "\n".join(lines) + "\n"
+    path = Path(path)
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return True
+
+
+def build_related_posts(
+    posts_dir: Path | str = Path("_posts"),
+    *,
+    index_path: Path | str | None = DEFAULT_INDEX_PATH,
+    output_path: Path | str = DEFAULT_OUTPUT_PATH,
+    top_k: int = DEFAULT_TOP_K,
+) -> dict[str, int]:
+    """인덱스를 갱신하고 관련 포스트 데이터 파일을 다시 쓴다."""
+    index = RelatedPostsIndex(index_path)
+    changed, removed = index.update(posts_dir)
+    related = index.related(top_k)
+    written = write_related_yaml(related, index.posts, output_path)
+    index.save()
+    stats = {"posts": len(index.posts), "changed": len(changed), "removed": len(removed), "written": int(written)}
+    logger.info(
+        f"관련 포스트: 포스트 {stats['posts']}개, 다시 분석 {stats['changed']}개, "
+        f"삭제 {stats['removed']}개{' (데이터 파일 갱신)' if written else ''}"
+    )
+    return stats
@@ -0,0 +1,210 @@
+"""로컬 관련성/카테고리 분류기 (TF-IDF + 다항 나이브 베이즈).
+
+LLM이 정하는 blog_category와 게시 가치는 생성 비용을 치른 뒤에야 알 수 있다.
+이미 _posts/{learning,qa-engineer,daily-life}에 카테고리별로 분류된 포스트가 있으므로
+이를 학습 데이터로 삼아 제목/요약만으로 카테고리와 관련성을 빠르게 예측한다.
+
+- 토큰: 영문/숫자 단어와 한글 음절 bigram (형태소 분석기 없이 띄어쓰기 차이에 강함)
+- 문서 벡터: (1 + log tf) × idf, L2 정규화
+- 카테고리: 다항 나이브 베이즈 (라플라스 스무딩, TF-IDF 가중치를 빈도로 사용).
+  Daily Life 포스트가 적어 사전 확률은 균등하게 둔다.
+- 관련성: 기술 카테고리(Learning, QA Engineer)의 사후 확률 합 × 어휘 적중률.
+  나이브 베이즈는 아는 토큰이 없으면 사전 확률만 남으므로, 블로그 어휘와
+  겹치는 토큰 비율을 곱해 스포츠/정치처럼 전혀 다른 주제의 점수를 낮춘다.
+  포스트는 한국어라 영어 기능어(we, by, in ...)는 어휘에 거의 없으므로 적중률
+  계산에서 빼고, 영어 항목이 기술 용어(ci, test ...)만으로 판단되게 한다.
+
+기존 포스트 leave-one-out 평가에서 제목+요약만으로 카테고리 정확도 약 82%,
+Daily Life 재현율 9/10이었고, 관련성 0.1 미만으로 떨어진 기술 포스트는 2/100이었다
+(benchmarks/bench_relevance_classifier.py).
+numpy는 의존성에 없으므로 학습과 예측 모두 표준 라이브러리의 희소 dict 연산만
+사용한다 (학습 수십 ms, 예측 항목당 100µs 미만).
+
+환경 변수
+----------
+RELEVANCE_CLASSIFIER
+    분류기 사용 여부 (기본값: true)
+RELEVANCE_MIN_SCORE
+    이보다 관련성이 낮은 항목은 우선순위를 낮추고, AI/QA/트렌드 키워드가 없으면
+    생성 전에 제외 (기본값: 0.1, 0이면 사용하지 않음)
+"""
+from __future__ import annotations
+
+import math
+import os
+import re
+import typing as t
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+from automation.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 포스트 디렉터리 → blog_category
+CATEGORY_DIRS = {"learning": "Learning", "qa-engineer": "QA Engineer", "daily-life": "Daily Life"}
+TOPICAL_CATEGORIES = ("Learning", "QA Engineer")
+DEFAULT_MIN_RELEVANCE = 0.1
+BODY_CHARS = 600  # 학습 시 본문 앞부분만 사용
+ALPHA = 0.5
+
+_FRONT_MATTER_RE = re.compile(r"\A---\s*\n(.*?)\n[ \t]*---[ \t]*\n?", re.DOTALL)
+_WORD_RE = re.compile(r"[a-z][a-z0-9+#.]*[a-z0-9+#]|[a-z]")
+_HANGUL_RE = re.compile(r"[가-힣]+")
+_MARKUP_RE = re.compile(r"`{3}.*?`{3}|<[^>]+>|\[([^\]]*)\]\([^)]*\)|https?://\S+", re.DOTALL)
+_STOPWORDS = frozenset({
+    "the", "and", "for", "with", "that", "this", "from", "are", "was", "you", "your", "can",
+    "will", "not", "but", "has", "have", "its", "into", "how", "what", "all", "our", "more",
+})
+# 어휘 적중률에서 빼는 영어 기능어/일반어 (토큰화 규칙은 검색 인덱스와 공유하므로 바꾸지 않는다)
+_COVERAGE_IGNORE = frozenset({
+    "a", "an", "as", "at", "be", "by", "do", "if", "in", "is", "it", "of", "on", "or", "so", "to",
+    "up", "us", "we", "he", "she", "they", "them", "their", "his", "her", "who", "why", "when",
+    "where", "which", "than", "then", "there", "these", "those", "were", "been", "being", "after",
+    "before", "over", "under", "about", "across", "new", "now", "just", "out", "one", "two", "get",
+    "got", "make", "made", "time", "year", "years", "day", "week", "says", "said",
+})
+
+
+def tokenize(text: str) -> list[str]:
+    """영문 단어(2자 이상, 불용어 제외)와 한글 음절 bigram."""
+    text = unicodedata.normalize("NFKC", text).lower()
+    tokens = [word for word in _WORD_RE.findall(text) if len(word) > 1 and word not in _STOPWORDS]
+    for run in _HANGUL_RE.findall(text):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def _post_text(path: Path) -> str:
+    """포스트의 제목/설명/태그와 본문 앞부분."""
+    raw = path.read_text(encoding="utf-8")
+    match = _FRONT_MATTER_RE.match(raw)
+    fields: list[str] = []
+    if match:
+        for line in match.group(1).splitlines():
+            name, sep, value = line.partition(":")
+            if sep and name.strip() in ("title", "description", "summary", "tags"):
+                fields.append(value.strip().strip("\"'[]"))
+        raw = raw[match.end():]
+    body = _MARKUP_RE.sub(lambda m: m.group(1) or " ", raw[: BODY_CHARS * 2])[:BODY_CHARS]
+    # 짧은 입력(제목+요약)으로 예측하므로 제목/설명 가중치를 본문보다 높인다.
+    return " ".join(fields * 3) + " " + body
+
+
+@dataclass
+class Prediction:
+    category: str
+    probability: float
+    relevance: float
+
+
+class RelevanceClassifier:
+    """TF-IDF 가중 다항 나이브 베이즈 분류기."""
+
+    def __init__(self, alpha: float = ALPHA):
+        self.alpha = alpha
+        self.idf: dict[str, float] = {}
+        self.priors: dict[str, float] = {}
+        self.log_probs: dict[str, dict[str, float]] = {}
+        self.unseen_log_prob: dict[str, float] = {}
+        self.documents = 0
+
+    @property
+    def categories(self) -> list[str]:
+        return list(self.priors)
+
+    def _vector(self, tokens: t.Iterable[str]) -> dict[str, float]:
+        counts = Counter(token for token in tokens if token in self.idf)
+        vector = {token: (1 + math.log(count)) * self.idf[token] for token, count in counts.items()}
+        norm = math.sqrt(sum(value * value for value in vector.values()))
+        return {token: value / norm for token, value in vector.items()} if norm else {}
+
+    def fit(self, texts: t.Sequence[str], labels: t.Sequence[str]) -> "RelevanceClassifier":
+        tokenized = [tokenize(text) for text in texts]
+        doc_freq: Counter[str] = Counter()
+        for tokens in tokenized:
+            doc_freq.update(set(tokens))
+        n_docs = len(tokenized)
+        # 한 문서에만 나오는 토큰은 제외 (과적합 방지, 어휘 크기 축소)
+        self.idf = {
+            token: math.log((1 + n_docs) / (1 + df)) + 1
+            for token, df in doc_freq.items() if df >= 2
+        }
+        self.documents = n_docs
+
+        weights: dict[str, Counter[str]] = {}
+        for tokens, label in zip(tokenized, labels):
+            weights.setdefault(label, Counter()).update(self._vector(tokens))
+
+        vocab_size = len(self.idf)
+        self.priors = {label: math.log(1 / len(weights)) for label in weights}
+        self.log_probs = {}
+        self.unseen_log_prob = {}
+        for label, counter in weights.items():
+            total = sum(counter.values()) + self.alpha * vocab_size
+            self.log_probs[label] = {token: math.log((w + self.alpha) / total) for token, w in counter.items()}
+            self.unseen_log_prob[label] = math.log(self.alpha / total)
+        return self
+
+    @classmethod
+    def from_posts(cls, posts_dir: Path | str) -> "RelevanceClassifier":
+        """카테고리 디렉터리별 포스트로 학습한다."""
+        texts: list[str] = []
+        labels: list[str] = []
+        for directory, category in CATEGORY_DIRS.items():
+            for path in sorted((Path(posts_dir) / directory).glob("*.md")):
+                try:
+                    texts.append(_post_text(path))
+                except OSError:
+                    continue
+                labels.append(category)
+        if len(set(labels)) < 2:
+            raise ValueError(f"학습할 포스트가 부족합니다: {posts_dir}")
+        return cls().fit(texts, labels)
+
+    def predict(self, title: str, summary: str = "") -> Prediction:
+        """카테고리, 그 확률, 관련성(0~1)을 반환한다."""
+        tokens = tokenize(f"{title} {summary}")
+        content = [token for token in tokens if token not in _COVERAGE_IGNORE]
+        coverage = sum(1 for token in content if token in self.idf) / len(content) if content else 0.0
+        vector = self._vector(tokenize(title) + tokens)
+        scores = {
+            label: prior + sum(
+                weight * self.log_probs[label].get(token, self.unseen_log_prob[label])
+                for token, weight in vector.items()
+            )
+            for label, prior in self.priors.items()
+        }
+        best = max(scores, key=scores.__getitem__)
+        top = scores[best]
+        exp_scores = {label: math.exp(score - top) for label, score in scores.items()}
+        total = sum(exp_scores.values())
+        topical = sum(exp_scores.get(label, 0.0) for label in TOPICAL_CATEGORIES) / total
+        relevance = topical * coverage
+        return Prediction(category=best, probability=exp_scores[best] / total, relevance=relevance)
+
+
+def classifier_enabled() -> bool:
+    return os.getenv("RELEVANCE_CLASSIFIER", "true").lower() in ("true", "1", "yes")
+
+
+def min_relevance_from_env() -> float:
+    return float(os.getenv("RELEVANCE_MIN_SCORE", str(DEFAULT_MIN_RELEVANCE)))
+
+
+def load_classifier(posts_dir: Path | str) -> RelevanceClassifier | None:
+    """설정에 따라 포스트로 학습한 분류기를 만든다 (비활성화/실패 시 None)."""
+    if not classifier_enabled():
+        return None
+    try:
+        classifier = RelevanceClassifier.from_posts(posts_dir)
+    except Exception as exc:
+        logger.warning(f"관련성 분류기를 만들 수 없어 건너뜁니다: {exc}")
+        return None
+    logger.info(f"관련성 분류기 학습 완료: 포스트 {classifier.documents}개, 어휘 {len(classifier.idf)}개")
+    return classifier
@@ -0,0 +1,285 @@
+"""블로그 전문 검색용 역색인 생성기.
+
+전체 본문을 담은 search.json 하나를 내려받게 하는 대신, 토큰 → 포스팅 목록을
+토큰 첫 글자 기준 샤드로 나눠 assets/search/에 쓴다. 검색 페이지는 manifest.json과
+질의 토큰이 속한 샤드만 내려받는다.
+
+- 토큰: relevance_classifier.tokenize (영문 단어 + 한글 음절 bigram). 브라우저도 같은
+  규칙으로 질의를 나눈다 (search.html).
+- 샤드: 한글은 첫 음절의 초성(19개), 영문은 첫 글자, 그 밖은 "_".
+- 포스팅: ``{"토큰": [문서 id, tf, 문서 id, tf, ...]}``
+- manifest.json: 문서 id → [page.path, 제목, 날짜, 토큰 수], 샤드별 내용 해시(캐시 무효화용)
+- 포스트별 토큰 빈도와 문서 id는 data/search_state.json에 보관한다. 새로 생기거나
+  바뀐/삭제된 포스트가 있으면 그 포스트의 이전/현재 토큰이 속한 샤드만 다시 쓴다.
+- 상태 파일은 커밋하지 않으므로, 상태가 없거나 상태의 문서 id가 커밋된 manifest.json과
+  다르면(다른 체크아웃에서 다시 만든 샤드를 받은 경우) 모든 샤드를 다시 쓰고,
+  더 이상 토큰이 없는 샤드 파일은 지운다.
+
+사용 예시::
+
+    python scripts/build_search_index.py
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import typing as t
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from automation.logger import get_logger
+from automation.relevance_classifier import tokenize
+
+logger = get_logger(__name__)
+
+DEFAULT_OUTPUT_DIR = Path("assets/search")
+DEFAULT_STATE_PATH = Path("data/search_state.json")
+MANIFEST_NAME = "manifest.json"
+INDEX_VERSION = 1
+
+_FRONT_MATTER_RE = re.compile(r"\A---\s*\n(.*?)\n[ \t]*---[ \t]*\n?", re.DOTALL)
+_MARKUP_RE = re.compile(r"<[^>]+>|\[([^\]]*)\]\([^)]*\)|https?://\S+|[`*#>|]")
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_SHARD_NAME_RE = re.compile(r"^(?:h\d{2}|[a-z]|_)$")
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_SYLLABLES_PER_INITIAL = 588  # 중성 21 × 종성 28
+
+
+def shard_of(term: str) -> str:
+    """토큰이 속한 샤드 이름 (한글: 초성 번호 h00~h18, 영문: 첫 글자, 그 밖: _)."""
+    first = term[:1]
+    if _HANGUL_BASE <= ord(first or " ") <= _HANGUL_LAST:
+        return f"h{(ord(first) - _HANGUL_BASE) // _SYLLABLES_PER_INITIAL:02d}"
+    if "a" <= first <= "z":
+        return first
+    return "_"
+
+
+def parse_post(raw: str, fallback_date: str = "") -> tuple[str, str, dict[str, int]]:
+    """포스트 원문에서 (제목, 날짜, 토큰 빈도)를 만든다. 코드 블록도 검색 대상에 포함한다."""
+    title = ""
+    date = fallback_date
+    searchable: list[str] = []
+    match = _FRONT_MATTER_RE.match(raw)
+    if match:
+        for line in match.group(1).splitlines():
+            name, sep, value = line.partition(":")
+            name = name.strip()
+            value = value.strip().strip("\"'[]")
+            if not sep:
+                continue
+            if name == "title":
+                title = value
+            elif name == "date":
+                found = _DATE_RE.search(value)
+                date = found.group(0) if found else date
+            if name in ("title", "tags", "description", "summary"):
+                searchable.append(value)
+        raw = raw[match.end():]
+    searchable.append(_MARKUP_RE.sub(lambda m: m.group(1) or " ", raw))
+    return title, date, dict(Counter(tokenize(" ".join(searchable))))
+
+
+class SearchIndex:
+    """포스트별 토큰 빈도와 문서 id를 보관하고 바뀐 샤드만 다시 쓴다."""
+
+    def __init__(
+        self,
+        output_dir: Path | str = DEFAULT_OUTPUT_DIR,
+        state_path: Path | str | None = DEFAULT_STATE_PATH,
+    ):
+        self.output_dir = Path(output_dir)
+        self.state_path = Path(state_path) if state_path else None
+        self.docs: dict[str, dict[str, t.Any]] = {}
+        self.next_id = 0
+        self._dirty_shards: set[str] = set()
+        self._docs_changed = False
+        self._state_dirty = False
+        self._rebuild = True  # 출력 디렉터리의 샤드가 상태의 문서 id와 맞는지 알 수 없으면 전부 다시 쓴다
+        self._load()
+
+    def _load(self) -> None:
+        if not self.state_path or not self.state_path.exists():
+            return
+        try:
+            data = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning(f"검색 인덱스 상태를 읽을 수 없어 새로 만듭니다: {exc}")
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        self.docs = data.get("docs", {})
+        self.next_id = int(data.get("next_id", 0))
+        self._rebuild = self._manifest_ids() != {key: doc["id"] for key, doc in self.docs.items()}
+        if self._rebuild:
+            logger.info("검색 인덱스 상태가 manifest.json과 달라 모든 샤드를 다시 씁니다.")
+
+    def _manifest_ids(self) -> dict[str, int] | None:
+        """커밋된 manifest.json의 page.path → 문서 id (없거나 읽을 수 없으면 None)."""
+        try:
+            manifest = json.loads(self._manifest_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if manifest.get("version") != INDEX_VERSION:
+            return None
+        return {doc[0]: int(doc_id) for doc_id, doc in manifest.get("docs", {}).items()}
+
+    def _save_state(self) -> None:
+        if not self.state_path:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": INDEX_VERSION, "next_id": self.next_id, "docs": self.docs}
+        tmp = self.state_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(self.state_path)
+        self._state_dirty = False
+
+    def _touch(self, terms: t.Iterable[str]) -> None:
+        self._dirty_shards.update(shard_of(term) for term in terms)
+        self._docs_changed = True
+
+    def index_file(self, path: Path, key: str) -> bool:
+        """포스트 하나를 인덱스에 반영한다. 내용이 바뀌어 다시 토큰화했으면 True."""
+        stat = path.stat()
+        known = self.docs.get(key)
+        if known and known["mtime"] == stat.st_mtime and known["size"] == stat.st_size:
+            return False
+        raw = path.read_bytes()
+        digest = hashlib.sha1(raw).hexdigest()
+        if known and known["digest"] == digest:
+            known["mtime"], known["size"] = stat.st_mtime, stat.st_size
+            self._state_dirty = True
+            return False
+        filename_date = _DATE_RE.match(path.name)
+        fallback_date = filename_date.group(0) if filename_date else ""
+        title, date, terms = parse_post(raw.decode("utf-8", errors="replace"), fallback_date)
+        if known:
+            self._touch(known["terms"])
+            doc_id = known["id"]
+        else:
+            doc_id = self.next_id
+            self.next_id += 1
+        self._touch(terms)
+        self.docs[key] = {
+            "id": doc_id,
+            "title": title,
+            "date": date,
+            "digest": digest,
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "terms": terms,
+        }
+        return True
+
+    def remove(self, key: str) -> None:
+        doc = self.docs.pop(key, None)
+        if doc:
+            self._touch(doc["terms"])
+
+    def update(self, posts_dir: Path | str) -> tuple[list[str], list[str]]:
+        """디렉터리와 인덱스를 맞춘다. (다시 토큰화한 키, 삭제된 키)를 반환한다."""
+        posts_dir = Path(posts_dir)
+        seen: set[str] = set()
+        changed: list[str] = []
+        for path in sorted(posts_dir.rglob("*.md")):
+            key = f"{posts_dir.name}/{path.relative_to(posts_dir).as_posix()}"
+            seen.add(key)
+            try:
+                if self.index_file(path, key):
+                    changed.append(key)
+            except OSError as exc:
+                logger.warning(f"포스트를 읽을 수 없습니다 ({path}): {exc}")
+        removed = [key for key in self.docs if key not in seen]
+        for key in removed:
+            self.remove(key)
+        return changed, removed
+
+    def add_post(self, path: Path | str, posts_dir: Path | str = Path("_posts")) -> list[str]:
+        """write_post에서 새 포스트 하나를 반영하고 바뀐 샤드만 바로 쓴다."""
+        path, posts_dir = Path(path), Path(posts_dir)
+        self.index_file(path, f"{posts_dir.name}/{path.relative_to(posts_dir).as_posix()}")
+        return self.write()
+
+    @property
+    def _manifest_path(self) -> Path:
+        return self.output_dir / MANIFEST_NAME
+
+    def _shard_postings(self, shards: set[str]) -> dict[str, dict[str, list[int]]]:
+        postings: dict[str, dict[str, list[int]]] = {shard: defaultdict(list) for shard in shards}
+        for doc in sorted(self.docs.values(), key=lambda doc: doc["id"]):
+            for term, tf in doc["terms"].items():
+                shard = postings.get(shard_of(term))
+                if shard is not None:
+                    shard[term].extend((doc["id"], tf))
+        return postings
+
+    def write(self) -> list[str]:
+        """바뀐 샤드와 manifest를 쓴다. 다시 쓴 샤드 이름 목록을 반환한다."""
+        if self._rebuild:
+            # 모든 샤드를 다시 쓰고, 기존 샤드 파일 중 토큰이 없는 것은 지운다.
+            self._touch(term for doc in self.docs.values() for term in doc["terms"])
+            if self.output_dir.exists():
+                self._dirty_shards.update(
+                    path.stem for path in self.output_dir.glob("*.json") if _SHARD_NAME_RE.match(path.stem)
+                )
+            self._rebuild = False
+        if not self._docs_changed:
+            if self._state_dirty:
+                self._save_state()
+            return []
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        manifest: dict[str, t.Any] = {}
+        if self._manifest_path.exists():
+            try:
+                manifest = json.loads(self._manifest_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                manifest = {}
+        shard_hashes: dict[str, str] = dict(manifest.get("shards", {}))
+
+        written: list[str] = []
+        for shard, postings in sorted(self._shard_postings(self._dirty_shards).items()):
+            shard_path = self.output_dir / f"{shard}.json"
+            if not postings:
+                shard_path.unlink(missing_ok=True)
+                shard_hashes.pop(shard, None)
+                continue
+            text = json.dumps(dict(sorted(postings.items())), ensure_ascii=False, separators=(",", ":"))
+            shard_path.write_text(text, encoding="utf-8")
+            shard_hashes[shard] = hashlib.sha1(text.encode("utf-8")).hexdigest()[:10]
+            written.append(shard)
+
+        manifest = {
+            "version": INDEX_VERSION,
+            "docs": {
+                str(doc["id"]): [key, doc["title"], doc["date"], sum(doc["terms"].values())]
+                for key, doc in sorted(self.docs.items(), key=lambda pair: pair[1]["id"])
+            },
+            "shards": dict(sorted(shard_hashes.items())),
+        }
+        self._manifest_path.write_text(
+            json.dumps(manifest, ensure_ascii=False, separators=(",", ":")), encoding="utf-8"
+        )
+        self._save_state()
+        self._dirty_shards.clear()
+        self._docs_changed = False
+        return written
+
+
+def build_search_index(
+    posts_dir: Path | str = Path("_posts"),
+    *,
+    output_dir: Path | str = DEFAULT_OUTPUT_DIR,
+    state_path: Path | str | None = DEFAULT_STATE_PATH,
+) -> dict[str, int]:
+    """_posts 전체와 인덱스를 맞추고 바뀐 샤드만 다시 쓴다."""
+    index = SearchIndex(output_dir, state_path)
+    changed, removed = index.update(posts_dir)
+    written = index.write()
+    stats = {"posts": len(index.docs), "changed": len(changed), "removed": len(removed), "shards": len(written)}
+    logger.info(
+        f"검색 인덱스: 포스트 {stats['posts']}개, 다시 분석 {stats['changed']}개, "
+        f"삭제 {stats['removed']}개, 샤드 {stats['shards']}개 갱신"
+    )
+    return stats
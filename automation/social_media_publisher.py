@@ -853,9 +853,15 @@ if __name__ == "__main__":
         # 오케스트레이터 초기화
         orchestrator = SocialMediaOrchestrator()
         
-        # 최신 블로그 포스트 찾기
-        posts_dir = Path("_posts")
-        latest_post = max(posts_dir.glob("**/*.md"), key=os.path.getmtime)
+        # 최신 블로그 포스트 찾기 (포스트 매니페스트 조회)
+        from automation.posts_manifest import PostsManifest
+
+        manifest = PostsManifest.from_env()
+        latest = manifest.latest()
+        if latest is None:
+            print("게시할 블로그 포스트가 없습니다.")
+            return
+        latest_post = manifest.file_path(latest)
         
         # 모든 플랫폼에 게시
         results = await orchestrator.publish_to_all_platforms(latest_post)
@@ -2,28 +2,36 @@
 
 Gmail API를 통해 특정 라벨(기본: newsletter)의 최근 메일을 조회하고,
 본문 텍스트와 포함된 링크를 추출하여 표준 FeedItem 형태로 반환한다.
+
+라벨별 마지막 historyId를 저장해 두고 다음 실행에서는 users.history.list로
+새로 추가된 메시지만 조회한다. 메시지는 HTTP 배치 요청으로 메타데이터를 먼저
+받아 중복을 거른 뒤, 통과한 메시지의 본문만 받는다.
 """
 from __future__ import annotations
 
-import base64
 import datetime as dt
-import html
-import re
+import json
 import typing as t
-
-from bs4 import BeautifulSoup  # type: ignore
+from pathlib import Path
 
 try:
     from google.auth.transport.requests import Request  # type: ignore
     from google.oauth2.credentials import Credentials  # type: ignore
-    from googleapiclient.discovery import build  # type: ignore
     from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
     GOOGLE_GMAIL_AVAILABLE = True
 except Exception:
     GOOGLE_GMAIL_AVAILABLE = False
 
+from automation.logger import get_logger
+
+from .google_services import get_service
+from .mail_extract import extract_message
+
+logger = get_logger(__name__)
+
 
 SCOPES = ["https://www.googleapis.com/auth/gmail.readonly"]
+MESSAGES_BATCH_SIZE = 50  # Gmail은 배치당 50개 이하를 권장 (초과 시 429 증가)
 
 
 def _get_credentials(client_secret_file: str, token_file: str) -> "Credentials":
@@ -48,79 +56,6 @@ def _get_credentials(client_secret_file: str, token_file: str) -> "Credentials":
     return creds
 
 
-def _decode_body(message: dict) -> str:
-    """메시지에서 본문 추출(Base64url decoding + HTML -> text)."""
-    payload = message.get("payload", {})
-    data = None
-
-    def _walk_parts(parts: list[dict]) -> str:
-        for part in parts:
-            mime = part.get("mimeType", "")
-            body = part.get("body", {})
-            data = body.get("data")
-            if data and ("html" in mime or "plain" in mime):
-                try:
-                    raw = base64.urlsafe_b64decode(data.encode("utf-8")).decode("utf-8", errors="replace")
-                    return raw
-                except Exception:
-                    continue
-            if part.get("parts"):
-                inner = _walk_parts(part["parts"])
-                if inner:
-                    return inner
-        return ""
-
-    parts = payload.get("parts") or []
-    if parts:
-        data = _walk_parts(parts)
-    else:
-        body = payload.get("body", {})
-        if body.get("data"):
-            try:
-                data = base64.urlsafe_b64decode(body["data"].encode("utf-8")).decode("utf-8", errors="replace")
-            except Exception:
-                data = None
-
-    if not data:
-        return ""
-
-    # HTML -> 텍스트
-    soup = BeautifulSoup(data, "html.parser")
-    text = soup.get_text(" ")
-    return html.unescape(re.sub(r"\s+", " ", text)).strip()
-
-
-def _extract_first_link(message: dict) -> str:
-    payload = message.get("payload", {})
-    # HTML 파트에서 첫 a[href] 추출
-    def _walk(parts: list[dict]) -> str:
-        for part in parts:
-            mime = part.get("mimeType", "")
-            body = part.get("body", {})
-            data = body.get("data")
-            if data and "html" in mime:
-                try:
-                    raw = base64.urlsafe_b64decode(data.encode("utf-8")).decode("utf-8", errors="replace")
-                    soup = BeautifulSoup(raw, "html.parser")
-                    a = soup.find("a", href=True)
-                    if a and a.get("href"):
-                        return a.get("href")
-                except Exception:
-                    pass
-            if part.get("parts"):
-                inner = _walk(part["parts"])
-                if inner:
-                    return inner
-        return ""
-
-    parts = payload.get("parts") or []
-    if parts:
-        link = _walk(parts)
-        if link:
-            return link
-    return ""
-
-
 def _get_header(headers: list[dict], name: str) -> str:
     for h in headers:
         if h.get("name", "").lower() == name.lower():
@@ -128,54 +63,207 @@ def _get_header(headers: list[dict], name: str) -> str:
     return ""
 
 
+def load_sync_state(path: Path | str) -> dict[str, dict[str, t.Any]]:
+    """라벨별 마지막 historyId 상태를 읽는다."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8")).get("labels", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_sync_state(state: t.Mapping[str, t.Mapping[str, t.Any]], path: Path | str) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"labels": state}, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def _is_not_found(exc: BaseException) -> bool:
+    """HttpError 404 여부.
+
+    startHistoryId가 보관 기간(약 1주)을 지나면 history.list가, history에 추가로 기록된 뒤
+    삭제된 메시지는 messages.get이 404를 반환한다.
+    """
+    status = getattr(getattr(exc, "resp", None), "status", None)
+    return status == 404 or str(status) == "404"
+
+
+def _history_message_ids(service: t.Any, label: str, start_history_id: str) -> tuple[list[str], str]:
+    """startHistoryId 이후 라벨에 추가된 메시지 ID(오래된 순)와 최신 historyId를 반환한다."""
+    message_ids: list[str] = []
+    latest = start_history_id
+    page_token = None
+    while True:
+        params: dict[str, t.Any] = {
+            "userId": "me",
+            "startHistoryId": start_history_id,
+            "labelId": label,
+            "historyTypes": ["messageAdded", "labelAdded"],
+        }
+        if page_token:
+            params["pageToken"] = page_token
+        resp = service.users().history().list(**params).execute()
+        latest = str(resp.get("historyId", latest))
+        for record in resp.get("history", []):
+            for change in record.get("messagesAdded", []) + record.get("labelsAdded", []):
+                mid = change.get("message", {}).get("id")
+                if mid and mid not in message_ids:
+                    message_ids.append(mid)
+        page_token = resp.get("nextPageToken")
+        if not page_token:
+            return message_ids, latest
+
+
+def _batch_get_messages(
+    service: t.Any, message_ids: t.Sequence[str], **params: t.Any
+) -> tuple[dict[str, dict], list[str]]:
+    """messages.get 요청을 HTTP 배치로 묶어 조회한다 (배치당 MESSAGES_BATCH_SIZE개).
+
+    (메시지 ID → 응답, 다시 받아야 할 메시지 ID)를 반환한다. 그사이 삭제되어 404가 난
+    메시지는 결과에서 빠지지만 다시 받을 대상도 아니다.
+    """
+    results: dict[str, dict] = {}
+    failed: list[str] = []
+
+    def _callback(request_id: str, response: dict, exception: Exception | None) -> None:
+        if exception is not None:
+            if _is_not_found(exception):
+                logger.debug(f"삭제된 Gmail 메시지를 건너뜁니다: {request_id}")
+                return
+            logger.warning(f"Gmail 메시지 조회 실패 ({request_id}): {exception}")
+            failed.append(request_id)
+            return
+        results[request_id] = response
+
+    for start in range(0, len(message_ids), MESSAGES_BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=_callback)
+        for mid in message_ids[start:start + MESSAGES_BATCH_SIZE]:
+            batch.add(service.users().messages().get(userId="me", id=mid, **params), request_id=mid)
+        batch.execute()
+    return results, failed
+
+
+def _select_new_messages(
+    message_ids: t.Sequence[str],
+    metadata: t.Mapping[str, dict],
+    seen_guids: t.Container[str],
+) -> list[str]:
+    """메타데이터만으로 중복을 걸러 본문을 받을 메시지 ID를 고른다.
+
+    이미 처리한 GUID와, 같은 발신자/제목으로 중복 발송된 메일은 제외한다.
+    """
+    selected: list[str] = []
+    seen_keys: set[tuple[str, str]] = set()
+    for mid in message_ids:
+        msg = metadata.get(mid)
+        if msg is None or f"gmail:{mid}" in seen_guids:
+            continue
+        headers = msg.get("payload", {}).get("headers", [])
+        key = (_get_header(headers, "From"), _get_header(headers, "Subject"))
+        if key in seen_keys:
+            continue
+        seen_keys.add(key)
+        selected.append(mid)
+    return selected
+
+
+def _message_to_item(msg: dict) -> dict[str, t.Any]:
+    mid = msg.get("id", "")
+    payload = msg.get("payload", {})
+    headers = payload.get("headers", [])
+    subject = _get_header(headers, "Subject") or "(제목 없음)"
+    date_str = _get_header(headers, "Date")
+    try:
+        # RFC2822 → ISO
+        dt_obj = dt.datetime.strptime(date_str[:31], "%a, %d %b %Y %H:%M:%S %z") if date_str else dt.datetime.now(dt.timezone.utc)
+        published_at = dt_obj.astimezone(dt.timezone.utc).isoformat()
+    except Exception:
+        published_at = dt.datetime.now(dt.timezone.utc).isoformat()
+
+    content = extract_message(msg, max_chars=6000)
+    link = content.link or f"mailto:{mid}"
+
+    return {
+        "guid": f"gmail:{mid}",
+        "title": subject,
+        "link": link,
+        "summary": content.text,
+        "published_at": published_at,
+        "source": "gmail",
+    }
+
+
+def sync_messages(
+    service: t.Any,
+    *,
+    label: str,
+    max_results: int = 20,
+    sync_state: dict[str, t.Any] | None = None,
+    seen_guids: t.Container[str] = (),
+) -> list[dict[str, t.Any]]:
+    """라벨의 새 메일만 조회해 FeedItem 형태로 반환한다.
+
+    sync_state에 historyId가 있으면 users.history.list로 그 이후 추가된 메시지를 모두
+    찾고, 없거나 만료되었으면 messages.list로 최근 max_results개를 조회한다.
+    메시지는 HTTP 배치로 format=metadata를 먼저 받아 중복을 거른 뒤,
+    남은 메시지만 format=full로 다시 받는다. sync_state는 제자리에서 갱신되며,
+    조회에 실패한 메시지가 있으면 다음 실행에서 다시 받도록 historyId를 옮기지 않는다
+    (그사이 삭제되어 404가 난 메시지는 실패로 보지 않는다).
+    """
+    sync_state = sync_state if sync_state is not None else {}
+    message_ids: list[str] | None = None
+    latest = ""
+    history_id = sync_state.get("history_id")
+    if history_id:
+        try:
+            message_ids, latest = _history_message_ids(service, label, str(history_id))
+        except Exception as exc:
+            if not _is_not_found(exc):
+                raise
+            logger.warning(f"Gmail historyId가 만료되어 전체 목록을 다시 조회합니다: {history_id}")
+
+    if message_ids is None:
+        # 목록 조회 전에 historyId를 받아 두어야 그 사이 도착한 메일을 다음 실행에서 놓치지 않는다.
+        profile = service.users().getProfile(userId="me").execute()
+        resp = service.users().messages().list(userId="me", labelIds=[label], maxResults=max_results).execute()
+        message_ids = [m["id"] for m in resp.get("messages", []) if m.get("id")]
+        latest = str(profile.get("historyId", ""))
+
+    items: list[dict[str, t.Any]] = []
+    complete = True
+    if message_ids:
+        metadata, metadata_failed = _batch_get_messages(
+            service, message_ids, format="metadata", metadataHeaders=["From", "Subject", "Date"]
+        )
+        selected = _select_new_messages(message_ids, metadata, seen_guids)
+        full, full_failed = _batch_get_messages(service, selected, format="full") if selected else ({}, [])
+        items = [_message_to_item(full[mid]) for mid in selected if mid in full]
+        complete = not metadata_failed and not full_failed
+
+    if complete and latest:
+        sync_state["history_id"] = latest
+    elif not complete:
+        logger.warning(f"Gmail 메시지 일부를 받지 못해 historyId를 유지합니다: {history_id or '(없음)'}")
+    return items
+
+
 def collect(
     *,
     client_secret_file: str,
     token_file: str,
     label: str = "newsletter",
     max_results: int = 20,
+    sync_state: dict[str, t.Any] | None = None,
+    seen_guids: t.Container[str] = (),
 ) -> list[dict[str, t.Any]]:
-    """Gmail 라벨 기반으로 최근 메일을 수집해 FeedItem 형태로 반환."""
-    creds = _get_credentials(client_secret_file, token_file)
-    service = build("gmail", "v1", credentials=creds)
-
-    # 라벨명으로 필터링
-    resp = service.users().messages().list(userId="me", labelIds=[label], maxResults=max_results).execute()
-    messages = resp.get("messages", [])
-    if not messages:
-        return []
-
-    results: list[dict[str, t.Any]] = []
-    for m in messages:
-        mid = m.get("id")
-        if not mid:
-            continue
-        msg = service.users().messages().get(userId="me", id=mid, format="full").execute()
-        payload = msg.get("payload", {})
-        headers = payload.get("headers", [])
-        subject = _get_header(headers, "Subject") or "(제목 없음)"
-        date_str = _get_header(headers, "Date")
-        try:
-            # RFC2822 → ISO
-            dt_obj = dt.datetime.strptime(date_str[:31], "%a, %d %b %Y %H:%M:%S %z") if date_str else dt.datetime.now(dt.timezone.utc)
-            published_at = dt_obj.astimezone(dt.timezone.utc).isoformat()
-        except Exception:
-            published_at = dt.datetime.now(dt.timezone.utc).isoformat()
-
-        body_text = _decode_body(msg)
-        first_link = _extract_first_link(msg)
-        link = first_link or f"mailto:{mid}"
-
-        item = {
-            "guid": f"gmail:{mid}",
-            "title": subject,
-            "link": link,
-            "summary": body_text[:6000],
-            "published_at": published_at,
-            "source": "gmail",
-        }
-        results.append(item)
-
-    return results
-
+    """Gmail 라벨 기반으로 새 메일을 수집해 FeedItem 형태로 반환.
 
+    sync_state(라벨별 상태 dict)를 넘기면 historyId 기반 증분 동기화를 한다.
+    """
+    creds = _get_credentials(client_secret_file, token_file)
+    service = get_service("gmail", "v1", credentials=creds, cache_key=f"gmail:{token_file}")
+    return sync_messages(
+        service, label=label, max_results=max_results, sync_state=sync_state, seen_guids=seen_guids
+    )
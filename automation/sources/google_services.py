@@ -0,0 +1,128 @@
+"""Google API 서비스 객체 공용 팩토리.
+
+googleapiclient의 build()는 호출할 때마다 discovery 문서(수백 KB JSON)를 읽고
+파싱하여 리소스 메서드를 동적으로 생성한다. YouTube/Gmail 수집기가 실행 중에
+서비스를 여러 번 만들면 이 비용이 반복되므로, 여기서는 (API, 버전, 자격 증명)별로
+서비스를 한 번만 만들어 프로세스 전체에서 재사용하고 HTTP 전송 객체도 공유한다.
+httplib2.Http는 스레드 안전하지 않고 YouTube/Gmail 수집기는 수집 엔진에서 서로 다른
+스레드로 동시에 실행되므로, 전송 객체는 API별로 하나씩 둔다.
+
+discovery 문서는 네트워크로 받지 않는다. google-api-python-client 2.x에 포함된
+정적 문서(static_discovery=True)를 사용하며, GOOGLE_DISCOVERY_DIR에
+``{api}.{version}.json`` 파일이 있으면 그 문서를 우선 사용한다.
+
+환경 변수
+----------
+GOOGLE_DISCOVERY_DIR
+    discovery 문서 디렉터리 (선택, 기본값: 라이브러리 내장 문서)
+GOOGLE_API_TIMEOUT_SECONDS
+    공유 HTTP 전송 객체의 요청 타임아웃 (초, 기본값: 30)
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import typing as t
+from pathlib import Path
+
+from automation.logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import httplib2  # type: ignore
+    from googleapiclient.discovery import build, build_from_document  # type: ignore
+    GOOGLE_API_AVAILABLE = True
+except Exception:
+    GOOGLE_API_AVAILABLE = False
+
+try:
+    import google_auth_httplib2  # type: ignore
+    AUTH_HTTPLIB2_AVAILABLE = True
+except Exception:
+    AUTH_HTTPLIB2_AVAILABLE = False
+
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+_services: dict[tuple[str, str, str], t.Any] = {}
+_services_lock = threading.Lock()
+_http: dict[str, t.Any] = {}
+
+
+def _shared_http(api: str) -> t.Any:
+    """API별 공용 httplib2.Http (연결 재사용)."""
+    if api not in _http:
+        timeout = float(os.getenv("GOOGLE_API_TIMEOUT_SECONDS", str(DEFAULT_TIMEOUT_SECONDS)))
+        _http[api] = httplib2.Http(timeout=timeout)
+    return _http[api]
+
+
+def _discovery_document(api: str, version: str) -> str | None:
+    """GOOGLE_DISCOVERY_DIR에 저장된 discovery 문서를 읽는다 (없으면 None)."""
+    directory = os.getenv("GOOGLE_DISCOVERY_DIR")
+    if not directory:
+        return None
+    path = Path(directory) / f"{api}.{version}.json"
+    try:
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _identity(developer_key: str | None, credentials: t.Any, cache_key: str | None) -> str:
+    """캐시 키에 쓸 자격 증명 식별자 (API 키 원문은 남기지 않는다)."""
+    if cache_key:
+        return cache_key
+    if developer_key:
+        return "key:" + hashlib.sha256(developer_key.encode("utf-8")).hexdigest()[:16]
+    if credentials is not None:
+        return f"credentials:{id(credentials)}"
+    return "anonymous"
+
+
+def _build(api: str, version: str, developer_key: str | None, credentials: t.Any) -> t.Any:
+    kwargs: dict[str, t.Any] = {"developerKey": developer_key}
+    if credentials is None:
+        kwargs["http"] = _shared_http(api)
+    elif AUTH_HTTPLIB2_AVAILABLE:
+        kwargs["http"] = google_auth_httplib2.AuthorizedHttp(credentials, http=_shared_http(api))
+    else:
+        kwargs["credentials"] = credentials
+
+    document = _discovery_document(api, version)
+    if document is not None:
+        return build_from_document(document, **kwargs)
+    return build(api, version, static_discovery=True, cache_discovery=False, **kwargs)
+
+
+def get_service(
+    api: str,
+    version: str,
+    *,
+    developer_key: str | None = None,
+    credentials: t.Any = None,
+    cache_key: str | None = None,
+) -> t.Any:
+    """(API, 버전, 자격 증명)별로 한 번만 만든 서비스 객체를 반환한다.
+
+    OAuth 자격 증명은 실행마다 새 객체가 만들어지므로 토큰 파일 경로 같은
+    안정적인 cache_key를 함께 넘기면 같은 서비스를 재사용한다.
+    """
+    if not GOOGLE_API_AVAILABLE:
+        raise RuntimeError("google-api-python-client이 필요합니다. 'pip install google-api-python-client'를 설치하세요.")
+    key = (api, version, _identity(developer_key, credentials, cache_key))
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = _build(api, version, developer_key, credentials)
+            _services[key] = service
+            logger.debug(f"Google API 서비스 생성: {api} {version}")
+        return service
+
+
+def reset_services() -> None:
+    """캐시된 서비스와 HTTP 전송 객체를 비운다 (테스트용)."""
+    with _services_lock:
+        _services.clear()
+        _http.clear()
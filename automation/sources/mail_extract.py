@@ -0,0 +1,178 @@
+"""Gmail 메시지 본문/링크 단일 패스 추출기.
+
+뉴스레터 HTML은 수백 KB에 달하지만 요약에는 앞부분 텍스트(기본 6000자)와
+대표 링크 하나만 필요하다. MIME 트리를 한 번만 순회하며 각 파트를 한 번만
+디코딩하고, 표준 라이브러리 HTMLParser로 스트리밍 토큰화하여 본문 텍스트와
+첫 번째 의미 있는 링크를 함께 수집한다. 텍스트 예산을 채우고 링크를 찾으면
+나머지 HTML은 파싱하지 않는다.
+
+수신 거부/설정 변경/웹에서 보기 링크는 건너뛰고, 클릭 추적 리디렉터 링크는
+다른 링크가 없을 때만 사용한다.
+"""
+from __future__ import annotations
+
+import base64
+import re
+import typing as t
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+DEFAULT_MAX_CHARS = 6000
+FEED_CHUNK_CHARS = 8192
+
+_SKIP_CONTENT_TAGS = frozenset({"script", "style", "head", "title", "noscript"})
+_LINK_SCHEMES = ("http://", "https://")
+_PLAIN_URL_RE = re.compile(r"https?://[^\s<>\"')\]]+")
+
+# 본문과 무관한 관리용 링크 (URL 또는 링크 텍스트에 포함되면 제외)
+_IGNORED_LINK_WORDS = (
+    "unsubscribe", "optout", "opt-out", "opt_out", "manage-subscription", "manage_subscription",
+    "email-preferences", "preferences", "view-in-browser", "view in browser", "webversion",
+    "수신거부", "수신 거부", "구독 취소", "구독취소", "구독 해지", "웹에서 보기", "브라우저에서 보기",
+)
+# 클릭 추적 리디렉터 (다른 링크가 없을 때만 사용)
+_TRACKING_HOST_PARTS = (
+    "list-manage.com", "mandrillapp.com", "sendgrid.net", "mailchimp", "mcsv.net",
+    "convertkit-mail", "mailgun", "sparkpostmail", "hubspotlinks",
+)
+_TRACKING_PATH_PARTS = ("/track/click", "/ls/click", "/wf/click", "/redirect/", "/click?")
+
+
+@dataclass
+class MailContent:
+    text: str
+    link: str
+
+
+def _decode_part(data: str) -> str:
+    try:
+        return base64.urlsafe_b64decode(data.encode("utf-8")).decode("utf-8", errors="replace")
+    except Exception:
+        return ""
+
+
+def _find_parts(payload: t.Mapping[str, t.Any]) -> tuple[str | None, str | None]:
+    """MIME 트리를 한 번 순회해 첫 HTML 파트와 첫 텍스트 파트의 인코딩된 데이터를 찾는다."""
+    html_data: str | None = None
+    plain_data: str | None = None
+    stack = [payload]
+    while stack and html_data is None:
+        part = stack.pop()
+        data = (part.get("body") or {}).get("data")
+        mime = part.get("mimeType", "")
+        if data:
+            if "html" in mime:
+                html_data = data
+            elif plain_data is None and ("plain" in mime or not mime):
+                plain_data = data
+        stack.extend(reversed(part.get("parts") or []))
+    return html_data, plain_data
+
+
+def classify_link(href: str, anchor_text: str = "") -> str:
+    """링크를 "content", "tracking", "ignore" 중 하나로 분류한다."""
+    href = href.strip()
+    if not href.lower().startswith(_LINK_SCHEMES):
+        return "ignore"
+    lowered = href.lower()
+    label = anchor_text.strip().lower()
+    if any(word in lowered or word in label for word in _IGNORED_LINK_WORDS):
+        return "ignore"
+    parts = urlsplit(lowered)
+    target = f"{parts.path}?{parts.query}"
+    if any(part in parts.netloc for part in _TRACKING_HOST_PARTS) or any(
+        part in target for part in _TRACKING_PATH_PARTS
+    ):
+        return "tracking"
+    return "content"
+
+
+class _MailHTMLParser(HTMLParser):
+    """본문 텍스트(예산까지)와 첫 의미 있는 링크를 한 번에 수집하는 토크나이저."""
+
+    def __init__(self, max_chars: int):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.chunks: list[str] = []
+        self.length = 0
+        self.link = ""
+        self.fallback_link = ""
+        self._skip_depth = 0
+        self._href: str | None = None
+        self._anchor_text: list[str] = []
+
+    @property
+    def done(self) -> bool:
+        return self.length >= self.max_chars and bool(self.link)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in _SKIP_CONTENT_TAGS:
+            self._skip_depth += 1
+        elif tag == "a" and not self.link:
+            self._href = dict(attrs).get("href") or None
+            self._anchor_text = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIP_CONTENT_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == "a" and self._href is not None:
+            kind = classify_link(self._href, " ".join(self._anchor_text))
+            if kind == "content":
+                self.link = self._href.strip()
+            elif kind == "tracking" and not self.fallback_link:
+                self.fallback_link = self._href.strip()
+            self._href = None
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        if self._href is not None:
+            self._anchor_text.append(data)
+        if self.length >= self.max_chars:
+            return
+        words = data.split()
+        if words:
+            chunk = " ".join(words)
+            self.chunks.append(chunk)
+            self.length += len(chunk) + 1
+
+
+def extract_html(html_text: str, max_chars: int = DEFAULT_MAX_CHARS) -> MailContent:
+    """HTML에서 본문 텍스트(최대 max_chars자)와 대표 링크를 추출한다."""
+    parser = _MailHTMLParser(max_chars)
+    for start in range(0, len(html_text), FEED_CHUNK_CHARS):
+        parser.feed(html_text[start:start + FEED_CHUNK_CHARS])
+        if parser.done:
+            break
+    else:
+        parser.close()
+    text = " ".join(parser.chunks)[:max_chars]
+    return MailContent(text=text, link=parser.link or parser.fallback_link)
+
+
+def extract_plain(plain_text: str, max_chars: int = DEFAULT_MAX_CHARS) -> MailContent:
+    """텍스트 파트에서 본문과 첫 의미 있는 URL을 추출한다."""
+    link = fallback = ""
+    for match in _PLAIN_URL_RE.finditer(plain_text):
+        kind = classify_link(match.group(0))
+        if kind == "content":
+            link = match.group(0)
+            break
+        if kind == "tracking" and not fallback:
+            fallback = match.group(0)
+    text = " ".join(plain_text[: max_chars * 2].split())[:max_chars]
+    return MailContent(text=text, link=link or fallback)
+
+
+def extract_message(message: t.Mapping[str, t.Any], max_chars: int = DEFAULT_MAX_CHARS) -> MailContent:
+    """Gmail API 메시지(format=full)에서 본문 텍스트와 대표 링크를 추출한다.
+
+    HTML 파트가 있으면 HTML을, 없으면 텍스트 파트를 사용한다.
+    """
+    html_data, plain_data = _find_parts(message.get("payload") or {})
+    if html_data is not None:
+        return extract_html(_decode_part(html_data), max_chars)
+    if plain_data is not None:
+        return extract_plain(_decode_part(plain_data), max_chars)
+    return MailContent(text="", link="")
@@ -0,0 +1,187 @@
+"""YouTube 자막 디스크 캐시.
+
+워치리스트/채널 업로드처럼 실행마다 반복해서 등장하는 영상의 자막을
+(video_id, 언어) 키로 zlib 압축하여 SQLite 파일 하나에 보관한다.
+전체 크기가 한도를 넘으면 가장 오래 사용되지 않은 항목부터 제거한다.
+
+자막이 없는 영상도 짧은 기간 동안 기억하여(negative cache) 매번 조회하지 않는다.
+자동 생성 자막은 업로드 후 몇 시간 뒤에 생기므로 영구히 기억하지는 않는다.
+
+환경 변수
+----------
+YOUTUBE_TRANSCRIPT_CACHE_PATH
+    캐시 파일 경로 (기본값: data/youtube_transcripts.sqlite3)
+YOUTUBE_TRANSCRIPT_CACHE_MAX_MB
+    캐시 최대 크기 (MB, 기본값: 50, 0이면 비활성화)
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+import typing as t
+import zlib
+from pathlib import Path
+
+from automation.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_PATH = Path("data/youtube_transcripts.sqlite3")
+DEFAULT_MAX_MB = 50
+NO_TRANSCRIPT = "-"  # 자막 없음 표시용 언어 키
+NEGATIVE_TTL_SECONDS = 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcripts (
+    video_id TEXT NOT NULL,
+    lang TEXT NOT NULL,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (video_id, lang)
+);
+CREATE INDEX IF NOT EXISTS idx_transcripts_accessed ON transcripts (accessed_at);
+"""
+
+
+class TranscriptCache:
+    """(video_id, 언어) 키의 압축 자막 캐시 (스레드 안전, LRU 크기 제한)."""
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_CACHE_PATH,
+        max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024,
+        clock: t.Callable[[], float] = time.time,
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_env(cls) -> "TranscriptCache | None":
+        max_mb = float(os.getenv("YOUTUBE_TRANSCRIPT_CACHE_MAX_MB", str(DEFAULT_MAX_MB)))
+        if max_mb <= 0:
+            return None
+        path = os.getenv("YOUTUBE_TRANSCRIPT_CACHE_PATH", str(DEFAULT_CACHE_PATH))
+        try:
+            return cls(path, int(max_mb * 1024 * 1024))
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning(f"자막 캐시를 열 수 없어 비활성화합니다: {exc}")
+            return None
+
+    def get(self, video_id: str, languages: t.Sequence[str]) -> str | None:
+        """languages 순서대로 캐시된 자막을 찾는다.
+
+        자막이 없다고 기록된 영상은 빈 문자열을, 캐시에 없으면 None을 반환한다.
+        """
+        with self._lock:
+            now = self._clock()
+            for lang in languages:
+                row = self._conn.execute(
+                    "SELECT data FROM transcripts WHERE video_id = ? AND lang = ?", (video_id, lang)
+                ).fetchone()
+                if row is not None:
+                    self._touch(video_id, lang, now)
+                    self.hits += 1
+                    return zlib.decompress(row[0]).decode("utf-8")
+
+            row = self._conn.execute(
+                "SELECT created_at FROM transcripts WHERE video_id = ? AND lang = ?", (video_id, NO_TRANSCRIPT)
+            ).fetchone()
+            if row is not None and now - row[0] < NEGATIVE_TTL_SECONDS:
+                self.hits += 1
+                return ""
+            self.misses += 1
+            return None
+
+    def put(self, video_id: str, lang: str, text: str) -> None:
+        """자막을 저장한다. text가 비어 있으면 자막 없음으로 기록한다."""
+        if not text.strip():
+            lang, text = NO_TRANSCRIPT, ""
+        data = zlib.compress(text.encode("utf-8"), 6)
+        with self._lock:
+            now = self._clock()
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO transcripts (video_id, lang, data, size, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (video_id, lang, data, len(data), now, now),
+                )
+                if lang != NO_TRANSCRIPT:
+                    self._conn.execute(
+                        "DELETE FROM transcripts WHERE video_id = ? AND lang = ?", (video_id, NO_TRANSCRIPT)
+                    )
+                self._evict()
+
+    def _touch(self, video_id: str, lang: str, now: float) -> None:
+        with self._conn:
+            self._conn.execute(
+                "UPDATE transcripts SET accessed_at = ? WHERE video_id = ? AND lang = ?", (now, video_id, lang)
+            )
+
+    def _evict(self) -> None:
+        total = self._total_bytes()
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT rowid, size FROM transcripts ORDER BY accessed_at").fetchall()
+        doomed: list[int] = []
+        for rowid, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append(rowid)
+            total -= size
+        self._conn.executemany("DELETE FROM transcripts WHERE rowid = ?", [(rowid,) for rowid in doomed])
+        self.evictions += len(doomed)
+
+    def _total_bytes(self) -> int:
+        return int(self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM transcripts").fetchone()[0])
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            entries = int(self._conn.execute("SELECT COUNT(*) FROM transcripts").fetchone()[0])
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": entries,
+                "bytes": self._total_bytes(),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache: TranscriptCache | None = None
+_default_cache_loaded = False
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> TranscriptCache | None:
+    """환경 변수 설정으로 만든 프로세스 공용 캐시를 반환한다 (비활성화 시 None)."""
+    global _default_cache, _default_cache_loaded
+    with _default_cache_lock:
+        if not _default_cache_loaded:
+            _default_cache = TranscriptCache.from_env()
+            _default_cache_loaded = True
+        return _default_cache
+
+
+def reset_default_cache() -> None:
+    """공용 캐시를 닫고 다음 호출 시 환경 변수를 다시 읽도록 한다 (테스트용)."""
+    global _default_cache, _default_cache_loaded
+    with _default_cache_lock:
+        if _default_cache is not None:
+            _default_cache.close()
+        _default_cache = None
+        _default_cache_loaded = False
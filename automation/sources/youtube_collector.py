@@ -2,25 +2,33 @@
 
 YouTube Data API v3를 사용해 최신 동영상을 키워드로 검색하고,
 자막을 가져와 요약 대상으로 사용할 텍스트를 구성한다.
+
+자막 조회는 영상마다 여러 번의 HTTP 요청이 필요하므로, 파이프라인은
+fetch_transcripts=False로 메타데이터만 수집한 뒤 중복/필터링을 통과한
+항목에 대해서만 hydrate_transcripts()로 자막을 채운다.
 """
 from __future__ import annotations
 
 import datetime as dt
+import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 import typing as t
 from dataclasses import dataclass
+from pathlib import Path
 
-try:
-    from googleapiclient.discovery import build  # type: ignore
-    GOOGLE_API_AVAILABLE = True
-except Exception:
-    GOOGLE_API_AVAILABLE = False
+from .google_services import GOOGLE_API_AVAILABLE, get_service
+from .transcript_cache import get_default_cache
+from .youtube_quota import QuotaLedger, is_quota_exceeded_error
 
 try:
-    from youtube_transcript_api import YouTubeTranscriptApi  # type: ignore
+    from youtube_transcript_api import NoTranscriptFound, TranscriptsDisabled, YouTubeTranscriptApi  # type: ignore
     TRANSCRIPT_AVAILABLE = True
+    # 영상에 자막이 없다는 확정 응답 (이 경우만 빈 결과를 캐시한다)
+    _NO_TRANSCRIPT_ERRORS: tuple[type[BaseException], ...] = (NoTranscriptFound, TranscriptsDisabled)
 except Exception:
     TRANSCRIPT_AVAILABLE = False
+    _NO_TRANSCRIPT_ERRORS = ()
 
 
 @dataclass
@@ -41,109 +49,337 @@ def _days_ago_iso(days: int) -> str:
     return (dt.datetime.utcnow() - dt.timedelta(days=days)).replace(microsecond=0).isoformat() + "Z"
 
 
+def _fetch_transcript(video_id: str, languages: list[str]) -> tuple[str, str]:
+    """YouTubeTranscriptApi로 자막을 가져와 (언어 코드, 텍스트)를 반환한다."""
+    transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+    # 우선 한국어, 다음 영어
+    for lang in languages:
+        try:
+            tr = transcript_list.find_transcript([lang])
+        except NoTranscriptFound:
+            continue
+        chunks = tr.fetch()
+        return getattr(tr, "language_code", lang), " ".join(chunk.get("text", "") for chunk in chunks)
+    # 자동 생성 자막도 시도
+    tr = transcript_list.find_generated_transcript(languages)
+    chunks = tr.fetch()
+    return getattr(tr, "language_code", languages[0]), " ".join(chunk.get("text", "") for chunk in chunks)
+
+
 def _safe_get_transcript(video_id: str, languages: list[str] | None = None) -> str:
     if not TRANSCRIPT_AVAILABLE:
         return ""
     languages = languages or ["ko", "en"]
+    cache = get_default_cache()
+    if cache is not None:
+        cached = cache.get(video_id, languages)
+        if cached is not None:
+            return cached
     try:
-        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-        # 우선 한국어, 다음 영어
-        for lang in languages:
-            if transcript_list.find_transcript([lang]):
-                tr = transcript_list.find_transcript([lang])
-                chunks = tr.fetch()
-                return " ".join(chunk.get("text", "") for chunk in chunks)
-        # 자동 생성 자막도 시도
-        tr = transcript_list.find_generated_transcript(languages)
-        chunks = tr.fetch()
-        return " ".join(chunk.get("text", "") for chunk in chunks)
+        lang, text = _fetch_transcript(video_id, languages)
+    except _NO_TRANSCRIPT_ERRORS:
+        lang, text = "", ""
     except Exception:
+        # 네트워크 오류, 요청 제한 등 일시적인 실패는 캐시하지 않고 다음 실행에서 다시 시도한다.
         return ""
+    if cache is not None:
+        cache.put(video_id, lang, text)
+    return text
+
+
+def transcript_cache_stats() -> dict[str, int] | None:
+    """자막 캐시 적중/미스 통계를 반환한다 (캐시 비활성화 시 None)."""
+    cache = get_default_cache()
+    return cache.stats() if cache is not None else None
+
+
+SUMMARY_SEED_CHARS = 6000  # 요약 입력을 위한 원문 시드 텍스트 길이 제한
+YOUTUBE_GUID_PREFIX = "youtube:"
+VIDEOS_BATCH_SIZE = 50  # videos.list 한 번에 조회할 수 있는 최대 ID 수
+
+
+def _summary_seed(video_id: str, description: str, fetch_transcript: bool) -> str:
+    transcript_text = _safe_get_transcript(video_id) if fetch_transcript else ""
+    base_text = transcript_text if transcript_text.strip() else description
+    return base_text[:SUMMARY_SEED_CHARS]
+
+
+def hydrate_transcripts(items: t.Iterable[t.MutableMapping[str, t.Any]], *, max_workers: int = 4) -> int:
+    """YouTube 항목의 summary를 자막으로 채운다 (스레드 풀에서 병렬 조회).
+
+    fetch_transcripts=False로 수집한 항목 중 실제로 게시할 항목에만 호출한다.
+    자막이 없으면 기존 summary(영상 설명)를 유지한다. 자막을 채운 항목 수를 반환한다.
+    """
+    targets = [item for item in items if str(item.get("guid", "")).startswith(YOUTUBE_GUID_PREFIX)]
+    if not targets or not TRANSCRIPT_AVAILABLE:
+        return 0
+
+    def fetch(item: t.MutableMapping[str, t.Any]) -> str:
+        return _safe_get_transcript(item["guid"][len(YOUTUBE_GUID_PREFIX):])
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(targets)))) as pool:
+        transcripts = list(pool.map(fetch, targets))
+
+    hydrated = 0
+    for item, transcript_text in zip(targets, transcripts):
+        if transcript_text.strip():
+            item["summary"] = transcript_text[:SUMMARY_SEED_CHARS]
+            hydrated += 1
+    return hydrated
+
+
+def _execute(request: t.Any, method: str, quota: QuotaLedger | None) -> dict[str, t.Any]:
+    """API 요청을 실행하고 쿼터 장부에 비용을 기록한다 (실패한 호출도 쿼터가 차감된다)."""
+    if quota is not None:
+        quota.charge(method)
+    try:
+        return request.execute()
+    except Exception as exc:
+        if quota is not None and is_quota_exceeded_error(exc):
+            quota.mark_exhausted()
+        raise
 
 
 def _build_service(api_key: str):
-    return build("youtube", "v3", developerKey=api_key)
+    """API 키별로 한 번만 만든 YouTube 서비스 객체를 재사용한다 (google_services 공용 캐시)."""
+    return get_service("youtube", "v3", developer_key=api_key)
 
 
-def collect(
+def _require_google_api() -> None:
+    if not GOOGLE_API_AVAILABLE:
+        raise RuntimeError("google-api-python-client이 필요합니다. 'pip install google-api-python-client'를 설치하세요.")
+
+
+def _video_to_item(v: t.Mapping[str, t.Any], fetch_transcripts: bool) -> dict[str, t.Any]:
+    """videos.list 응답 항목을 표준 FeedItem 형태로 변환한다."""
+    vid = v.get("id", "")
+    sn = v.get("snippet", {})
+    description = sn.get("description", "")
+    thumbnails = (sn.get("thumbnails", {}) or {})
+    thumb = thumbnails.get("high") or thumbnails.get("medium") or thumbnails.get("default") or {}
+    link = f"https://www.youtube.com/watch?v={vid}"
+    return {
+        "guid": f"{YOUTUBE_GUID_PREFIX}{vid}",
+        "title": sn.get("title", "(제목 없음)"),
+        "link": link,
+        "summary": _summary_seed(vid, description, fetch_transcripts),
+        "published_at": sn.get("publishedAt", _now_utc_iso()),
+        # extras
+        "thumbnail": thumb.get("url", ""),
+        "video_url": link,
+        "source": "youtube",
+        "channel_name": sn.get("channelTitle", ""),
+    }
+
+
+def fetch_video_details(
+    *,
+    api_key: str,
+    video_ids: t.Iterable[str],
+    fetch_transcripts: bool = True,
+    quota: QuotaLedger | None = None,
+) -> dict[str, dict[str, t.Any]]:
+    """여러 수집 경로에서 모은 비디오 ID의 상세 정보를 50개씩 묶어 조회한다.
+
+    중복 ID는 한 번만 조회하며, {video_id: FeedItem 딕셔너리} 인덱스를 반환한다.
+    배치 하나가 실패해도 나머지 배치는 계속 조회한다 (쿼터 소진은 예외로 전달).
+    """
+    _require_google_api()
+    unique_ids = list(dict.fromkeys(vid for vid in video_ids if vid))
+    if not unique_ids:
+        return {}
+
+    service = _build_service(api_key)
+    index: dict[str, dict[str, t.Any]] = {}
+    for i in range(0, len(unique_ids), VIDEOS_BATCH_SIZE):
+        batch_ids = unique_ids[i:i + VIDEOS_BATCH_SIZE]
+        try:
+            details_resp = _execute(service.videos().list(
+                part="snippet,contentDetails,statistics",
+                id=",".join(batch_ids),
+            ), "videos.list", quota)
+        except Exception as e:
+            if is_quota_exceeded_error(e):
+                raise
+            print(f"⚠️ 비디오 상세 배치 조회 실패 ({i}-{i+len(batch_ids)}): {e}")
+            continue
+
+        for v in details_resp.get("items", []):
+            index[v.get("id", "")] = _video_to_item(v, fetch_transcripts)
+            # 자막 조회 사이 짧은 대기
+            if fetch_transcripts:
+                time.sleep(0.05)
+    return index
+
+
+def _ordered_items(video_ids: t.Sequence[str], index: t.Mapping[str, dict[str, t.Any]]) -> list[dict[str, t.Any]]:
+    return [index[vid] for vid in video_ids if vid in index]
+
+
+def search_video_ids(
     *,
     api_key: str,
     keywords: str,
     max_results: int = 10,
     region_code: str = "KR",
     published_after_days: int = 7,
-) -> list[dict[str, t.Any]]:
-    """YouTube에서 키워드 기반으로 최신 영상을 수집해 표준 FeedItem 형태로 반환.
-
-    Returns list of dicts with keys compatible to FeedItem: guid, title, link, summary, published_at
-    and extras: thumbnail, video_url, source.
-    """
-    if not GOOGLE_API_AVAILABLE:
-        raise RuntimeError("google-api-python-client이 필요합니다. 'pip install google-api-python-client'를 설치하세요.")
-
+    quota: QuotaLedger | None = None,
+) -> list[str]:
+    """키워드 검색(search.list, 100 units)으로 최신 영상 ID만 찾는다."""
+    _require_google_api()
     service = _build_service(api_key)
 
-    published_after = _days_ago_iso(published_after_days)
-
     # 검색어: 쉼표 구분 문자열을 공백으로 합쳐 검색 정확도 개선
     query = " ".join([k.strip() for k in keywords.split(",") if k.strip()])
 
-    search_resp = service.search().list(
+    search_resp = _execute(service.search().list(
         part="snippet",
         q=query,
         type="video",
         maxResults=max_results,
         regionCode=region_code,
-        publishedAfter=published_after,
+        publishedAfter=_days_ago_iso(published_after_days),
         order="date",
         safeSearch="none",
-    ).execute()
+    ), "search.list", quota)
 
-    video_ids: list[str] = [item["id"]["videoId"] for item in search_resp.get("items", []) if item.get("id", {}).get("videoId")]
-    if not video_ids:
-        return []
+    return [item["id"]["videoId"] for item in search_resp.get("items", []) if item.get("id", {}).get("videoId")]
 
-    details_resp = service.videos().list(
-        part="snippet,contentDetails,statistics",
-        id=",".join(video_ids),
-        maxResults=max_results,
-    ).execute()
-
-    results: list[dict[str, t.Any]] = []
-    for v in details_resp.get("items", []):
-        vid = v.get("id", "")
-        sn = v.get("snippet", {})
-        title = sn.get("title", "(제목 없음)")
-        description = sn.get("description", "")
-        published_at = sn.get("publishedAt", _now_utc_iso())
-        thumbnails = (sn.get("thumbnails", {}) or {})
-        thumb = thumbnails.get("high") or thumbnails.get("medium") or thumbnails.get("default") or {}
-        thumb_url = thumb.get("url", "")
-
-        transcript_text = _safe_get_transcript(vid)
-        base_text = transcript_text if transcript_text.strip() else description
-        summary_seed = base_text[:6000]  # 요약 입력을 위한 원문 시드 텍스트(길이 제한)
-
-        link = f"https://www.youtube.com/watch?v={vid}"
-        guid = f"youtube:{vid}"
-
-        item = {
-            "guid": guid,
-            "title": title,
-            "link": link,
-            "summary": summary_seed,
-            "published_at": published_at,
-            # extras
-            "thumbnail": thumb_url,
-            "video_url": link,
-            "source": "youtube",
-        }
-        results.append(item)
-
-        # 간단한 쿼터 보호: 요청 사이 짧은 대기
-        time.sleep(0.05)
 
-    return results
+def collect(
+    *,
+    api_key: str,
+    keywords: str,
+    max_results: int = 10,
+    region_code: str = "KR",
+    published_after_days: int = 7,
+    fetch_transcripts: bool = True,
+    quota: QuotaLedger | None = None,
+) -> list[dict[str, t.Any]]:
+    """YouTube에서 키워드 기반으로 최신 영상을 수집해 표준 FeedItem 형태로 반환.
+
+    fetch_transcripts=False면 자막 대신 영상 설명을 summary로 사용한다 (hydrate_transcripts 참고).
+    quota가 주어지면 호출 비용(search.list 100 + videos.list 1)을 기록한다.
+
+    Returns list of dicts with keys compatible to FeedItem: guid, title, link, summary, published_at
+    and extras: thumbnail, video_url, source, channel_name.
+    """
+    video_ids = search_video_ids(
+        api_key=api_key,
+        keywords=keywords,
+        max_results=max_results,
+        region_code=region_code,
+        published_after_days=published_after_days,
+        quota=quota,
+    )
+    index = fetch_video_details(api_key=api_key, video_ids=video_ids, fetch_transcripts=fetch_transcripts, quota=quota)
+    return _ordered_items(video_ids, index)
+
+
+def load_channel_state(path: Path | str) -> dict[str, dict[str, t.Any]]:
+    """채널별 업로드 재생목록 ID와 워터마크 상태를 읽는다."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8")).get("channels", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_channel_state(state: t.Mapping[str, t.Mapping[str, t.Any]], path: Path | str) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"channels": state}, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def _uploads_playlist_id(
+    service: t.Any, channel_id: str, channel_state: dict[str, t.Any], quota: QuotaLedger | None = None
+) -> str:
+    """채널의 업로드 재생목록 ID를 조회하고 상태에 캐시한다 (channels.list, 1 unit)."""
+    cached = channel_state.get("uploads_playlist_id")
+    if cached:
+        return cached
+    resp = _execute(service.channels().list(part="contentDetails", id=channel_id), "channels.list", quota)
+    items = resp.get("items", [])
+    if not items:
+        raise RuntimeError(f"채널을 찾을 수 없습니다: {channel_id}")
+    playlist_id = items[0]["contentDetails"]["relatedPlaylists"]["uploads"]
+    channel_state["uploads_playlist_id"] = playlist_id
+    return playlist_id
+
+
+def channel_video_ids(
+    *,
+    api_key: str,
+    channel_id: str,
+    max_results: int = 10,
+    published_after_days: int = 7,
+    channel_state: dict[str, t.Any] | None = None,
+    quota: QuotaLedger | None = None,
+) -> list[str]:
+    """채널 업로드 재생목록(playlistItems.list, 1 unit)에서 워터마크 이후의 새 영상 ID를 찾는다.
+
+    channel_state가 주어지면 업로드 재생목록 ID를 캐시하고, 찾은 영상(ID/게시 시각, 최신순)은
+    pending_videos에만 기록한다. 영상을 처리한 뒤 commit_watermark로 워터마크를 옮긴다.
+    """
+    _require_google_api()
+    service = _build_service(api_key)
+    if channel_state is None:
+        channel_state = {}
+
+    published_after = _days_ago_iso(published_after_days)
+    last_video_id = channel_state.get("last_video_id")
+    last_published_at = channel_state.get("last_published_at", "")
+
+    # 업로드 재생목록은 최신순으로 정렬되어 있으므로 워터마크나 기간을 벗어나면 중단한다.
+    playlist_resp = _execute(service.playlistItems().list(
+        part="contentDetails",
+        playlistId=_uploads_playlist_id(service, channel_id, channel_state, quota),
+        maxResults=min(50, max_results),
+    ), "playlistItems.list", quota)
+
+    video_ids: list[str] = []
+    found: list[list[str]] = []
+    for entry in playlist_resp.get("items", []):
+        details = entry.get("contentDetails", {})
+        vid = details.get("videoId")
+        video_published_at = details.get("videoPublishedAt", "")
+        if not vid:
+            continue
+        if vid == last_video_id or (last_published_at and video_published_at and video_published_at <= last_published_at):
+            break
+        if video_published_at and video_published_at < published_after:
+            break
+        found.append([vid, video_published_at])
+        video_ids.append(vid)
+
+    if found:
+        channel_state["pending_videos"] = found
+    return video_ids
+
+
+def commit_watermark(
+    channel_state: dict[str, t.Any],
+    *,
+    apply: bool = True,
+    retry: t.Container[str] = (),
+) -> None:
+    """channel_video_ids가 찾은 영상까지 워터마크를 옮긴다. apply=False면 버린다.
+
+    retry에 든 영상 ID(이번 실행에서 처리하지 못한 영상)가 있으면 워터마크는 그보다
+    오래된 영상까지만 옮겨, 다음 실행에서 그 영상부터 다시 찾는다.
+    """
+    pending = channel_state.pop("pending_videos", None)
+    if not apply or not pending:
+        return
+    watermark = None
+    for vid, published_at in reversed(pending):
+        if vid in retry:
+            break
+        watermark = (vid, published_at)
+    if watermark is not None:
+        channel_state["last_video_id"], channel_state["last_published_at"] = watermark
 
 
 def collect_from_channel(
@@ -152,164 +388,64 @@ def collect_from_channel(
     channel_id: str,
     max_results: int = 10,
     published_after_days: int = 7,
+    fetch_transcripts: bool = True,
+    channel_state: dict[str, t.Any] | None = None,
+    quota: QuotaLedger | None = None,
 ) -> list[dict[str, t.Any]]:
     """특정 YouTube 채널에서 최신 영상을 수집해 표준 FeedItem 형태로 반환.
     
+    search.list(100 units) 대신 채널의 업로드 재생목록을 playlistItems.list(1 unit)로 조회한다.
+    channel_state가 주어지면 업로드 재생목록 ID를 캐시하고, 마지막으로 본 영상 ID와
+    게시 시각(워터마크)보다 새로운 영상만 반환한다. 워터마크는 상세 조회가 성공한 뒤에 갱신한다.
+    
     Args:
         api_key: YouTube Data API v3 키
         channel_id: YouTube 채널 ID (UC로 시작)
         max_results: 최대 결과 수
         published_after_days: 최근 N일 이내 동영상만 수집
+        fetch_transcripts: False면 자막 조회를 생략하고 영상 설명을 사용
+        channel_state: 채널별 상태 딕셔너리 (load_channel_state 결과의 항목, 제자리에서 갱신됨)
+        quota: 호출 비용을 기록할 쿼터 장부
     
     Returns:
         list of dicts with keys compatible to FeedItem: guid, title, link, summary, published_at
         and extras: thumbnail, video_url, source, channel_name.
     """
-    if not GOOGLE_API_AVAILABLE:
-        raise RuntimeError("google-api-python-client이 필요합니다. 'pip install google-api-python-client'를 설치하세요.")
-    
-    service = _build_service(api_key)
-    
-    published_after = _days_ago_iso(published_after_days)
-    
-    # 채널의 최신 동영상 검색
-    search_resp = service.search().list(
-        part="snippet",
-        channelId=channel_id,
-        type="video",
-        maxResults=max_results,
-        publishedAfter=published_after,
-        order="date",
-    ).execute()
-    
-    video_ids: list[str] = [item["id"]["videoId"] for item in search_resp.get("items", []) if item.get("id", {}).get("videoId")]
-    if not video_ids:
-        return []
-    
-    # 동영상 상세 정보 조회
-    details_resp = service.videos().list(
-        part="snippet,contentDetails,statistics",
-        id=",".join(video_ids),
-        maxResults=max_results,
-    ).execute()
-    
-    results: list[dict[str, t.Any]] = []
-    for v in details_resp.get("items", []):
-        vid = v.get("id", "")
-        sn = v.get("snippet", {})
-        title = sn.get("title", "(제목 없음)")
-        description = sn.get("description", "")
-        published_at = sn.get("publishedAt", _now_utc_iso())
-        channel_title = sn.get("channelTitle", "")
-        thumbnails = (sn.get("thumbnails", {}) or {})
-        thumb = thumbnails.get("high") or thumbnails.get("medium") or thumbnails.get("default") or {}
-        thumb_url = thumb.get("url", "")
-        
-        # 자막 추출 시도
-        transcript_text = _safe_get_transcript(vid)
-        base_text = transcript_text if transcript_text.strip() else description
-        summary_seed = base_text[:6000]  # 요약 입력을 위한 원문 시드 텍스트
-        
-        link = f"https://www.youtube.com/watch?v={vid}"
-        guid = f"youtube:{vid}"
-        
-        item = {
-            "guid": guid,
-            "title": title,
-            "link": link,
-            "summary": summary_seed,
-            "published_at": published_at,
-            # extras
-            "thumbnail": thumb_url,
-            "video_url": link,
-            "source": "youtube",
-            "channel_name": channel_title,
-        }
-        results.append(item)
-        
-        # API 쿼터 보호
-        time.sleep(0.05)
-    
-    return results
+    video_ids = channel_video_ids(
+        api_key=api_key,
+        channel_id=channel_id,
+        max_results=max_results,
+        published_after_days=published_after_days,
+        channel_state=channel_state,
+        quota=quota,
+    )
+    index = fetch_video_details(api_key=api_key, video_ids=video_ids, fetch_transcripts=fetch_transcripts, quota=quota)
+    if channel_state is not None:
+        commit_watermark(channel_state)
+    return _ordered_items(video_ids, index)
 
 
 def collect_from_watchlist(
     *,
     api_key: str,
     video_ids: list[str],
+    fetch_transcripts: bool = True,
+    quota: QuotaLedger | None = None,
 ) -> list[dict[str, t.Any]]:
     """워치리스트의 특정 비디오 ID들을 수집해 표준 FeedItem 형태로 반환.
     
     Args:
         api_key: YouTube Data API v3 키
         video_ids: YouTube 비디오 ID 리스트 (11자리 문자열)
+        fetch_transcripts: False면 자막 조회를 생략하고 영상 설명을 사용
+        quota: 호출 비용을 기록할 쿼터 장부
     
     Returns:
         list of dicts with keys compatible to FeedItem: guid, title, link, summary, published_at
         and extras: thumbnail, video_url, source, channel_name.
     """
-    if not GOOGLE_API_AVAILABLE:
-        raise RuntimeError("google-api-python-client이 필요합니다. 'pip install google-api-python-client'를 설치하세요.")
-    
-    if not video_ids:
-        return []
-    
-    service = _build_service(api_key)
-    
-    # 비디오 상세 정보 조회 (최대 50개씩 요청 가능)
-    # 워치리스트는 보통 소수이므로 한 번에 요청
-    results: list[dict[str, t.Any]] = []
-    
-    # API 제한을 고려하여 50개씩 분할
-    for i in range(0, len(video_ids), 50):
-        batch_ids = video_ids[i:i+50]
-        
-        try:
-            details_resp = service.videos().list(
-                part="snippet,contentDetails,statistics",
-                id=",".join(batch_ids),
-            ).execute()
-            
-            for v in details_resp.get("items", []):
-                vid = v.get("id", "")
-                sn = v.get("snippet", {})
-                title = sn.get("title", "(제목 없음)")
-                description = sn.get("description", "")
-                published_at = sn.get("publishedAt", _now_utc_iso())
-                channel_title = sn.get("channelTitle", "")
-                thumbnails = (sn.get("thumbnails", {}) or {})
-                thumb = thumbnails.get("high") or thumbnails.get("medium") or thumbnails.get("default") or {}
-                thumb_url = thumb.get("url", "")
-                
-                # 자막 추출 시도
-                transcript_text = _safe_get_transcript(vid)
-                base_text = transcript_text if transcript_text.strip() else description
-                summary_seed = base_text[:6000]  # 요약 입력을 위한 원문 시드 텍스트
-                
-                link = f"https://www.youtube.com/watch?v={vid}"
-                guid = f"youtube:{vid}"
-                
-                item = {
-                    "guid": guid,
-                    "title": title,
-                    "link": link,
-                    "summary": summary_seed,
-                    "published_at": published_at,
-                    # extras
-                    "thumbnail": thumb_url,
-                    "video_url": link,
-                    "source": "youtube_watchlist",
-                    "channel_name": channel_title,
-                }
-                results.append(item)
-                
-                # API 쿼터 보호
-                time.sleep(0.05)
-        
-        except Exception as e:
-            print(f"⚠️ 워치리스트 배치 수집 실패 ({i}-{i+len(batch_ids)}): {e}")
-            continue
-    
+    index = fetch_video_details(api_key=api_key, video_ids=video_ids, fetch_transcripts=fetch_transcripts, quota=quota)
+    results = _ordered_items(video_ids, index)
+    for item in results:
+        item["source"] = "youtube_watchlist"
     return results
-
-
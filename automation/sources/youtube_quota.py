@@ -0,0 +1,208 @@
+"""YouTube Data API 쿼터 회계 및 수집 예산 배분.
+
+YouTube Data API는 호출 종류별 단가(search.list 100, 그 외 목록 조회 1)를
+태평양 시간 자정 기준 일일 한도에서 차감한다. QuotaLedger는 호출마다 단가를
+기록해 일일 사용량을 파일에 남기고, QuotaPlanner는 남은 예산을 하루의 남은
+실행 횟수로 나눈 뒤 우선순위와 과거 수확량(새 영상 수)에 따라 채널/키워드 그룹에
+배분하여 오후에 quotaExceeded로 실패하는 대신 하루 동안 고르게 수집한다.
+"""
+from __future__ import annotations
+
+import datetime as dt
+import json
+import math
+import threading
+import typing as t
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from automation.logger import get_logger
+
+logger = get_logger(__name__)
+
+QUOTA_COSTS: dict[str, int] = {
+    "search.list": 100,
+    "videos.list": 1,
+    "channels.list": 1,
+    "playlistItems.list": 1,
+}
+DEFAULT_DAILY_QUOTA = 10000
+DEFAULT_LEDGER_PATH = Path("data/youtube_quota.json")
+PRIORITY_WEIGHTS: dict[str, float] = {"high": 3.0, "medium": 2.0, "low": 1.0}
+YIELD_SMOOTHING = 0.3  # 수확량 지수이동평균 가중치
+
+try:
+    from zoneinfo import ZoneInfo
+
+    _PACIFIC: dt.tzinfo = ZoneInfo("America/Los_Angeles")
+except Exception:  # tzdata가 없는 환경: 표준시 기준 근사
+    _PACIFIC = dt.timezone(dt.timedelta(hours=-8))
+
+
+def _utc_now() -> dt.datetime:
+    return dt.datetime.now(dt.timezone.utc)
+
+
+def pacific_date(now: dt.datetime | None = None) -> str:
+    """쿼터 일자 키 (태평양 시간 기준 YYYY-MM-DD)."""
+    return (now or _utc_now()).astimezone(_PACIFIC).date().isoformat()
+
+
+def seconds_until_reset(now: dt.datetime | None = None) -> float:
+    """다음 쿼터 초기화(태평양 시간 자정)까지 남은 시간(초)."""
+    local = (now or _utc_now()).astimezone(_PACIFIC)
+    midnight = (local + dt.timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return max(0.0, (midnight - local).total_seconds())
+
+
+def is_quota_exceeded_error(exc: BaseException) -> bool:
+    return "quotaExceeded" in str(exc) or "dailyLimitExceeded" in str(exc)
+
+
+class QuotaLedger:
+    """호출별 쿼터 사용량과 소스별 수확량을 기록하는 장부 (스레드 안전)."""
+
+    def __init__(
+        self,
+        path: Path | str | None = DEFAULT_LEDGER_PATH,
+        daily_limit: int = DEFAULT_DAILY_QUOTA,
+        clock: t.Callable[[], dt.datetime] = _utc_now,
+    ):
+        self.path = Path(path) if path else None
+        self.daily_limit = daily_limit
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data = self._load()
+
+    def _load(self) -> dict[str, t.Any]:
+        data: dict[str, t.Any] = {}
+        if self.path and self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                logger.warning(f"YouTube 쿼터 장부를 읽을 수 없어 새로 시작합니다: {exc}")
+        data.setdefault("yields", {})
+        return data
+
+    def _roll_over(self) -> dict[str, t.Any]:
+        """일자가 바뀌었으면 사용량을 초기화한다 (수확량은 유지)."""
+        today = pacific_date(self._clock())
+        if self._data.get("date") != today:
+            self._data.update({"date": today, "used": 0, "by_method": {}})
+        return self._data
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            payload = json.dumps(self._roll_over(), ensure_ascii=False, indent=2, sort_keys=True)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(payload, encoding="utf-8")
+        except OSError as exc:
+            logger.warning(f"YouTube 쿼터 장부 저장 실패: {exc}")
+
+    def charge(self, method: str, calls: int = 1) -> int:
+        """호출 비용을 기록하고 차감한 단위 수를 반환한다."""
+        units = QUOTA_COSTS.get(method, 1) * calls
+        with self._lock:
+            data = self._roll_over()
+            data["used"] += units
+            data["by_method"][method] = data["by_method"].get(method, 0) + units
+        return units
+
+    def mark_exhausted(self) -> None:
+        """API가 quotaExceeded를 반환하면 오늘 남은 예산을 0으로 맞춘다."""
+        with self._lock:
+            data = self._roll_over()
+            data["used"] = max(data["used"], self.daily_limit)
+
+    def used(self) -> int:
+        with self._lock:
+            return int(self._roll_over()["used"])
+
+    def remaining(self) -> int:
+        return max(0, self.daily_limit - self.used())
+
+    def record_yield(self, source: str, items: int) -> None:
+        """소스가 이번 실행에서 가져온 새 영상 수를 지수이동평균으로 기록한다."""
+        with self._lock:
+            yields = self._data["yields"]
+            previous = yields.get(source)
+            yields[source] = items if previous is None else (1 - YIELD_SMOOTHING) * previous + YIELD_SMOOTHING * items
+
+    def yield_of(self, source: str) -> float | None:
+        with self._lock:
+            return self._data["yields"].get(source)
+
+    def summary(self) -> dict[str, t.Any]:
+        with self._lock:
+            data = self._roll_over()
+            return {
+                "date": data["date"],
+                "used": data["used"],
+                "limit": self.daily_limit,
+                "by_method": dict(data["by_method"]),
+            }
+
+
+@dataclass
+class CollectionTask:
+    """쿼터를 소비하는 수집 작업 하나 (채널, 키워드 그룹, 워치리스트)."""
+
+    source: str
+    cost: int
+    priority: str = "medium"
+    payload: t.Any = field(default=None, repr=False)
+
+
+def channel_task_cost(uploads_cached: bool) -> int:
+    """채널 폴링 비용: (재생목록 미캐시 시 channels.list) + playlistItems.list + videos.list."""
+    return (0 if uploads_cached else QUOTA_COSTS["channels.list"]) + QUOTA_COSTS["playlistItems.list"] + QUOTA_COSTS["videos.list"]
+
+
+def keyword_task_cost() -> int:
+    return QUOTA_COSTS["search.list"] + QUOTA_COSTS["videos.list"]
+
+
+def watchlist_task_cost(video_count: int) -> int:
+    return QUOTA_COSTS["videos.list"] * max(1, math.ceil(video_count / 50))
+
+
+class QuotaPlanner:
+    """남은 일일 예산을 이번 실행 몫으로 나누고 작업을 고른다."""
+
+    def __init__(self, ledger: QuotaLedger, runs_per_day: int = 4, clock: t.Callable[[], dt.datetime] = _utc_now):
+        self.ledger = ledger
+        self.runs_per_day = max(1, runs_per_day)
+        self._clock = clock
+
+    def runs_left_today(self) -> int:
+        interval = 86400 / self.runs_per_day
+        return max(1, math.ceil(seconds_until_reset(self._clock()) / interval))
+
+    def run_budget(self) -> int:
+        """이번 실행에서 쓸 수 있는 단위 수 (남은 예산 / 오늘 남은 실행 횟수)."""
+        return self.ledger.remaining() // self.runs_left_today()
+
+    def score(self, task: CollectionTask) -> float:
+        """우선순위 가중치 × 과거 수확량 (기록이 없으면 한 번은 시도하도록 1로 가정)."""
+        past_yield = self.ledger.yield_of(task.source)
+        return PRIORITY_WEIGHTS.get(task.priority, 1.0) * (0.5 + (1.0 if past_yield is None else past_yield))
+
+    def plan(self, tasks: t.Sequence[CollectionTask]) -> tuple[list[CollectionTask], list[CollectionTask]]:
+        """(이번 실행에서 수행할 작업, 다음 실행으로 미룬 작업)을 반환한다."""
+        budget = self.run_budget()
+        ordered = sorted(tasks, key=lambda task: (-self.score(task) / max(1, task.cost), task.cost))
+        selected: list[CollectionTask] = []
+        deferred: list[CollectionTask] = []
+        for task in ordered:
+            if task.cost <= budget:
+                selected.append(task)
+                budget -= task.cost
+            else:
+                deferred.append(task)
+        # 원래 순서(채널 → 워치리스트 → 키워드)를 유지해 실행한다.
+        position = {id(task): index for index, task in enumerate(tasks)}
+        selected.sort(key=lambda task: position[id(task)])
+        return selected, deferred
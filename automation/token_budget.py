@@ -0,0 +1,135 @@
+"""프롬프트 입력 토큰 추정 및 예산 분배 모듈.
+
+토크나이저 의존성 없이 문자 종류별 비율로 토큰 수를 빠르게 추정하고,
+요약/웹 연구/MCP 등 프롬프트 섹션에 우선순위대로 토큰을 분배하여
+설정된 입력 예산을 넘지 않도록 각 섹션을 잘라낸다.
+
+환경 변수
+----------
+PROMPT_INPUT_TOKEN_BUDGET
+    항목당 프롬프트 입력 토큰 예산 (기본값: 12000, 0이면 비활성화)
+"""
+from __future__ import annotations
+
+import os
+import re
+import typing as t
+from dataclasses import dataclass
+
+from automation.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_INPUT_TOKEN_BUDGET = 12000
+TRUNCATION_MARKER = "\n...(이하 생략)"
+
+# 한글/한자/가나 등 CJK 문자는 대부분 문자당 1토큰 안팎으로 분할된다.
+_CJK_PATTERN = re.compile("[\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u3400-\u9fff\uac00-\ud7af\uf900-\ufaff]")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# 프로바이더별 (CJK 문자당 토큰 수, 그 외 문자당 토큰 수) 근사치
+_PROVIDER_RATIOS: dict[str, tuple[float, float]] = {
+    "openai": (0.8, 1 / 4.0),
+    "claude": (1.1, 1 / 3.5),
+    "gemini": (0.7, 1 / 4.0),
+    "perplexity": (1.0, 1 / 3.8),
+}
+_DEFAULT_RATIO = (1.0, 1 / 4.0)
+
+
+def estimate_tokens(text: str, provider: str | None = None) -> int:
+    """문자 종류별 비율로 토큰 수를 추정한다 (보수적으로 올림)."""
+    if not text:
+        return 0
+    cjk_ratio, other_ratio = _PROVIDER_RATIOS.get(provider or "", _DEFAULT_RATIO)
+    cjk = len(_CJK_PATTERN.findall(text))
+    # 연속 공백은 대부분 하나의 토큰으로 합쳐지므로 한 글자로 센다.
+    other = len(_WHITESPACE_PATTERN.sub(" ", text)) - cjk
+    return int(cjk * cjk_ratio + max(0, other) * other_ratio) + 1
+
+
+def truncate_to_tokens(text: str, max_tokens: int, provider: str | None = None) -> str:
+    """추정 토큰 수가 max_tokens 이하가 되도록 텍스트 끝을 잘라낸다."""
+    if max_tokens <= 0:
+        return ""
+    estimated = estimate_tokens(text, provider)
+    if estimated <= max_tokens:
+        return text
+
+    marker_tokens = estimate_tokens(TRUNCATION_MARKER, provider)
+    target = max(1, max_tokens - marker_tokens)
+    cut = int(len(text) * target / estimated)
+    while cut > 0 and estimate_tokens(text[:cut], provider) > target:
+        cut = int(cut * 0.9)
+    if cut <= 0:
+        return ""
+
+    # 가능하면 줄/문장 경계에서 자른다.
+    boundary = max(text.rfind("\n", 0, cut), text.rfind(". ", 0, cut))
+    if boundary > cut * 0.8:
+        cut = boundary
+    return text[:cut].rstrip() + TRUNCATION_MARKER
+
+
+@dataclass
+class PromptSection:
+    """예산 분배 대상 프롬프트 섹션 (priority가 낮을수록 먼저 배정)."""
+
+    name: str
+    text: str
+    priority: int = 0
+    min_tokens: int = 0
+
+
+class TokenBudgeter:
+    """섹션 우선순위에 따라 입력 토큰 예산을 분배한다."""
+
+    def __init__(self, budget: int, provider: str | None = None):
+        self.budget = budget
+        self.provider = provider
+
+    @classmethod
+    def from_env(cls, provider: str | None = None) -> "TokenBudgeter | None":
+        budget = int(os.getenv("PROMPT_INPUT_TOKEN_BUDGET", str(DEFAULT_INPUT_TOKEN_BUDGET)))
+        if budget <= 0:
+            return None
+        return cls(budget, provider)
+
+    def fit(self, sections: t.Sequence[PromptSection], reserved_tokens: int = 0) -> dict[str, str]:
+        """섹션별로 잘라낸 텍스트를 반환한다.
+
+        reserved_tokens는 지시문/JSON 스키마처럼 줄일 수 없는 고정 부분의 토큰 수다.
+        먼저 우선순위 순서로 각 섹션의 최소 배정량(min_tokens)을 보장한 뒤,
+        남은 예산을 다시 우선순위 순서로 채운다.
+        """
+        needs = {section.name: estimate_tokens(section.text, self.provider) for section in sections}
+        available = self.budget - reserved_tokens
+        if sum(needs.values()) <= available:
+            return {section.name: section.text for section in sections}
+
+        ordered = sorted(sections, key=lambda section: section.priority)
+        grants = {section.name: 0 for section in sections}
+        remaining = max(0, available)
+        for section in ordered:
+            grant = min(needs[section.name], section.min_tokens, remaining)
+            grants[section.name] = grant
+            remaining -= grant
+        for section in ordered:
+            extra = min(needs[section.name] - grants[section.name], remaining)
+            grants[section.name] += extra
+            remaining -= extra
+
+        fitted: dict[str, str] = {}
+        trimmed: list[str] = []
+        for section in sections:
+            if grants[section.name] >= needs[section.name]:
+                fitted[section.name] = section.text
+                continue
+            fitted[section.name] = truncate_to_tokens(section.text, grants[section.name], self.provider)
+            trimmed.append(f"{section.name} {needs[section.name]}→{grants[section.name]}")
+
+        logger.info(
+            f"프롬프트 토큰 예산({self.budget}) 초과로 섹션 축소 "
+            f"[{self.provider or 'default'}, 고정 {reserved_tokens}]: {', '.join(trimmed)}"
+        )
+        return fitted
@@ -0,0 +1,289 @@
+"""URL 정규화 및 리디렉트 해석 인덱스.
+
+같은 기사가 feedburner 리디렉트, 추적 파라미터가 붙은 뉴스레터 링크,
+``news.hada.io/topic?id=`` 페이지 등 여러 형태의 URL로 들어온다. 추적 파라미터와
+프래그먼트를 제거하고 스킴/호스트/경로를 정규화한 "정규 URL"을 만들어
+중복 판단과 웹 연구 캐시의 키로만 사용한다. 게시물에 쓰는 링크는 원래 URL
+(리디렉터 링크는 최종 URL)을 그대로 둔다 (resolve).
+
+단축 URL/클릭 추적 리디렉터 호스트의 링크는 HEAD 요청으로 최종 URL을 확인하며,
+결과는 data/canonical_urls.json에 저장해 다음 실행에서는 네트워크 없이 재사용한다.
+같은 파일에 정규 URL 기준의 웹 연구 결과도 TTL과 함께 캐시한다.
+
+환경 변수
+----------
+URL_RESOLVE_REDIRECTS
+    리디렉터 링크를 HEAD 요청으로 해석할지 여부 (기본값: true)
+URL_CACHE_TTL_DAYS
+    리디렉트 해석/연구 캐시 유효 기간 (일, 기본값: 7)
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import typing as t
+from pathlib import Path
+from urllib.parse import parse_qsl, quote, unquote, urlencode, urlsplit, urlunsplit
+
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+from automation.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_INDEX_PATH = Path("data/canonical_urls.json")
+DEFAULT_TTL_DAYS = 7
+HEAD_TIMEOUT_SECONDS = 5.0
+MAX_ENTRIES = 2000  # 네임스페이스별 최대 항목 수
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# 추적용 쿼리 파라미터 (이름 또는 접두사가 일치하면 제거)
+TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "ref", "ref_src", "ref_url", "referrer", "spm", "si", "feature",
+    "_hsenc", "_hsmi", "mkt_tok", "oly_enc_id", "oly_anon_id", "vero_id", "wickedid",
+    "s_cid", "cmpid", "trk", "trkcampaign", "sc_channel", "sr_share",
+})
+TRACKING_PREFIXES = ("utm_", "pk_", "hsa_", "ga_", "mtm_")
+# 호스트별로 의미 있는 파라미터만 남긴다 (나머지는 모두 제거)
+KEEP_ONLY_PARAMS: dict[str, tuple[str, ...]] = {
+    "news.hada.io": ("id",),
+    "youtube.com": ("v", "list"),
+    "news.ycombinator.com": ("id",),
+}
+# HEAD 요청으로 최종 URL을 확인할 리디렉터 호스트 (접미사 일치)
+REDIRECT_HOSTS = (
+    "feedproxy.google.com", "feeds.feedburner.com", "t.co", "bit.ly", "buff.ly", "ow.ly",
+    "lnkd.in", "tinyurl.com", "goo.gl", "dlvr.it", "rebrand.ly", "shorturl.at", "is.gd",
+    "list-manage.com", "mailchi.mp", "mandrillapp.com", "sendgrid.net", "mcsv.net",
+    "convertkit-mail.com", "convertkit-mail2.com", "hubspotlinks.com", "substack.com",
+    "stibee.com", "page.link",
+)
+_REDIRECT_PATH_HOSTS = ("substack.com", "stibee.com")  # 리디렉트 경로에서만 해석
+_REDIRECT_PATH_PARTS = ("/redirect", "/click", "/track")
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_PATH_SAFE = "/%:@!$&'()*+,;=-._~"
+
+
+def _is_tracking_param(name: str) -> bool:
+    lowered = name.lower()
+    return lowered in TRACKING_PARAMS or lowered.startswith(TRACKING_PREFIXES)
+
+
+def _host_matches(host: str, suffixes: t.Iterable[str]) -> bool:
+    return any(host == suffix or host.endswith("." + suffix) for suffix in suffixes)
+
+
+def canonicalize(url: str) -> str:
+    """URL을 정규 형태로 바꾼다 (네트워크 요청 없음).
+
+    - http/https가 아닌 링크(mailto: 등)는 공백만 제거해 그대로 반환
+    - 스킴은 https, 호스트는 소문자로 바꾸고 ``www.``/``m.``/기본 포트 제거
+    - 추적 파라미터와 프래그먼트 제거, 남은 파라미터는 이름순 정렬
+    - 경로의 퍼센트 인코딩을 통일하고 끝의 ``/`` 제거
+    - ``youtu.be/ID``, ``/shorts/ID``는 ``youtube.com/watch?v=ID``로 통일
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS or not parts.hostname:
+        return url
+
+    host = parts.hostname.rstrip(".")
+    for prefix in ("www.", "m."):
+        if host.startswith(prefix) and host.count(".") >= 2:
+            host = host[len(prefix):]
+            break
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host if port in (None, *_DEFAULT_PORTS.values()) else f"{host}:{port}"
+
+    path = quote(unquote(parts.path), safe=_PATH_SAFE).rstrip("/")
+    params = parse_qsl(parts.query, keep_blank_values=True)
+
+    if host == "youtu.be" and path:
+        netloc, params = "youtube.com", [("v", path.lstrip("/").split("/")[0]), *params]
+        path = "/watch"
+    elif host == "youtube.com" and path.startswith("/shorts/"):
+        params = [("v", path[len("/shorts/"):].split("/")[0]), *params]
+        path = "/watch"
+
+    keep_only = KEEP_ONLY_PARAMS.get(netloc)
+    if keep_only is not None:
+        params = [(name, value) for name, value in params if name in keep_only]
+    else:
+        params = [(name, value) for name, value in params if not _is_tracking_param(name)]
+    query = urlencode(sorted(params), quote_via=quote)
+    return urlunsplit(("https", netloc, path, query, ""))
+
+
+def is_redirector(url: str) -> bool:
+    """HEAD 요청으로 최종 URL을 확인해야 하는 리디렉터 링크인지 여부."""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return False
+    host = (parts.hostname or "").lower()
+    if not _host_matches(host, REDIRECT_HOSTS):
+        return False
+    if _host_matches(host, _REDIRECT_PATH_HOSTS):
+        return any(part in parts.path.lower() for part in _REDIRECT_PATH_PARTS)
+    return True
+
+
+def _head_final_url(url: str, timeout: float) -> str | None:
+    """리디렉트를 따라가 최종 URL을 반환한다 (실패하면 None)."""
+    if not REQUESTS_AVAILABLE:
+        return None
+    headers = {"User-Agent": USER_AGENT}
+    try:
+        response = requests.head(url, allow_redirects=True, timeout=timeout, headers=headers)
+        if response.status_code in (403, 405, 501):
+            # HEAD를 거부하는 서버는 본문을 받지 않는 GET으로 다시 시도한다.
+            response = requests.get(url, allow_redirects=True, timeout=timeout, headers=headers, stream=True)
+            response.close()
+        return str(response.url) or None
+    except Exception as exc:
+        logger.debug(f"리디렉트 해석 실패 ({url}): {exc}")
+        return None
+
+
+class CanonicalUrlIndex:
+    """정규 URL 해석 결과와 정규 URL 기준 캐시(연구 결과)를 보관한다.
+
+    네임스페이스별로 ``{정규 URL: {"value": ..., "saved": epoch}}``를 저장한다.
+    ``redirects`` 네임스페이스는 리디렉터 URL → 최종 URL 매핑이다.
+    """
+
+    REDIRECTS = "redirects"
+    RESEARCH = "research"
+
+    def __init__(
+        self,
+        path: Path | str | None = DEFAULT_INDEX_PATH,
+        *,
+        resolve_redirects: bool = True,
+        ttl_seconds: float = DEFAULT_TTL_DAYS * 86400,
+        timeout: float = HEAD_TIMEOUT_SECONDS,
+        max_entries: int = MAX_ENTRIES,
+        resolver: t.Callable[[str, float], str | None] | None = None,
+        clock: t.Callable[[], float] = time.time,
+    ):
+        self.path = Path(path) if path else None
+        self.resolve_redirects = resolve_redirects
+        self.ttl_seconds = ttl_seconds
+        self.timeout = timeout
+        self.max_entries = max_entries
+        self._resolver = resolver or _head_final_url
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data: dict[str, dict[str, dict[str, t.Any]]] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.lookups = 0
+        self._load()
+
+    @classmethod
+    def from_env(cls, path: Path | str = DEFAULT_INDEX_PATH) -> "CanonicalUrlIndex":
+        resolve = os.getenv("URL_RESOLVE_REDIRECTS", "true").lower() in ("true", "1", "yes")
+        ttl_days = float(os.getenv("URL_CACHE_TTL_DAYS", str(DEFAULT_TTL_DAYS)))
+        return cls(path, resolve_redirects=resolve, ttl_seconds=ttl_days * 86400)
+
+    def _load(self) -> None:
+        if not self.path or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning(f"정규 URL 인덱스를 읽을 수 없어 새로 시작합니다: {exc}")
+            return
+        if data.get("version") != 1:
+            return
+        self._data = {name: dict(entries) for name, entries in data.get("namespaces", {}).items()}
+
+    def save(self) -> None:
+        if not self.path or not self._dirty:
+            return
+        with self._lock:
+            payload = {"version": 1, "namespaces": self._data}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self.path.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+                self._dirty = False
+            except OSError as exc:
+                logger.warning(f"정규 URL 인덱스 저장 실패: {exc}")
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._data.values())
+
+    def _fresh(self, entry: t.Mapping[str, t.Any]) -> bool:
+        return self._clock() - float(entry.get("saved", 0)) < self.ttl_seconds
+
+    def get(self, namespace: str, url: str) -> t.Any | None:
+        """정규 URL 기준 캐시 값을 반환한다 (없거나 만료되면 None)."""
+        key = self.canonical(url)
+        with self._lock:
+            entry = self._data.get(namespace, {}).get(key)
+            if entry is not None and self._fresh(entry):
+                self.hits += 1
+                return entry["value"]
+            self.misses += 1
+            return None
+
+    def put(self, namespace: str, url: str, value: t.Any) -> None:
+        self._put(namespace, self.canonical(url), value)
+
+    def _put(self, namespace: str, key: str, value: t.Any) -> None:
+        with self._lock:
+            entries = self._data.setdefault(namespace, {})
+            entries.pop(key, None)
+            entries[key] = {"value": value, "saved": int(self._clock())}
+            while len(entries) > self.max_entries:
+                # dict는 삽입 순서를 유지하므로 맨 앞이 가장 오래된 항목이다.
+                entries.pop(next(iter(entries)))
+            self._dirty = True
+
+    def resolve(self, url: str) -> str:
+        """게시물에 쓸 링크를 반환한다. 리디렉터 링크만 HEAD 결과(캐시)의 최종 URL로 바꾼다."""
+        url = url.strip()
+        canonical = canonicalize(url)
+        if not self.resolve_redirects or not is_redirector(canonical):
+            return url
+        with self._lock:
+            self.lookups += 1
+            entry = self._data.get(self.REDIRECTS, {}).get(canonical)
+            if entry is not None and self._fresh(entry):
+                return str(entry["value"])
+        final = self._resolver(url, self.timeout)
+        if not final:
+            # 실패는 저장하지 않아 다음 실행에서 다시 시도한다.
+            return url
+        self._put(self.REDIRECTS, canonical, final)
+        return final
+
+    def canonical(self, url: str) -> str:
+        """정규 URL을 반환한다. 리디렉터 링크는 최종 URL을 정규화한다."""
+        return canonicalize(self.resolve(url))
+
+    def key(self, url: str) -> str | None:
+        """중복 판단용 키 (http/https 링크가 아니면 None)."""
+        if not url or not url.strip().lower().startswith(("http://", "https://")):
+            return None
+        return self.canonical(url)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            counts = {name: len(entries) for name, entries in self._data.items()}
+            return {"hits": self.hits, "misses": self.misses, "redirect_lookups": self.lookups, **counts}
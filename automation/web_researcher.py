@@ -11,7 +11,7 @@ import json
 import re
 import time
 import typing as t
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 
 try:
     import requests
@@ -32,6 +32,9 @@ except ImportError:
 
 from automation.logger import get_logger
 
+if t.TYPE_CHECKING:
+    from automation.url_canonical import CanonicalUrlIndex
+
 logger = get_logger(__name__)
 
 if not REQUESTS_AVAILABLE:
@@ -59,16 +62,52 @@ class ResearchResult:
     expert_opinions: list[dict[str, str]] = field(default_factory=list)
     related_articles: list[WebResource] = field(default_factory=list)
 
+    @property
+    def is_empty(self) -> bool:
+        return not (self.web_results or self.expert_opinions or self.related_articles)
+
+    @classmethod
+    def from_dict(cls, data: t.Mapping[str, t.Any]) -> "ResearchResult":
+        return cls(
+            web_results=[WebResource(**res) for res in data.get("web_results", [])],
+            expert_opinions=[dict(op) for op in data.get("expert_opinions", [])],
+            related_articles=[WebResource(**res) for res in data.get("related_articles", [])],
+        )
+
 
 class WebResearcher:
-    """웹 검색 및 외부 자료 수집."""
+    """웹 검색 및 외부 자료 수집.
+
+    cache(CanonicalUrlIndex)가 주어지면 연구 결과를 기사 정규 URL 기준으로 캐시하여
+    추적 파라미터나 리디렉트만 다른 같은 기사를 다시 검색하지 않는다.
+    """
     
-    def __init__(self, max_search_results: int = 5, enable_expert_search: bool = True):
+    def __init__(
+        self,
+        max_search_results: int = 5,
+        enable_expert_search: bool = True,
+        cache: CanonicalUrlIndex | None = None,
+    ):
         self.max_search_results = max_search_results
         self.enable_expert_search = enable_expert_search
+        self.cache = cache
     
     def research(self, title: str, summary: str, url: str) -> ResearchResult:
         """주어진 기사에 대한 웹 연구를 수행한다."""
+        cache = self.cache if self.cache is not None and self.cache.key(url) else None
+        if cache is not None:
+            cached = cache.get(cache.RESEARCH, url)
+            if cached is not None:
+                logger.debug(f"웹 연구 캐시 적중: {url}")
+                return ResearchResult.from_dict(cached)
+
+        result = self._research(title, summary)
+        if cache is not None and not result.is_empty:
+            # 빈 결과(검색 실패)는 저장하지 않고 다음 실행에서 다시 시도한다.
+            cache.put(cache.RESEARCH, url, asdict(result))
+        return result
+
+    def _research(self, title: str, summary: str) -> ResearchResult:
         result = ResearchResult()
         
         # 1. 웹 검색 수행
@@ -0,0 +1,106 @@
+"""Gmail 뉴스레터 본문/링크 추출 비용 벤치마크.
+
+대용량 뉴스레터(표 레이아웃, 추적 링크, 인라인 스타일이 많은 HTML)를 합성해
+기존 방식(파트 디코딩 2회 + BeautifulSoup 전체 파싱 2회)과 단일 패스 추출기
+(``automation.sources.mail_extract.extract_message``)의 메시지당 비용을 비교한다.
+
+사용 예시::
+
+    python benchmarks/bench_gmail_extract.py --messages 50 --sections 400
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import html
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from automation.sources.mail_extract import extract_message  # noqa: E402
+
+try:
+    from bs4 import BeautifulSoup  # type: ignore
+    BS4_AVAILABLE = True
+except Exception:
+    BS4_AVAILABLE = False
+
+
+def _newsletter_html(index: int, sections: int) -> str:
+    head = (
+        "<html><head><style>" + "td { padding: 0; font-family: sans-serif; } " * 200 + "</style></head><body>"
+        f'<a href="https://news.example.com/view-in-browser?id={index}">웹에서 보기</a>'
+        f'<table><tr><td><a href="https://x.list-manage.com/track/click?u={index}">로고</a></td></tr>'
+    )
+    body = "".join(
+        f'<tr><td style="padding:12px;color:#333"><h2>{i}. 테스트 자동화 소식</h2>'
+        f"<p>Playwright와 LLM 에이전트를 결합한 E2E 테스트 사례 &amp; 회귀 테스트 비용 분석 {i}</p>"
+        f'<a href="https://blog.example.com/posts/{index}-{i}?utm_source=newsletter">자세히 보기</a>'
+        f'<img src="https://t.example.com/open.gif?m={index}&s={i}" width="1" height="1"></td></tr>'
+        for i in range(sections)
+    )
+    tail = f'</table><a href="https://news.example.com/unsubscribe?id={index}">수신거부</a></body></html>'
+    return head + body + tail
+
+
+def _message(index: int, sections: int) -> dict:
+    def encode(text: str) -> str:
+        return base64.urlsafe_b64encode(text.encode("utf-8")).decode("ascii")
+
+    plain = f"뉴스레터 {index}\n자세히 보기: https://blog.example.com/posts/{index}-0"
+    return {"id": f"m{index}", "payload": {"mimeType": "multipart/alternative", "parts": [
+        {"mimeType": "text/plain", "body": {"data": encode(plain)}},
+        {"mimeType": "text/html", "body": {"data": encode(_newsletter_html(index, sections))}},
+    ]}}
+
+
+def _legacy_extract(message: dict) -> tuple[str, str]:
+    """변경 전 gmail_collector의 _decode_body + _extract_first_link 동작 (HTML 파트 기준)."""
+    def html_part() -> str:
+        for part in message["payload"]["parts"]:
+            if "html" in part["mimeType"]:
+                return base64.urlsafe_b64decode(part["body"]["data"].encode("utf-8")).decode("utf-8", errors="replace")
+        return ""
+
+    soup = BeautifulSoup(html_part(), "html.parser")
+    text = html.unescape(re.sub(r"\s+", " ", soup.get_text(" "))).strip()[:6000]
+    anchor = BeautifulSoup(html_part(), "html.parser").find("a", href=True)
+    return text, anchor.get("href") if anchor else ""
+
+
+def _bench(func, messages: list[dict]) -> float:
+    """메시지당 평균 ms."""
+    started = time.perf_counter()
+    for message in messages:
+        func(message)
+    return (time.perf_counter() - started) / len(messages) * 1000
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Gmail 본문/링크 추출 벤치마크")
+    parser.add_argument("--messages", type=int, default=30, help="메시지 수 (기본값: 30)")
+    parser.add_argument("--sections", type=int, default=300, help="뉴스레터당 기사 수 (기본값: 300)")
+    args = parser.parse_args(argv)
+
+    messages = [_message(i, args.sections) for i in range(args.messages)]
+    size_kb = len(_newsletter_html(0, args.sections).encode("utf-8")) / 1024
+    print(f"messages={args.messages}  html size≈{size_kb:.0f} KB")
+
+    sample = extract_message(messages[0])
+    print(f"{'method':<24}{'per message (ms)':>18}  link")
+    single_ms = _bench(extract_message, messages)
+    print(f"{'single-pass':<24}{single_ms:>18.2f}  {sample.link}")
+    if BS4_AVAILABLE:
+        legacy_ms = _bench(_legacy_extract, messages)
+        print(f"{'legacy (bs4 x2)':<24}{legacy_ms:>18.2f}  {_legacy_extract(messages[0])[1]}")
+        print(f"speedup: {legacy_ms / single_ms:.1f}x")
+    else:
+        print("beautifulsoup4가 없어 기존 방식 측정을 건너뜁니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
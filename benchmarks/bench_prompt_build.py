@@ -0,0 +1,106 @@
+"""프롬프트 생성 비용 마이크로 벤치마크.
+
+프로바이더별 ``_build_prompt``의 항목당 비용을 측정한다.
+최초 호출(템플릿 컴파일 포함)과 캐시된 이후 호출을 구분하고, 토큰 예산 적용
+(PROMPT_INPUT_TOKEN_BUDGET) 여부에 따른 차이도 함께 출력한다.
+
+사용 예시::
+
+    python benchmarks/bench_prompt_build.py --items 500
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from automation.prompt_templates import reset_prompt_cache  # noqa: E402
+from automation.qa_generator import (  # noqa: E402
+    ClaudeProvider,
+    GeminiProvider,
+    OpenAIProvider,
+    PerplexityProvider,
+)
+
+PROVIDERS = {
+    "openai": OpenAIProvider,
+    "claude": ClaudeProvider,
+    "perplexity": PerplexityProvider,
+    "gemini": GeminiProvider,
+}
+
+
+def _items(count: int) -> list[dict[str, str]]:
+    return [
+        {
+            "guid": f"bench-{i}",
+            "title": f"LLM 기반 테스트 자동화 도구 비교 #{i}",
+            "link": f"https://news.hada.io/topic?id={10000 + i}",
+            "summary": "Playwright와 LLM 에이전트를 결합한 E2E 테스트 자동화 사례를 소개합니다. " * 20,
+            "published_at": "2025-01-06T09:00:00Z",
+        }
+        for i in range(count)
+    ]
+
+
+def _research() -> SimpleNamespace:
+    results = [
+        SimpleNamespace(title=f"검색 결과 {i}", snippet="테스트 자동화 도입 효과에 대한 분석 " * 10)
+        for i in range(3)
+    ]
+    opinions = [{"title": "HN 토론", "comments": 42}, {"title": "Reddit 토론", "comments": 17}]
+    return SimpleNamespace(web_results=results, expert_opinions=opinions)
+
+
+MCP_INSIGHTS = {
+    "thoughts": [f"{i}단계 사고: QA 관점 영향 분석" for i in range(5)],
+    "insights": ["회귀 테스트 비용 감소", "플래키 테스트 탐지", "리뷰 절차 필요"],
+    "conclusion": "작은 범위의 파일럿부터 시작하는 것이 바람직하다.",
+}
+
+
+def bench(name: str, items: list[dict[str, str]], with_context: bool) -> tuple[float, float]:
+    """(최초 호출 ms, 이후 항목당 µs)를 반환한다."""
+    reset_prompt_cache()
+    provider = PROVIDERS[name](api_key="bench")
+    if with_context:
+        provider.set_research_data(_research())
+        provider.set_mcp_insights(MCP_INSIGHTS)
+
+    started = time.perf_counter()
+    provider._build_prompt(items[0])
+    cold_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    for item in items:
+        provider._build_prompt(item)
+    warm_us = (time.perf_counter() - started) / len(items) * 1_000_000
+    return cold_ms, warm_us
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="프롬프트 생성 비용 벤치마크")
+    parser.add_argument("--items", type=int, default=300, help="측정할 항목 수 (기본값: 300)")
+    args = parser.parse_args(argv)
+
+    items = _items(args.items)
+    print(f"{'provider':<12}{'context':<10}{'budget':<8}{'first call (ms)':>18}{'per item (us)':>16}")
+    for budget in ("12000", "0"):
+        os.environ["PROMPT_INPUT_TOKEN_BUDGET"] = budget
+        for name in PROVIDERS:
+            for with_context in (False, True):
+                cold_ms, warm_us = bench(name, items, with_context)
+                print(
+                    f"{name:<12}{('yes' if with_context else 'no'):<10}{('on' if budget != '0' else 'off'):<8}"
+                    f"{cold_ms:>18.2f}{warm_us:>16.1f}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
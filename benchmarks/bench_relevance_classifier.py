@@ -0,0 +1,93 @@
+"""로컬 관련성 분류기 벤치마크.
+
+_posts의 기존 포스트로 leave-one-out 평가를 한다. 각 포스트를 뺀 나머지로 학습한 뒤
+생성 단계에서 쓰는 입력과 같은 제목+요약(front matter의 summary 또는 description)만으로
+예측해 다음을 측정한다.
+
+- 카테고리 정확도와 카테고리별 혼동 행렬
+- ``--min-relevance`` 기준으로 제외되는 포스트 수 (기술 포스트가 잘못 제외되는 비율)
+- 학습 시간과 예측 1건당 시간
+
+사용 예시::
+
+    python benchmarks/bench_relevance_classifier.py --min-relevance 0.1
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from automation.relevance_classifier import (  # noqa: E402
+    CATEGORY_DIRS,
+    DEFAULT_MIN_RELEVANCE,
+    TOPICAL_CATEGORIES,
+    RelevanceClassifier,
+    _FRONT_MATTER_RE,
+    _post_text,
+)
+
+
+def title_and_summary(path: Path) -> tuple[str, str]:
+    fields: dict[str, str] = {}
+    match = _FRONT_MATTER_RE.match(path.read_text(encoding="utf-8"))
+    for line in (match.group(1).splitlines() if match else []):
+        name, sep, value = line.partition(":")
+        if sep:
+            fields[name.strip()] = value.strip().strip("\"'")
+    return fields.get("title", ""), fields.get("summary") or fields.get("description", "")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="로컬 관련성 분류기 벤치마크")
+    parser.add_argument("--posts-dir", type=Path, default=ROOT / "_posts", help="학습할 포스트 디렉터리")
+    parser.add_argument("--min-relevance", type=float, default=DEFAULT_MIN_RELEVANCE, help="제외 기준 관련성")
+    args = parser.parse_args(argv)
+
+    paths = [
+        (path, category)
+        for directory, category in CATEGORY_DIRS.items()
+        for path in sorted((args.posts_dir / directory).glob("*.md"))
+    ]
+    texts = [_post_text(path) for path, _ in paths]
+    labels = [category for _, category in paths]
+    queries = [title_and_summary(path) for path, _ in paths]
+    print(f"posts={len(paths)}  " + "  ".join(f"{c}={n}" for c, n in Counter(labels).items()))
+
+    confusion: Counter[tuple[str, str]] = Counter()
+    dropped: Counter[str] = Counter()
+    fit_seconds = 0.0
+    for i in range(len(paths)):
+        started = time.perf_counter()
+        classifier = RelevanceClassifier().fit(texts[:i] + texts[i + 1:], labels[:i] + labels[i + 1:])
+        fit_seconds += time.perf_counter() - started
+        prediction = classifier.predict(*queries[i])
+        confusion[(labels[i], prediction.category)] += 1
+        if prediction.relevance < args.min_relevance:
+            dropped[labels[i]] += 1
+
+    correct = sum(count for (actual, predicted), count in confusion.items() if actual == predicted)
+    print(f"accuracy={correct / len(paths):.3f}  fit={fit_seconds / len(paths) * 1000:.0f} ms")
+    categories = list(CATEGORY_DIRS.values())
+    print(f"{'actual/predicted':<20}" + "".join(f"{c:>14}" for c in categories) + f"{'dropped':>10}")
+    for actual in categories:
+        row = "".join(f"{confusion[(actual, predicted)]:>14}" for predicted in categories)
+        print(f"{actual:<20}{row}{dropped[actual]:>10}")
+    topical = sum(count for category, count in Counter(labels).items() if category in TOPICAL_CATEGORIES)
+    wrongly_dropped = sum(dropped[category] for category in TOPICAL_CATEGORIES)
+    print(f"topical posts dropped at {args.min_relevance}: {wrongly_dropped}/{topical}")
+
+    started = time.perf_counter()
+    for query in queries * 10:
+        classifier.predict(*query)
+    print(f"predict: {(time.perf_counter() - started) / (len(queries) * 10) * 1e6:.1f} µs/item")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
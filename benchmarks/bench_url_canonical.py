@@ -0,0 +1,106 @@
+"""URL 정규화/리디렉트 해석 인덱스 벤치마크.
+
+기존 포스트 front matter의 ``original_url``과 data/geeknews_state.json의 처리 목록을
+과거 링크 집합으로 사용한다. 각 링크를 실제로 들어오는 형태(추적 파라미터,
+http/www 차이, 프래그먼트, 단축 URL 리디렉트)로 변형해 다음을 측정한다.
+
+- 원본 문자열 기준과 정규 URL 기준의 고유 키 수 (중복 판단 효과)
+- 정규화 처리량
+- 리디렉트 해석 비용: 인덱스가 빈 상태(HEAD 요청)와 저장된 인덱스 재사용 시
+
+HEAD 요청은 ``--head-latency-ms`` 만큼 지연되는 가짜 리졸버로 대신한다.
+
+사용 예시::
+
+    python benchmarks/bench_url_canonical.py --head-latency-ms 120
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from automation.url_canonical import CanonicalUrlIndex, canonicalize  # noqa: E402
+
+_ORIGINAL_URL_RE = re.compile(r'^original_url:\s*"?([^"\n]+)"?\s*$', re.MULTILINE)
+
+
+def historical_links(root: Path = ROOT) -> list[str]:
+    links: set[str] = set()
+    for path in (root / "_posts").rglob("*.md"):
+        links.update(match.strip() for match in _ORIGINAL_URL_RE.findall(path.read_text(encoding="utf-8")))
+    state = root / "data" / "geeknews_state.json"
+    if state.exists():
+        processed = json.loads(state.read_text(encoding="utf-8")).get("processed", [])
+        links.update(guid for guid in processed if guid.startswith("http"))
+    return sorted(links)
+
+
+def variants(link: str, number: int) -> list[tuple[str, str]]:
+    """(관측 URL, 단축 URL이면 리졸버가 돌려줄 최종 URL) 목록."""
+    bare = link.split("://", 1)[-1]
+    sep = "&" if "?" in link else "?"
+    return [
+        (link, ""),
+        (f"{link}{sep}utm_source=newsletter&utm_medium=email&mc_cid={number}", ""),
+        (f"http://www.{bare}#comments" if not bare.startswith("www.") else f"http://{bare}#comments", ""),
+        (f"{link}{sep}fbclid=IwAR{number}", ""),
+        (f"https://bit.ly/gn{number}", f"{link}{sep}utm_source=twitter"),
+        (f"https://feedproxy.google.com/~r/geeknews/~3/{number}", link),
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="URL 정규화/리디렉트 인덱스 벤치마크")
+    parser.add_argument("--head-latency-ms", type=float, default=80.0, help="가짜 HEAD 요청 지연 (기본값: 80)")
+    parser.add_argument("--repeat", type=int, default=20, help="정규화 처리량 측정 반복 (기본값: 20)")
+    args = parser.parse_args(argv)
+
+    links = historical_links()
+    observed: list[str] = []
+    targets: dict[str, str] = {}
+    for number, link in enumerate(links):
+        for url, final in variants(link, number):
+            observed.append(url)
+            if final:
+                targets[url] = final
+    print(f"historical links={len(links)}  observed urls={len(observed)}")
+
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        for url in observed:
+            canonicalize(url)
+    per_url_us = (time.perf_counter() - started) / (args.repeat * len(observed)) * 1e6
+    print(f"canonicalize: {per_url_us:.1f} µs/url")
+
+    head_calls = [0]
+
+    def resolver(url: str, timeout: float) -> str | None:
+        head_calls[0] += 1
+        time.sleep(args.head_latency_ms / 1000)
+        return targets.get(url)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "canonical_urls.json"
+        print(f"{'run':<18}{'unique keys':>12}{'HEAD calls':>12}{'seconds':>10}")
+        print(f"{'raw strings':<18}{len(set(observed)):>12}{'-':>12}{'-':>10}")
+        for label in ("cold index", "warm index"):
+            index = CanonicalUrlIndex(path, resolver=resolver)
+            head_calls[0] = 0
+            started = time.perf_counter()
+            keys = {index.canonical(url) for url in observed}
+            elapsed = time.perf_counter() - started
+            index.save()
+            print(f"{label:<18}{len(keys):>12}{head_calls[0]:>12}{elapsed:>10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""관련 포스트 데이터(_data/related.yml)를 생성하는 스크립트.
+
+Jekyll 빌드 전에 실행합니다. 바뀐 포스트만 다시 분석하므로 반복 실행해도 빠릅니다.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from automation.related_posts import (
+    DEFAULT_INDEX_PATH,
+    DEFAULT_OUTPUT_PATH,
+    DEFAULT_TOP_K,
+    build_related_posts,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="관련 포스트 데이터 생성")
+    parser.add_argument("--posts-dir", type=Path, default=project_root / "_posts", help="포스트 디렉터리")
+    parser.add_argument("--index", type=Path, default=project_root / DEFAULT_INDEX_PATH, help="토큰 빈도 인덱스 파일")
+    parser.add_argument("--output", type=Path, default=project_root / DEFAULT_OUTPUT_PATH, help="출력 YAML 파일")
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K, help=f"포스트당 관련 포스트 수 (기본값: {DEFAULT_TOP_K})")
+    parser.add_argument("--rebuild", action="store_true", help="인덱스를 무시하고 모든 포스트를 다시 분석")
+    args = parser.parse_args(argv)
+
+    if args.rebuild and args.index.exists():
+        args.index.unlink()
+    stats = build_related_posts(args.posts_dir, index_path=args.index, output_path=args.output, top_k=args.top_k)
+    print(
+        f"포스트 {stats['posts']}개 (다시 분석 {stats['changed']}개, 삭제 {stats['removed']}개), "
+        f"{args.output} {'갱신' if stats['written'] else '변경 없음'}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
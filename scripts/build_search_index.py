@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""블로그 검색 인덱스(assets/search/)를 생성하는 스크립트.
+
+Jekyll 빌드 전에 실행합니다. 새로 생기거나 바뀐 포스트가 속한 샤드만 다시 씁니다.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from automation.search_index import DEFAULT_OUTPUT_DIR, DEFAULT_STATE_PATH, build_search_index
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="블로그 검색 인덱스 생성")
+    parser.add_argument("--posts-dir", type=Path, default=project_root / "_posts", help="포스트 디렉터리")
+    parser.add_argument("--output-dir", type=Path, default=project_root / DEFAULT_OUTPUT_DIR, help="샤드 출력 디렉터리")
+    parser.add_argument("--state", type=Path, default=project_root / DEFAULT_STATE_PATH, help="포스트별 토큰 빈도 상태 파일")
+    parser.add_argument("--rebuild", action="store_true", help="상태 파일을 무시하고 모든 샤드를 다시 생성")
+    args = parser.parse_args(argv)
+
+    if args.rebuild and args.state.exists():
+        args.state.unlink()
+    stats = build_search_index(args.posts_dir, output_dir=args.output_dir, state_path=args.state)
+    print(
+        f"포스트 {stats['posts']}개 (다시 분석 {stats['changed']}개, 삭제 {stats['removed']}개), "
+        f"샤드 {stats['shards']}개 갱신"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -136,11 +136,11 @@ def auto_push_posts(created_files: List[Path], project_dir: Path | None = None)
             run_command(["git", "add", str(relative_path)], cwd=project_dir)
             print(f"  ✓ 추가됨: {relative_path}")
         
-        # data/geeknews_state.json도 추가 (있는 경우)
-        state_file = project_dir / "data" / "geeknews_state.json"
-        if state_file.exists():
-            run_command(["git", "add", "data/geeknews_state.json"], cwd=project_dir)
-            print(f"  ✓ 추가됨: data/geeknews_state.json")
+        # 상태 파일과 사이트 데이터 파일도 추가 (있는 경우)
+        for extra in ("data/geeknews_state.json", "_data/related.yml", "assets/search"):
+            if (project_dir / extra).exists():
+                run_command(["git", "add", extra], cwd=project_dir)
+                print(f"  ✓ 추가됨: {extra}")
         
         # 커밋 메시지 생성
         print("\n[2단계] Git 커밋 생성 중...")
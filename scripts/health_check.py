@@ -10,6 +10,8 @@ import os
 import shutil
 import subprocess
 import sys
+import urllib.error
+import urllib.request
 from datetime import datetime
 from pathlib import Path
 
@@ -202,6 +204,37 @@ def check_directories() -> tuple[bool, str]:
         return False, "일부 디렉토리 없음"
 
 
+def check_posts_manifest() -> tuple[bool, str]:
+    """포스트 매니페스트의 포스트 수와 최신 포스트를 확인합니다."""
+    print("\n📚 포스트 매니페스트 확인 중...")
+    
+    try:
+        from automation.posts_manifest import PostsManifest
+        
+        manifest = PostsManifest.from_env(Config.POSTS_DIR)
+        try:
+            total = manifest.count()
+            latest = manifest.latest()
+            for category in ("QA Engineer", "Learning", "Daily Life"):
+                print(f"  {category}: {manifest.count(category)}개")
+            if latest is None:
+                print("  ℹ️  기록된 포스트가 없습니다.")
+                return True, "포스트 없음"
+            print(f"  최신 포스트: {latest.path} ({latest.date})")
+            if not manifest.file_path(latest).exists():
+                # 포스트를 직접 지우거나 옮긴 경우: 디렉터리와 다시 맞춘다.
+                updated, removed = manifest.sync()
+                print(f"  ⚠️  최신 포스트 파일이 없어 다시 맞췄습니다 (갱신 {len(updated)}개, 삭제 {len(removed)}개).")
+                return False, f"{latest.path} 없음"
+            print(f"  ✅ 총 {total}개 포스트")
+            return True, f"{total}개"
+        finally:
+            manifest.close()
+    except Exception as e:
+        print(f"  ❌ 포스트 매니페스트 확인 실패: {e}")
+        return False, str(e)
+
+
 def check_nodejs() -> tuple[bool, str]:
     """Node.js 설치를 확인합니다."""
     print("\n🟢 Node.js 확인 중...")
@@ -237,6 +270,8 @@ def check_mcp_server() -> tuple[bool, str]:
         print("  ℹ️  MCP가 비활성화되어 있습니다.")
         return True, "비활성화"
     
+    circuit = check_mcp_circuit()
+    
     mcp_url = os.getenv("MCP_SERVER_URL", "http://localhost:3000")
     
     try:
@@ -249,6 +284,8 @@ def check_mcp_server() -> tuple[bool, str]:
         with urllib.request.urlopen(request, timeout=5) as response:
             if response.status == 200:
                 print(f"  ✅ MCP 서버 연결 성공: {mcp_url}")
+                if circuit and circuit["state"] != "closed":
+                    return True, f"정상 (서킷 {circuit['state']}, 다음 실행에서 재확인)"
                 return True, "정상"
             else:
                 print(f"  ⚠️  MCP 서버 응답 이상: HTTP {response.status}")
@@ -263,6 +300,27 @@ def check_mcp_server() -> tuple[bool, str]:
         return False, str(e)
 
 
+def check_mcp_circuit() -> dict | None:
+    """파이프라인이 저장한 MCP 서킷 브레이커 상태를 출력합니다."""
+    try:
+        from automation.mcp_client import mcp_breaker_status
+        circuit = mcp_breaker_status()
+    except Exception as e:
+        print(f"  ⚠️  MCP 서킷 상태를 읽을 수 없습니다: {e}")
+        return None
+    
+    if circuit is None:
+        print("  ℹ️  저장된 MCP 서킷 상태가 없습니다.")
+    elif circuit["state"] == "closed":
+        print(f"  ✅ MCP 서킷: closed (누적 차단 {circuit['total_trips']}회)")
+    else:
+        print(
+            f"  ⚠️  MCP 서킷: {circuit['state']} "
+            f"(연속 실패 {circuit['consecutive_failures']}회, 재확인까지 {circuit['retry_in_seconds']}초)"
+        )
+    return circuit
+
+
 def check_git_config() -> tuple[bool, str]:
     """Git 설정을 확인합니다."""
     print("\n🔧 Git 설정 확인 중...")
@@ -346,6 +404,7 @@ def main() -> int:
         ("Git 설정", check_git_config),
         ("디스크", check_disk_space),
         ("디렉토리", check_directories),
+        ("포스트", check_posts_manifest),
         ("마지막 실행", check_last_run),
     ]
     
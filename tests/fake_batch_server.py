@@ -0,0 +1,227 @@
+"""오프라인 테스트용 가짜 Batch API 서버.
+
+OpenAI Files/Batches API와 Anthropic Message Batches API의 필요한 부분만 흉내 낸다.
+배치는 ``polls_until_done``번 조회된 뒤 완료되며, 각 요청의 응답 텍스트는
+``responder(custom_id, payload)``로 만든다 (None을 반환하면 해당 요청은 실패 처리).
+
+단독 실행::
+
+    python -m tests.fake_batch_server --port 8765
+    OPENAI_BATCH_BASE_URL=http://127.0.0.1:8765/v1 python -m automation.geeknews_pipeline --batch
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import threading
+import typing as t
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+Responder = t.Callable[[str, t.Dict[str, t.Any]], t.Optional[str]]
+
+
+def default_responder(custom_id: str, payload: dict[str, t.Any]) -> str:
+    """프롬프트 일부를 요약으로 돌려주는 기본 응답."""
+    return json.dumps({
+        "summary": f"배치 응답 {custom_id}",
+        "qa_pairs": [{"question": "배치로 생성되었나요?", "answer": "네."}],
+        "follow_ups": [],
+        "resources": [],
+        "blog_category": "Learning",
+    }, ensure_ascii=False)
+
+
+class FakeBatchServer:
+    """스레드에서 실행되는 가짜 Batch API 서버."""
+
+    def __init__(self, responder: Responder = default_responder, polls_until_done: int = 1, port: int = 0):
+        self.responder = responder
+        self.polls_until_done = polls_until_done
+        self.files: dict[str, bytes] = {}
+        self.batches: dict[str, dict[str, t.Any]] = {}
+        self.requests_log: list[tuple[str, str]] = []
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "FakeBatchServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeBatchServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: t.Any) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # 배치 처리
+    # ------------------------------------------------------------------
+    def _create_batch(self, kind: str, lines: list[dict[str, t.Any]]) -> dict[str, t.Any]:
+        batch_id = f"batch_{uuid.uuid4().hex[:12]}"
+        batch = {"id": batch_id, "kind": kind, "lines": lines, "polls": 0}
+        self.batches[batch_id] = batch
+        return batch
+
+    def _advance(self, batch: dict[str, t.Any]) -> bool:
+        batch["polls"] += 1
+        done = batch["polls"] >= self.polls_until_done
+        if done and "output" not in batch:
+            batch["output"] = [
+                (line["custom_id"], self.responder(line["custom_id"], line.get("body") or line.get("params") or {}))
+                for line in batch["lines"]
+            ]
+        return done
+
+    def _openai_batch_view(self, batch: dict[str, t.Any]) -> dict[str, t.Any]:
+        view = {"id": batch["id"], "object": "batch", "status": "in_progress"}
+        if "output" in batch:
+            records = []
+            for custom_id, text in batch["output"]:
+                if text is None:
+                    records.append({"custom_id": custom_id, "response": {"status_code": 500, "body": {}}, "error": None})
+                else:
+                    records.append({
+                        "custom_id": custom_id,
+                        "response": {
+                            "status_code": 200,
+                            "body": {"choices": [{"message": {"role": "assistant", "content": text}}]},
+                        },
+                        "error": None,
+                    })
+            file_id = f"file-out-{batch['id']}"
+            self.files[file_id] = "\n".join(json.dumps(r, ensure_ascii=False) for r in records).encode("utf-8")
+            view.update(status="completed", output_file_id=file_id, error_file_id=None)
+        return view
+
+    def _anthropic_batch_view(self, batch: dict[str, t.Any]) -> dict[str, t.Any]:
+        view = {"id": batch["id"], "type": "message_batch", "processing_status": "in_progress", "results_url": None}
+        if "output" in batch:
+            view.update(processing_status="ended", results_url=f"{self.base_url}/messages/batches/{batch['id']}/results")
+        return view
+
+    def _anthropic_results(self, batch: dict[str, t.Any]) -> bytes:
+        records = []
+        for custom_id, text in batch.get("output", []):
+            if text is None:
+                records.append({"custom_id": custom_id, "result": {"type": "errored", "error": {"type": "api_error"}}})
+            else:
+                records.append({
+                    "custom_id": custom_id,
+                    "result": {"type": "succeeded", "message": {"content": [{"type": "text", "text": text}]}},
+                })
+        return "\n".join(json.dumps(r, ensure_ascii=False) for r in records).encode("utf-8")
+
+    # ------------------------------------------------------------------
+    # HTTP 핸들러
+    # ------------------------------------------------------------------
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: t.Any) -> None:  # noqa: A002 - 상위 시그니처
+                pass
+
+            def _send(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _json(self, payload: t.Any, status: int = 200) -> None:
+                self._send(status, json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+            def _body(self) -> bytes:
+                return self.rfile.read(int(self.headers.get("Content-Length", "0")))
+
+            def do_POST(self) -> None:  # noqa: N802 - http.server 규약
+                server.requests_log.append(("POST", self.path))
+                body = self._body()
+                if self.path == "/v1/files":
+                    file_id = f"file-{uuid.uuid4().hex[:12]}"
+                    server.files[file_id] = _extract_multipart_file(body, self.headers.get("Content-Type", ""))
+                    self._json({"id": file_id, "object": "file", "purpose": "batch"})
+                elif self.path == "/v1/batches":
+                    payload = json.loads(body)
+                    raw = server.files.get(payload.get("input_file_id"), b"")
+                    lines = [json.loads(line) for line in raw.decode("utf-8").splitlines() if line.strip()]
+                    batch = server._create_batch("openai", lines)
+                    self._json(server._openai_batch_view(batch))
+                elif self.path == "/v1/messages/batches":
+                    payload = json.loads(body)
+                    batch = server._create_batch("anthropic", payload.get("requests", []))
+                    self._json(server._anthropic_batch_view(batch))
+                else:
+                    self._json({"error": "not found"}, status=404)
+
+            def do_GET(self) -> None:  # noqa: N802 - http.server 규약
+                server.requests_log.append(("GET", self.path))
+                match = re.fullmatch(r"/v1/batches/([\w-]+)", self.path)
+                if match and match.group(1) in server.batches:
+                    batch = server.batches[match.group(1)]
+                    server._advance(batch)
+                    self._json(server._openai_batch_view(batch))
+                    return
+                match = re.fullmatch(r"/v1/files/([\w-]+)/content", self.path)
+                if match and match.group(1) in server.files:
+                    self._send(200, server.files[match.group(1)], "application/jsonl")
+                    return
+                match = re.fullmatch(r"/v1/messages/batches/([\w-]+)(/results)?", self.path)
+                if match and match.group(1) in server.batches:
+                    batch = server.batches[match.group(1)]
+                    if match.group(2):
+                        self._send(200, server._anthropic_results(batch), "application/jsonl")
+                    else:
+                        server._advance(batch)
+                        self._json(server._anthropic_batch_view(batch))
+                    return
+                self._json({"error": "not found"}, status=404)
+
+        return Handler
+
+
+def _extract_multipart_file(body: bytes, content_type: str) -> bytes:
+    """multipart/form-data 본문에서 file 파트의 내용을 꺼낸다."""
+    match = re.search(r"boundary=([^;]+)", content_type)
+    if not match:
+        return body
+    boundary = b"--" + match.group(1).encode()
+    for part in body.split(boundary):
+        if b'name="file"' not in part:
+            continue
+        _, _, content = part.partition(b"\r\n\r\n")
+        return content.rsplit(b"\r\n", 1)[0]
+    return b""
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="오프라인 테스트용 가짜 Batch API 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--polls", type=int, default=1, help="완료까지 필요한 상태 조회 횟수")
+    args = parser.parse_args(argv)
+
+    server = FakeBatchServer(polls_until_done=args.polls, port=args.port)
+    print(f"가짜 Batch API 서버 실행 중: {server.base_url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
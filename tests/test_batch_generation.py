@@ -0,0 +1,114 @@
+"""Batch API 제출 모드 테스트 (가짜 배치 서버 사용)."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from automation import geeknews_pipeline
+from automation.batch_generation import AnthropicBatchClient, OpenAIBatchClient, run_batch
+from automation.qa_generator import (
+    ClaudeProvider,
+    OpenAIProvider,
+    QAContentGenerator,
+    QAResult,
+)
+from tests.fake_batch_server import FakeBatchServer
+
+
+@pytest.fixture
+def fake_server():
+    with FakeBatchServer(polls_until_done=2) as server:
+        yield server
+
+
+def _items(count: int) -> list[dict]:
+    return [
+        {
+            "guid": f"guid-{i}",
+            "title": f"Batch Article {i}",
+            "link": f"https://example.com/{i}",
+            "summary": "배치 백필 테스트",
+            "published_at": "Mon, 06 Jan 2025 09:00:00 +0000",
+        }
+        for i in range(count)
+    ]
+
+
+class TestBatchClients:
+    """Batch API 클라이언트 테스트."""
+
+    def test_openai_round_trip(self, fake_server, tmp_path: Path):
+        """OpenAI 배치 파일 업로드 → 폴링 → 결과 수집."""
+        client = OpenAIBatchClient("test-key", base_url=fake_server.base_url)
+        requests = [("item-0", {"model": "gpt-4o-mini", "messages": []}),
+                    ("item-1", {"model": "gpt-4o-mini", "messages": []})]
+
+        results = run_batch(client, requests, work_dir=tmp_path, poll_interval=0, timeout=5)
+
+        assert set(results) == {"item-0", "item-1"}
+        assert json.loads(results["item-0"])["summary"] == "배치 응답 item-0"
+        batch_file = next(tmp_path.glob("openai-*.jsonl"))
+        first_line = json.loads(batch_file.read_text(encoding="utf-8").splitlines()[0])
+        assert first_line["url"] == "/v1/chat/completions"
+        assert ("POST", "/v1/files") in fake_server.requests_log
+
+    def test_anthropic_round_trip_with_failure(self, tmp_path: Path):
+        """Anthropic 배치에서 실패한 요청은 None으로 반환된다."""
+        def responder(custom_id, payload):
+            return None if custom_id == "item-1" else "ok"
+
+        with FakeBatchServer(responder=responder) as server:
+            client = AnthropicBatchClient("test-key", base_url=server.base_url)
+            results = run_batch(
+                client,
+                [("item-0", {"model": "claude"}), ("item-1", {"model": "claude"})],
+                work_dir=tmp_path,
+                poll_interval=0,
+                timeout=5,
+            )
+
+        assert results == {"item-0": "ok", "item-1": None}
+
+
+class TestGenerateBatch:
+    """QAContentGenerator.generate_batch 테스트."""
+
+    def test_generate_batch_with_claude(self, fake_server, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Claude 프로바이더는 Message Batches로 제출된다."""
+        monkeypatch.setenv("ANTHROPIC_BATCH_BASE_URL", fake_server.base_url)
+        generator = QAContentGenerator(provider=ClaudeProvider("test-key"), enable_mcp=False)
+
+        results = generator.generate_batch(_items(3), work_dir=tmp_path, poll_interval=0, timeout=5)
+
+        assert [r.summary for r in results] == ["배치 응답 item-0", "배치 응답 item-1", "배치 응답 item-2"]
+        assert ("POST", "/v1/messages/batches") in fake_server.requests_log
+
+    def test_failed_items_fall_back_to_rule_based(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """배치에서 실패한 항목은 규칙 기반 결과로 대체된다."""
+        with FakeBatchServer(responder=lambda custom_id, payload: None) as server:
+            monkeypatch.setenv("OPENAI_BATCH_BASE_URL", server.base_url)
+            generator = QAContentGenerator(provider=OpenAIProvider("test-key"), enable_mcp=False)
+            results = generator.generate_batch(_items(1), work_dir=tmp_path, poll_interval=0, timeout=5)
+
+        assert len(results) == 1
+        assert isinstance(results[0], QAResult)
+        assert len(results[0].qa_pairs) == 3
+
+    def test_pipeline_batch_mode_writes_posts(self, fake_server, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """배치 결과가 write_post로 전달된다."""
+        monkeypatch.setenv("OPENAI_BATCH_BASE_URL", fake_server.base_url)
+        monkeypatch.setenv("BATCH_WORK_DIR", str(tmp_path / "batches"))
+        monkeypatch.setenv("BATCH_POLL_INTERVAL_SECONDS", "0")
+        monkeypatch.setattr(geeknews_pipeline, "POSTS_DIR", tmp_path / "_posts")
+        generator = QAContentGenerator(provider=OpenAIProvider("test-key"), enable_mcp=False)
+        filtered = [(item, None) for item in _items(2)]
+
+        written = [
+            geeknews_pipeline.write_post(item, qa_result, metrics=metrics)
+            for item, metrics, qa_result in geeknews_pipeline._generate_batch(generator, None, filtered)
+        ]
+
+        assert len(written) == 2
+        assert "배치 응답 item-1" in written[1].read_text(encoding="utf-8")
@@ -0,0 +1,144 @@
+"""소스 간 유사 중복 탐지 테스트."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from automation.dedupe import (
+    NearDuplicateIndex,
+    collapse_near_duplicates,
+    fingerprint,
+    normalize_text,
+)
+
+SUMMARY = "Andrej Karpathy는 AGI 개발에는 최소 10년이 더 걸릴 것으로 전망함. 현존하는 AI 에이전트들은 인상적이지만 지속 학습에 미치지 못함"
+
+
+def _item(guid: str, title: str, summary: str = "") -> dict[str, str]:
+    return {"guid": guid, "title": title, "summary": summary, "link": "", "published_at": ""}
+
+
+class TestNormalization:
+    """정규화 테스트."""
+
+    def test_spacing_width_and_symbols_are_ignored(self):
+        """띄어쓰기, 전각 문자, 기호, URL 차이는 무시한다."""
+        assert normalize_text("Ｃlaude Skills – 워크 플로우 ⭐⭐⭐ https://x.io/a") == normalize_text(
+            "claude skills: 워크플로우"
+        )
+
+
+class TestCollapse:
+    """collapse_near_duplicates 테스트."""
+
+    def test_batch_duplicates_keep_first(self):
+        """같은 배치에서 제목이 거의 같은 항목은 먼저 나온 것만 남긴다."""
+        items = [
+            _item("geeknews:1", "Andrej Karpathy – AGI는 아직 10년 남았음", SUMMARY),
+            _item("gmail:abc", "[뉴스레터] Andrej Karpathy: AGI는 아직 10년 남았음"),
+            _item("geeknews:2", "Tor 브라우저, 다양한 Firefox AI 기능 제거"),
+        ]
+
+        kept, dropped = collapse_near_duplicates(items, NearDuplicateIndex(None))
+
+        assert [item["guid"] for item in kept] == ["geeknews:1", "geeknews:2"]
+        assert dropped[0][0]["guid"] == "gmail:abc"
+        assert dropped[0][1] == "geeknews:1"
+
+    def test_same_summary_with_different_title(self):
+        """제목이 달라도 요약이 같으면 중복으로 본다."""
+        index = NearDuplicateIndex(None)
+        index.add_item("geeknews:1", _item("geeknews:1", "Karpathy 인터뷰", SUMMARY))
+
+        kept, dropped = collapse_near_duplicates([_item("reddit:9", "AGI is a decade away", SUMMARY)], index)
+
+        assert kept == []
+        assert dropped[0][1] == "geeknews:1"
+
+    def test_shared_channel_header_does_not_collapse(self):
+        """같은 채널의 영상은 설명 머리말이 같아도 제목이 다르면 다른 이야기로 본다."""
+        header = (
+            "매주 화요일 QA 실무 팟캐스트 QA Talk입니다. 테스트 자동화, 품질 문화, 커리어 이야기를 현업 엔지니어와 함께 나눕니다.\n"
+            "📧 문의: hello@qatalk.kr\n🔗 https://patreon.com/qatalk\n#QA #테스트자동화\n"
+        )
+        items = [
+            _item("youtube:a", "Playwright로 E2E 테스트 안정화하기",
+                  header + "이번 에피소드에서는 Playwright 대기 전략과 flaky 테스트를 줄이는 방법을 다룹니다."),
+            _item("youtube:b", "QA 엔지니어 연봉 협상 노하우",
+                  header + "이번 에피소드에서는 QA 엔지니어의 연봉 협상과 이직 준비 과정을 이야기합니다."),
+        ]
+
+        kept, dropped = collapse_near_duplicates(items, NearDuplicateIndex(None))
+
+        assert [item["guid"] for item in kept] == ["youtube:a", "youtube:b"]
+        assert dropped == []
+
+    def test_version_only_title_difference_is_kept(self):
+        """버전 숫자만 다른 제목은 다른 이야기로 본다."""
+        for first, second in (
+            ("Rust 1.80 released", "Rust 1.81 released"),
+            ("Python 3.13 릴리스", "Python 3.12 릴리스"),
+        ):
+            index = NearDuplicateIndex(None)
+            index.add_item("geeknews:1", _item("geeknews:1", first, SUMMARY))
+
+            kept, dropped = collapse_near_duplicates([_item("geeknews:2", second, SUMMARY)], index)
+
+            assert len(kept) == 1 and dropped == [], second
+
+    def test_unrelated_items_are_kept(self):
+        """관련 있지만 다른 이야기는 남긴다."""
+        index = NearDuplicateIndex(None)
+        index.add_item("geeknews:1", _item("geeknews:1", "Anthropic, Claude Skills 공개"))
+
+        kept, _ = collapse_near_duplicates(
+            [_item("geeknews:2", "Claude Skills는 굉장하다, MCP보다 더 큰 혁신일지도")], index
+        )
+
+        assert len(kept) == 1
+
+    def test_disabled_threshold(self):
+        """임계값이 0이면 아무것도 거르지 않는다."""
+        items = [_item("a", "같은 제목"), _item("b", "같은 제목")]
+
+        kept, dropped = collapse_near_duplicates(items, NearDuplicateIndex(None, threshold=0))
+
+        assert len(kept) == 2 and dropped == []
+
+
+class TestNearDuplicateIndex:
+    """인덱스 저장/초기화 테스트."""
+
+    def test_persist_and_reload(self, tmp_path: Path):
+        """저장한 지문을 다시 읽어 같은 결과를 낸다."""
+        path = tmp_path / "near_duplicate_index.json"
+        index = NearDuplicateIndex(path)
+        index.add_item("geeknews:1", _item("geeknews:1", "Beads - 코딩 에이전트를 위한 메모리 업그레이드"))
+        index.save()
+
+        reloaded = NearDuplicateIndex(path)
+
+        assert reloaded.loaded_from_disk
+        match = reloaded.query(fingerprint(_item("x", "Beads: 코딩 에이전트를 위한 메모리 업그레이드 ⭐⭐⭐")))
+        assert match is not None and match[0] == "geeknews:1"
+
+    def test_max_entries_evicts_oldest(self):
+        """한도를 넘으면 가장 오래된 항목을 제거한다."""
+        index = NearDuplicateIndex(None, max_entries=2)
+        for number, title in enumerate(["첫째 이야기 제목", "둘째 이야기 제목", "셋째 이야기 제목"]):
+            index.add_item(f"k{number}", _item(f"k{number}", title))
+            index._entries[f"k{number}"]["added"] = number
+
+        assert "k0" not in index and len(index) == 2
+
+    def test_seed_from_posts(self, tmp_path: Path):
+        """기존 포스트 front matter로 초기화한다."""
+        post = tmp_path / "learning" / "2025-10-19-karpathy.md"
+        post.parent.mkdir()
+        post.write_text(
+            f'---\nlayout: post\ntitle: "Andrej Karpathy – AGI는 아직 10년 남았음"\nsummary: "{SUMMARY}"\n---\n본문',
+            encoding="utf-8",
+        )
+        index = NearDuplicateIndex(None)
+
+        assert index.seed_from_posts(tmp_path) == 1
+        assert index.query(fingerprint(_item("x", "Andrej Karpathy – AGI는 아직 10년 남았음"))) is not None
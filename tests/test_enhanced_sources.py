@@ -7,36 +7,96 @@ from unittest.mock import Mock, patch, AsyncMock
 import os
 
 from automation.enhanced_sources import (
+    AsyncRateLimiter,
     RedditCollector,
     DevToCollector,
+    SharedHTTPSession,
     StackOverflowCollector,
     ContentAggregator,
     EnhancedContent
 )
 
 
+class _FakeResponse:
+    def __init__(self, payload, status=200, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._payload = payload
+
+    async def json(self):
+        return self._payload
+
+    async def text(self):
+        return str(self._payload)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+class FakeClientSession:
+    """aiohttp.ClientSession.request를 흉내 내며 동시 요청 수를 기록한다."""
+
+    def __init__(self, respond, delay=0.05):
+        self.respond = respond
+        self.delay = delay
+        self.closed = False
+        self.urls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def request(self, method, url, **kwargs):
+        session = self
+
+        class _Call:
+            async def __aenter__(self):
+                session.urls.append(url)
+                session.in_flight += 1
+                session.max_in_flight = max(session.max_in_flight, session.in_flight)
+                await asyncio.sleep(session.delay)
+                session.in_flight -= 1
+                return _FakeResponse(session.respond(method, url, kwargs))
+
+            async def __aexit__(self, *exc_info):
+                return None
+
+        return _Call()
+
+    async def close(self):
+        self.closed = True
+
+
+def _shared_http(respond, max_concurrency=8):
+    http = SharedHTTPSession(max_concurrency=max_concurrency)
+    http._session = FakeClientSession(respond)
+    return http
+
+
 class TestRedditCollector:
     """RedditCollector 테스트."""
     
     @pytest.mark.asyncio
     async def test_get_access_token(self):
-        """액세스 토큰 획득 테스트."""
-        collector = RedditCollector("test_client_id", "test_client_secret")
-        
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_response.json = AsyncMock(return_value={
-                "access_token": "test_token",
-                "expires_in": 3600
-            })
-            
-            mock_post = AsyncMock(return_value=mock_response)
-            mock_session.return_value.__aenter__.return_value.post = mock_post
-            
-            token = await collector._get_access_token()
-            assert token == "test_token"
-            assert collector._access_token == "test_token"
+        """액세스 토큰 획득 테스트 (공유 세션의 request로 POST)."""
+        requests = []
+
+        def respond(method, url, kwargs):
+            requests.append((method, url))
+            return {"access_token": "test_token", "expires_in": 3600}
+
+        http = _shared_http(respond)
+        collector = RedditCollector("test_client_id", "test_client_secret", http=http)
+
+        token = await collector._get_access_token()
+        assert token == "test_token"
+        assert collector._access_token == "test_token"
+        assert requests == [("POST", "https://www.reddit.com/api/v1/access_token")]
+
+        # 만료 전에는 캐시된 토큰을 다시 쓴다
+        assert await collector._get_access_token() == "test_token"
+        assert len(requests) == 1
     
     @pytest.mark.asyncio
     async def test_parse_reddit_post(self):
@@ -67,6 +127,73 @@ class TestRedditCollector:
         assert "softwaretesting" in content.tags
 
 
+class TestConcurrentCollection:
+    """공유 세션 기반 동시 수집 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_reddit_listings_fetched_concurrently(self):
+        """subreddit별 hot/top 요청을 세마포어 한도 안에서 동시에 보낸다."""
+        def respond(method, url, kwargs):
+            if method == "POST":
+                return {"access_token": "token", "expires_in": 3600}
+            name = url.split("/r/")[1].split("/")[0]
+            return {"data": {"children": [{"data": {"id": name, "title": f"{name} post", "subreddit": name}}]}}
+
+        http = _shared_http(respond, max_concurrency=4)
+        collector = RedditCollector("id", "secret", http=http)
+        collector.rate_limiter = AsyncRateLimiter(rate=1000, burst=20)
+
+        started = asyncio.get_running_loop().time()
+        contents = await collector.collect(limit=50)
+        elapsed = asyncio.get_running_loop().time() - started
+
+        session = http._session
+        assert len(session.urls) == 1 + 2 * len(collector.subreddits)
+        assert session.max_in_flight == 4
+        assert elapsed < 0.05 * len(session.urls) / 2
+        assert len(contents) == len(collector.subreddits)  # 같은 post ID는 한 번만
+
+    @pytest.mark.asyncio
+    async def test_stackoverflow_tags_share_session(self):
+        """태그별 요청이 같은 세션을 쓰고, 공유 세션은 수집기가 닫지 않는다."""
+        def respond(method, url, kwargs):
+            tag = kwargs["params"]["tagged"]
+            return {"items": [{"question_id": tag, "title": f"{tag} question", "tags": [tag]}]}
+
+        http = _shared_http(respond)
+        collector = StackOverflowCollector(http=http)
+
+        contents = await collector.collect_top_questions()
+
+        assert sorted(c.title for c in contents) == sorted(f"{tag} question" for tag in collector.qa_tags)
+        assert http._session.max_in_flight > 1
+        assert http._session.closed is False
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_spaces_requests(self):
+        """버스트를 넘는 요청은 속도에 맞춰 기다린다."""
+        limiter = AsyncRateLimiter(rate=50, burst=2)
+        loop = asyncio.get_running_loop()
+
+        started = loop.time()
+        for _ in range(4):
+            await limiter.acquire()
+
+        assert loop.time() - started >= 0.035
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_defer(self):
+        """defer()로 지정한 시간 동안 새 요청을 막는다."""
+        limiter = AsyncRateLimiter(rate=1000, burst=10)
+        loop = asyncio.get_running_loop()
+        limiter.defer(0.05)
+
+        started = loop.time()
+        await limiter.acquire()
+
+        assert loop.time() - started >= 0.04
+
+
 class TestDevToCollector:
     """DevToCollector 테스트."""
     
@@ -184,5 +311,86 @@ class TestContentAggregator:
         assert score < 70
 
 
+def _content(source, title, url, likes=150):
+    return EnhancedContent(
+        source=source,
+        title=title,
+        url=url,
+        content="playwright test automation " * 10,
+        author="tester",
+        engagement={"likes": likes, "comments": 0, "shares": 0},
+        tags=[],
+        published_at=datetime.now(),
+        metadata={}
+    )
+
+
+class _DelayedCollector:
+    def __init__(self, delay, contents):
+        self.delay = delay
+        self.contents = contents
+
+    async def collect(self):
+        await asyncio.sleep(self.delay)
+        return self.contents
+
+
+def _streaming_aggregator(collectors):
+    aggregator = ContentAggregator()
+    aggregator.collectors = {name: None for name in collectors}
+    aggregator._is_collector_configured = lambda name: True
+    aggregator._initialize_collector = lambda name, cls, http=None: collectors[name]
+    return aggregator
+
+
+class TestStreamingAggregator:
+    """as_completed 기반 스트리밍 수집 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_yields_in_completion_order_and_dedupes(self):
+        """먼저 끝난 수집기의 콘텐츠부터 내보내고, 다른 소스의 같은 URL은 한 번만 낸다."""
+        aggregator = _streaming_aggregator({
+            "devto": _DelayedCollector(0.05, [_content("devto", "느린 글", "https://example.com/a/")]),
+            "medium": _DelayedCollector(0.0, [
+                _content("medium", "빠른 글", "https://example.com/a", likes=10),
+                _content("medium", "인기 글", "https://example.com/b"),
+            ]),
+        })
+
+        titles = [content.title async for content in aggregator.stream_all_sources()]
+
+        assert titles == ["인기 글", "빠른 글"]
+
+    @pytest.mark.asyncio
+    async def test_collector_deadline(self):
+        """마감 시간을 넘긴 수집기는 건너뛰고 나머지 결과를 낸다."""
+        aggregator = _streaming_aggregator({
+            "devto": _DelayedCollector(5, [_content("devto", "너무 느린 글", "https://example.com/slow")]),
+            "medium": _DelayedCollector(0.0, [_content("medium", "빠른 글", "https://example.com/fast")]),
+        })
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        titles = [c.title async for c in aggregator.stream_all_sources(deadlines={"devto": 0.05})]
+
+        assert titles == ["빠른 글"]
+        assert loop.time() - started < 1
+
+    @pytest.mark.asyncio
+    async def test_aggregate_all_sources_wraps_stream(self):
+        """aggregate_all_sources는 스트림 결과를 점수순으로 모은다."""
+        aggregator = _streaming_aggregator({
+            "medium": _DelayedCollector(0.0, [
+                _content("medium", "보통 글", "https://example.com/1", likes=10),
+                _content("medium", "인기 글", "https://example.com/2"),
+            ]),
+        })
+
+        contents = await aggregator.aggregate_all_sources()
+
+        assert [c.title for c in contents] == ["인기 글", "보통 글"]
+        assert all("quality_score" in c.metadata for c in contents)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
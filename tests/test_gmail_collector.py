@@ -0,0 +1,216 @@
+"""Gmail 수집기 증분 동기화 테스트 (가짜 API 서비스 사용)."""
+from __future__ import annotations
+
+import base64
+import typing as t
+
+from automation.sources import gmail_collector
+
+
+class _NotFound(Exception):
+    resp = type("Resp", (), {"status": 404})()
+
+
+class _FakeRequest:
+    def __init__(self, service: "FakeGmailService", name: str, params: dict[str, t.Any]):
+        self._service = service
+        self.name = name
+        self.params = params
+
+    def execute(self) -> dict[str, t.Any]:
+        self._service.calls.append(self.name)
+        return self._service.respond(self.name, self.params)
+
+
+class _FakeBatch:
+    def __init__(self, service: "FakeGmailService", callback: t.Callable[..., None]):
+        self._service = service
+        self._callback = callback
+        self._requests: list[tuple[str, _FakeRequest]] = []
+
+    def add(self, request: _FakeRequest, request_id: str) -> None:
+        self._requests.append((request_id, request))
+
+    def execute(self) -> None:
+        self._service.batches.append([request.params for _, request in self._requests])
+        for request_id, request in self._requests:
+            if request_id in self._service.failing:
+                self._callback(request_id, None, RuntimeError("rate limited"))
+                continue
+            if request_id in self._service.deleted:
+                self._callback(request_id, None, _NotFound("Requested entity was not found."))
+                continue
+            self._callback(request_id, self._service.respond(request.name, request.params), None)
+
+
+class _FakeResource:
+    def __init__(self, service: "FakeGmailService", prefix: str):
+        self._service = service
+        self._prefix = prefix
+
+    def list(self, **params: t.Any) -> _FakeRequest:
+        return _FakeRequest(self._service, f"{self._prefix}.list", params)
+
+    def get(self, **params: t.Any) -> _FakeRequest:
+        return _FakeRequest(self._service, f"{self._prefix}.get", params)
+
+
+class FakeGmailService:
+    """users().messages()/history()/getProfile()와 배치 요청을 흉내 낸다."""
+
+    def __init__(self, mail: dict[str, tuple[str, str]], history_id: str = "200"):
+        self.mail = mail  # 메시지 ID -> (발신자, 제목)
+        self.history_id = history_id
+        self.added_since: dict[str, list[str]] = {}
+        self.failing: set[str] = set()  # 배치 조회가 실패하는 메시지 ID
+        self.deleted: set[str] = set()  # history에는 남았지만 삭제되어 404가 나는 메시지 ID
+        self.calls: list[str] = []
+        self.batches: list[list[dict[str, t.Any]]] = []
+
+    def users(self) -> "FakeGmailService":
+        return self
+
+    def messages(self) -> _FakeResource:
+        return _FakeResource(self, "messages")
+
+    def history(self) -> _FakeResource:
+        return _FakeResource(self, "history")
+
+    def getProfile(self, **params: t.Any) -> _FakeRequest:  # noqa: N802 - googleapiclient 메서드 이름
+        return _FakeRequest(self, "getProfile", params)
+
+    def new_batch_http_request(self, callback: t.Callable[..., None]) -> _FakeBatch:
+        return _FakeBatch(self, callback)
+
+    def respond(self, name: str, params: dict[str, t.Any]) -> dict[str, t.Any]:
+        if name == "getProfile":
+            return {"historyId": self.history_id}
+        if name == "messages.list":
+            return {"messages": [{"id": mid} for mid in self.mail]}
+        if name == "history.list":
+            added = self.added_since.get(params["startHistoryId"], [])
+            return {
+                "historyId": self.history_id,
+                "history": [{"messagesAdded": [{"message": {"id": mid}}]} for mid in added],
+            }
+        sender, subject = self.mail[params["id"]]
+        payload: dict[str, t.Any] = {
+            "headers": [{"name": "From", "value": sender}, {"name": "Subject", "value": subject}],
+        }
+        if params["format"] == "full":
+            body = base64.urlsafe_b64encode(f"<p>{subject} 본문</p>".encode("utf-8")).decode("ascii")
+            payload.update({"mimeType": "text/html", "body": {"data": body}})
+        return {"id": params["id"], "payload": payload}
+
+
+class TestIncrementalSync:
+    """historyId 기반 증분 동기화 테스트."""
+
+    def test_first_run_lists_and_stores_history_id(self):
+        """상태가 없으면 messages.list로 조회하고 historyId를 기록한다."""
+        service = FakeGmailService({"m1": ("a@x.com", "1호"), "m2": ("b@x.com", "2호")}, history_id="150")
+        state: dict[str, t.Any] = {}
+
+        items = gmail_collector.sync_messages(service, label="newsletter", sync_state=state)
+
+        assert [item["guid"] for item in items] == ["gmail:m1", "gmail:m2"]
+        assert items[0]["summary"] == "1호 본문"
+        assert state["history_id"] == "150"
+        assert "history.list" not in service.calls
+
+    def test_next_run_fetches_only_added_messages(self):
+        """다음 실행은 history.list로 새로 추가된 메시지만 받는다."""
+        service = FakeGmailService({"m1": ("a@x.com", "1호"), "m3": ("c@x.com", "3호")}, history_id="210")
+        service.added_since["150"] = ["m3"]
+        state: dict[str, t.Any] = {"history_id": "150"}
+
+        items = gmail_collector.sync_messages(service, label="newsletter", sync_state=state)
+
+        assert [item["guid"] for item in items] == ["gmail:m3"]
+        assert "messages.list" not in service.calls
+        assert state["history_id"] == "210"
+
+    def test_history_is_not_truncated_to_max_results(self):
+        """history.list로 찾은 메시지는 max_results보다 많아도 모두 받는다."""
+        mail = {f"m{i}": (f"{i}@x.com", f"{i}호") for i in range(5)}
+        service = FakeGmailService(mail, history_id="210")
+        service.added_since["150"] = list(mail)
+        state: dict[str, t.Any] = {"history_id": "150"}
+
+        items = gmail_collector.sync_messages(service, label="newsletter", max_results=2, sync_state=state)
+
+        assert [item["guid"] for item in items] == [f"gmail:m{i}" for i in range(5)]
+        assert state["history_id"] == "210"
+
+    def test_failed_fetch_keeps_history_id(self):
+        """조회에 실패한 메시지가 있으면 historyId를 옮기지 않아 다음 실행에서 다시 받는다."""
+        service = FakeGmailService({"m3": ("c@x.com", "3호"), "m4": ("d@x.com", "4호")}, history_id="210")
+        service.added_since["150"] = ["m3", "m4"]
+        service.failing.add("m4")
+        state: dict[str, t.Any] = {"history_id": "150"}
+
+        items = gmail_collector.sync_messages(service, label="newsletter", sync_state=state)
+
+        assert [item["guid"] for item in items] == ["gmail:m3"]
+        assert state["history_id"] == "150"
+
+    def test_deleted_message_does_not_hold_history_id(self):
+        """history에 기록된 뒤 삭제되어 404가 난 메시지는 건너뛰고 historyId를 옮긴다."""
+        service = FakeGmailService({"m3": ("c@x.com", "3호"), "m4": ("d@x.com", "4호")}, history_id="210")
+        service.added_since["150"] = ["m3", "m4"]
+        service.deleted.add("m4")
+        state: dict[str, t.Any] = {"history_id": "150"}
+
+        items = gmail_collector.sync_messages(service, label="newsletter", sync_state=state)
+
+        assert [item["guid"] for item in items] == ["gmail:m3"]
+        assert state["history_id"] == "210"
+
+    def test_full_body_only_for_messages_passing_dedupe(self):
+        """메타데이터로 중복을 거른 뒤 남은 메시지만 본문을 받는다."""
+        service = FakeGmailService({
+            "m1": ("a@x.com", "1호"),
+            "m2": ("a@x.com", "1호"),  # 같은 뉴스레터 중복 발송
+            "m3": ("c@x.com", "3호"),
+        })
+
+        items = gmail_collector.sync_messages(service, label="newsletter", seen_guids={"gmail:m3"})
+
+        metadata_batch, full_batch = service.batches
+        assert {params["format"] for params in metadata_batch} == {"metadata"}
+        assert [params["id"] for params in full_batch] == ["m1"]
+        assert [item["guid"] for item in items] == ["gmail:m1"]
+
+    def test_batches_are_split(self, monkeypatch):
+        """메시지는 배치 크기 단위로 나눠 요청한다."""
+        monkeypatch.setattr(gmail_collector, "MESSAGES_BATCH_SIZE", 2)
+        service = FakeGmailService({f"m{i}": (f"{i}@x.com", f"{i}호") for i in range(5)})
+
+        gmail_collector.sync_messages(service, label="newsletter")
+
+        assert [len(batch) for batch in service.batches] == [2, 2, 1, 2, 2, 1]
+
+    def test_expired_history_falls_back_to_list(self):
+        """historyId가 만료되어 404가 나면 전체 목록으로 다시 시작한다."""
+        service = FakeGmailService({"m1": ("a@x.com", "1호")}, history_id="300")
+        original = service.respond
+
+        def respond(name: str, params: dict[str, t.Any]) -> dict[str, t.Any]:
+            if name == "history.list":
+                raise _NotFound("Requested entity was not found.")
+            return original(name, params)
+
+        service.respond = respond  # type: ignore[method-assign]
+        state: dict[str, t.Any] = {"history_id": "1"}
+
+        items = gmail_collector.sync_messages(service, label="newsletter", sync_state=state)
+
+        assert [item["guid"] for item in items] == ["gmail:m1"]
+        assert state["history_id"] == "300"
+
+    def test_sync_state_round_trip(self, tmp_path):
+        """라벨별 상태는 파일에 저장되고 다시 읽힌다."""
+        path = tmp_path / "gmail_sync_state.json"
+        gmail_collector.save_sync_state({"newsletter": {"history_id": "150"}}, path)
+
+        assert gmail_collector.load_sync_state(path) == {"newsletter": {"history_id": "150"}}
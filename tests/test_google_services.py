@@ -0,0 +1,76 @@
+"""Google API 서비스 공용 팩토리 테스트."""
+from __future__ import annotations
+
+import typing as t
+from pathlib import Path
+
+import pytest
+
+from automation.sources import google_services
+
+
+@pytest.fixture
+def build_calls(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, t.Any]]:
+    calls: list[tuple[str, t.Any]] = []
+
+    def fake_build(api: str, version: str, **kwargs: t.Any) -> object:
+        calls.append(("build", (api, version, kwargs)))
+        return object()
+
+    def fake_build_from_document(document: str, **kwargs: t.Any) -> object:
+        calls.append(("document", (document, kwargs)))
+        return object()
+
+    monkeypatch.setattr(google_services, "GOOGLE_API_AVAILABLE", True)
+    monkeypatch.setattr(google_services, "AUTH_HTTPLIB2_AVAILABLE", False)
+    monkeypatch.setattr(google_services, "build", fake_build, raising=False)
+    monkeypatch.setattr(google_services, "build_from_document", fake_build_from_document, raising=False)
+    monkeypatch.setattr(google_services, "_shared_http", lambda api: f"shared-http:{api}")
+    monkeypatch.delenv("GOOGLE_DISCOVERY_DIR", raising=False)
+    google_services.reset_services()
+    yield calls
+    google_services.reset_services()
+
+
+class TestGetService:
+    """get_service 테스트."""
+
+    def test_service_is_built_once_per_key(self, build_calls):
+        """같은 API 키로 여러 번 요청해도 서비스는 한 번만 만든다."""
+        first = google_services.get_service("youtube", "v3", developer_key="key")
+        second = google_services.get_service("youtube", "v3", developer_key="key")
+        other = google_services.get_service("youtube", "v3", developer_key="other")
+
+        assert first is second
+        assert other is not first
+        assert len(build_calls) == 2
+
+    def test_uses_static_discovery_and_shared_http(self, build_calls):
+        """내장 discovery 문서와 공유 HTTP 전송 객체로 만든다."""
+        google_services.get_service("youtube", "v3", developer_key="key")
+
+        _, (api, version, kwargs) = build_calls[0]
+        assert (api, version) == ("youtube", "v3")
+        assert kwargs["static_discovery"] is True
+        assert kwargs["cache_discovery"] is False
+        assert kwargs["http"] == "shared-http:youtube"
+
+    def test_discovery_dir_override(self, build_calls, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """GOOGLE_DISCOVERY_DIR에 문서가 있으면 그 문서로 만든다."""
+        (tmp_path / "gmail.v1.json").write_text('{"name": "gmail"}', encoding="utf-8")
+        monkeypatch.setenv("GOOGLE_DISCOVERY_DIR", str(tmp_path))
+
+        google_services.get_service("gmail", "v1", credentials=object(), cache_key="gmail:token.json")
+
+        kind, (document, kwargs) = build_calls[0]
+        assert kind == "document"
+        assert document == '{"name": "gmail"}'
+        assert "credentials" in kwargs
+
+    def test_cache_key_reuses_service_across_credentials(self, build_calls):
+        """cache_key가 같으면 자격 증명 객체가 바뀌어도 재사용한다."""
+        first = google_services.get_service("gmail", "v1", credentials=object(), cache_key="gmail:token.json")
+        second = google_services.get_service("gmail", "v1", credentials=object(), cache_key="gmail:token.json")
+
+        assert first is second
+        assert len(build_calls) == 1
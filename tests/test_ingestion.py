@@ -0,0 +1,181 @@
+"""수집기 플러그인 레지스트리와 통합 수집 엔진 테스트."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import typing as t
+
+import pytest
+
+from automation import geeknews_pipeline  # noqa: F401  (core 플러그인 등록)
+from automation.ingestion import (
+    CollectResult,
+    CollectorPlugin,
+    IngestionContext,
+    IngestionEngine,
+    default_plugins,
+    registered_collectors,
+)
+
+
+def _item(guid: str, title: str = "제목") -> dict[str, t.Any]:
+    return {"guid": guid, "title": title, "link": f"https://example.com/{guid}", "summary": "", "extra": 1}
+
+
+class SlowSyncPlugin(CollectorPlugin):
+    def __init__(self, name: str, delay: float, items: list[dict[str, t.Any]], configured: bool = True):
+        self.name = name  # type: ignore[misc]
+        self.delay = delay
+        self.items = items
+        self.configured = configured
+        self.threads: list[str] = []
+
+    def is_configured(self, ctx: IngestionContext) -> bool:
+        return self.configured
+
+    def collect_sync(self, ctx: IngestionContext) -> list[dict[str, t.Any]]:
+        self.threads.append(threading.current_thread().name)
+        time.sleep(self.delay)
+        return self.items
+
+
+class StatefulPlugin(SlowSyncPlugin):
+    """상태 저장을 commit으로 돌려주는 수집기."""
+
+    def __init__(self, name: str, delay: float, saved: list[str]):
+        super().__init__(name, delay, [_item(name)])
+        self.saved = saved
+
+    def collect_sync(self, ctx: IngestionContext) -> CollectResult:  # type: ignore[override]
+        return CollectResult(super().collect_sync(ctx), commit=lambda retry: self.saved.append(self.name))
+
+
+class AsyncPlugin(CollectorPlugin):
+    name = "async"
+    blocking = False
+    cost = 5
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    async def collect_async(self, ctx: IngestionContext) -> list[dict[str, t.Any]]:
+        session = ctx.shared("session", _FakeSession)
+        await asyncio.sleep(self.delay)
+        return [_item(f"async:{id(session)}", "비동기")]
+
+
+class _FakeSession:
+    closed = False
+
+    async def close(self) -> None:
+        _FakeSession.closed = True
+
+
+class TestIngestionEngine:
+    """IngestionEngine 테스트."""
+
+    def test_sync_collectors_run_concurrently_in_executor(self):
+        """동기 수집기는 스레드 풀에서 동시에 실행된다."""
+        rss = SlowSyncPlugin("rss", 0.2, [_item("a")])
+        youtube = SlowSyncPlugin("youtube", 0.2, [_item("b")])
+
+        started = time.perf_counter()
+        items = IngestionEngine([rss, youtube]).run()
+
+        assert time.perf_counter() - started < 0.35
+        assert rss.threads[0].startswith("ingestion")
+        assert [item["guid"] for item in items] == ["a", "b"]
+
+    def test_results_follow_plugin_order_and_are_normalized(self):
+        """먼저 끝난 수집기와 관계없이 플러그인 순서로 합치고 GUID 중복을 제거한다."""
+        rss = SlowSyncPlugin("rss", 0.1, [_item("same", "RSS 제목"), _item("r2")])
+        fast = AsyncPlugin()
+        gmail = SlowSyncPlugin("gmail", 0.0, [_item("same", "뉴스레터 제목"), {"guid": "no-title"}])
+
+        _FakeSession.closed = False
+        items = IngestionEngine([rss, fast, gmail]).run()
+
+        assert [item["title"] for item in items] == ["RSS 제목", "제목", "비동기"]
+        assert set(items[0]) == {"guid", "title", "link", "summary", "published_at"}
+        assert _FakeSession.closed
+
+    def test_unconfigured_failing_and_over_budget_plugins(self):
+        """설정되지 않았거나 실패하거나 예산을 넘는 수집기는 결과에서 빠진다."""
+
+        class Broken(CollectorPlugin):
+            name = "broken"
+
+            def collect_sync(self, ctx: IngestionContext) -> list[dict[str, t.Any]]:
+                raise RuntimeError("boom")
+
+        engine = IngestionEngine(
+            [SlowSyncPlugin("off", 0, [_item("x")], configured=False), Broken(), AsyncPlugin(), SlowSyncPlugin("ok", 0, [_item("y")])],
+            cost_budget=3,
+        )
+
+        items = engine.run()
+
+        assert [item["guid"] for item in items] == ["y"]
+        assert engine.reports["off"].skipped == "not configured"
+        assert engine.reports["broken"].error == "boom"
+        assert engine.reports["async"].skipped == "over budget"
+
+    def test_deadline(self):
+        """마감 시간을 넘긴 수집기는 기다리지 않는다."""
+        slow = AsyncPlugin(delay=5)
+        slow.deadline = 0.05  # type: ignore[misc]
+
+        started = time.perf_counter()
+        items = IngestionEngine([slow, SlowSyncPlugin("ok", 0, [_item("y")])]).run()
+
+        assert time.perf_counter() - started < 1
+        assert [item["guid"] for item in items] == ["y"]
+
+    def test_state_is_committed_by_caller_and_skipped_on_timeout(self):
+        """수집기 상태는 commit_state() 호출 시에만 저장되고, 마감을 넘긴 수집기의 상태는 버린다."""
+        saved: list[str] = []
+        slow = StatefulPlugin("slow", 0.3, saved)
+        slow.deadline = 0.05  # type: ignore[misc]
+        engine = IngestionEngine([StatefulPlugin("gmail", 0, saved), slow])
+
+        items = engine.run()
+        assert [item["guid"] for item in items] == ["gmail"]
+        assert saved == []
+
+        time.sleep(0.4)  # 마감 후에도 스레드에서 끝까지 실행된 수집기
+        engine.commit_state()
+        engine.commit_state()
+
+        assert saved == ["gmail"]
+        assert engine.reports["slow"].error == "timeout"
+
+    def test_discard_state(self):
+        """discard_state() 후에는 상태를 저장하지 않는다."""
+        saved: list[str] = []
+        engine = IngestionEngine([StatefulPlugin("gmail", 0, saved)])
+        engine.run()
+
+        engine.discard_state()
+        engine.commit_state()
+
+        assert saved == []
+
+
+class TestRegistry:
+    """플러그인 레지스트리 테스트."""
+
+    def test_core_plugins_registered(self):
+        """파이프라인의 RSS/YouTube/Gmail 수집기가 등록되어 있다."""
+        assert {"rss", "youtube", "gmail"} <= set(registered_collectors())
+
+    def test_enhanced_plugins_only_when_enabled(self, monkeypatch: pytest.MonkeyPatch):
+        """enhanced 소스는 ENABLE_ENHANCED_SOURCES일 때만 포함되고 core 뒤에 온다."""
+        monkeypatch.setenv("ENABLE_ENHANCED_SOURCES", "false")
+        assert all(plugin.group == "core" for plugin in default_plugins())
+
+        monkeypatch.setenv("ENABLE_ENHANCED_SOURCES", "true")
+        names = [plugin.name for plugin in default_plugins()]
+
+        assert {"reddit", "devto", "stackoverflow"} <= set(names)
+        assert names.index("rss") < names.index("devto")
@@ -0,0 +1,85 @@
+"""Gmail 본문/링크 단일 패스 추출기 테스트."""
+from __future__ import annotations
+
+import base64
+
+from automation.sources.mail_extract import classify_link, extract_html, extract_message
+
+
+def _encode(text: str) -> str:
+    return base64.urlsafe_b64encode(text.encode("utf-8")).decode("ascii")
+
+
+NEWSLETTER = """
+<html><head><title>주간 QA</title><style>p { color: red; }</style></head>
+<body>
+  <a href="https://example.com/view-in-browser">웹에서 보기</a>
+  <p>이번 주 &amp; 지난 주의
+     테스트 자동화 소식</p>
+  <a href="https://click.mailchimp.com/track/click?u=1">추적 링크</a>
+  <a href="https://blog.example.com/playwright-tips">Playwright 팁</a>
+  <script>var tracking = 1;</script>
+  <a href="https://example.com/unsubscribe?id=1">수신거부</a>
+</body></html>
+"""
+
+
+class TestExtractHtml:
+    """HTML 추출 테스트."""
+
+    def test_text_and_first_content_link(self):
+        """보이는 텍스트만 모으고 관리/추적 링크를 건너뛴 첫 링크를 고른다."""
+        content = extract_html(NEWSLETTER)
+
+        assert content.link == "https://blog.example.com/playwright-tips"
+        assert "이번 주 & 지난 주의 테스트 자동화 소식" in content.text
+        assert "color" not in content.text
+        assert "tracking" not in content.text
+        assert "주간 QA" not in content.text
+
+    def test_tracking_link_is_fallback(self):
+        """추적 링크밖에 없으면 그 링크를 사용한다."""
+        html_text = '<p>본문</p><a href="https://x.list-manage.com/track/click?id=9">기사</a>'
+
+        assert extract_html(html_text).link == "https://x.list-manage.com/track/click?id=9"
+
+    def test_text_budget(self):
+        """텍스트는 예산까지만 수집한다."""
+        html_text = '<a href="https://a.example.com/post">글</a>' + "<p>가나다라마바사</p>" * 5000
+
+        content = extract_html(html_text, max_chars=100)
+
+        assert len(content.text) == 100
+        assert content.link == "https://a.example.com/post"
+
+
+class TestExtractMessage:
+    """Gmail 메시지 MIME 처리 테스트."""
+
+    def test_prefers_html_part(self):
+        """multipart/alternative에서는 HTML 파트를 사용한다."""
+        message = {"payload": {"mimeType": "multipart/alternative", "parts": [
+            {"mimeType": "text/plain", "body": {"data": _encode("평문 https://plain.example.com")}},
+            {"mimeType": "text/html", "body": {"data": _encode(NEWSLETTER)}},
+        ]}}
+
+        content = extract_message(message)
+
+        assert content.link == "https://blog.example.com/playwright-tips"
+
+    def test_plain_only_message(self):
+        """HTML이 없으면 텍스트 파트에서 본문과 URL을 뽑는다."""
+        body = "안녕하세요\n\n  새 글: https://blog.example.com/a\n수신 거부: https://example.com/unsubscribe"
+        message = {"payload": {"mimeType": "text/plain", "body": {"data": _encode(body)}}}
+
+        content = extract_message(message)
+
+        assert content.text.startswith("안녕하세요 새 글:")
+        assert content.link == "https://blog.example.com/a"
+
+    def test_classify_link(self):
+        """링크 분류."""
+        assert classify_link("mailto:a@example.com") == "ignore"
+        assert classify_link("https://example.com/a", "구독 취소") == "ignore"
+        assert classify_link("https://u1.sendgrid.net/ls/click?x=1") == "tracking"
+        assert classify_link("https://news.hada.io/topic?id=1") == "content"
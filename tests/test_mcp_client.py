@@ -0,0 +1,179 @@
+"""MCP 클라이언트 테스트."""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from automation.circuit_breaker import CLOSED, OPEN
+from automation.mcp_client import MCPCircuitBreaker, SyncSequentialThinkingClient, ThinkCache
+
+
+def _mock_client(handler, cache: ThinkCache | None = None, breaker=None) -> SyncSequentialThinkingClient:
+    client = SyncSequentialThinkingClient(server_url="http://mcp.test", timeout=5.0, cache=cache, breaker=breaker)
+    client.async_client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler), timeout=5.0)
+    return client
+
+
+class TestSyncSequentialThinkingClient:
+    """백그라운드 루프 기반 동기 클라이언트 테스트."""
+
+    def test_concurrent_calls_share_one_loop(self):
+        """여러 스레드의 호출이 하나의 루프 스레드에서 처리된다."""
+        loop_threads: set[str] = set()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            loop_threads.add(threading.current_thread().name)
+            problem = json.loads(request.content)["problem"]
+            return httpx.Response(200, json={"thoughts": [problem], "insights": [], "conclusion": "ok"})
+
+        client = _mock_client(handler)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(lambda i: client.think(f"문제 {i}", depth=1), range(16)))
+        finally:
+            client.close()
+
+        assert [r["thoughts"][0] for r in results] == [f"문제 {i}" for i in range(16)]
+        assert loop_threads == {"mcp-event-loop"}
+
+    def test_think_inside_running_event_loop(self):
+        """이미 이벤트 루프가 실행 중인 스레드에서도 호출할 수 있다."""
+        client = _mock_client(lambda request: httpx.Response(200, json={"conclusion": "ok"}))
+
+        async def caller():
+            return client.think("문제")
+
+        try:
+            assert asyncio.run(caller())["conclusion"] == "ok"
+        finally:
+            client.close()
+
+    def test_submit_think_returns_future(self):
+        """submit_think는 블로킹하지 않고 Future를 반환한다."""
+        client = _mock_client(lambda request: httpx.Response(200, json={"conclusion": "ok"}))
+        try:
+            future = client.submit_think("문제")
+            assert future.result(timeout=5)["conclusion"] == "ok"
+        finally:
+            client.close()
+
+    def test_server_error_returns_fallback(self):
+        """서버 오류 시 fallback 딕셔너리를 반환한다."""
+        client = _mock_client(lambda request: httpx.Response(503))
+        try:
+            result = client.think("문제")
+        finally:
+            client.close()
+
+        assert result["fallback"] is True
+
+    def test_close_is_idempotent(self):
+        """close를 여러 번 호출해도 안전하고, 종료 후 호출은 거부된다."""
+        client = _mock_client(lambda request: httpx.Response(200, json={}))
+        client.close()
+        client.close()
+
+        assert client.health_check() is False
+        with pytest.raises(RuntimeError):
+            client.think("문제")
+
+
+class TestThinkCache:
+    """MCP 분석 결과 캐시 테스트."""
+
+    def test_repeated_problem_hits_cache(self, tmp_path):
+        """같은 (문제, 깊이, 컨텍스트)는 서버를 한 번만 호출하고 파일에 저장된다."""
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(json.loads(request.content)["problem"])
+            return httpx.Response(200, json={"conclusion": "ok"})
+
+        cache = ThinkCache(60, tmp_path / "cache.json")
+        client = _mock_client(handler, cache)
+        try:
+            client.think("문제", depth=2)
+            client.think("문제", depth=2)
+            client.think("문제", depth=3)
+        finally:
+            client.close()
+
+        assert calls == ["문제", "문제"]
+        assert cache.stats() == {"hits": 1, "misses": 2}
+        reloaded = ThinkCache(60, tmp_path / "cache.json")
+        assert reloaded.get(ThinkCache.make_key("문제", 2)) == {"conclusion": "ok"}
+
+    def test_expired_entry_is_ignored(self):
+        """TTL이 지난 항목은 사용하지 않는다."""
+        now = [1000.0]
+        cache = ThinkCache(60, clock=lambda: now[0])
+        cache.put("key", {"conclusion": "ok"})
+
+        now[0] += 61
+        assert cache.get("key") is None
+
+    def test_fallback_result_is_not_cached(self):
+        """서버 오류로 인한 폴백 결과는 캐시하지 않는다."""
+        cache = ThinkCache(60)
+        client = _mock_client(lambda request: httpx.Response(503), cache)
+        try:
+            client.think("문제")
+        finally:
+            client.close()
+
+        assert cache.get(ThinkCache.make_key("문제", 3)) is None
+
+
+class TestMCPCircuitBreaker:
+    """MCP 서킷 브레이커 테스트."""
+
+    def test_open_circuit_skips_server(self, tmp_path):
+        """연속 실패 후에는 서버를 호출하지 않고 즉시 폴백한다."""
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(503)
+
+        breaker = MCPCircuitBreaker(failure_threshold=2, cooldown_seconds=60, state_path=tmp_path / "state.json")
+        client = _mock_client(handler, breaker=breaker)
+        try:
+            results = [client.think(f"문제 {i}") for i in range(4)]
+        finally:
+            client.close()
+
+        assert calls == ["/think", "/think"]
+        assert results[-1]["circuit_open"] is True
+        assert breaker.state == OPEN
+        assert MCPCircuitBreaker(state_path=tmp_path / "state.json").state == OPEN
+
+    def test_background_probe_closes_circuit(self):
+        """쿨다운 후 백그라운드 헬스체크가 성공하면 서킷이 닫힌다."""
+        healthy = threading.Event()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/health":
+                return httpx.Response(200 if healthy.is_set() else 503)
+            return httpx.Response(200, json={"conclusion": "ok"}) if healthy.is_set() else httpx.Response(503)
+
+        breaker = MCPCircuitBreaker(failure_threshold=1, cooldown_seconds=0.05)
+        client = _mock_client(handler, breaker=breaker)
+        try:
+            client.think("문제")
+            assert breaker.total_trips == 1
+            healthy.set()
+
+            deadline = time.monotonic() + 5
+            while breaker.state != CLOSED and time.monotonic() < deadline:
+                time.sleep(0.02)
+
+            assert breaker.state == CLOSED
+            assert client.think("문제")["conclusion"] == "ok"
+        finally:
+            client.close()
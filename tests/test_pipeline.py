@@ -0,0 +1,140 @@
+"""run_pipeline 통합 테스트 (수집 엔진/LLM 프로바이더는 가짜로 대체)."""
+from __future__ import annotations
+
+import typing as t
+from unittest.mock import Mock
+
+import pytest
+
+from automation import geeknews_pipeline
+from automation.provider_router import ProviderRouter
+from automation.qa_generator import QAContentGenerator, QAResult
+
+
+class FakeEngine:
+    """주어진 항목을 돌려주고 상태 반영 시 넘겨받은 retry를 기록하는 수집 엔진."""
+
+    def __init__(self, items: list[dict[str, t.Any]]):
+        self.items = items
+        self.retry: t.AbstractSet[str] | None = None
+
+    def run(self) -> list[dict[str, t.Any]]:
+        return list(self.items)
+
+    def commit_state(self, retry: t.AbstractSet[str] = frozenset()) -> None:
+        self.retry = retry
+
+
+def _item(guid: str, title: str) -> dict[str, t.Any]:
+    return {
+        "guid": guid,
+        "title": title,
+        "link": f"https://example.com/{guid.replace(':', '-')}",
+        "summary": f"{title} 요약",
+        "published_at": "2025-10-01T00:00:00+00:00",
+    }
+
+
+def _generator() -> QAContentGenerator:
+    provider = Mock(spec=["generate"])
+    provider.generate.return_value = QAResult(summary="ok")
+    return QAContentGenerator(provider=provider, enable_mcp=False)
+
+
+@pytest.fixture
+def pipeline_env(tmp_path, monkeypatch):
+    """임시 디렉터리에서 파이프라인을 실행하도록 상태/출력 경로와 환경 변수를 맞춘다."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "_posts").mkdir()
+    monkeypatch.setenv("AUTO_GIT_PUSH", "false")
+    monkeypatch.setenv("URL_RESOLVE_REDIRECTS", "false")
+    monkeypatch.setenv("RELEVANCE_CLASSIFIER", "false")
+
+    def run(items: list[dict[str, t.Any]], generator: QAContentGenerator, max_posts: int = 10) -> FakeEngine:
+        engine = FakeEngine(items)
+        monkeypatch.setattr(geeknews_pipeline, "IngestionEngine", lambda **kwargs: engine)
+        monkeypatch.setattr(geeknews_pipeline, "QAContentGenerator", lambda: generator)
+        geeknews_pipeline.run_pipeline(max_posts, "https://example.com/feed", None, enable_web_research=False)
+        return engine
+
+    return run
+
+
+class TestRunPipeline:
+    """run_pipeline 테스트."""
+
+    def test_router_is_closed_after_generation(self, pipeline_env):
+        """라우터는 모든 생성이 끝난 뒤 닫히고, 생성 중 만든 스레드 풀도 정리된다."""
+        router = ProviderRouter([("a", Mock()), ("b", Mock())], hedge_enabled=True)
+        executors = []
+        get_executor = router._get_executor
+
+        def tracking_get_executor():
+            executor = get_executor()
+            executors.append(executor)
+            return executor
+
+        router._get_executor = tracking_get_executor
+        for _, provider in router.providers():
+            provider.generate.return_value = QAResult(summary="ok")
+
+        pipeline_env(
+            [_item("g1", "AI 에이전트 테스트 자동화"), _item("g2", "LLM 기반 QA 도구")],
+            QAContentGenerator(provider=router, enable_mcp=False),
+        )
+
+        assert executors
+        assert all(executor._shutdown for executor in executors)
+        assert router._executor is None
+
+    def test_items_cut_by_max_posts_are_retried(self, pipeline_env):
+        """max_posts에 밀린 항목은 처리 상태에 넣지 않고 수집기에 다시 받을 GUID로 넘긴다."""
+        titles = ["LLM 에이전트 평가 방법", "GPT 기반 코드 리뷰 도입기", "생성형 AI로 테스트 데이터 만들기"]
+        items = [_item(f"gmail:m{i}", title) for i, title in enumerate(titles)]
+
+        engine = pipeline_env(items, _generator(), max_posts=1)
+
+        processed = geeknews_pipeline.load_state()
+        assert len(engine.retry) == 2
+        assert engine.retry.isdisjoint(processed)
+        assert {item["guid"] for item in items} <= engine.retry | processed
+
+    def test_near_duplicates_are_not_marked_processed(self, pipeline_env, tmp_path):
+        """이미 게시한 이야기와 비슷해 제외한 항목은 처리 상태에 넣지 않는다."""
+        post = tmp_path / "_posts" / "learning" / "2025-10-19-karpathy.md"
+        post.parent.mkdir()
+        post.write_text('---\ntitle: "Andrej Karpathy – AI 에이전트는 아직 10년 남았음"\n---\n본문', encoding="utf-8")
+        items = [
+            _item("gmail:abc", "[뉴스레터] Andrej Karpathy: AI 에이전트는 아직 10년 남았음"),
+            _item("geeknews:2", "LLM 기반 QA 도구"),
+        ]
+
+        pipeline_env(items, _generator())
+
+        processed = geeknews_pipeline.load_state()
+        assert "geeknews:2" in processed
+        assert "gmail:abc" not in processed
+
+
+class TestCollectYouTube:
+    """_collect_youtube 테스트."""
+
+    def test_yield_counts_only_new_videos(self, tmp_path, monkeypatch):
+        """수확량은 이미 처리했거나 앞선 작업이 찾은 영상을 빼고 센다."""
+        config = geeknews_pipeline.Config
+        monkeypatch.setattr(config, "YOUTUBE_QUOTA_FILE", tmp_path / "youtube_quota.json")
+        monkeypatch.setattr(config, "YOUTUBE_CHANNEL_STATE_FILE", tmp_path / "youtube_channel_state.json")
+        monkeypatch.setattr(config, "YOUTUBE_CHANNELS_ENABLED", False)
+        monkeypatch.setattr(config, "YOUTUBE_WATCHLIST_ENABLED", True)
+        monkeypatch.setattr(config, "YOUTUBE_KEYWORD_GROUPS_ENABLED", False)
+        monkeypatch.setattr(config, "load_watchlist", lambda: [{"video_id": "v1"}, {"video_id": "v2"}])
+        youtube = geeknews_pipeline.youtube_collector
+        monkeypatch.setattr(youtube, "search_video_ids", lambda **kwargs: ["v2", "v3", "v4"])
+        monkeypatch.setattr(youtube, "fetch_video_details", lambda **kwargs: {})
+        monkeypatch.setattr(geeknews_pipeline, "load_state", lambda: {"youtube:v1", "youtube:v3"})
+
+        geeknews_pipeline._collect_youtube()
+
+        ledger = geeknews_pipeline.QuotaLedger(config.YOUTUBE_QUOTA_FILE, config.YOUTUBE_DAILY_QUOTA)
+        assert ledger.yield_of("watchlist") == 1
+        assert ledger.yield_of("keywords:default") == 1
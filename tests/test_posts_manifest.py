@@ -0,0 +1,98 @@
+"""포스트 매니페스트 테스트."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from automation import geeknews_pipeline
+from automation.posts_manifest import PostsManifest, parse_front_matter
+from automation.qa_generator import QAResult
+
+
+def _write(posts_dir: Path, relative: str, title: str = "제목", mtime: float | None = None) -> Path:
+    path = posts_dir / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f'---\nlayout: post\ntitle: "{title}"\ndate: 2025-10-01 09:00:00 +0900\n'
+        f"categories: [QA Engineer]\ntags: ['AI', 'QA']\n---\n\n본문\n",
+        encoding="utf-8",
+    )
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+def _item(guid: str, title: str) -> dict[str, str]:
+    return {"guid": guid, "title": title, "link": f"https://example.com/{guid}", "summary": "", "published_at": ""}
+
+
+class TestPostsManifest:
+    """PostsManifest 테스트."""
+
+    def test_parse_front_matter(self):
+        """제목, 날짜, 카테고리, 태그 목록을 읽는다."""
+        fields = parse_front_matter('---\ntitle: "A: B"\ncategories: [Daily Life]\ntags: [\'x\', "y"]\n---\n')
+
+        assert fields == {"title": "A: B", "categories": ["Daily Life"], "tags": ["x", "y"]}
+
+    def test_bootstrap_from_existing_posts_and_latest(self, tmp_path: Path):
+        """비어 있으면 기존 포스트로 채우고 최신 포스트는 수정 시각 기준이다."""
+        posts_dir = tmp_path / "_posts"
+        _write(posts_dir, "qa-engineer/2025-10-01-old.md", mtime=1000)
+        _write(posts_dir, "learning/2025-09-30-new.md", "새 글", mtime=2000)
+
+        manifest = PostsManifest(tmp_path / "manifest.sqlite3", posts_dir)
+        latest = manifest.latest()
+
+        assert manifest.count() == 2
+        assert latest is not None and latest.path == "_posts/learning/2025-09-30-new.md"
+        assert (latest.slug, latest.date, latest.category, latest.tags) == ("new", "2025-09-30", "QA Engineer", ["AI", "QA"])
+        assert manifest.file_path(latest) == posts_dir / "learning/2025-09-30-new.md"
+
+    def test_sync_reads_only_changed_files(self, tmp_path: Path):
+        """수정 시각/크기가 같은 파일은 건너뛰고 삭제된 파일은 지운다."""
+        posts_dir = tmp_path / "_posts"
+        keep = _write(posts_dir, "learning/2025-10-01-keep.md", mtime=1000)
+        gone = _write(posts_dir, "learning/2025-10-02-gone.md", mtime=1000)
+        manifest = PostsManifest(tmp_path / "manifest.sqlite3", posts_dir)
+
+        gone.unlink()
+        _write(posts_dir, "learning/2025-10-03-added.md")
+        updated, removed = manifest.sync()
+
+        assert updated == ["_posts/learning/2025-10-03-added.md"]
+        assert removed == ["_posts/learning/2025-10-02-gone.md"]
+        assert manifest.get(keep) is not None
+
+    def test_unique_slug(self, tmp_path: Path):
+        """같은 날짜에 다른 GUID가 쓰는 슬러그는 번호를 붙이고, 같은 GUID는 그대로 쓴다."""
+        posts_dir = tmp_path / "_posts"
+        manifest = PostsManifest(tmp_path / "manifest.sqlite3", posts_dir)
+        manifest.record(_write(posts_dir, "learning/2025-10-01-geeknews.md"), guid="a")
+        manifest.record(_write(posts_dir, "learning/2025-10-01-geeknews-2.md"), guid="b")
+
+        assert manifest.unique_slug("2025-10-01", "geeknews", guid="c") == "geeknews-3"
+        assert manifest.unique_slug("2025-10-01", "geeknews", guid="a") == "geeknews"
+        assert manifest.unique_slug("2025-10-01", "geeknews", guid="b") == "geeknews-2"
+        assert manifest.unique_slug("2025-10-02", "geeknews", guid="c") == "geeknews"
+
+
+class TestWritePostIntegration:
+    """write_post 연동 테스트."""
+
+    def test_write_post_records_and_avoids_slug_collision(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """한글 제목 포스트가 같은 날 두 개 생겨도 덮어쓰지 않고 GUID로 찾을 수 있다."""
+        posts_dir = tmp_path / "_posts"
+        monkeypatch.setattr(geeknews_pipeline, "POSTS_DIR", posts_dir)
+        manifest = PostsManifest(tmp_path / "manifest.sqlite3", posts_dir)
+
+        first = geeknews_pipeline.write_post(_item("g1", "첫 번째 글"), QAResult(summary="요약"), manifest=manifest)
+        second = geeknews_pipeline.write_post(_item("g2", "두 번째 글"), QAResult(summary="요약"), manifest=manifest)
+
+        assert first != second and first.exists() and second.exists()
+        assert second.name.endswith("-geeknews-2.md")
+        record = manifest.by_guid("g2")[0]
+        assert (record.title, record.category) == ("두 번째 글", "Learning")
+        assert manifest.latest().guid == "g2"
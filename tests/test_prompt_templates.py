@@ -0,0 +1,82 @@
+"""프롬프트 템플릿 엔진 테스트."""
+from __future__ import annotations
+
+import pytest
+
+from automation import prompt_templates
+from automation.prompt_templates import (
+    format_mcp_context,
+    get_template,
+    prompt_values,
+    reset_prompt_cache,
+    select_template,
+)
+from automation.qa_generator import ClaudeProvider, GeminiProvider, OpenAIProvider, PerplexityProvider
+
+
+@pytest.fixture(autouse=True)
+def _clear_prompt_cache():
+    reset_prompt_cache()
+    yield
+    reset_prompt_cache()
+
+
+class TestPromptTemplates:
+    """템플릿 컴파일/렌더링 테스트."""
+
+    def test_templates_are_cached(self):
+        """같은 이름의 템플릿은 한 번만 컴파일된다."""
+        assert get_template("claude") is get_template("claude")
+
+    @pytest.mark.parametrize("name", ["openai", "claude", "perplexity", "gemini"])
+    def test_render_substitutes_all_placeholders(self, name, sample_feed_item):
+        """렌더링 결과에 자리표시자가 남지 않는다."""
+        prompt = get_template(name).render(prompt_values(sample_feed_item, "요약"))
+
+        assert sample_feed_item["title"] in prompt
+        assert "$" not in prompt
+
+    def test_multiline_context_is_not_indented(self, sample_feed_item):
+        """여러 줄 컨텍스트가 들어가도 템플릿 들여쓰기가 유지된다."""
+        mcp = format_mcp_context({"thoughts": ["첫 단계"], "insights": [], "conclusion": "결론"})
+        prompt = get_template("claude").render(prompt_values(sample_feed_item, "요약", mcp_context=mcp))
+
+        assert "\n제목: " in prompt
+        assert "\n다음 관점에서 분석하세요:" in prompt
+
+    def test_enhanced_settings_are_read_once(self, monkeypatch: pytest.MonkeyPatch, sample_feed_item):
+        """향상된 프롬프트 설정은 캐시되며 reset 후에 다시 읽는다."""
+        monkeypatch.setenv("USE_ENHANCED_PROMPTS", "false")
+        assert select_template("openai") is get_template("openai")
+
+        monkeypatch.setenv("USE_ENHANCED_PROMPTS", "true")
+        assert select_template("openai") is get_template("openai")
+
+        reset_prompt_cache()
+        enhanced = select_template("openai")
+        assert enhanced.name.startswith("enhanced:")
+        assert select_template("openai") is enhanced
+
+        prompt = enhanced.render(prompt_values(sample_feed_item, "요약", research_context='줄1\n"인용"'))
+        assert sample_feed_item["title"] in prompt
+        assert '줄1\\n\\"인용\\"' in prompt
+
+
+class TestProviderPrompts:
+    """프로바이더가 공통 템플릿 엔진을 사용하는지 테스트."""
+
+    @pytest.mark.parametrize("provider_cls", [OpenAIProvider, ClaudeProvider, PerplexityProvider, GeminiProvider])
+    def test_build_prompt(self, provider_cls, sample_feed_item):
+        """모든 프로바이더가 템플릿으로 프롬프트를 만든다."""
+        prompt = provider_cls(api_key="test-key")._build_prompt(sample_feed_item)
+
+        assert sample_feed_item["title"] in prompt
+        assert sample_feed_item["link"] in prompt
+        assert prompt == prompt.strip()
+
+    def test_enhanced_import_failure_falls_back(self, monkeypatch: pytest.MonkeyPatch):
+        """향상된 프롬프트를 불러올 수 없으면 기본 템플릿을 사용한다."""
+        monkeypatch.setenv("USE_ENHANCED_PROMPTS", "true")
+        monkeypatch.setattr(prompt_templates, "get_enhanced_template", lambda settings: None)
+
+        assert select_template("openai") is get_template("openai")
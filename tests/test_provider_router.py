@@ -0,0 +1,320 @@
+"""프로바이더 라우터 및 서킷 브레이커 테스트."""
+from __future__ import annotations
+
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from automation.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from automation.provider_router import AllProvidersFailedError, ProviderRouter
+from automation.qa_generator import (
+    ClaudeProvider,
+    OpenAIProvider,
+    QAContentGenerator,
+    QAResult,
+)
+
+
+class FakeClock:
+    """테스트용 수동 시계."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _provider(clock: FakeClock, latency: float = 0.0, error: Exception | None = None) -> Mock:
+    provider = Mock()
+
+    def generate(item):
+        clock.now += latency
+        if error is not None:
+            raise error
+        return QAResult(summary="ok")
+
+    provider.generate.side_effect = generate
+    return provider
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 테스트."""
+
+    def test_opens_after_threshold(self):
+        """연속 실패가 임계치에 도달하면 열린다."""
+        clock = FakeClock()
+        breaker = CircuitBreaker("llm", failure_threshold=2, cooldown_seconds=10, clock=clock)
+
+        breaker.record_failure()
+        assert breaker.state == CLOSED
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert not breaker.allow_request()
+        assert breaker.total_trips == 1
+
+    def test_half_open_allows_single_trial(self):
+        """쿨다운 이후 시험 호출은 1회만 허용된다."""
+        clock = FakeClock()
+        breaker = CircuitBreaker("llm", failure_threshold=1, cooldown_seconds=10, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 10
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        breaker.record_success()
+        assert breaker.state == CLOSED
+
+    def test_restore_keeps_remaining_cooldown(self):
+        """저장한 상태를 복원하면 남은 쿨다운이 이어진다."""
+        clock = FakeClock()
+        breaker = CircuitBreaker("mcp", failure_threshold=1, cooldown_seconds=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 4
+
+        restored = CircuitBreaker("mcp", failure_threshold=1, cooldown_seconds=10, clock=FakeClock())
+        restored.restore(breaker.export_state())
+
+        assert restored.state == OPEN
+        assert restored.total_trips == 1
+        assert 5.5 <= restored.seconds_until_retry() <= 6
+
+
+class TestProviderRouter:
+    """ProviderRouter 테스트."""
+
+    def test_failover_to_next_provider(self, sample_feed_item):
+        """첫 프로바이더가 실패하면 다음 프로바이더로 넘어간다."""
+        clock = FakeClock()
+        failing = _provider(clock, error=RuntimeError("Claude API 오류 (HTTP 529): overloaded"))
+        healthy = _provider(clock)
+        router = ProviderRouter([("claude", failing), ("openai", healthy)], clock=clock)
+
+        result = router.generate(sample_feed_item)
+
+        assert result.summary == "ok"
+        assert healthy.generate.call_count == 1
+
+    def test_circuit_skips_failing_provider(self, sample_feed_item):
+        """5xx가 반복되면 서킷이 열려 해당 프로바이더를 호출하지 않는다."""
+        clock = FakeClock()
+        failing = _provider(clock, error=RuntimeError("OpenAI API 오류 (HTTP 503): unavailable"))
+        router = ProviderRouter([("openai", failing)], failure_threshold=2, clock=clock)
+
+        for _ in range(2):
+            with pytest.raises(AllProvidersFailedError):
+                router.generate(sample_feed_item)
+        with pytest.raises(AllProvidersFailedError, match="서킷"):
+            router.generate(sample_feed_item)
+
+        assert failing.generate.call_count == 2
+        assert router.health_snapshot()["openai"]["circuit"] == OPEN
+
+    def test_client_errors_do_not_trip_circuit(self, sample_feed_item):
+        """4xx(429 제외) 오류는 서킷을 열지 않는다."""
+        clock = FakeClock()
+        failing = _provider(clock, error=RuntimeError("OpenAI API 오류 (HTTP 400): bad request"))
+        router = ProviderRouter(
+            [("openai", failing), ("claude", _provider(clock))],
+            failure_threshold=1,
+            clock=clock,
+        )
+
+        router.generate(sample_feed_item)
+
+        assert router.health_snapshot()["openai"]["circuit"] == CLOSED
+
+    def test_ranks_by_latency(self, sample_feed_item):
+        """오류율이 같으면 중앙값 지연 시간이 낮은 프로바이더를 우선한다."""
+        clock = FakeClock()
+        slow = _provider(clock, latency=5.0)
+        fast = _provider(clock, latency=1.0)
+        router = ProviderRouter([("slow", slow), ("fast", fast)], clock=clock)
+
+        router._record_success("slow", 5.0)
+        router._record_success("fast", 1.0)
+
+        assert router.ranked_providers() == ["fast", "slow"]
+
+    def test_all_failed_raises(self, sample_feed_item):
+        """모든 프로바이더가 실패하면 예외가 발생한다."""
+        clock = FakeClock()
+        router = ProviderRouter(
+            [("claude", _provider(clock, error=RuntimeError("HTTP 500"))),
+             ("openai", _provider(clock, error=RuntimeError("HTTP 500")))],
+            clock=clock,
+        )
+
+        with pytest.raises(AllProvidersFailedError):
+            router.generate(sample_feed_item)
+
+
+class TestBuildProvider:
+    """QAContentGenerator 프로바이더 구성 테스트."""
+
+    def test_multiple_keys_build_router(self, monkeypatch: pytest.MonkeyPatch):
+        """API 키가 여러 개면 라우터를 구성한다."""
+        monkeypatch.setenv("CLAUDE_API_KEY", "claude-key")
+        monkeypatch.setenv("OPENAI_API_KEY", "openai-key")
+        monkeypatch.delenv("LLM_PROVIDERS", raising=False)
+
+        generator = QAContentGenerator(enable_mcp=False)
+
+        assert isinstance(generator._provider, ProviderRouter)
+        assert generator._provider.provider_names == ["claude", "openai"]
+        assert set(generator.provider_health()) == {"claude", "openai"}
+
+    def test_router_can_be_disabled(self, monkeypatch: pytest.MonkeyPatch):
+        """ENABLE_PROVIDER_ROUTER=false면 첫 번째 프로바이더만 사용한다."""
+        monkeypatch.setenv("CLAUDE_API_KEY", "claude-key")
+        monkeypatch.setenv("OPENAI_API_KEY", "openai-key")
+        monkeypatch.setenv("ENABLE_PROVIDER_ROUTER", "false")
+
+        generator = QAContentGenerator(enable_mcp=False)
+
+        assert isinstance(generator._provider, ClaudeProvider)
+        assert generator.provider_health() is None
+
+    def test_provider_order_from_env(self, monkeypatch: pytest.MonkeyPatch):
+        """LLM_PROVIDERS 순서를 따른다."""
+        monkeypatch.setenv("CLAUDE_API_KEY", "claude-key")
+        monkeypatch.setenv("OPENAI_API_KEY", "openai-key")
+        monkeypatch.setenv("LLM_PROVIDERS", "openai,claude")
+
+        generator = QAContentGenerator(enable_mcp=False)
+
+        assert generator._provider.provider_names == ["openai", "claude"]
+        assert isinstance(generator._provider._providers["openai"], OpenAIProvider)
+
+
+class TestHedgedRequests:
+    """hedge 요청 테스트."""
+
+    @staticmethod
+    def _sleeping_provider(delay: float, summary: str) -> Mock:
+        provider = Mock()
+
+        def generate(item):
+            time.sleep(delay)
+            return QAResult(summary=summary)
+
+        provider.generate.side_effect = generate
+        return provider
+
+    def test_hedge_fires_when_primary_is_slow(self, sample_feed_item):
+        """1순위가 대기 시간을 넘기면 2순위 결과를 사용한다."""
+        slow = self._sleeping_provider(0.5, "slow")
+        fast = self._sleeping_provider(0.0, "fast")
+        router = ProviderRouter(
+            [("slow", slow), ("fast", fast)],
+            hedge_enabled=True,
+            hedge_budget=1,
+            hedge_default_delay=0.05,
+        )
+
+        result = router.generate(sample_feed_item)
+        router.close()
+
+        assert result.summary == "fast"
+        assert router.hedge_stats() == {"enabled": True, "fired": 1, "won": 1, "budget": 1}
+
+    def test_hedge_budget_is_respected(self, sample_feed_item):
+        """hedge 예산을 모두 쓰면 1순위 응답을 기다린다."""
+        slow = self._sleeping_provider(0.1, "slow")
+        fast = self._sleeping_provider(0.0, "fast")
+        router = ProviderRouter(
+            [("slow", slow), ("fast", fast)],
+            hedge_enabled=True,
+            hedge_budget=0,
+            hedge_default_delay=0.01,
+        )
+
+        result = router.generate(sample_feed_item)
+        router.close()
+
+        assert result.summary == "slow"
+        assert fast.generate.call_count == 0
+        assert router.hedge_stats()["fired"] == 0
+
+    def test_exhausted_budget_keeps_half_open_trial(self, sample_feed_item):
+        """hedge 예산이 없으면 2순위의 half-open 시험 슬롯을 차지하지 않는다."""
+        slow = self._sleeping_provider(0.1, "slow")
+        fast = self._sleeping_provider(0.0, "fast")
+        router = ProviderRouter(
+            [("slow", slow), ("fast", fast)],
+            failure_threshold=1,
+            cooldown_seconds=0,
+            hedge_enabled=True,
+            hedge_budget=0,
+            hedge_default_delay=0.01,
+        )
+        router._breakers["fast"].record_failure()
+
+        assert router.generate(sample_feed_item).summary == "slow"
+        router.close()
+
+        assert router._breakers["fast"].state == HALF_OPEN
+        assert router._breakers["fast"].allow_request()
+
+    def test_cancelled_hedge_releases_half_open_trial(self, sample_feed_item):
+        """시작 전에 취소된 hedge 요청은 half-open 시험 슬롯을 돌려준다."""
+        router = ProviderRouter(
+            [("slow", self._sleeping_provider(0.2, "slow")), ("fast", Mock())],
+            failure_threshold=1,
+            cooldown_seconds=0,
+            hedge_enabled=True,
+        )
+        router._breakers["fast"].record_failure()
+        executor = router._get_executor()
+        blockers = [executor.submit(time.sleep, 0.2) for _ in range(executor._max_workers)]
+
+        assert router._breakers["fast"].allow_request()
+        future = router._submit(executor, "fast", sample_feed_item)
+        assert future.cancel()
+        router.close()
+
+        assert router._breakers["fast"].allow_request()
+        for blocker in blockers:
+            blocker.cancel()
+
+    def test_client_error_releases_half_open_trial(self, sample_feed_item):
+        """서킷 판단 대상이 아닌 실패도 시험 슬롯을 돌려준다."""
+        clock = FakeClock()
+        router = ProviderRouter(
+            [("a", _provider(clock, error=RuntimeError("HTTP 400"))), ("b", _provider(clock))],
+            failure_threshold=1,
+            cooldown_seconds=0,
+            clock=clock,
+        )
+        router._breakers["a"].record_failure()
+
+        router.generate(sample_feed_item)
+
+        assert router._breakers["a"].state == HALF_OPEN
+        assert router._breakers["a"].allow_request()
+
+    def test_generator_close_shuts_down_router(self):
+        """QAContentGenerator.close()는 라우터의 hedge 스레드 풀을 정리한다."""
+        router = ProviderRouter([("a", Mock()), ("b", Mock())], hedge_enabled=True)
+        router._get_executor()
+
+        QAContentGenerator(provider=router, enable_mcp=False).close()
+
+        assert router._executor is None
+
+    def test_hedge_delay_uses_p90(self):
+        """표본이 충분하면 p90 지연 시간을 hedge 시점으로 사용한다."""
+        router = ProviderRouter(
+            [("a", Mock()), ("b", Mock())],
+            hedge_enabled=True,
+            hedge_default_delay=30.0,
+        )
+        assert router._hedge_delay("a") == 30.0
+
+        for latency in (1.0, 2.0, 3.0, 4.0, 10.0):
+            router._record_success("a", latency)
+
+        assert router._hedge_delay("a") == 10.0
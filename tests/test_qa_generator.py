@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import Future
 from unittest.mock import Mock, patch, MagicMock
 
 import pytest
@@ -140,6 +141,39 @@ class TestQAContentGenerator:
         assert result.summary
 
 
+class TestMCPPrefetch:
+    """MCP 사전 분석 테스트."""
+
+    def _generator(self, mcp_client) -> QAContentGenerator:
+        generator = QAContentGenerator(provider=RuleBasedProvider(), enable_mcp=False)
+        generator.mcp_client = mcp_client
+        return generator
+
+    def test_prefetched_result_is_used(self, sample_feed_item):
+        """사전 분석을 제출하면 생성 시 think를 다시 호출하지 않는다."""
+        future: Future = Future()
+        future.set_result({"thoughts": ["단계"], "insights": [], "conclusion": "결론"})
+        mcp_client = Mock()
+        mcp_client.submit_think.return_value = future
+
+        generator = self._generator(mcp_client)
+        assert generator.start_mcp_prefetch([sample_feed_item]) == 1
+
+        assert generator._run_mcp_analysis(sample_feed_item)["conclusion"] == "결론"
+        mcp_client.think.assert_not_called()
+
+    def test_deadline_skips_mcp(self, sample_feed_item):
+        """마감이 지나도 끝나지 않은 분석은 기다리지 않는다."""
+        mcp_client = Mock()
+        mcp_client.submit_think.return_value = Future()
+
+        generator = self._generator(mcp_client)
+        generator.start_mcp_prefetch([sample_feed_item], deadline_seconds=0)
+
+        assert generator._run_mcp_analysis(sample_feed_item) is None
+        mcp_client.think.assert_not_called()
+
+
 class TestQAResult:
     """QAResult 데이터클래스 테스트."""
     
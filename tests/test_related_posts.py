@@ -0,0 +1,80 @@
+"""관련 포스트 인덱스 테스트."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from automation.related_posts import RelatedPostsIndex, build_related_posts
+
+POSTS = {
+    "qa-engineer/2025-01-01-playwright.md": ("Playwright 테스트 자동화", "Playwright E2E 테스트 셀렉터 전략과 자동화 팁"),
+    "qa-engineer/2025-01-02-flaky.md": ("플레이키 테스트 줄이기", "E2E 테스트 자동화에서 불안정한 셀렉터와 대기 전략"),
+    "learning/2025-01-03-k8s.md": ("쿠버네티스 오토스케일링", "HPA와 클러스터 오토스케일러 설정"),
+    "learning/2025-01-04-k8s-cost.md": ("쿠버네티스 비용 줄이기", "클러스터 오토스케일러와 노드 설정"),
+    "daily-life/2025-01-05-steak.md": ("스테이크 굽는 법", "팬 온도와 레스팅 시간"),
+}
+
+
+def _write(posts_dir: Path, relative: str, title: str, body: str) -> Path:
+    path = posts_dir / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f'---\nlayout: post\ntitle: "{title}"\ntags: [test]\n---\n\n{body}\n', encoding="utf-8")
+    return path
+
+
+def _posts(tmp_path: Path) -> Path:
+    posts_dir = tmp_path / "_posts"
+    for relative, (title, body) in POSTS.items():
+        _write(posts_dir, relative, title, body)
+    return posts_dir
+
+
+class TestRelatedPostsIndex:
+    """RelatedPostsIndex 테스트."""
+
+    def test_most_similar_post_comes_first(self, tmp_path: Path):
+        """주제가 겹치는 포스트가 가장 먼저 오고 자기 자신은 제외한다."""
+        index = RelatedPostsIndex(None)
+        index.update(_posts(tmp_path))
+
+        related = index.related(top_k=2)
+
+        assert related["_posts/qa-engineer/2025-01-01-playwright.md"][0][0] == "_posts/qa-engineer/2025-01-02-flaky.md"
+        assert related["_posts/learning/2025-01-03-k8s.md"][0][0] == "_posts/learning/2025-01-04-k8s-cost.md"
+        assert all(key != other for key, pairs in related.items() for other, _ in pairs)
+
+    def test_only_changed_files_are_retokenized(self, tmp_path: Path):
+        """내용이 바뀐 파일만 다시 분석하고 삭제된 파일은 인덱스에서 뺀다."""
+        posts_dir = _posts(tmp_path)
+        index_path = tmp_path / "related_index.json"
+        first = RelatedPostsIndex(index_path)
+        assert len(first.update(posts_dir)[0]) == len(POSTS)
+        first.save()
+
+        _write(posts_dir, "learning/2025-01-03-k8s.md", "쿠버네티스 HPA", "HPA 설정 변경")
+        (posts_dir / "daily-life/2025-01-05-steak.md").unlink()
+        touched = posts_dir / "qa-engineer/2025-01-02-flaky.md"
+        touched.write_text(touched.read_text(encoding="utf-8"), encoding="utf-8")
+
+        changed, removed = RelatedPostsIndex(index_path).update(posts_dir)
+
+        assert changed == ["_posts/learning/2025-01-03-k8s.md"]
+        assert removed == ["_posts/daily-life/2025-01-05-steak.md"]
+
+    def test_build_writes_yaml_for_layout(self, tmp_path: Path):
+        """레이아웃이 page.path로 찾을 수 있는 YAML을 쓰고, 바뀐 게 없으면 다시 쓰지 않는다."""
+        yaml = pytest.importorskip("yaml")
+        posts_dir = _posts(tmp_path)
+        output = tmp_path / "_data" / "related.yml"
+
+        stats = build_related_posts(posts_dir, index_path=tmp_path / "index.json", output_path=output, top_k=3)
+        again = build_related_posts(posts_dir, index_path=tmp_path / "index.json", output_path=output, top_k=3)
+
+        data = yaml.safe_load(output.read_text(encoding="utf-8"))
+        assert stats["written"] == 1 and again == {"posts": 5, "changed": 0, "removed": 0, "written": 0}
+        assert data["_posts/qa-engineer/2025-01-01-playwright.md"][0] == {
+            "path": "_posts/qa-engineer/2025-01-02-flaky.md",
+            "title": "플레이키 테스트 줄이기",
+            "score": data["_posts/qa-engineer/2025-01-01-playwright.md"][0]["score"],
+        }
@@ -0,0 +1,134 @@
+"""로컬 관련성 분류기와 ContentFilter 연동 테스트."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from automation.content_filter import LOW_RELEVANCE_PENALTY, ContentFilter
+from automation.relevance_classifier import RelevanceClassifier, load_classifier, tokenize
+
+POSTS = {
+    "learning": [
+        ("Rust 비동기 런타임 비교", "Tokio와 async-std의 스케줄러 구조와 성능 비교"),
+        ("쿠버네티스 오토스케일링 가이드", "HPA와 클러스터 오토스케일러 설정 방법"),
+        ("파이썬 타입 힌트 활용", "mypy로 대규모 코드베이스의 타입 오류 줄이기"),
+        ("LLM 프롬프트 캐싱 정리", "토큰 비용을 줄이는 프롬프트 캐싱 전략"),
+        ("GitHub Actions CI 캐시 설정", "CI 빌드 시간을 줄이는 의존성 캐시"),
+    ],
+    "qa-engineer": [
+        ("Playwright 테스트 자동화 입문", "E2E 테스트 작성과 셀렉터 전략"),
+        ("플레이키 테스트 줄이기", "테스트 자동화에서 불안정한 테스트 원인 분석"),
+        ("API 테스트 자동화 전략", "Postman과 pytest로 회귀 테스트 구성"),
+        ("QA 엔지니어의 테스트 설계", "경계값 분석과 테스트 케이스 설계 기법"),
+        ("CI에서 test 병렬 실행", "test 샤딩으로 회귀 테스트 시간 단축"),
+    ],
+    "daily-life": [
+        ("김치찌개 맛있게 끓이는 법", "집에서 만드는 간단한 요리 레시피"),
+        ("주말 캠핑 준비물", "가을 캠핑 장비와 요리 준비 팁"),
+        ("여행지 맛집 고르는 법", "현지 음식과 요리 즐기기"),
+    ],
+}
+
+
+def _write_posts(root: Path) -> Path:
+    for directory, posts in POSTS.items():
+        (root / directory).mkdir(parents=True)
+        for index, (title, summary) in enumerate(posts):
+            (root / directory / f"2025-01-0{index + 1}-post.md").write_text(
+                f'---\nlayout: post\ntitle: "{title}"\ndescription: "{summary}"\n---\n\n{summary} 본문입니다.\n',
+                encoding="utf-8",
+            )
+    return root
+
+
+class TestRelevanceClassifier:
+    """RelevanceClassifier 테스트."""
+
+    def test_tokenize_hangul_bigrams_and_words(self):
+        """한글은 음절 bigram, 영문은 소문자 단어로 나눈다."""
+        assert tokenize("Playwright 테스트 the") == ["playwright", "테스", "스트"]
+
+    def test_predicts_category_and_relevance(self, tmp_path: Path):
+        """포스트 디렉터리로 학습해 카테고리를 예측하고 주제와 먼 항목은 관련성이 낮다."""
+        classifier = RelevanceClassifier.from_posts(_write_posts(tmp_path))
+
+        qa = classifier.predict("Playwright 테스트 자동화 팁", "플레이키 테스트 원인")
+        life = classifier.predict("캠핑 요리 레시피", "간단한 요리")
+        unknown = classifier.predict("Premier League derby result", "Arsenal won")
+
+        assert qa.category == "QA Engineer"
+        assert life.category == "Daily Life"
+        assert qa.relevance > life.relevance
+        assert unknown.relevance == 0.0
+
+    def test_load_classifier_disabled_or_missing_posts(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """비활성화되었거나 학습할 포스트가 없으면 None."""
+        monkeypatch.setenv("RELEVANCE_CLASSIFIER", "true")
+        assert load_classifier(tmp_path / "missing") is None
+
+        monkeypatch.setenv("RELEVANCE_CLASSIFIER", "false")
+        assert load_classifier(_write_posts(tmp_path)) is None
+
+
+class TestContentFilterIntegration:
+    """ContentFilter의 관련성 단계 테스트."""
+
+    def test_low_relevance_lowers_priority_of_ai_items(self, tmp_path: Path):
+        """AI 키워드가 있는 항목은 관련성이 낮아도 남기되 우선순위를 낮추고 예측 카테고리를 메트릭에 남긴다."""
+        classifier = RelevanceClassifier.from_posts(_write_posts(tmp_path))
+        content_filter = ContentFilter(classifier=classifier, min_relevance=0.1)
+        items = [
+            {"title": "Premier League AI referee", "summary": "Arsenal derby", "link": ""},
+            {"title": "Playwright 테스트 자동화 팁", "summary": "AI 기반 플레이키 테스트 분석", "link": ""},
+        ]
+
+        selected = content_filter.filter_and_sort(items)
+
+        assert [item["title"] for item, _ in selected] == ["Playwright 테스트 자동화 팁", "Premier League AI referee"]
+        assert selected[0][1].predicted_category == "QA Engineer"
+        unranked = ContentFilter().analyze(items[0])
+        assert selected[1][1].priority_score == unranked.priority_score - LOW_RELEVANCE_PENALTY
+
+    def test_english_items(self, tmp_path: Path):
+        """영어 기술 항목은 남기고, 키워드/인기도 근거 없이 주제와 먼 영어 항목만 제외한다."""
+        classifier = RelevanceClassifier.from_posts(_write_posts(tmp_path))
+        content_filter = ContentFilter(classifier=classifier, min_relevance=0.1)
+        items = {
+            "Kubernetes 1.32 released": ("Sidecar containers graduate to stable in the new release", 0),
+            "How we reduced CI time by 70% with test sharding": ("We split the suite across runners", 50),
+            "Why SQLite is so fast": ("A look at the B-tree pager and the query planner", 250),
+            "Lakers beat Celtics in overtime": ("LeBron James scored 40 points", 0),
+        }
+
+        decisions = {}
+        for title, (summary, votes) in items.items():
+            metrics = content_filter.analyze({"title": title, "summary": summary, "link": ""})
+            metrics.votes = votes
+            decisions[title] = content_filter.should_process(metrics)
+
+        assert decisions == {
+            "Kubernetes 1.32 released": True,
+            "How we reduced CI time by 70% with test sharding": True,
+            "Why SQLite is so fast": True,
+            "Lakers beat Celtics in overtime": False,
+        }
+
+    def test_popular_item_passes_low_relevance(self, tmp_path: Path):
+        """투표수 기준을 넘은 항목은 관련성이 낮아도 남긴다 (분류기 도입 전과 동일)."""
+        classifier = RelevanceClassifier.from_posts(_write_posts(tmp_path))
+        content_filter = ContentFilter(classifier=classifier, min_relevance=0.1)
+        metrics = content_filter.analyze({"title": "Why SQLite is so fast", "summary": "", "link": ""})
+
+        assert metrics.relevance is not None and metrics.relevance < 0.1
+        metrics.votes = 250
+        assert content_filter.should_process(metrics)
+        metrics.votes = 0
+        assert not content_filter.should_process(metrics)
+
+    def test_without_classifier_behaviour_is_unchanged(self):
+        """분류기가 없으면 관련성 단계를 건너뛴다."""
+        metrics = ContentFilter().analyze({"title": "OpenAI GPT 모델 발표", "summary": ""})
+
+        assert metrics.relevance is None
+        assert ContentFilter(min_relevance=0.5).should_process(metrics)
@@ -0,0 +1,123 @@
+"""블로그 검색 인덱스 테스트."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from automation import geeknews_pipeline
+from automation.qa_generator import QAResult
+from automation.search_index import SearchIndex, build_search_index, shard_of
+
+
+def _write(posts_dir: Path, relative: str, title: str, body: str) -> Path:
+    path = posts_dir / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f'---\nlayout: post\ntitle: "{title}"\ndate: 2025-10-01 09:00:00 +0900\n---\n\n{body}\n',
+        encoding="utf-8",
+    )
+    return path
+
+
+def _load(output_dir: Path, name: str) -> dict:
+    return json.loads((output_dir / f"{name}.json").read_text(encoding="utf-8"))
+
+
+class TestSearchIndex:
+    """SearchIndex 테스트."""
+
+    def test_shard_of(self):
+        """한글은 초성, 영문은 첫 글자로 샤드를 나눈다."""
+        assert shard_of("가나") == "h00"
+        assert shard_of("테스") == "h16"
+        assert shard_of("playwright") == "p"
+        assert shard_of("1.5") == "_"
+
+    def test_postings_and_manifest(self, tmp_path: Path):
+        """토큰별 [문서 id, tf] 포스팅과 page.path를 담은 manifest를 쓴다."""
+        posts_dir = tmp_path / "_posts"
+        _write(posts_dir, "qa-engineer/2025-10-01-a.md", "Playwright 테스트", "테스트 자동화")
+        _write(posts_dir, "learning/2025-10-02-b.md", "Rust 입문", "러스트 소유권")
+        output_dir = tmp_path / "search"
+
+        stats = build_search_index(posts_dir, output_dir=output_dir, state_path=tmp_path / "state.json")
+
+        manifest = _load(output_dir, "manifest")
+        docs = {doc[0]: (doc_id, doc) for doc_id, doc in manifest["docs"].items()}
+        doc_id, doc = docs["_posts/qa-engineer/2025-10-01-a.md"]
+        assert stats["posts"] == 2
+        assert doc[1:3] == ["Playwright 테스트", "2025-10-01"]
+        assert _load(output_dir, "h16")["테스"] == [int(doc_id), 2]
+        assert set(manifest["shards"]) >= {"h16", "p", "r"}
+
+    def test_only_affected_shards_are_rewritten(self, tmp_path: Path):
+        """바뀐 포스트의 이전/현재 토큰이 속한 샤드만 다시 쓰고, 비게 된 샤드는 지운다."""
+        posts_dir = tmp_path / "_posts"
+        output_dir = tmp_path / "search"
+        state = tmp_path / "state.json"
+        _write(posts_dir, "learning/2025-10-01-a.md", "Kubernetes", "zebra")
+        _write(posts_dir, "learning/2025-10-02-b.md", "Docker", "docker")
+        build_search_index(posts_dir, output_dir=output_dir, state_path=state)
+
+        _write(posts_dir, "learning/2025-10-01-a.md", "Kubernetes", "kafka")
+        index = SearchIndex(output_dir, state)
+        changed, _ = index.update(posts_dir)
+        written = index.write()
+
+        assert changed == ["_posts/learning/2025-10-01-a.md"]
+        assert written == ["k"]
+        assert not (output_dir / "z.json").exists()
+        assert "z" not in _load(output_dir, "manifest")["shards"]
+        assert "docker" in _load(output_dir, "d")
+
+    def test_stateless_rebuild_removes_stale_shards(self, tmp_path: Path):
+        """상태 없이 다시 만들면 모든 샤드를 쓰고 토큰이 없어진 샤드 파일은 지운다."""
+        posts_dir = tmp_path / "_posts"
+        output_dir = tmp_path / "search"
+        _write(posts_dir, "learning/2025-10-01-a.md", "Kubernetes", "zebra")
+        build_search_index(posts_dir, output_dir=output_dir, state_path=tmp_path / "state.json")
+
+        _write(posts_dir, "learning/2025-10-01-a.md", "Kubernetes", "kafka")
+        build_search_index(posts_dir, output_dir=output_dir, state_path=tmp_path / "other.json")
+
+        assert not (output_dir / "z.json").exists()
+        assert "kafka" in _load(output_dir, "k")
+
+    def test_ids_follow_manifest_from_other_checkout(self, tmp_path: Path):
+        """다른 체크아웃에서 번호를 새로 매긴 manifest를 받으면 모든 샤드를 그 상태와 맞춰 다시 쓴다."""
+        posts_dir = tmp_path / "_posts"
+        output_dir = tmp_path / "search"
+        host_state = tmp_path / "host.json"
+        _write(posts_dir, "learning/2025-10-02-b.md", "Docker", "docker")
+        build_search_index(posts_dir, output_dir=output_dir, state_path=host_state)
+        _write(posts_dir, "learning/2025-10-01-a.md", "Kubernetes", "kafka")
+        build_search_index(posts_dir, output_dir=output_dir, state_path=host_state)
+        # 다른 체크아웃: 상태 없이 전체를 다시 만들어 문서 id가 0..N으로 바뀐다.
+        build_search_index(posts_dir, output_dir=output_dir, state_path=tmp_path / "other.json")
+
+        _write(posts_dir, "learning/2025-10-03-c.md", "Zig", "zig")
+        index = SearchIndex(output_dir, host_state)
+        index.update(posts_dir)
+        index.write()
+
+        manifest = _load(output_dir, "manifest")
+        ids = {doc[0]: int(doc_id) for doc_id, doc in manifest["docs"].items()}
+        assert _load(output_dir, "d")["docker"][0] == ids["_posts/learning/2025-10-02-b.md"]
+        assert _load(output_dir, "k")["kafka"][0] == ids["_posts/learning/2025-10-01-a.md"]
+
+    def test_write_post_updates_index(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """write_post가 새 포스트를 바로 검색 인덱스에 반영한다."""
+        monkeypatch.setattr(geeknews_pipeline, "POSTS_DIR", tmp_path / "_posts")
+        _write(tmp_path / "_posts", "learning/2025-10-01-old.md", "기존 글", "내용")
+        index = SearchIndex(tmp_path / "search", tmp_path / "state.json")
+        index.update(tmp_path / "_posts")
+        index.write()
+        item = {"guid": "g1", "title": "Zig 컴파일러 소개", "link": "https://example.com/zig", "summary": "", "published_at": ""}
+
+        path = geeknews_pipeline.write_post(item, QAResult(summary="요약"), search_index=index)
+
+        manifest = _load(tmp_path / "search", "manifest")
+        assert f"_posts/learning/{path.name}" in [doc[0] for doc in manifest["docs"].values()]
+        assert "zig" in _load(tmp_path / "search", "z")
@@ -0,0 +1,92 @@
+"""토큰 예산 모듈 테스트."""
+from __future__ import annotations
+
+import pytest
+
+from automation.qa_generator import ClaudeProvider, OpenAIProvider
+from automation.token_budget import (
+    TRUNCATION_MARKER,
+    PromptSection,
+    TokenBudgeter,
+    estimate_tokens,
+    truncate_to_tokens,
+)
+
+
+class TestEstimateTokens:
+    """토큰 추정 테스트."""
+
+    def test_empty(self):
+        """빈 문자열은 0토큰."""
+        assert estimate_tokens("") == 0
+
+    def test_korean_costs_more_than_english(self):
+        """같은 길이라면 한글이 영문보다 토큰이 많다."""
+        assert estimate_tokens("가" * 400, "openai") > estimate_tokens("a" * 400, "openai")
+
+    def test_provider_ratios_differ(self):
+        """프로바이더별로 다른 비율을 사용한다."""
+        text = "테스트 자동화 전략 " * 50
+        assert estimate_tokens(text, "claude") > estimate_tokens(text, "gemini")
+
+
+class TestTruncate:
+    """텍스트 자르기 테스트."""
+
+    def test_short_text_unchanged(self):
+        """예산 이내면 그대로 반환한다."""
+        assert truncate_to_tokens("짧은 문장", 100) == "짧은 문장"
+
+    def test_long_text_fits_budget(self):
+        """잘라낸 결과가 예산을 넘지 않는다."""
+        text = "\n".join(f"{i}번째 줄: 유튜브 자막 내용입니다." for i in range(500))
+        result = truncate_to_tokens(text, 300, "openai")
+
+        assert result.endswith(TRUNCATION_MARKER)
+        assert estimate_tokens(result, "openai") <= 300
+
+
+class TestTokenBudgeter:
+    """예산 분배 테스트."""
+
+    def test_no_trimming_within_budget(self):
+        """예산 이내면 섹션을 자르지 않는다."""
+        budgeter = TokenBudgeter(1000, "openai")
+        result = budgeter.fit([PromptSection("summary", "요약"), PromptSection("mcp", "결론")])
+        assert result == {"summary": "요약", "mcp": "결론"}
+
+    def test_priority_order(self):
+        """우선순위가 높은 섹션이 먼저 예산을 받는다."""
+        budgeter = TokenBudgeter(600, "openai")
+        summary = "요약 " * 400
+        mcp = "인사이트 " * 400
+
+        result = budgeter.fit(
+            [PromptSection("summary", summary, priority=0), PromptSection("mcp", mcp, priority=1, min_tokens=50)],
+            reserved_tokens=100,
+        )
+
+        assert 50 <= estimate_tokens(result["mcp"], "openai") <= 60
+        total = sum(estimate_tokens(text, "openai") for text in result.values())
+        assert total <= 500
+
+    def test_from_env_disabled(self, monkeypatch: pytest.MonkeyPatch):
+        """예산 0이면 비활성화된다."""
+        monkeypatch.setenv("PROMPT_INPUT_TOKEN_BUDGET", "0")
+        assert TokenBudgeter.from_env("openai") is None
+
+
+class TestProviderPromptBudget:
+    """프로바이더 프롬프트 예산 적용 테스트."""
+
+    @pytest.mark.parametrize("provider_cls, name", [(OpenAIProvider, "openai"), (ClaudeProvider, "claude")])
+    def test_long_transcript_is_trimmed(self, provider_cls, name, monkeypatch: pytest.MonkeyPatch):
+        """긴 자막이 포함된 요약은 예산에 맞게 잘린다."""
+        monkeypatch.setenv("PROMPT_INPUT_TOKEN_BUDGET", "6000")
+        provider = provider_cls(api_key="test-key")
+        item = {"title": "긴 영상", "link": "https://youtu.be/x", "summary": "자막 문장입니다. " * 5000}
+
+        prompt = provider._build_prompt(item)
+
+        assert TRUNCATION_MARKER in prompt
+        assert estimate_tokens(prompt, name) <= 6000 * 1.05
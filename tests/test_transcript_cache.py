@@ -0,0 +1,131 @@
+"""YouTube 자막 캐시 테스트."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from automation.sources import transcript_cache, youtube_collector
+from automation.sources.transcript_cache import NEGATIVE_TTL_SECONDS, TranscriptCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+class TestTranscriptCache:
+    """TranscriptCache 테스트."""
+
+    def test_round_trip_is_compressed(self, tmp_path: Path):
+        """저장한 자막을 그대로 돌려주며 압축되어 저장된다."""
+        cache = TranscriptCache(tmp_path / "cache.sqlite3")
+        text = "테스트 자동화 전략에 대한 자막입니다. " * 200
+        cache.put("vid1", "ko", text)
+
+        assert cache.get("vid1", ["ko", "en"]) == text
+        assert cache.stats()["bytes"] < len(text.encode("utf-8")) / 5
+
+    def test_language_order(self, tmp_path: Path):
+        """요청한 언어 순서대로 찾는다."""
+        cache = TranscriptCache(tmp_path / "cache.sqlite3")
+        cache.put("vid1", "en", "english")
+
+        assert cache.get("vid1", ["ko", "en"]) == "english"
+        assert cache.get("vid1", ["ko"]) is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction(self, tmp_path: Path, clock: FakeClock):
+        """크기 한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거한다."""
+        cache = TranscriptCache(tmp_path / "cache.sqlite3", max_bytes=10**9, clock=clock)
+        for index in range(3):
+            clock.now += 1
+            cache.put(f"vid{index}", "ko", f"자막 {index} " + "가나다라마바사" * index)
+        clock.now += 1
+        cache.get("vid0", ["ko"])
+
+        cache.max_bytes = cache.stats()["bytes"] - 1
+        clock.now += 1
+        cache.put("vid3", "ko", "짧은 자막")
+
+        assert cache.get("vid0", ["ko"]) is not None
+        assert cache.get("vid1", ["ko"]) is None
+        assert cache.stats()["evictions"] >= 1
+
+    def test_negative_entry_expires(self, tmp_path: Path, clock: FakeClock):
+        """자막 없음 기록은 일정 시간 뒤 만료된다."""
+        cache = TranscriptCache(tmp_path / "cache.sqlite3", clock=clock)
+        cache.put("vid1", "", "")
+
+        assert cache.get("vid1", ["ko", "en"]) == ""
+        clock.now += NEGATIVE_TTL_SECONDS + 1
+        assert cache.get("vid1", ["ko", "en"]) is None
+
+    def test_persists_across_instances(self, tmp_path: Path):
+        """다른 인스턴스(다음 실행)에서도 재사용된다."""
+        TranscriptCache(tmp_path / "cache.sqlite3").put("vid1", "ko", "자막")
+
+        assert TranscriptCache(tmp_path / "cache.sqlite3").get("vid1", ["ko"]) == "자막"
+
+
+class TestCollectorUsesCache:
+    """수집기 자막 조회 캐시 연동 테스트."""
+
+    def test_second_lookup_skips_network(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """같은 영상의 자막은 한 번만 네트워크에서 가져온다."""
+        monkeypatch.setenv("YOUTUBE_TRANSCRIPT_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+        transcript_cache.reset_default_cache()
+        fetched: list[str] = []
+
+        def fake_fetch(video_id: str, languages: list[str]) -> tuple[str, str]:
+            fetched.append(video_id)
+            return "ko", f"{video_id} 자막"
+
+        monkeypatch.setattr(youtube_collector, "TRANSCRIPT_AVAILABLE", True)
+        monkeypatch.setattr(youtube_collector, "_fetch_transcript", fake_fetch)
+        try:
+            assert youtube_collector._safe_get_transcript("vid1") == "vid1 자막"
+            assert youtube_collector._safe_get_transcript("vid1") == "vid1 자막"
+            stats = youtube_collector.transcript_cache_stats()
+        finally:
+            transcript_cache.reset_default_cache()
+
+        assert fetched == ["vid1"]
+        assert stats["hits"] == 1
+
+    def test_only_missing_transcripts_are_negative_cached(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """자막이 없다는 응답만 캐시하고 일시적인 오류는 다음 조회에서 다시 시도한다."""
+
+        class NoTranscriptFound(Exception):
+            pass
+
+        monkeypatch.setenv("YOUTUBE_TRANSCRIPT_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+        transcript_cache.reset_default_cache()
+        fetched: list[str] = []
+
+        def fake_fetch(video_id: str, languages: list[str]) -> tuple[str, str]:
+            fetched.append(video_id)
+            if video_id == "none":
+                raise NoTranscriptFound(video_id)
+            raise ConnectionError("429 Too Many Requests")
+
+        monkeypatch.setattr(youtube_collector, "TRANSCRIPT_AVAILABLE", True)
+        monkeypatch.setattr(youtube_collector, "_NO_TRANSCRIPT_ERRORS", (NoTranscriptFound,))
+        monkeypatch.setattr(youtube_collector, "_fetch_transcript", fake_fetch)
+        try:
+            for _ in range(2):
+                assert youtube_collector._safe_get_transcript("none") == ""
+                assert youtube_collector._safe_get_transcript("flaky") == ""
+        finally:
+            transcript_cache.reset_default_cache()
+
+        assert fetched == ["none", "flaky", "flaky"]
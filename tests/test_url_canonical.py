@@ -0,0 +1,160 @@
+"""URL 정규화 및 정규 URL 인덱스 테스트."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from automation.geeknews_pipeline import select_new_items
+from automation.url_canonical import CanonicalUrlIndex, canonicalize, is_redirector
+from automation.web_researcher import ResearchResult, WebResearcher, WebResource
+
+
+def _item(guid: str, link: str) -> dict[str, str]:
+    return {"guid": guid, "title": "제목", "link": link, "summary": "", "published_at": ""}
+
+
+class TestCanonicalize:
+    """canonicalize 테스트."""
+
+    def test_tracking_params_scheme_and_host(self):
+        """추적 파라미터, 프래그먼트, www, http, 끝 슬래시 차이를 없앤다."""
+        assert canonicalize(
+            "http://WWW.Example.com:80/posts/a/?utm_source=newsletter&b=2&fbclid=x&a=1#comments"
+        ) == "https://example.com/posts/a?a=1&b=2"
+
+    def test_host_specific_params(self):
+        """GeekNews와 YouTube는 식별 파라미터만 남긴다."""
+        assert canonicalize("https://news.hada.io/topic?id=23734&utm_medium=rss&foo=1") == (
+            "https://news.hada.io/topic?id=23734"
+        )
+        assert canonicalize("https://youtu.be/fj4WcRSo4AY?si=abc&t=30") == "https://youtube.com/watch?v=fj4WcRSo4AY"
+        assert canonicalize("https://m.youtube.com/watch?v=fj4WcRSo4AY&feature=share") == (
+            "https://youtube.com/watch?v=fj4WcRSo4AY"
+        )
+
+    def test_percent_encoding_is_unified(self):
+        """한글 경로는 인코딩 여부와 관계없이 같은 URL이 된다."""
+        assert canonicalize("https://example.com/글/테스트") == canonicalize(
+            "https://example.com/%EA%B8%80/%ed%85%8c%ec%8a%a4%ed%8a%b8"
+        )
+
+    def test_non_http_links_are_kept(self):
+        """mailto: 등은 그대로 둔다."""
+        assert canonicalize(" mailto:18f2a ") == "mailto:18f2a"
+
+    def test_redirector_hosts(self):
+        """단축 URL/추적 리디렉터만 HEAD 해석 대상이다."""
+        assert is_redirector("https://feedproxy.google.com/~r/geeknews/~3/abc")
+        assert is_redirector("https://x.us1.list-manage.com/track/click?u=1")
+        assert is_redirector("https://example.substack.com/redirect/abc")
+        assert not is_redirector("https://example.substack.com/p/post")
+        assert not is_redirector("https://news.hada.io/topic?id=1")
+
+
+class TestCanonicalUrlIndex:
+    """리디렉트 해석 캐시와 네임스페이스 캐시 테스트."""
+
+    def test_redirect_is_resolved_once_and_persisted(self, tmp_path: Path):
+        """리디렉터는 한 번만 해석하고 파일에 저장한 결과를 재사용한다."""
+        calls: list[str] = []
+
+        def resolver(url: str, timeout: float) -> str:
+            calls.append(url)
+            return "https://www.example.com/article/?utm_campaign=feed"
+
+        path = tmp_path / "canonical_urls.json"
+        index = CanonicalUrlIndex(path, resolver=resolver)
+        assert index.canonical("https://bit.ly/abc") == "https://example.com/article"
+        assert index.canonical("https://bit.ly/abc?utm_source=x") == "https://example.com/article"
+        assert index.resolve("https://bit.ly/abc") == "https://www.example.com/article/?utm_campaign=feed"
+        index.save()
+
+        reloaded = CanonicalUrlIndex(path, resolver=resolver)
+
+        assert reloaded.canonical("https://bit.ly/abc") == "https://example.com/article"
+        assert calls == ["https://bit.ly/abc"]
+
+    def test_failed_resolution_is_not_cached(self):
+        """해석에 실패하면 정규화만 한 URL을 쓰고 다음에 다시 시도한다."""
+        calls: list[str] = []
+
+        def resolver(url: str, timeout: float) -> None:
+            calls.append(url)
+            return None
+
+        index = CanonicalUrlIndex(None, resolver=resolver)
+
+        assert index.canonical("https://t.co/xyz") == "https://t.co/xyz"
+        index.canonical("https://t.co/xyz")
+        assert len(calls) == 2
+
+    def test_ttl_expiry(self):
+        """TTL이 지난 캐시 값은 반환하지 않는다."""
+        now = [1000.0]
+        index = CanonicalUrlIndex(None, ttl_seconds=60, clock=lambda: now[0])
+        index.put(index.RESEARCH, "https://example.com/a?utm_source=x", {"web_results": []})
+
+        assert index.get(index.RESEARCH, "http://www.example.com/a/") == {"web_results": []}
+        now[0] += 61
+        assert index.get(index.RESEARCH, "https://example.com/a") is None
+
+
+class TestIntegration:
+    """파이프라인 중복 판단과 연구 캐시 연동 테스트."""
+
+    def test_select_new_items_by_canonical_link(self):
+        """정규 URL이 이미 처리되었거나 배치에서 겹치는 항목은 제외하고 정규 URL은 따로 담는다."""
+        index = CanonicalUrlIndex(None, resolve_redirects=False)
+        processed = {"https://news.hada.io/topic?id=1"}
+        items = [
+            _item("gmail:a", "https://news.hada.io/topic?id=1&utm_source=newsletter"),
+            _item("devto:1", "https://dev.to/a/post?utm_source=rss"),
+            _item("reddit:1", "https://www.dev.to/a/post/"),
+            _item("gmail:b", "mailto:b"),
+        ]
+
+        selected = select_new_items(items, processed, index)
+
+        assert [item["guid"] for item in selected] == ["devto:1", "gmail:b"]
+        assert selected[0]["link"] == "https://dev.to/a/post?utm_source=rss"
+        assert selected[0]["canonical_url"] == "https://dev.to/a/post"
+        assert "canonical_url" not in selected[1]
+
+    def test_published_link_keeps_original_url(self):
+        """게시 링크는 http, www/m 호스트, YouTube 시작 시각을 그대로 두고 리디렉터만 최종 URL로 바꾼다."""
+        index = CanonicalUrlIndex(None, resolver=lambda url, timeout: "http://m.example.com/story")
+        items = [
+            _item("a", "http://legacy.example.org/page"),
+            _item("b", "https://www.youtube.com/watch?v=fj4WcRSo4AY&t=95"),
+            _item("c", "https://bit.ly/story"),
+        ]
+
+        selected = select_new_items(items, set(), index)
+
+        assert [item["link"] for item in selected] == [
+            "http://legacy.example.org/page",
+            "https://www.youtube.com/watch?v=fj4WcRSo4AY&t=95",
+            "http://m.example.com/story",
+        ]
+        assert [item["canonical_url"] for item in selected] == [
+            "https://legacy.example.org/page",
+            "https://youtube.com/watch?v=fj4WcRSo4AY",
+            "https://example.com/story",
+        ]
+
+    def test_research_cache_by_canonical_url(self):
+        """추적 파라미터만 다른 같은 기사는 다시 검색하지 않는다."""
+        index = CanonicalUrlIndex(None, resolve_redirects=False)
+        researcher = WebResearcher(cache=index)
+        calls: list[str] = []
+
+        def fake_research(title: str, summary: str) -> ResearchResult:
+            calls.append(title)
+            return ResearchResult(web_results=[WebResource(title="결과", url="https://a.example.com")])
+
+        researcher._research = fake_research  # type: ignore[method-assign]
+
+        researcher.research("제목", "", "https://example.com/a?utm_source=x")
+        cached = researcher.research("제목", "", "https://example.com/a")
+
+        assert calls == ["제목"]
+        assert cached.web_results[0].url == "https://a.example.com"
@@ -0,0 +1,283 @@
+"""YouTube 수집기 테스트 (가짜 API 서비스 사용)."""
+from __future__ import annotations
+
+import threading
+import typing as t
+
+import pytest
+
+from automation.sources import youtube_collector
+from automation.sources.youtube_quota import QuotaLedger
+
+
+class _FakeRequest:
+    def __init__(self, response: dict[str, t.Any]):
+        self._response = response
+
+    def execute(self) -> dict[str, t.Any]:
+        return self._response
+
+
+class _FakeResource:
+    def __init__(self, service: "FakeYouTubeService", name: str):
+        self._service = service
+        self._name = name
+
+    def list(self, **params: t.Any) -> _FakeRequest:
+        self._service.calls.append((self._name, params))
+        return _FakeRequest(self._service.respond(self._name, params))
+
+
+class FakeYouTubeService:
+    """googleapiclient YouTube 서비스의 search/videos/channels/playlistItems 호출을 흉내 낸다.
+
+    videos는 최신순으로 전달한다 (업로드 재생목록과 같은 순서).
+    """
+
+    def __init__(self, videos: dict[str, dict[str, t.Any]]):
+        self.videos_by_id = videos
+        self.calls: list[tuple[str, dict[str, t.Any]]] = []
+
+    def call_names(self) -> list[str]:
+        return [name for name, _ in self.calls]
+
+    def respond(self, name: str, params: dict[str, t.Any]) -> dict[str, t.Any]:
+        if name == "search":
+            return {"items": [{"id": {"videoId": vid}} for vid in self.videos_by_id]}
+        if name == "channels":
+            return {"items": [{"contentDetails": {"relatedPlaylists": {"uploads": "UU" + params["id"][2:]}}}]}
+        if name == "playlistItems":
+            return {"items": [
+                {"contentDetails": {"videoId": vid, "videoPublishedAt": snippet["publishedAt"]}}
+                for vid, snippet in list(self.videos_by_id.items())[: params["maxResults"]]
+            ]}
+        ids = params["id"].split(",")
+        return {"items": [{"id": vid, "snippet": self.videos_by_id[vid]} for vid in ids if vid in self.videos_by_id]}
+
+    def search(self) -> _FakeResource:
+        return _FakeResource(self, "search")
+
+    def videos(self) -> _FakeResource:
+        return _FakeResource(self, "videos")
+
+    def channels(self) -> _FakeResource:
+        return _FakeResource(self, "channels")
+
+    def playlistItems(self) -> _FakeResource:  # noqa: N802 - googleapiclient 메서드 이름
+        return _FakeResource(self, "playlistItems")
+
+
+def _snippet(title: str, days_ago: int = 0) -> dict[str, t.Any]:
+    published_at = youtube_collector._days_ago_iso(days_ago)
+    return {"title": title, "description": f"{title} 설명", "publishedAt": published_at, "channelTitle": "QA"}
+
+
+@pytest.fixture
+def fake_service(monkeypatch: pytest.MonkeyPatch) -> FakeYouTubeService:
+    service = FakeYouTubeService({"vid00000001": _snippet("첫 영상"), "vid00000002": _snippet("둘째 영상", 1)})
+    monkeypatch.setattr(youtube_collector, "GOOGLE_API_AVAILABLE", True)
+    monkeypatch.setattr(youtube_collector, "_build_service", lambda api_key: service)
+    return service
+
+
+@pytest.fixture
+def transcript_calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+    lock = threading.Lock()
+
+    def fake_transcript(video_id: str, languages: list[str] | None = None) -> str:
+        with lock:
+            calls.append(video_id)
+        return "" if video_id == "vid00000002" else f"{video_id} 자막"
+
+    monkeypatch.setattr(youtube_collector, "TRANSCRIPT_AVAILABLE", True)
+    monkeypatch.setattr(youtube_collector, "_safe_get_transcript", fake_transcript)
+    return calls
+
+
+class TestLazyTranscripts:
+    """자막 지연 조회 테스트."""
+
+    def test_collect_without_transcripts(self, fake_service, transcript_calls):
+        """fetch_transcripts=False면 자막을 조회하지 않고 설명을 사용한다."""
+        items = youtube_collector.collect(api_key="key", keywords="QA", fetch_transcripts=False)
+
+        assert transcript_calls == []
+        assert [item["summary"] for item in items] == ["첫 영상 설명", "둘째 영상 설명"]
+
+    def test_collect_with_transcripts_by_default(self, fake_service, transcript_calls):
+        """기본값은 기존처럼 수집 시점에 자막을 조회한다."""
+        items = youtube_collector.collect_from_channel(api_key="key", channel_id="UC1")
+
+        assert sorted(transcript_calls) == ["vid00000001", "vid00000002"]
+        assert items[0]["summary"] == "vid00000001 자막"
+
+    def test_hydrate_only_youtube_items(self, transcript_calls):
+        """YouTube 항목만 자막을 채우고, 자막이 없으면 설명을 유지한다."""
+        items = [
+            {"guid": "youtube:vid00000001", "summary": "설명1"},
+            {"guid": "youtube:vid00000002", "summary": "설명2"},
+            {"guid": "https://news.hada.io/topic?id=1", "summary": "뉴스"},
+        ]
+
+        hydrated = youtube_collector.hydrate_transcripts(items, max_workers=2)
+
+        assert hydrated == 1
+        assert sorted(transcript_calls) == ["vid00000001", "vid00000002"]
+        assert [item["summary"] for item in items] == ["vid00000001 자막", "설명2", "뉴스"]
+
+
+class TestChannelPolling:
+    """업로드 재생목록 기반 채널 수집 테스트."""
+
+    def test_uses_uploads_playlist_instead_of_search(self, fake_service, transcript_calls):
+        """search.list 없이 channels.list → playlistItems.list → videos.list 순으로 호출한다."""
+        state: dict[str, t.Any] = {}
+        items = youtube_collector.collect_from_channel(
+            api_key="key", channel_id="UCabc", fetch_transcripts=False, channel_state=state
+        )
+
+        assert fake_service.call_names() == ["channels", "playlistItems", "videos"]
+        assert fake_service.calls[1][1]["playlistId"] == "UUabc"
+        assert [item["guid"] for item in items] == ["youtube:vid00000001", "youtube:vid00000002"]
+        assert state["uploads_playlist_id"] == "UUabc"
+        assert state["last_video_id"] == "vid00000001"
+
+    def test_watermark_skips_seen_videos(self, fake_service, transcript_calls):
+        """워터마크 이후 새 영상이 없으면 videos.list를 호출하지 않는다."""
+        state: dict[str, t.Any] = {}
+        youtube_collector.collect_from_channel(api_key="key", channel_id="UCabc", channel_state=state)
+        fake_service.calls.clear()
+
+        items = youtube_collector.collect_from_channel(api_key="key", channel_id="UCabc", channel_state=state)
+
+        assert items == []
+        assert fake_service.call_names() == ["playlistItems"]
+
+    def test_watermark_is_pending_until_committed(self, fake_service):
+        """새 워터마크는 commit_watermark 전까지 반영되지 않고, apply=False면 버린다."""
+        state: dict[str, t.Any] = {"last_video_id": "vid00000002"}
+
+        video_ids = youtube_collector.channel_video_ids(api_key="key", channel_id="UCabc", channel_state=state)
+
+        assert video_ids == ["vid00000001"]
+        assert state["last_video_id"] == "vid00000002"
+        youtube_collector.commit_watermark(state, apply=False)
+        assert state == {"last_video_id": "vid00000002", "uploads_playlist_id": "UUabc"}
+
+        youtube_collector.channel_video_ids(api_key="key", channel_id="UCabc", channel_state=state)
+        youtube_collector.commit_watermark(state)
+        assert state["last_video_id"] == "vid00000001"
+        assert "pending_videos" not in state
+
+    def test_watermark_stops_before_retried_video(self, monkeypatch: pytest.MonkeyPatch):
+        """처리하지 못한 영상이 있으면 워터마크는 그보다 오래된 영상까지만 옮긴다."""
+        service = FakeYouTubeService({
+            "vid00000003": _snippet("셋째 영상"),
+            "vid00000002": _snippet("둘째 영상", 1),
+            "vid00000001": _snippet("첫 영상", 2),
+        })
+        monkeypatch.setattr(youtube_collector, "GOOGLE_API_AVAILABLE", True)
+        monkeypatch.setattr(youtube_collector, "_build_service", lambda api_key: service)
+        state: dict[str, t.Any] = {}
+
+        youtube_collector.channel_video_ids(api_key="key", channel_id="UCabc", channel_state=state)
+        youtube_collector.commit_watermark(state, retry={"vid00000002"})
+        assert state["last_video_id"] == "vid00000001"
+
+        video_ids = youtube_collector.channel_video_ids(api_key="key", channel_id="UCabc", channel_state=state)
+        assert video_ids == ["vid00000003", "vid00000002"]
+        youtube_collector.commit_watermark(state, retry={"vid00000001", "vid00000003"})
+        assert state["last_video_id"] == "vid00000002"
+
+    def test_failed_detail_fetch_keeps_watermark(self, fake_service, monkeypatch: pytest.MonkeyPatch):
+        """상세 조회가 실패하면 워터마크를 옮기지 않아 다음 실행에서 같은 영상을 다시 찾는다."""
+        def failing_details(**kwargs: t.Any) -> dict[str, t.Any]:
+            raise RuntimeError("backendError")
+
+        monkeypatch.setattr(youtube_collector, "fetch_video_details", failing_details)
+        state: dict[str, t.Any] = {}
+
+        with pytest.raises(RuntimeError):
+            youtube_collector.collect_from_channel(api_key="key", channel_id="UCabc", channel_state=state)
+
+        assert "last_video_id" not in state
+
+    def test_old_videos_are_skipped(self, monkeypatch: pytest.MonkeyPatch, transcript_calls):
+        """수집 기간보다 오래된 업로드는 반환하지 않는다."""
+        service = FakeYouTubeService({"vid00000001": _snippet("새 영상"), "vid00000002": _snippet("옛 영상", 30)})
+        monkeypatch.setattr(youtube_collector, "GOOGLE_API_AVAILABLE", True)
+        monkeypatch.setattr(youtube_collector, "_build_service", lambda api_key: service)
+
+        items = youtube_collector.collect_from_channel(api_key="key", channel_id="UCabc", published_after_days=7)
+
+        assert [item["title"] for item in items] == ["새 영상"]
+
+    def test_channel_state_round_trip(self, tmp_path):
+        """채널 상태는 파일에 저장되고 다시 읽힌다."""
+        path = tmp_path / "youtube_channel_state.json"
+        youtube_collector.save_channel_state({"UCabc": {"uploads_playlist_id": "UUabc"}}, path)
+
+        assert youtube_collector.load_channel_state(path) == {"UCabc": {"uploads_playlist_id": "UUabc"}}
+
+
+class TestQuotaAccounting:
+    """수집기 쿼터 기록 테스트."""
+
+    def test_collect_charges_search_and_videos(self, fake_service, transcript_calls):
+        """키워드 수집은 search.list 100 + videos.list 1을 기록한다."""
+        ledger = QuotaLedger(None)
+        youtube_collector.collect(api_key="key", keywords="QA", fetch_transcripts=False, quota=ledger)
+
+        assert ledger.summary()["by_method"] == {"search.list": 100, "videos.list": 1}
+
+    def test_quota_exceeded_marks_ledger(self, monkeypatch: pytest.MonkeyPatch):
+        """quotaExceeded 오류가 나면 오늘 남은 예산을 0으로 만든다."""
+        class ExhaustedRequest:
+            def execute(self):
+                raise RuntimeError('<HttpError 403 "quotaExceeded">')
+
+        ledger = QuotaLedger(None)
+        with pytest.raises(RuntimeError):
+            youtube_collector._execute(ExhaustedRequest(), "search.list", ledger)
+
+        assert ledger.remaining() == 0
+
+
+class TestBatchedHydration:
+    """경로 통합 상세 조회 테스트."""
+
+    def test_duplicates_are_fetched_once_in_full_batches(self, monkeypatch: pytest.MonkeyPatch, transcript_calls):
+        """여러 경로의 ID를 합쳐 중복 없이 50개씩 조회한다."""
+        service = FakeYouTubeService({f"vid{i:08d}": _snippet(f"영상 {i}") for i in range(120)})
+        monkeypatch.setattr(youtube_collector, "GOOGLE_API_AVAILABLE", True)
+        monkeypatch.setattr(youtube_collector, "_build_service", lambda api_key: service)
+        channel_ids = [f"vid{i:08d}" for i in range(70)]
+        keyword_ids = [f"vid{i:08d}" for i in range(50, 120)]
+
+        index = youtube_collector.fetch_video_details(
+            api_key="key", video_ids=channel_ids + keyword_ids, fetch_transcripts=False
+        )
+
+        assert len(index) == 120
+        assert [len(params["id"].split(",")) for _, params in service.calls] == [50, 50, 20]
+
+    def test_watchlist_series_metadata_from_index(self):
+        """워치리스트 항목은 인덱스에서 꺼내 시리즈 정보를 붙인다."""
+        from automation import geeknews_pipeline
+        from automation.sources.youtube_quota import CollectionTask
+
+        index = {"vid00000001": {"guid": "youtube:vid00000001", "title": "1편", "source": "youtube"}}
+        watchlist = [
+            {"video_id": "vid00000001", "series": "입문", "series_order": 1},
+            {"video_id": "vid00000009", "series": "입문", "series_order": 2},
+        ]
+        task = CollectionTask("watchlist", 1, "high", watchlist)
+
+        items = geeknews_pipeline._youtube_task_items(task, ["vid00000001", "vid00000009"], index)
+
+        assert items == [{
+            "guid": "youtube:vid00000001", "title": "1편", "source": "youtube_watchlist",
+            "series": "입문", "series_order": 1,
+        }]
+        assert index["vid00000001"]["source"] == "youtube"
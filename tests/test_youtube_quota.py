@@ -0,0 +1,96 @@
+"""YouTube 쿼터 장부/예산 배분 테스트."""
+from __future__ import annotations
+
+import datetime as dt
+from pathlib import Path
+
+from automation.sources.youtube_quota import (
+    CollectionTask,
+    QuotaLedger,
+    QuotaPlanner,
+    keyword_task_cost,
+    pacific_date,
+)
+
+
+class FakeClock:
+    def __init__(self, now: dt.datetime):
+        self.now = now
+
+    def __call__(self) -> dt.datetime:
+        return self.now
+
+
+def _utc(hour: int, day: int = 6) -> dt.datetime:
+    return dt.datetime(2025, 1, day, hour, 0, tzinfo=dt.timezone.utc)
+
+
+class TestQuotaLedger:
+    """QuotaLedger 테스트."""
+
+    def test_pacific_day_boundary(self):
+        """쿼터 일자는 태평양 시간 기준이다 (UTC 07시는 전날)."""
+        assert pacific_date(_utc(7)) == "2025-01-05"
+        assert pacific_date(_utc(9)) == "2025-01-06"
+
+    def test_charge_and_persist(self, tmp_path: Path):
+        """호출 단가가 누적되고 파일에 저장된다."""
+        clock = FakeClock(_utc(12))
+        ledger = QuotaLedger(tmp_path / "quota.json", daily_limit=1000, clock=clock)
+        ledger.charge("search.list")
+        ledger.charge("videos.list", calls=3)
+        ledger.save()
+
+        reloaded = QuotaLedger(tmp_path / "quota.json", daily_limit=1000, clock=clock)
+        assert reloaded.used() == 103
+        assert reloaded.remaining() == 897
+        assert reloaded.summary()["by_method"] == {"search.list": 100, "videos.list": 3}
+
+    def test_usage_resets_next_day(self, tmp_path: Path):
+        """태평양 시간 자정이 지나면 사용량이 초기화되고 수확량은 유지된다."""
+        clock = FakeClock(_utc(12))
+        ledger = QuotaLedger(tmp_path / "quota.json", clock=clock)
+        ledger.charge("search.list")
+        ledger.record_yield("keywords:playwright", 4)
+
+        clock.now = _utc(12, day=7)
+        assert ledger.used() == 0
+        assert ledger.yield_of("keywords:playwright") == 4
+
+    def test_mark_exhausted(self):
+        """quotaExceeded 이후에는 남은 예산이 0이다."""
+        ledger = QuotaLedger(None, daily_limit=500)
+        ledger.mark_exhausted()
+        assert ledger.remaining() == 0
+
+
+class TestQuotaPlanner:
+    """QuotaPlanner 테스트."""
+
+    def test_budget_is_split_over_remaining_runs(self):
+        """남은 예산을 오늘 남은 실행 횟수로 나눈다."""
+        # 태평양 시간 04시 → 자정까지 20시간, 6시간 간격이면 4회 남음
+        clock = FakeClock(_utc(12))
+        ledger = QuotaLedger(None, daily_limit=1000, clock=clock)
+        planner = QuotaPlanner(ledger, runs_per_day=4, clock=clock)
+
+        assert planner.runs_left_today() == 4
+        assert planner.run_budget() == 250
+
+    def test_plan_prefers_priority_and_yield(self):
+        """예산이 부족하면 우선순위와 과거 수확량이 높은 작업을 고른다."""
+        clock = FakeClock(_utc(12))
+        ledger = QuotaLedger(None, daily_limit=4 * 150, clock=clock)
+        ledger.record_yield("keywords:dry", 0)
+        ledger.record_yield("keywords:rich", 5)
+        tasks = [
+            CollectionTask("channel:UC1", 2, "low"),
+            CollectionTask("keywords:dry", keyword_task_cost(), "high"),
+            CollectionTask("keywords:rich", keyword_task_cost(), "medium"),
+            CollectionTask("keywords:new", keyword_task_cost(), "low"),
+        ]
+
+        selected, deferred = QuotaPlanner(ledger, runs_per_day=4, clock=clock).plan(tasks)
+
+        assert [task.source for task in selected] == ["channel:UC1", "keywords:rich"]
+        assert {task.source for task in deferred} == {"keywords:dry", "keywords:new"}